@@ -0,0 +1,48 @@
+"""add keyset pagination indexes
+
+Revision ID: a3c91e7d5f20
+Revises: c0dfa4d0b2a0
+Create Date: 2026-01-05 10:12:40.518210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e7d5f20'
+down_revision: Union[str, Sequence[str], None] = 'c0dfa4d0b2a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_submissions_event_created_id",
+        "submissions",
+        ["event_uuid", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_events_organizer_created_id",
+        "events",
+        ["organizer_uuid", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_events_status_start_id",
+        "events",
+        ["status", "start_date", "id"],
+    )
+    op.create_index(
+        "ix_activity_templates_organizer_created_id",
+        "activity_templates",
+        ["organizer_uuid", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activity_templates_organizer_created_id", table_name="activity_templates")
+    op.drop_index("ix_events_status_start_id", table_name="events")
+    op.drop_index("ix_events_organizer_created_id", table_name="events")
+    op.drop_index("ix_submissions_event_created_id", table_name="submissions")
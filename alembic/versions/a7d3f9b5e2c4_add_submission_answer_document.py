@@ -0,0 +1,73 @@
+"""add submission answer document
+
+Revision ID: a7d3f9b5e2c4
+Revises: f4a8c2e6d0b3
+Create Date: 2026-01-20 11:27:16.804512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3f9b5e2c4'
+down_revision: Union[str, Sequence[str], None] = 'f4a8c2e6d0b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 相容 view：已有 answers 的報名展開 document，其餘沿用 submission_values
+ANSWER_VALUES_VIEW = """
+CREATE VIEW submission_answer_values AS
+SELECT s.uuid AS submission_uuid,
+       f.uuid AS event_field_uuid,
+       a.key AS field_key,
+       a.value AS value,
+       false AS is_deleted
+  FROM submissions s
+ CROSS JOIN LATERAL jsonb_each(s.answers) a
+  JOIN event_fields f
+    ON f.event_uuid = s.event_uuid
+   AND f.field_key = a.key
+   AND f.is_deleted = false
+ WHERE s.answers IS NOT NULL
+UNION ALL
+SELECT v.submission_uuid,
+       v.event_field_uuid,
+       v.field_key,
+       coalesce(v.value, to_jsonb(v.raw_value)) AS value,
+       v.is_deleted
+  FROM submission_values v
+  JOIN submissions s ON s.uuid = v.submission_uuid
+ WHERE s.answers IS NULL
+"""
+
+
+def upgrade() -> None:
+    op.add_column("submissions", sa.Column("answers", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column("submissions", sa.Column("answers_version", sa.Integer(), nullable=True))
+
+    # 只做 DDL：nullable 且無 default 的欄位只改 catalog，ACCESS EXCLUSIVE lock 只持有極短時間
+    # 既有報名的回填不在 migration transaction 內執行（會一路持有 lock 直到回填完成）
+    # → 部署後以 python -m app.services.submission.answers backfill 分批 commit
+
+    op.create_index(
+        "ix_submissions_answers",
+        "submissions",
+        ["answers"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"answers": "jsonb_path_ops"},
+    )
+
+    op.execute(ANSWER_VALUES_VIEW)
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW IF EXISTS submission_answer_values")
+    op.drop_index("ix_submissions_answers", table_name="submissions")
+    op.drop_column("submissions", "answers_version")
+    op.drop_column("submissions", "answers")
@@ -0,0 +1,35 @@
+"""add fields_version to events
+
+Revision ID: a9c4e2f6b8d3
+Revises: f7b3d2a6c8e1
+Create Date: 2026-01-10 10:12:38.581904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e2f6b8d3'
+down_revision: Union[str, Sequence[str], None] = 'f7b3d2a6c8e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column(
+            "fields_version",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="報名欄位定義版本（validator 快取比對）",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("events", "fields_version")
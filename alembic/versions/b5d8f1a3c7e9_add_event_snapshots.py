@@ -0,0 +1,62 @@
+"""add event_snapshots
+
+Revision ID: b5d8f1a3c7e9
+Revises: a9c4e2f6b8d3
+Create Date: 2026-01-10 16:42:05.317268
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d8f1a3c7e9'
+down_revision: Union[str, Sequence[str], None] = 'a9c4e2f6b8d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_snapshots",
+        sa.Column("event_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("public_json", sa.Text(), nullable=True),
+        sa.Column("detail_json", sa.Text(), nullable=True),
+        sa.Column("schedule_json", sa.Text(), nullable=True),
+        sa.Column("built_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by_role", sa.String(), nullable=True),
+        sa.Column("updated_by_role", sa.String(), nullable=True),
+        sa.Column("deleted_by_role", sa.String(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["event_uuid"], ["events.uuid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_event_snapshots_event_uuid"), "event_snapshots", ["event_uuid"], unique=True)
+    op.create_index(op.f("ix_event_snapshots_uuid"), "event_snapshots", ["uuid"], unique=True)
+    op.create_index(op.f("ix_event_snapshots_id"), "event_snapshots", ["id"], unique=False)
+    op.create_index(op.f("ix_event_snapshots_created_by"), "event_snapshots", ["created_by"], unique=False)
+    op.create_index(op.f("ix_event_snapshots_updated_by"), "event_snapshots", ["updated_by"], unique=False)
+    op.create_index(op.f("ix_event_snapshots_deleted_by"), "event_snapshots", ["deleted_by"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_event_snapshots_deleted_by"), table_name="event_snapshots")
+    op.drop_index(op.f("ix_event_snapshots_updated_by"), table_name="event_snapshots")
+    op.drop_index(op.f("ix_event_snapshots_created_by"), table_name="event_snapshots")
+    op.drop_index(op.f("ix_event_snapshots_id"), table_name="event_snapshots")
+    op.drop_index(op.f("ix_event_snapshots_uuid"), table_name="event_snapshots")
+    op.drop_index(op.f("ix_event_snapshots_event_uuid"), table_name="event_snapshots")
+    op.drop_table("event_snapshots")
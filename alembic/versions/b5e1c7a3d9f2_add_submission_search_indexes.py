@@ -0,0 +1,69 @@
+"""add submission search indexes
+
+Revision ID: b5e1c7a3d9f2
+Revises: a7d3f9b5e2c4
+Create Date: 2026-01-27 15:42:08.319265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1c7a3d9f2'
+down_revision: Union[str, Sequence[str], None] = 'a7d3f9b5e2c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# answer document 的可搜尋文字（所有值，小寫）；IMMUTABLE 才能用於 index
+ANSWER_TEXT_FUNCTION = """
+CREATE OR REPLACE FUNCTION submission_answer_text(answers jsonb)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT lower(string_agg(a.value, ' '))
+      FROM jsonb_each_text(answers) a
+$$
+"""
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # btree_gin：event_uuid（=）與 trigram 放在同一個 GIN index
+    # → 搜尋只掃描該活動的 posting list，短字串（無 trigram）也不會展開成全表 bitmap
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.execute(ANSWER_TEXT_FUNCTION)
+
+    op.create_index(
+        "ix_submissions_email_trgm",
+        "submissions",
+        ["event_uuid", sa.text("lower(user_email) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_submissions_code_trgm",
+        "submissions",
+        ["event_uuid", sa.text("lower(submission_code) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_submissions_answers_trgm",
+        "submissions",
+        ["event_uuid", sa.text("submission_answer_text(answers) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submissions_answers_trgm", table_name="submissions")
+    op.drop_index("ix_submissions_code_trgm", table_name="submissions")
+    op.drop_index("ix_submissions_email_trgm", table_name="submissions")
+    op.execute("DROP FUNCTION IF EXISTS submission_answer_text(jsonb)")
@@ -0,0 +1,35 @@
+"""add membership_version to users
+
+Revision ID: b81f4c2e9d13
+Revises: a3c91e7d5f20
+Create Date: 2026-01-06 14:27:51.302114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81f4c2e9d13'
+down_revision: Union[str, Sequence[str], None] = 'a3c91e7d5f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "membership_version",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="membership 版本（JWT claims 比對）",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "membership_version")
@@ -0,0 +1,113 @@
+"""add event price shards and holds
+
+Revision ID: c3e7a1d9f5b2
+Revises: b5d8f1a3c7e9
+Create Date: 2026-01-14 10:18:33.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e7a1d9f5b2'
+down_revision: Union[str, Sequence[str], None] = 'b5d8f1a3c7e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event_prices",
+        sa.Column("shard_count", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    op.create_table(
+        "event_price_shards",
+        sa.Column("price_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("shard_no", sa.Integer(), nullable=False),
+        sa.Column("capacity", sa.Integer(), nullable=True),
+        sa.Column("sold", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by_role", sa.String(), nullable=True),
+        sa.Column("updated_by_role", sa.String(), nullable=True),
+        sa.Column("deleted_by_role", sa.String(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["price_uuid"], ["event_prices.uuid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("price_uuid", "shard_no", name="uq_event_price_shards_price_shard"),
+    )
+    op.create_index(op.f("ix_event_price_shards_price_uuid"), "event_price_shards", ["price_uuid"], unique=False)
+    op.create_index(op.f("ix_event_price_shards_uuid"), "event_price_shards", ["uuid"], unique=True)
+    op.create_index(op.f("ix_event_price_shards_id"), "event_price_shards", ["id"], unique=False)
+    op.create_index(op.f("ix_event_price_shards_created_by"), "event_price_shards", ["created_by"], unique=False)
+    op.create_index(op.f("ix_event_price_shards_updated_by"), "event_price_shards", ["updated_by"], unique=False)
+    op.create_index(op.f("ix_event_price_shards_deleted_by"), "event_price_shards", ["deleted_by"], unique=False)
+
+    op.create_table(
+        "event_price_holds",
+        sa.Column("price_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("submission_uuid", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("shard_no", sa.Integer(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by_role", sa.String(), nullable=True),
+        sa.Column("updated_by_role", sa.String(), nullable=True),
+        sa.Column("deleted_by_role", sa.String(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["price_uuid"], ["event_prices.uuid"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["submission_uuid"], ["submissions.uuid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_event_price_holds_price_uuid"), "event_price_holds", ["price_uuid"], unique=False)
+    op.create_index(op.f("ix_event_price_holds_submission_uuid"), "event_price_holds", ["submission_uuid"], unique=False)
+    op.create_index(op.f("ix_event_price_holds_expires_at"), "event_price_holds", ["expires_at"], unique=False)
+    op.create_index(op.f("ix_event_price_holds_uuid"), "event_price_holds", ["uuid"], unique=True)
+    op.create_index(op.f("ix_event_price_holds_id"), "event_price_holds", ["id"], unique=False)
+    op.create_index(op.f("ix_event_price_holds_created_by"), "event_price_holds", ["created_by"], unique=False)
+    op.create_index(op.f("ix_event_price_holds_updated_by"), "event_price_holds", ["updated_by"], unique=False)
+    op.create_index(op.f("ix_event_price_holds_deleted_by"), "event_price_holds", ["deleted_by"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_event_price_holds_deleted_by"), table_name="event_price_holds")
+    op.drop_index(op.f("ix_event_price_holds_updated_by"), table_name="event_price_holds")
+    op.drop_index(op.f("ix_event_price_holds_created_by"), table_name="event_price_holds")
+    op.drop_index(op.f("ix_event_price_holds_id"), table_name="event_price_holds")
+    op.drop_index(op.f("ix_event_price_holds_uuid"), table_name="event_price_holds")
+    op.drop_index(op.f("ix_event_price_holds_expires_at"), table_name="event_price_holds")
+    op.drop_index(op.f("ix_event_price_holds_submission_uuid"), table_name="event_price_holds")
+    op.drop_index(op.f("ix_event_price_holds_price_uuid"), table_name="event_price_holds")
+    op.drop_table("event_price_holds")
+
+    op.drop_index(op.f("ix_event_price_shards_deleted_by"), table_name="event_price_shards")
+    op.drop_index(op.f("ix_event_price_shards_updated_by"), table_name="event_price_shards")
+    op.drop_index(op.f("ix_event_price_shards_created_by"), table_name="event_price_shards")
+    op.drop_index(op.f("ix_event_price_shards_id"), table_name="event_price_shards")
+    op.drop_index(op.f("ix_event_price_shards_uuid"), table_name="event_price_shards")
+    op.drop_index(op.f("ix_event_price_shards_price_uuid"), table_name="event_price_shards")
+    op.drop_table("event_price_shards")
+
+    op.drop_column("event_prices", "shard_count")
@@ -0,0 +1,64 @@
+"""add revoked_access_tokens
+
+Revision ID: c4d7a9e1f305
+Revises: b81f4c2e9d13
+Create Date: 2026-01-07 11:05:19.774620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7a9e1f305'
+down_revision: Union[str, Sequence[str], None] = 'b81f4c2e9d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_access_tokens",
+        sa.Column("jti", sa.String(length=64), nullable=False),
+        sa.Column("user_uuid", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("reason", sa.String(), nullable=True),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by_role", sa.String(), nullable=True),
+        sa.Column("updated_by_role", sa.String(), nullable=True),
+        sa.Column("deleted_by_role", sa.String(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_revoked_access_tokens_jti"), "revoked_access_tokens", ["jti"], unique=True)
+    op.create_index(op.f("ix_revoked_access_tokens_uuid"), "revoked_access_tokens", ["uuid"], unique=True)
+    op.create_index(op.f("ix_revoked_access_tokens_id"), "revoked_access_tokens", ["id"], unique=False)
+    op.create_index(op.f("ix_revoked_access_tokens_user_uuid"), "revoked_access_tokens", ["user_uuid"], unique=False)
+    op.create_index(op.f("ix_revoked_access_tokens_expires_at"), "revoked_access_tokens", ["expires_at"], unique=False)
+    op.create_index(op.f("ix_revoked_access_tokens_created_by"), "revoked_access_tokens", ["created_by"], unique=False)
+    op.create_index(op.f("ix_revoked_access_tokens_updated_by"), "revoked_access_tokens", ["updated_by"], unique=False)
+    op.create_index(op.f("ix_revoked_access_tokens_deleted_by"), "revoked_access_tokens", ["deleted_by"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_revoked_access_tokens_deleted_by"), table_name="revoked_access_tokens")
+    op.drop_index(op.f("ix_revoked_access_tokens_updated_by"), table_name="revoked_access_tokens")
+    op.drop_index(op.f("ix_revoked_access_tokens_created_by"), table_name="revoked_access_tokens")
+    op.drop_index(op.f("ix_revoked_access_tokens_expires_at"), table_name="revoked_access_tokens")
+    op.drop_index(op.f("ix_revoked_access_tokens_user_uuid"), table_name="revoked_access_tokens")
+    op.drop_index(op.f("ix_revoked_access_tokens_id"), table_name="revoked_access_tokens")
+    op.drop_index(op.f("ix_revoked_access_tokens_uuid"), table_name="revoked_access_tokens")
+    op.drop_index(op.f("ix_revoked_access_tokens_jti"), table_name="revoked_access_tokens")
+    op.drop_table("revoked_access_tokens")
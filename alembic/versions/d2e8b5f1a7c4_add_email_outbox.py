@@ -0,0 +1,80 @@
+"""add email_outbox
+
+Revision ID: d2e8b5f1a7c4
+Revises: c4d7a9e1f305
+Create Date: 2026-01-08 10:42:03.518207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2e8b5f1a7c4'
+down_revision: Union[str, Sequence[str], None] = 'c4d7a9e1f305'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_outbox",
+        sa.Column("to_email", sa.String(), nullable=False),
+        sa.Column("recipient_domain", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("html", sa.Text(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("ref_type", sa.String(), nullable=True),
+        sa.Column("ref_uuid", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("status", sa.String(length=20), server_default="pending", nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("provider_message_id", sa.String(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by_role", sa.String(), nullable=True),
+        sa.Column("updated_by_role", sa.String(), nullable=True),
+        sa.Column("deleted_by_role", sa.String(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_email_outbox_uuid"), "email_outbox", ["uuid"], unique=True)
+    op.create_index(op.f("ix_email_outbox_id"), "email_outbox", ["id"], unique=False)
+    op.create_index(op.f("ix_email_outbox_recipient_domain"), "email_outbox", ["recipient_domain"], unique=False)
+    op.create_index(op.f("ix_email_outbox_ref_uuid"), "email_outbox", ["ref_uuid"], unique=False)
+    op.create_index(op.f("ix_email_outbox_created_by"), "email_outbox", ["created_by"], unique=False)
+    op.create_index(op.f("ix_email_outbox_updated_by"), "email_outbox", ["updated_by"], unique=False)
+    op.create_index(op.f("ix_email_outbox_deleted_by"), "email_outbox", ["deleted_by"], unique=False)
+    op.create_index(
+        "ix_email_outbox_ready",
+        "email_outbox",
+        ["next_attempt_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'sending')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_outbox_ready", table_name="email_outbox")
+    op.drop_index(op.f("ix_email_outbox_deleted_by"), table_name="email_outbox")
+    op.drop_index(op.f("ix_email_outbox_updated_by"), table_name="email_outbox")
+    op.drop_index(op.f("ix_email_outbox_created_by"), table_name="email_outbox")
+    op.drop_index(op.f("ix_email_outbox_ref_uuid"), table_name="email_outbox")
+    op.drop_index(op.f("ix_email_outbox_recipient_domain"), table_name="email_outbox")
+    op.drop_index(op.f("ix_email_outbox_id"), table_name="email_outbox")
+    op.drop_index(op.f("ix_email_outbox_uuid"), table_name="email_outbox")
+    op.drop_table("email_outbox")
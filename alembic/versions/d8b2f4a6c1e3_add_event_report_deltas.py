@@ -0,0 +1,59 @@
+"""add event_report_deltas
+
+Revision ID: d8b2f4a6c1e3
+Revises: c3e7a1d9f5b2
+Create Date: 2026-01-17 09:51:27.440318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b2f4a6c1e3'
+down_revision: Union[str, Sequence[str], None] = 'c3e7a1d9f5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_report_deltas",
+        sa.Column("event_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("delta", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by_role", sa.String(), nullable=True),
+        sa.Column("updated_by_role", sa.String(), nullable=True),
+        sa.Column("deleted_by_role", sa.String(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["event_uuid"], ["events.uuid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_event_report_deltas_event_uuid"), "event_report_deltas", ["event_uuid"], unique=False)
+    op.create_index(op.f("ix_event_report_deltas_uuid"), "event_report_deltas", ["uuid"], unique=True)
+    op.create_index(op.f("ix_event_report_deltas_id"), "event_report_deltas", ["id"], unique=False)
+    op.create_index(op.f("ix_event_report_deltas_created_by"), "event_report_deltas", ["created_by"], unique=False)
+    op.create_index(op.f("ix_event_report_deltas_updated_by"), "event_report_deltas", ["updated_by"], unique=False)
+    op.create_index(op.f("ix_event_report_deltas_deleted_by"), "event_report_deltas", ["deleted_by"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_event_report_deltas_deleted_by"), table_name="event_report_deltas")
+    op.drop_index(op.f("ix_event_report_deltas_updated_by"), table_name="event_report_deltas")
+    op.drop_index(op.f("ix_event_report_deltas_created_by"), table_name="event_report_deltas")
+    op.drop_index(op.f("ix_event_report_deltas_id"), table_name="event_report_deltas")
+    op.drop_index(op.f("ix_event_report_deltas_uuid"), table_name="event_report_deltas")
+    op.drop_index(op.f("ix_event_report_deltas_event_uuid"), table_name="event_report_deltas")
+    op.drop_table("event_report_deltas")
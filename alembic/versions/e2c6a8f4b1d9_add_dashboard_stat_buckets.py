@@ -0,0 +1,119 @@
+"""add dashboard stat buckets
+
+Revision ID: e2c6a8f4b1d9
+Revises: d8b2f4a6c1e3
+Create Date: 2026-01-18 10:12:05.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c6a8f4b1d9'
+down_revision: Union[str, Sequence[str], None] = 'd8b2f4a6c1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list:
+    return [
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by_role", sa.String(), nullable=True),
+        sa.Column("updated_by_role", sa.String(), nullable=True),
+        sa.Column("deleted_by_role", sa.String(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    ]
+
+
+def _counter_columns() -> list:
+    return [
+        sa.Column("granularity", sa.String(length=8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("verified_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("paid_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("completed_count", sa.Integer(), server_default="0", nullable=False),
+    ]
+
+
+def _base_indexes(table: str) -> None:
+    op.create_index(op.f(f"ix_{table}_uuid"), table, ["uuid"], unique=True)
+    op.create_index(op.f(f"ix_{table}_id"), table, ["id"], unique=False)
+    op.create_index(op.f(f"ix_{table}_created_by"), table, ["created_by"], unique=False)
+    op.create_index(op.f(f"ix_{table}_updated_by"), table, ["updated_by"], unique=False)
+    op.create_index(op.f(f"ix_{table}_deleted_by"), table, ["deleted_by"], unique=False)
+
+
+def _drop_base_indexes(table: str) -> None:
+    for column in ("deleted_by", "updated_by", "created_by", "id", "uuid"):
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_stat_buckets",
+        sa.Column("event_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("organizer_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        *_counter_columns(),
+        *_base_columns(),
+        sa.ForeignKeyConstraint(["event_uuid"], ["events.uuid"], ondelete="CASCADE"),
+        sa.UniqueConstraint("event_uuid", "granularity", "bucket_start", name="uq_event_stat_buckets_event_bucket"),
+    )
+    op.create_index(
+        "ix_event_stat_buckets_organizer_bucket",
+        "event_stat_buckets",
+        ["organizer_uuid", "granularity", "bucket_start"],
+        unique=False,
+    )
+    _base_indexes("event_stat_buckets")
+
+    op.create_table(
+        "organizer_stat_buckets",
+        sa.Column("organizer_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        *_counter_columns(),
+        *_base_columns(),
+        sa.ForeignKeyConstraint(["organizer_uuid"], ["organizers.uuid"], ondelete="CASCADE"),
+        sa.UniqueConstraint(
+            "organizer_uuid", "granularity", "bucket_start", name="uq_organizer_stat_buckets_organizer_bucket"
+        ),
+    )
+    _base_indexes("organizer_stat_buckets")
+
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+        *_base_columns(),
+        sa.UniqueConstraint("name"),
+    )
+    _base_indexes("rollup_watermarks")
+
+    op.create_index("ix_submissions_updated_at", "submissions", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submissions_updated_at", table_name="submissions")
+
+    _drop_base_indexes("rollup_watermarks")
+    op.drop_table("rollup_watermarks")
+
+    _drop_base_indexes("organizer_stat_buckets")
+    op.drop_table("organizer_stat_buckets")
+
+    _drop_base_indexes("event_stat_buckets")
+    op.drop_index("ix_event_stat_buckets_organizer_bucket", table_name="event_stat_buckets")
+    op.drop_table("event_stat_buckets")
@@ -0,0 +1,59 @@
+"""add submission_code_sequences
+
+Revision ID: e5a1c9d3b7f2
+Revises: d2e8b5f1a7c4
+Create Date: 2026-01-09 09:18:44.061392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c9d3b7f2'
+down_revision: Union[str, Sequence[str], None] = 'd2e8b5f1a7c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "submission_code_sequences",
+        sa.Column("event_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("next_value", sa.BigInteger(), server_default="1", nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_by_role", sa.String(), nullable=True),
+        sa.Column("updated_by_role", sa.String(), nullable=True),
+        sa.Column("deleted_by_role", sa.String(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["event_uuid"], ["events.uuid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_submission_code_sequences_event_uuid"), "submission_code_sequences", ["event_uuid"], unique=True)
+    op.create_index(op.f("ix_submission_code_sequences_uuid"), "submission_code_sequences", ["uuid"], unique=True)
+    op.create_index(op.f("ix_submission_code_sequences_id"), "submission_code_sequences", ["id"], unique=False)
+    op.create_index(op.f("ix_submission_code_sequences_created_by"), "submission_code_sequences", ["created_by"], unique=False)
+    op.create_index(op.f("ix_submission_code_sequences_updated_by"), "submission_code_sequences", ["updated_by"], unique=False)
+    op.create_index(op.f("ix_submission_code_sequences_deleted_by"), "submission_code_sequences", ["deleted_by"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_submission_code_sequences_deleted_by"), table_name="submission_code_sequences")
+    op.drop_index(op.f("ix_submission_code_sequences_updated_by"), table_name="submission_code_sequences")
+    op.drop_index(op.f("ix_submission_code_sequences_created_by"), table_name="submission_code_sequences")
+    op.drop_index(op.f("ix_submission_code_sequences_id"), table_name="submission_code_sequences")
+    op.drop_index(op.f("ix_submission_code_sequences_uuid"), table_name="submission_code_sequences")
+    op.drop_index(op.f("ix_submission_code_sequences_event_uuid"), table_name="submission_code_sequences")
+    op.drop_table("submission_code_sequences")
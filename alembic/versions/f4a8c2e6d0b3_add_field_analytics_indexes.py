@@ -0,0 +1,39 @@
+"""add field analytics indexes
+
+Revision ID: f4a8c2e6d0b3
+Revises: e2c6a8f4b1d9
+Create Date: 2026-01-19 14:03:41.592106
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a8c2e6d0b3'
+down_revision: Union[str, Sequence[str], None] = 'e2c6a8f4b1d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_submission_values_field_scalar",
+        "submission_values",
+        ["event_field_uuid", sa.text("(value #>> '{}')")],
+        unique=False,
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.create_index(
+        "ix_submissions_event_updated",
+        "submissions",
+        ["event_uuid", "updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submissions_event_updated", table_name="submissions")
+    op.drop_index("ix_submission_values_field_scalar", table_name="submission_values")
@@ -0,0 +1,29 @@
+"""add email_verified / rejected to submission_status
+
+Revision ID: f7b3d2a6c8e1
+Revises: e5a1c9d3b7f2
+Create Date: 2026-01-09 15:36:12.447809
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b3d2a6c8e1'
+down_revision: Union[str, Sequence[str], None] = 'e5a1c9d3b7f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ALTER TYPE ... ADD VALUE 不能與使用新值的語句在同一個 transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE submission_status ADD VALUE IF NOT EXISTS 'email_verified' AFTER 'pending'")
+        op.execute("ALTER TYPE submission_status ADD VALUE IF NOT EXISTS 'rejected' AFTER 'paid'")
+
+
+def downgrade() -> None:
+    # PostgreSQL 不支援移除 enum 值
+    pass
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.core.db import get_db
 from app.core.dependencies import get_current_super_admin
+from app.core.principal_cache import invalidate_principal
 
 from app.crud.user.crud_user import user_crud
 
@@ -73,6 +74,7 @@ def admin_soft_delete_user(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_super_admin)
 ):
+    invalidate_principal(db, uuid)
     deleted = user_crud.delete(db, uuid)
     if not deleted:
         raise HTTPException(404, "User not found")
@@ -109,7 +111,9 @@ def admin_disable_user(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_super_admin)
 ):
-    ok = user_crud.delete(db, uuid)
+    # 立即撤銷所有 worker 上的快取身分（commit 後廣播）
+    invalidate_principal(db, uuid)
+    ok = user_crud.set_active(db, uuid, False)
     if not ok:
         raise HTTPException(404, "User not found")
 
@@ -126,6 +130,7 @@ def admin_enable_user(
     db: Session = Depends(get_db),
     current_admin=Depends(get_current_super_admin),
 ):
+    invalidate_principal(db, uuid)
     ok = user_crud.set_active(db, uuid, True)
     if not ok:
         raise HTTPException(status_code=404, detail="User not found")
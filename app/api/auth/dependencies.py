@@ -3,20 +3,15 @@
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.db import get_db
 from app.core.jwt import decode_access_token
-from app.models.user.user import User
-from app.api.auth.identity import build_identity
+from app.core.membership_version import membership_versions
+from app.core.principal_cache import principal_cache
+from app.api.auth.identity import Principal, load_principal
 
-def get_current_user(
-    request: Request,
-    db: Session = Depends(get_db),
-) -> dict:
-    """
-    Unified auth dependency.
-    Returns a dict compatible with /auth/me response.
-    """
 
+def _decode_request_token(request: Request) -> dict:
     access_token = request.cookies.get("access_token")
     if not access_token:
         raise HTTPException(
@@ -25,23 +20,89 @@ def get_current_user(
         )
 
     payload = decode_access_token(access_token)
-    user_uuid = payload.get("sub")
-    if not user_uuid:
+    if not payload.get("sub"):
         raise HTTPException(
             status_code=401,
             detail="Invalid token",
         )
 
-    user = (
-        db.query(User)
-        .filter(User.uuid == user_uuid, User.is_deleted == False)
-        .first()
-    )
+    return payload
+
+
+def _resolve_principal(db: Session, user_uuid: str) -> Principal:
+    """
+    principal cache → load_principal()（cache miss 時只跑一條 SQL）
+    """
+    principal = principal_cache.get(user_uuid)
+    if principal is not None:
+        return principal
+
+    generation = principal_cache.generation
+
+    principal = load_principal(db, user_uuid)
+    if principal is None:
+        raise HTTPException(
+            status_code=404,
+            detail="User not found",
+        )
+
+    principal_cache.put(user_uuid, principal, generation=generation)
+    return principal
+
+
+def _principal_from_claims(db: Session, payload: dict) -> Principal:
+    """
+    JWT membership claims 模式：版本相符 → 直接以 claim 建立 Principal
+
+    版本不符代表 token 簽發後 membership 已異動 → 401，前端走 /auth/refresh 重新簽發
+    """
+    user_uuid = payload["sub"]
 
-    if not user:
+    current = membership_versions.current(db, user_uuid)
+    if current is None:
         raise HTTPException(
             status_code=404,
             detail="User not found",
         )
 
-    return build_identity(db, user)
\ No newline at end of file
+    if payload.get("mv") != current:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token membership outdated",
+            headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+        )
+
+    return Principal.from_claims(user_uuid, payload["m"], current)
+
+
+def get_current_user(
+    request: Request,
+    db: Session = Depends(get_db),
+) -> Principal:
+    """
+    Unified auth dependency.
+    Returns a Principal (dict-compatible with /auth/me response).
+
+    - claims 模式（settings.JWT_MEMBERSHIP_CLAIMS）且 token 帶 m / mv：
+      只比對 membership_version，不查 membership
+    - 其他：principal cache（見 app/core/principal_cache.py）
+    """
+    payload = _decode_request_token(request)
+
+    if settings.JWT_MEMBERSHIP_CLAIMS and "m" in payload and "mv" in payload:
+        return _principal_from_claims(db, payload)
+
+    return _resolve_principal(db, payload["sub"])
+
+
+def get_current_principal(
+    request: Request,
+    db: Session = Depends(get_db),
+) -> Principal:
+    """
+    完整 Principal（含 organizer 名稱），不使用 token claims
+
+    用於 /auth/me 等需要顯示資料的 endpoint
+    """
+    payload = _decode_request_token(request)
+    return _resolve_principal(db, payload["sub"])
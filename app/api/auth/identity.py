@@ -1,71 +1,257 @@
 # app/api/auth/identity.py
 
+"""
+Principal（登入者身分）
+
+說明：
+- load_principal()：單一 SQL statement 取出 user 狀態 + system roles
+  + organizer memberships（含 organizer 名稱），不經過 ORM relationship
+- Principal：不可變（frozen + __slots__），可安全放進 principal cache 共用
+- RBAC 判斷使用預先建好的 system_roles / organizer_roles（O(1)）
+- memberships / principal["uuid"] 等 dict 介面保留給 /auth/me 與舊 API
+- to_claims() / from_claims()：JWT membership claims 模式（settings.JWT_MEMBERSHIP_CLAIMS）
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.user.user import User
 from app.models.membership.system_membership import SystemMembership
 from app.models.membership.organizer_membership import OrganizerMembership
 from app.models.organizer.organizer import Organizer
 
 
-def build_identity(db: Session, user: User) -> dict:
-    """
-    Build identity payload for RBAC and /auth/me
-    """
+# =========================================================
+# Principal
+# =========================================================
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    uuid: str
+    email: str
+
+    # 有效的 system roles（已排除停用 / 停權）
+    system_roles: frozenset[str]
+
+    # organizer_uuid → membership role
+    organizer_roles: Mapping[str, str]
+
+    # organizer_uuid → organizer name（/auth/me 顯示用）
+    organizer_names: Mapping[str, str]
+
+    # 舊版 identity dict 的 memberships（順序：system → organizer）
+    memberships: tuple[dict, ...]
+
+    # users.membership_version（載入 / 簽發當下）
+    membership_version: int = 0
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        uuid,
+        email: str,
+        system_roles: Iterable[str],
+        organizers: Iterable[tuple[Any, Optional[str], str]],
+        membership_version: int = 0,
+    ) -> "Principal":
+        """
+        :param organizers: (organizer_uuid, organizer_name, membership_role)
+        """
+        system_roles = tuple(system_roles)
+        organizers = [(str(o_uuid), name, role) for o_uuid, name, role in organizers]
+
+        memberships = (
+            *(
+                {"type": "system", "role": role, "status": "active"}
+                for role in system_roles
+            ),
+            *(
+                {
+                    "type": "organizer",
+                    "organizer_uuid": o_uuid,
+                    "organizer_name": name,
+                    "membership_role": role,
+                }
+                for o_uuid, name, role in organizers
+            ),
+        )
+
+        return cls(
+            uuid=str(uuid),
+            email=email,
+            system_roles=frozenset(system_roles),
+            organizer_roles=MappingProxyType({o: r for o, _, r in organizers}),
+            organizer_names=MappingProxyType({o: n for o, n, _ in organizers}),
+            memberships=memberships,
+            membership_version=membership_version,
+        )
+
+    # -----------------------------------------------------
+    # JWT membership claims
+    # -----------------------------------------------------
+
+    def to_claims(self) -> dict:
+        """
+        精簡 claim：{"e": email, "s": [system roles], "o": ["<organizer_uuid>:<role>"]}
+        """
+        return {
+            "e": self.email,
+            "s": sorted(self.system_roles),
+            "o": [f"{o}:{r}" for o, r in self.organizer_roles.items()],
+        }
+
+    @classmethod
+    def from_claims(cls, user_uuid: str, claims: dict, membership_version: int) -> "Principal":
+        """
+        由 token claim 還原（organizer_name 不在 claim 內，為 None）
+        """
+        organizers = []
+        for pair in claims.get("o", ()):
+            organizer_uuid, _, role = pair.rpartition(":")
+            organizers.append((organizer_uuid, None, role))
+
+        return cls.build(
+            uuid=user_uuid,
+            email=claims.get("e", ""),
+            system_roles=claims.get("s", ()),
+            organizers=organizers,
+            membership_version=membership_version,
+        )
+
+    # -----------------------------------------------------
+    # RBAC lookups
+    # -----------------------------------------------------
+
+    def has_system_role(self, allowed_roles: Iterable[str]) -> bool:
+        return not self.system_roles.isdisjoint(allowed_roles)
+
+    def organizer_role(self, organizer_uuid) -> Optional[str]:
+        return self.organizer_roles.get(str(organizer_uuid))
+
+    # -----------------------------------------------------
+    # Legacy dict interface（identity["uuid"] / identity.get("memberships")）
+    # -----------------------------------------------------
+
+    _DICT_KEYS = ("uuid", "email", "memberships")
 
-    # ----------------------------
-    # System memberships
-    # ----------------------------
-    system_memberships = (
-        db.query(SystemMembership)
-        .filter(
-            SystemMembership.user_uuid == user.uuid,
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._DICT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._DICT_KEYS:
+            return default
+        return getattr(self, key)
+
+    def as_dict(self) -> dict:
+        """
+        /auth/me 回傳格式
+        """
+        return {
+            "uuid": self.uuid,
+            "email": self.email,
+            "name": None,
+            "role": "user",
+            "memberships": [dict(m) for m in self.memberships],
+        }
+
+
+# =========================================================
+# Loader（single statement）
+# =========================================================
+
+def _principal_statement(user_uuid):
+    system_roles = (
+        select(func.array_agg(SystemMembership.role))
+        .where(
+            SystemMembership.user_uuid == User.uuid,
             SystemMembership.is_deleted == False,
             SystemMembership.is_active == True,
             SystemMembership.is_suspended == False,
         )
-        .all()
+        .correlate(User)
+        .scalar_subquery()
     )
 
-    system_payload = [
-        {
-            "type": "system",
-            "role": m.role,
-            "status": "active",
-        }
-        for m in system_memberships
-    ]
-
-    # ----------------------------
-    # Organizer memberships
-    # ----------------------------
-    organizer_memberships = (
-        db.query(OrganizerMembership)
+    organizers = (
+        select(
+            func.json_agg(
+                func.json_build_array(
+                    OrganizerMembership.organizer_uuid,
+                    Organizer.name,
+                    OrganizerMembership.role,
+                )
+            )
+        )
+        .select_from(OrganizerMembership)
         .join(Organizer, Organizer.uuid == OrganizerMembership.organizer_uuid)
-        .filter(
-            OrganizerMembership.user_uuid == user.uuid,
+        .where(
+            OrganizerMembership.user_uuid == User.uuid,
             OrganizerMembership.is_deleted == False,
             OrganizerMembership.is_active == True,
             Organizer.is_deleted == False,
         )
-        .all()
+        .correlate(User)
+        .scalar_subquery()
     )
 
-    organizer_payload = [
-        {
-            "type": "organizer",
-            "organizer_uuid": str(m.organizer_uuid),
-            "organizer_name": m.organizer.name,
-            "membership_role": m.role,
-        }
-        for m in organizer_memberships
-    ]
-
-    return {
-        "uuid": str(user.uuid),
-        "email": user.email,
-        "memberships": [
-            *system_payload,
-            *organizer_payload,
-        ],
+    return select(
+        User.uuid,
+        User.email,
+        User.membership_version,
+        system_roles.label("system_roles"),
+        organizers.label("organizers"),
+    ).where(
+        User.uuid == user_uuid,
+        User.is_deleted == False,
+        User.is_active == True,
+    )
+
+
+def load_principal(db: Session, user_uuid) -> Optional[Principal]:
+    """
+    一次查詢載入 Principal；使用者不存在 / 已停用 → None
+    """
+    row = db.execute(_principal_statement(user_uuid)).one_or_none()
+    if row is None:
+        return None
+
+    return Principal.build(
+        uuid=row.uuid,
+        email=row.email,
+        system_roles=row.system_roles or (),
+        organizers=row.organizers or (),
+        membership_version=row.membership_version,
+    )
+
+
+def access_token_data(principal: Principal) -> dict:
+    """
+    access token payload（sub / type；claims 模式另帶 m / mv）
+    """
+    data = {
+        "sub": principal.uuid,
+        "type": "user",
     }
+
+    if settings.JWT_MEMBERSHIP_CLAIMS:
+        data["m"] = principal.to_claims()
+        data["mv"] = principal.membership_version
+
+    return data
+
+
+def build_identity(db: Session, user: User) -> Principal:
+    """
+    Legacy helper：由 User ORM 物件建立 identity
+
+    ⚠️ 新程式請直接使用 load_principal()
+    """
+    return load_principal(db, user.uuid)
@@ -1,16 +1,19 @@
 # app/api/auth/login.py
 
 from fastapi import APIRouter, Depends, HTTPException, Response, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 
 from app.core.db import get_db
-from app.core.security import verify_password
 from app.core.jwt import create_access_token
 from app.core.config import settings
+from app.core.password_hasher import password_hasher
+from app.api.auth.identity import access_token_data, load_principal
 
 from app.crud.user.crud_user import user_crud
 from app.crud.user.crud_refresh_token import refresh_token_crud
+from app.models.user.user import User
 
 router = APIRouter(tags=["Auth"])
 
@@ -22,11 +25,53 @@ class LoginSchema(BaseModel):
     email: EmailStr
     password: str
 
+
+# ------------------------------------------------------------
+# DB 部分（在 request threadpool 執行）
+# ------------------------------------------------------------
+def _issue_tokens(
+    db: Session,
+    user: User,
+    new_password_hash: str | None,
+    user_agent: str,
+) -> tuple[str, str]:
+    """
+    建立 access / refresh token；rehash 與 refresh token 同一次 commit
+    """
+    # 密碼 cost 已變更 → 寫回新 Hash
+    if new_password_hash:
+        user.password_hash = new_password_hash
+
+    if settings.JWT_MEMBERSHIP_CLAIMS:
+        principal = load_principal(db, user.uuid)
+        if principal is None:
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        token_data = access_token_data(principal)
+    else:
+        token_data = {
+            "sub": str(user.uuid),
+            "type": "user",   # optional：未來擴充用
+        }
+
+    access_token = create_access_token(token_data)
+
+    refresh_token_obj = refresh_token_crud.create_token(
+        db=db,
+        user_uuid=user.uuid,
+        user_agent=user_agent,
+        commit=False,
+    )
+    refresh_token = refresh_token_obj.token
+
+    db.commit()
+    return access_token, refresh_token
+
+
 # ------------------------------------------------------------
 # Unified Login API
 # ------------------------------------------------------------
 @router.post("/login")
-def unified_login(
+async def unified_login(
     data: LoginSchema,
     response: Response,
     request: Request,
@@ -36,33 +81,39 @@ def unified_login(
     統一登入 API
     - 只負責身份驗證
     - 不處理角色、不處理平台
+
+    ⚠️ async endpoint：
+    - DB 操作丟到 request threadpool
+    - bcrypt 在專用 hashing executor（滿載時 503，不佔用其他 API 的 thread）
     """
 
     # 1. 查詢使用者
-    user = user_crud.get_by_email(db, data.email)
+    user = await run_in_threadpool(user_crud.get_for_login, db, data.email)
 
     # ⚠️ 不暴露帳號是否存在
-    if not user or not user.password_hash:
+    if not user or not user.password_hash or not user.is_active:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    # 2. 驗證密碼
-    if not verify_password(data.password, user.password_hash):
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+    user_uuid, user_email = str(user.uuid), user.email
 
-    # 3. 建立 Access Token（只放 identity）
-    access_token = create_access_token({
-        "sub": str(user.uuid),
-        "type": "user",   # optional：未來擴充用
-    })
+    # 2. 驗證密碼（cost 變更時同時取得新 Hash）
+    valid, new_password_hash = await password_hasher.verify_and_update(
+        data.password,
+        user.password_hash,
+    )
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    # 4. 建立 Refresh Token
-    refresh_token_obj = refresh_token_crud.create_token(
-        db=db,
-        user_uuid=user.uuid,
-        user_agent=request.headers.get("User-Agent", "unknown"),
+    # 3. 建立 Access / Refresh Token（單次 commit，不再 refresh）
+    access_token, refresh_token = await run_in_threadpool(
+        _issue_tokens,
+        db,
+        user,
+        new_password_hash,
+        request.headers.get("User-Agent", "unknown"),
     )
 
-    # 5. 寫入 Cookie
+    # 4. 寫入 Cookie
     response.set_cookie(
         key="access_token",
         value=access_token,
@@ -74,19 +125,18 @@ def unified_login(
 
     response.set_cookie(
         key="refresh_token",
-        value=refresh_token_obj.token,
+        value=refresh_token,
         httponly=True,
         secure=settings.COOKIE_SECURE,
         samesite="lax",
         max_age=60 * 60 * 24 * 30,
     )
 
-    # 6. 回傳登入成功（不含 token）
+    # 5. 回傳登入成功（不含 token）
     return {
         "success": True,
         "user": {
-            "uuid": str(user.uuid),
-            "email": user.email,
+            "uuid": user_uuid,
+            "email": user_email,
         },
     }
-
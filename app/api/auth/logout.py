@@ -1,16 +1,35 @@
 # app/api/auth/logout.py
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.jwt import decode_access_token, revoke_access_token
 
 router = APIRouter()
 
 
 @router.post("/logout")
-def logout(response: Response):
+def logout(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """
-    登出：清除 access_token、refresh_token Cookie
+    登出：撤銷目前的 access token（jti deny-list），並清除 Cookie
     """
 
+    access_token = request.cookies.get("access_token")
+    if access_token:
+        try:
+            payload = decode_access_token(access_token)
+        except HTTPException:
+            # 已過期 / 無效 / 已撤銷：不需再撤銷
+            payload = None
+
+        if payload:
+            revoke_access_token(db, payload, reason="logout")
+
     response.delete_cookie(
         key="access_token",
         path="/",
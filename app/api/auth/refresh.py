@@ -2,11 +2,11 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from datetime import datetime
 
 from app.core.db import get_db
+from app.core.config import settings
 from app.core.jwt import create_access_token
-from app.models.user.user import User
+from app.api.auth.identity import access_token_data, load_principal
 from app.crud.user.crud_refresh_token import refresh_token_crud
 
 router = APIRouter(tags=["Auth"])
@@ -20,6 +20,9 @@ def refresh_access_token(
 ):
     """
     使用 refresh_token 換取新的 access_token。
+
+    JWT membership claims 模式下，membership_version 不符的 access token
+    會被拒絕（401 Token membership outdated），前端改打此 API 取得新 claim。
     """
 
     # 1. 從 cookie 取得 refresh_token
@@ -29,21 +32,18 @@ def refresh_access_token(
         raise HTTPException(status_code=401, detail="Refresh token missing")
 
     # 2. 查詢 DB refresh token
-    db_token = refresh_token_crud.get_by_token(db, refresh_token)
+    db_token = refresh_token_crud.get_valid_token(db, refresh_token)
 
     if not db_token:
         raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
 
-    # 3. 查詢 user
-    user = db.query(User).filter(User.id == db_token.user_id).first()
-    if not user:
+    # 3. 重新載入 principal（最新 membership + membership_version）
+    principal = load_principal(db, db_token.user_uuid)
+    if principal is None:
         raise HTTPException(status_code=401, detail="User not found")
 
     # 4. 建立新的 Access Token
-    new_access_token = create_access_token({
-        "sub": str(user.uuid),
-        "role": user.role
-    })
+    new_access_token = create_access_token(access_token_data(principal))
 
     # 5. 寫回 Cookie（覆蓋舊的 access_token）
     response.set_cookie(
@@ -51,7 +51,7 @@ def refresh_access_token(
         value=new_access_token,
         httponly=True,
         samesite="lax",
-        secure=False,   # 本地測試用，部署 Cloud Run 改成 True
+        secure=settings.COOKIE_SECURE,
         max_age=60 * 15,  # 15 分鐘
     )
 
@@ -59,8 +59,8 @@ def refresh_access_token(
         "success": True,
         "access_token": new_access_token,
         "user": {
-            "uuid": str(user.uuid),
-            "email": user.email,
-            "role": user.role
+            "uuid": principal.uuid,
+            "email": principal.email,
+            "role": "user",
         }
     }
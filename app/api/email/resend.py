@@ -8,11 +8,10 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
-from app.core.config import settings
 from app.models.auth.email_verification import EmailVerification
 from app.models.submission.submission import Submission
 
-from app.api.utils.email_verification_mailer import send_verification_email
+from app.api.utils.email_verification_mailer import enqueue_verification_email
 
 router = APIRouter()
 
@@ -177,15 +176,18 @@ def resend_verification_email(
     )
 
     db.add(ev)
-    db.commit()
-    db.refresh(ev)
 
     # --------------------------------------------------
-    # 5️⃣ 發送驗證信
+    # 5️⃣ 驗證信寫入 outbox（與新 token 一起 commit）
     # --------------------------------------------------
-    send_verification_email(
+    enqueue_verification_email(
+        db,
         to_email=submission.user_email,
         token=token,
+        ref_type="submission",
+        ref_uuid=submission.uuid,
     )
 
+    db.commit()
+
     return ResendEmailResponse(status="sent")
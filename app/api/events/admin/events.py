@@ -8,14 +8,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.core.db import get_db
 from app.core.dependencies import require_super_admin
 
 from app.models.event.event import Event
+from app.crud.base.loader_profiles import with_loader_profile, reload_with_profile
+from app.crud.base.pagination import paginate_query
+from app.services.event.snapshot import refresh_event_snapshot
 from app.schemas.event.core.event_response import EventResponse
 from app.schemas.event.core.event_status_update import EventStatusUpdate
-from app.schemas.common.pagination import PaginatedResponse
+from app.schemas.common.pagination import PaginatedResponse, PaginationMode, TotalMode
 
 
 router = APIRouter(
@@ -30,6 +34,9 @@ router = APIRouter(
 def list_events_admin(
     page: int = 1,
     page_size: int = 20,
+    paginate: PaginationMode = "offset",
+    cursor: Optional[str] = None,
+    count: TotalMode = "none",
     db: Session = Depends(get_db),
     _admin=Depends(require_super_admin),
 ):
@@ -38,20 +45,19 @@ def list_events_admin(
     """
     query = db.query(Event).filter(Event.is_deleted == False)
 
-    total = query.count()
-    events = (
-        query
-        .order_by(Event.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    result = paginate_query(
+        with_loader_profile(query, "event.detail"),
+        keys=(Event.created_at, Event.id),
+        mode=paginate,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        count=count,
     )
 
     return PaginatedResponse(
-        items=[EventResponse.model_validate(e) for e in events],
-        total=total,
-        page=page,
-        page_size=page_size,
+        items=[EventResponse.model_validate(e) for e in result.items],
+        **result.meta(),
     )
 
 
@@ -71,7 +77,7 @@ def update_event_status_admin(
     """
 
     event = (
-        db.query(Event)
+        with_loader_profile(db.query(Event), "event.row")
         .filter(Event.uuid == event_uuid, Event.is_deleted == False)
         .first()
     )
@@ -80,7 +86,8 @@ def update_event_status_admin(
         raise HTTPException(status_code=404, detail="Event not found")
 
     event.status = data.status
+    refresh_event_snapshot(db, event.uuid)
     db.commit()
-    db.refresh(event)
+    event = reload_with_profile(db, event, "event.detail")
 
     return EventResponse.model_validate(event)
\ No newline at end of file
@@ -8,6 +8,8 @@ from app.core.db import get_db
 from app.core.dependencies import require_organizer_admin
 
 from app.crud.event.crud_event_field import event_field_crud
+from app.services.event.snapshot import refresh_event_snapshot
+from app.services.submission.form_validator import bump_fields_version
 
 from app.schemas.event.field.event_field_create import EventFieldCreate
 from app.schemas.event.field.event_field_response import EventFieldResponse
@@ -49,4 +51,11 @@ def create_event_field(
         created_by=membership.user_uuid,
         created_by_role=membership.role,
     )
+
+    # 同一個 transaction：validator 快取版本 + 公開活動快照（EventPublic.fields）
+    bump_fields_version(db, event_uuid)
+    refresh_event_snapshot(db, event_uuid)
+
+    db.commit()
+    db.refresh(obj)
     return EventFieldResponse.model_validate(obj)
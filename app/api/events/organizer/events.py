@@ -7,7 +7,9 @@ from uuid import UUID
 from app.core.db import get_db
 from app.core.dependencies import require_organizer_admin
 
+from app.crud.base.loader_profiles import reload_with_profile
 from app.crud.event.crud_event import event_crud
+from app.services.event.snapshot import refresh_event_snapshot
 
 from app.schemas.event.core.event_create import EventCreate
 from app.schemas.event.core.event_update import EventUpdate
@@ -80,12 +82,15 @@ def update_event(
     if not obj or obj.organizer_uuid != membership.organizer_uuid:
         raise HTTPException(404, "Event not found")
 
-    obj = event_crud.update(
-        db,
-        db_obj=obj,
-        data=data,
-        updated_by=membership.user_uuid,
-        updated_by_role=membership.role,
-    )
+    for field, value in data.model_dump(exclude_unset=True).items():
+        setattr(obj, field, value)
+
+    obj.updated_by = membership.user_uuid
+    obj.updated_by_role = membership.role
+
+    refresh_event_snapshot(db, obj.uuid)
+
+    db.commit()
+    obj = reload_with_profile(db, obj, "event.detail")
 
     return EventResponse.model_validate(obj)
\ No newline at end of file
@@ -0,0 +1,133 @@
+# app/api/events/organizer/reports.py
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from uuid import UUID
+from starlette import status
+
+from app.core.db import get_db
+from app.core.dependencies import require_organizer_admin
+
+from app.models.event.event import Event
+from app.schemas.event.report.event_report import EventReportResponse
+from app.schemas.event.report.field_analytics import EventFieldAnalyticsResponse
+
+from app.services.event.field_analytics import get_field_analytics
+from app.services.event.report_aggregator import get_event_report, rebuild_event_report
+
+from app.exceptions.base import ActiFlowBusinessException
+
+# ============================================================
+# Organizer Event Report
+#
+# - 讀取 event_report_cache（增量維護）+ 尚未併入的 deltas
+#   → 成本與報名數無關
+# - rebuild：從報名資料重算（修復用；lock 忙碌 → 409）
+# - fields：欄位答案分析（DB 內聚合，依報名 fingerprint 快取）
+# ============================================================
+
+router = APIRouter(
+    prefix="/organizer/{organizer_uuid}/events/{event_uuid}/report",
+    tags=["Organizer - Reports"],
+)
+
+
+def _ensure_event(db: Session, event_uuid: UUID, organizer_uuid: UUID) -> None:
+    # ⚠️ 核心安全條件：event 必須屬於該 organizer
+    exists = db.execute(
+        select(Event.id).where(
+            Event.uuid == event_uuid,
+            Event.organizer_uuid == organizer_uuid,
+            Event.is_deleted == False,
+        )
+    ).first()
+
+    if exists is None:
+        raise ActiFlowBusinessException(
+            message="Event not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+
+def _response(event_uuid: UUID, report: dict) -> EventReportResponse:
+    return EventReportResponse(
+        event_uuid=event_uuid,
+        total_submissions=report["total"],
+        summary_json=report,
+    )
+
+
+# -------------------------------------------------------------------
+# A. 取得活動統計  Get event report (organizer admin)
+# -------------------------------------------------------------------
+@router.get("", response_model=EventReportResponse)
+def get_event_report_summary(
+    organizer_uuid: UUID,   # 僅作為 routing，不信任
+    event_uuid: UUID,
+    db: Session = Depends(get_db),
+    membership=Depends(require_organizer_admin),
+):
+    """
+    Organizer Admin / Owner：
+    報名總數、各狀態、每日、各票種名額、選項分布
+    """
+    _ensure_event(db, event_uuid, membership.organizer_uuid)
+
+    return _response(event_uuid, get_event_report(db, event_uuid))
+
+
+# -------------------------------------------------------------------
+# B. 重算活動統計  Rebuild event report (organizer admin)
+# -------------------------------------------------------------------
+@router.post("/rebuild", response_model=EventReportResponse)
+def rebuild_event_report_summary(
+    organizer_uuid: UUID,   # 僅作為 routing，不信任
+    event_uuid: UUID,
+    db: Session = Depends(get_db),
+    membership=Depends(require_organizer_admin),
+):
+    """
+    Organizer Admin / Owner：
+    從報名資料重算（修復用）
+
+    - 重算與所有活動的 fold 共用一把全域 lock：忙碌時不等待，回 409（稍後再試）
+    """
+    _ensure_event(db, event_uuid, membership.organizer_uuid)
+
+    report = rebuild_event_report(db, event_uuid, wait=False)
+    if report is None:
+        raise ActiFlowBusinessException(
+            message="Report aggregation is in progress, please retry later",
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    db.commit()
+
+    return _response(event_uuid, report)
+
+
+# -------------------------------------------------------------------
+# C. 欄位答案分析  Field answer analytics (organizer admin)
+# -------------------------------------------------------------------
+@router.get("/fields", response_model=EventFieldAnalyticsResponse)
+def get_event_field_analytics(
+    organizer_uuid: UUID,   # 僅作為 routing，不信任
+    event_uuid: UUID,
+    db: Session = Depends(get_db),
+    membership=Depends(require_organizer_admin),
+):
+    """
+    Organizer Admin / Owner：
+    選項分布 / 數值統計（min / max / avg / 百分位數）/ 填答率
+
+    報名沒有異動時只需一條 index 查詢（快取命中）
+    """
+    # 範圍條件在 fingerprint 查詢內（event 必須屬於該 organizer）
+    analytics = get_field_analytics(db, event_uuid, organizer_uuid=membership.organizer_uuid)
+    if analytics is None:
+        raise ActiFlowBusinessException(
+            message="Event not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    return EventFieldAnalyticsResponse(event_uuid=event_uuid, **analytics)
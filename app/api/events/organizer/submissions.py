@@ -1,31 +1,44 @@
 # app/api/events/organizer/submissions.py
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from uuid import UUID
 from starlette import status
+from typing import Literal, Optional
 
 from app.core.db import get_db
+from app.core.conditional import list_validators
 from app.core.dependencies import require_organizer_admin
 
+from app.models.event.event import Event
+from app.models.submission.enums import SubmissionStatus
 from app.models.submission.submission import Submission
 from app.schemas.submission.submission_response import SubmissionResponse
-from app.schemas.common.pagination import PaginatedResponse
-
-from app.crud.submission.crud_submission import submission_crud
-from app.crud.submission.crud_submission_status import assert_status_transition
-
+from app.schemas.submission.submission_import import SubmissionImportResponse, SubmissionImportRowError
+from app.schemas.submission.submission_search import SubmissionSearchHit, SubmissionSearchResponse
+from app.schemas.common.pagination import PaginatedResponse, PaginationMode, TotalMode
+
+from app.crud.base.loader_profiles import loader_options, with_loader_profile
+from app.crud.base.pagination import paginate_query
+from app.crud.submission.crud_submission_status import transition_submission
+
+from app.services.submission.export import iter_submission_export, load_export_fields
+from app.services.submission.importer import ImportFileError, import_submissions
+from app.services.submission.answers import READ_DOCUMENT, answer_value_context
+from app.services.event.report_aggregator import record_status_changes
+from app.services.submission.search import MIN_QUERY_LENGTH, search_submissions
+from app.services.email.outbox_worker import wake_outbox_worker
 from app.services.submission.notification import notify_submission_rejected, notify_submission_reopened, notify_submission_completed
-import logging
 
 from app.exceptions.base import ActiFlowBusinessException
+from app.exceptions.submission import SubmissionTransitionConflict
 
 router = APIRouter(
     prefix="/organizer/{organizer_uuid}/events/{event_uuid}/submissions",
     tags=["Organizer - Submissions"],
 )
-logger = logging.getLogger("submission.commands")
 
 class SubmissionReasonPayload(BaseModel):
     reason: str = Field(..., min_length=1, max_length=500)
@@ -37,14 +50,22 @@ class SubmissionReasonPayload(BaseModel):
 def list_event_submissions(
     organizer_uuid: UUID,   # 僅作為 routing，不信任
     event_uuid: UUID,
+    request: Request,
+    response: Response,
     page: int = 1,
     page_size: int = 20,
+    paginate: PaginationMode = "offset",
+    cursor: Optional[str] = None,
+    count: TotalMode = "none",
     db: Session = Depends(get_db),
     membership=Depends(require_organizer_admin),
 ):
     """
     Organizer Admin / Owner：
     取得某活動的報名資料
+
+    Conditional GET：狀態變更 / 新報名 / 匯入都會改變 fingerprint，
+    前端輪詢在沒有異動時只花一條聚合查詢（304）
     """
 
     # ⚠️ 核心安全條件：event 必須屬於該 organizer
@@ -58,20 +79,28 @@ def list_event_submissions(
         )
     )
 
-    total = query.count()
-    submissions = (
-        query
-        .order_by(Submission.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    validators = list_validators(
+        request, query, Submission.updated_at, scope=membership.organizer_uuid
     )
-
-    return PaginatedResponse(
-        items=[SubmissionResponse.model_validate(s) for s in submissions],
-        total=total,
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    validators.apply(response)
+
+    result = paginate_query(
+        with_loader_profile(query, "submission.answers" if READ_DOCUMENT else "submission.review"),
+        keys=(Submission.created_at, Submission.id),
+        mode=paginate,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count=count,
+    )
+
+    context = answer_value_context(db, event_uuid)
+    return PaginatedResponse(
+        items=[SubmissionResponse.model_validate(s, context=context) for s in result.items],
+        **result.meta(),
     )
 
 
@@ -83,74 +112,51 @@ def approve_submission(
     organizer_uuid: UUID,   # 僅 routing，不信任
     event_uuid: UUID,
     submission_uuid: UUID,
+    expected_version: Optional[int] = None,
     db: Session = Depends(get_db),
     membership=Depends(require_organizer_admin),
 ):
     """
     Organizer Admin / Owner：
     審核報名（paid -> completed）
-    """
 
-    # --------------------------------------------------------
-    # 1. 取得 Submission（統一使用 CRUD）
-    # --------------------------------------------------------
-    submission = submission_crud.get_by_uuid(db, submission_uuid)
-    if not submission:
-        raise ActiFlowBusinessException(
-            message="Submission not found",
-            status_code=status.HTTP_404_NOT_FOUND,
-        )
+    - expected_version：畫面上的 submission.version；已被他人異動 → 409
+    """
 
     # --------------------------------------------------------
-    # 2. 核心安全條件（submission 必須屬於該 event）
+    # 1. 狀態轉換（單一 UPDATE：範圍 + 狀態 + version 一起檢查）
     # --------------------------------------------------------
-    if submission.event_uuid != event_uuid:
-        raise ActiFlowBusinessException(
-            message="Submission does not belong to this event",
-            status_code=status.HTTP_403_FORBIDDEN,
-        )
+    result = transition_submission(
+        db,
+        submission_uuid,
+        "completed",
+        event_uuid=event_uuid,
+        organizer_uuid=membership.organizer_uuid,
+        expected_version=expected_version,
+    )
+    if not result.ok:
+        raise SubmissionTransitionConflict(result)
 
-    # --------------------------------------------------------
-    # 3. 狀態轉換檢查（domain rule）
-    # --------------------------------------------------------
-    try:
-        assert_status_transition(
-            current=submission.status,
-            target="completed",
-        )
-    except Exception as e:
-        raise ActiFlowBusinessException(
-            message=str(e),
-            status_code=status.HTTP_409_CONFLICT,
-        )
+    submission = result.submission
+    record_status_changes(db, [submission])
 
     # --------------------------------------------------------
-    # 4. 推進狀態
+    # 2. Email notification（寫入 outbox，與狀態變更同一個 transaction）
     # --------------------------------------------------------
-    submission.status = "completed"
+    notify_submission_completed(
+        db=db,
+        submission=submission,
+    )
 
     db.commit()
-    db.refresh(submission)
-
-    # --------------------------------------------------------
-    # 5. Email notification (side effect)
-    # --------------------------------------------------------
-    try:
-        notify_submission_completed(
-            db=db,
-            submission=submission,
-        )
-    except Exception:
-        logger.exception(
-            f"Failed to send approval email for submission {submission.uuid}"
-        )
 
     # --------------------------------------------------------
-    # 6. Command-style response
+    # 3. Command-style response
     # --------------------------------------------------------
     return {
         "submission_uuid": str(submission.uuid),
         "status": submission.status,
+        "version": submission.version,
     }
 
 
@@ -163,6 +169,7 @@ def reject_submission(
     event_uuid: UUID,
     submission_uuid: UUID,
     payload: SubmissionReasonPayload,
+    expected_version: Optional[int] = None,
     db: Session = Depends(get_db),
     membership=Depends(require_organizer_admin),
 ):
@@ -172,69 +179,45 @@ def reject_submission(
     """
 
     # --------------------------------------------------------
-    # 1. 取得 Submission
+    # 1. 狀態轉換
     # --------------------------------------------------------
-    submission = submission_crud.get_by_uuid(db, submission_uuid)
-    if not submission:
-        raise ActiFlowBusinessException(
-            message="Submission not found",
-            status_code=status.HTTP_404_NOT_FOUND,
-        )
+    result = transition_submission(
+        db,
+        submission_uuid,
+        "rejected",
+        event_uuid=event_uuid,
+        organizer_uuid=membership.organizer_uuid,
+        expected_version=expected_version,
+        values={
+            "status_reason": payload.reason,
+            "notes": None,
+        },
+    )
+    if not result.ok:
+        raise SubmissionTransitionConflict(result)
 
-    # --------------------------------------------------------
-    # 2. 核心安全條件
-    # --------------------------------------------------------
-    if submission.event_uuid != event_uuid:
-        raise ActiFlowBusinessException(
-            message="Submission does not belong to this event",
-            status_code=status.HTTP_403_FORBIDDEN,
-        )
+    submission = result.submission
+    record_status_changes(db, [submission])
 
     # --------------------------------------------------------
-    # 3. 狀態轉換檢查（domain）
+    # 2. Email notification（outbox）
     # --------------------------------------------------------
-    try:
-        assert_status_transition(
-            current=submission.status,
-            target="rejected",
-        )
-    except Exception as e:
-        raise ActiFlowBusinessException(
-            message=str(e),
-            status_code=status.HTTP_409_CONFLICT,
-        )
-
-    # --------------------------------------------------------
-    # 4. 推進狀態
-    # --------------------------------------------------------
-    submission.status = "rejected"
-    submission.status_reason = payload.reason
-    submission.notes = None
+    notify_submission_rejected(
+        db=db,
+        submission=submission,
+    )
 
     db.commit()
-    db.refresh(submission)
-
-    # --------------------------------------------------------
-    # 5. Side effect: email notification (non-blocking)
-    # --------------------------------------------------------
-    try:
-        notify_submission_rejected(
-            db=db,
-            submission=submission,
-        )
-    except Exception:
-        logger.exception(
-            f"Failed to send rejection email for submission {submission.uuid}"
-        )
 
     # --------------------------------------------------------
-    # 6. Command-style response
+    # 3. Command-style response
     # --------------------------------------------------------
     return {
         "submission_uuid": str(submission.uuid),
         "status": submission.status,
         "notes": submission.notes,
         "status_reason": submission.status_reason,
+        "version": submission.version,
     }
 
 # -------------------------------------------------------------------
@@ -246,6 +229,7 @@ def reopen_submission(
     event_uuid: UUID,
     submission_uuid: UUID,
     payload: SubmissionReasonPayload,
+    expected_version: Optional[int] = None,
     db: Session = Depends(get_db),
     membership=Depends(require_organizer_admin),
 ):
@@ -259,70 +243,255 @@ def reopen_submission(
     """
 
     # --------------------------------------------------------
-    # 1. 取得 Submission
+    # 1. 狀態轉換
     # --------------------------------------------------------
-    submission = submission_crud.get_by_uuid(db, submission_uuid)
-    if not submission:
-        raise ActiFlowBusinessException(
-            message="Submission not found",
-            status_code=status.HTTP_404_NOT_FOUND,
-        )
+    # status_reason = 對「使用者 / 外部」的官方理由（reject）
+    # notes         = 對「內部 / organizer / admin」的操作備註（reopen）
+    # --------------------------------------------------------
+    result = transition_submission(
+        db,
+        submission_uuid,
+        "paid",
+        event_uuid=event_uuid,
+        organizer_uuid=membership.organizer_uuid,
+        expected_version=expected_version,
+        values={
+            "status_reason": None,
+            "notes": payload.reason,
+        },
+    )
+    if not result.ok:
+        raise SubmissionTransitionConflict(result)
+
+    submission = result.submission
+    record_status_changes(db, [submission])
 
     # --------------------------------------------------------
-    # 2. 核心安全條件（必須屬於該 event）
+    # 2. Email notification（outbox）
     # --------------------------------------------------------
-    if submission.event_uuid != event_uuid:
-        raise ActiFlowBusinessException(
-            message="Submission does not belong to this event",
-            status_code=status.HTTP_403_FORBIDDEN,
-        )
+    notify_submission_reopened(
+        db=db,
+        submission=submission,
+    )
+
+    db.commit()
 
     # --------------------------------------------------------
-    # 3. 狀態轉換檢查（domain rule）
+    # 3. Command-style response
     # --------------------------------------------------------
-    try:
-        assert_status_transition(
-            current=submission.status,
-            target="paid",
+    return {
+        "submission_uuid": str(submission.uuid),
+        "status": submission.status,
+        "notes": submission.notes,
+        "status_reason": submission.status_reason,
+        "version": submission.version,
+    }
+
+
+# -------------------------------------------------------------------
+# E. 匯出報名資料  Export submissions (streaming CSV / JSONL)
+# -------------------------------------------------------------------
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+@router.get("/export")
+def export_event_submissions(
+    organizer_uuid: UUID,   # routing only
+    event_uuid: UUID,
+    format: Literal["csv", "jsonl", "xlsx"] = "csv",
+    header: Literal["label", "key"] = "label",
+    # enum 驗證在 streaming 開始前完成（不合法 → 422，而不是中斷的 200）
+    status_filter: Optional[SubmissionStatus] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    membership=Depends(require_organizer_admin),
+):
+    """
+    Organizer Admin / Owner：
+    串流匯出活動報名資料
+
+    - 每筆 submission 一列，SubmissionValue 依 EventField 順序展開為欄位（僅啟用中的欄位，可直接匯回）
+    - server-side cursor 分段讀取，記憶體不隨報名筆數成長
+    """
+
+    # --------------------------------------------------------
+    # 1. 核心安全條件：event 必須屬於該 organizer
+    # --------------------------------------------------------
+    event = (
+        db.query(Event.uuid, Event.event_code)
+        .filter(
+            Event.uuid == event_uuid,
+            Event.organizer_uuid == membership.organizer_uuid,
+            Event.is_deleted == False,
         )
-    except Exception as e:
+        .first()
+    )
+    if not event:
         raise ActiFlowBusinessException(
-            message=str(e),
-            status_code=status.HTTP_409_CONFLICT,
+            message="Event not found",
+            status_code=status.HTTP_404_NOT_FOUND,
         )
 
     # --------------------------------------------------------
-    # 4. 推進狀態
+    # 2. 欄位順序（pivot columns）
     # --------------------------------------------------------
-    # status_reason = 對「使用者 / 外部」的官方理由（reject）
-    # notes         = 對「內部 / organizer / admin」的操作備註（reopen）
+    fields = load_export_fields(db, event_uuid)
+
     # --------------------------------------------------------
-    submission.status = "paid"
-    submission.status_reason = None
-    submission.notes = payload.reason
+    # 3. Streaming response
+    # --------------------------------------------------------
+    return StreamingResponse(
+        iter_submission_export(
+            event_uuid,
+            fields=fields,
+            fmt=format,
+            header=header,
+            status=status_filter,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{event.event_code}-submissions.{format}"',
+        },
+    )
 
-    db.commit()
-    db.refresh(submission)
+
+# -------------------------------------------------------------------
+# F. 匯入報名資料  Import submissions (CSV / JSONL, COPY + set-based merge)
+# -------------------------------------------------------------------
+@router.post("/import", response_model=SubmissionImportResponse)
+def import_event_submissions(
+    organizer_uuid: UUID,   # routing only
+    event_uuid: UUID,
+    file: UploadFile = File(...),
+    format: Optional[Literal["csv", "jsonl"]] = None,
+    skip_verification: bool = False,
+    dedupe: bool = True,
+    db: Session = Depends(get_db),
+    membership=Depends(require_organizer_admin),
+):
+    """
+    Organizer Admin / Owner：
+    批次匯入線下 / 合作夥伴收集的報名
+
+    - 欄位以 EventField.field_key 或 label 對應（匯出檔可直接匯回）
+    - 不合法的列略過並逐列回報；合法的列一次寫入
+    - skip_verification=true：視為已驗證（email_verified），不寄驗證信
+    - format 未指定時依副檔名判斷
+    """
 
     # --------------------------------------------------------
-    # 5. Side effect: email notification (non-blocking)
+    # 1. 核心安全條件：event 必須屬於該 organizer
     # --------------------------------------------------------
-    try:
-        notify_submission_reopened(
-            db=db,
-            submission=submission,
+    event = (
+        db.query(Event.uuid, Event.event_code)
+        .filter(
+            Event.uuid == event_uuid,
+            Event.organizer_uuid == membership.organizer_uuid,
+            Event.is_deleted == False,
         )
-    except Exception:
-        logger.exception(
-            f"Failed to send reopen email for submission {submission.uuid}"
+        .first()
+    )
+    if not event:
+        raise ActiFlowBusinessException(
+            message="Event not found",
+            status_code=status.HTTP_404_NOT_FOUND,
         )
 
+    if format is None:
+        format = "jsonl" if (file.filename or "").lower().endswith((".jsonl", ".ndjson")) else "csv"
+
     # --------------------------------------------------------
-    # 6. Command-style response
+    # 2. 驗證 + COPY + merge（同一個 transaction）
     # --------------------------------------------------------
-    return {
-        "submission_uuid": str(submission.uuid),
-        "status": submission.status,
-        "notes": submission.notes,
-        "status_reason": submission.status_reason,
-    }
+    try:
+        report = import_submissions(
+            db,
+            event_uuid=event.uuid,
+            event_code=event.event_code,
+            stream=file.file,
+            fmt=format,
+            skip_verification=skip_verification,
+            dedupe=dedupe,
+        )
+    except ImportFileError as exc:
+        db.rollback()
+        raise ActiFlowBusinessException(
+            message=str(exc),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    db.commit()
+
+    if report.verification_emails:
+        wake_outbox_worker()
+
+    return SubmissionImportResponse(
+        batch_id=report.batch_id,
+        total_rows=report.total_rows,
+        imported=report.imported,
+        failed=report.failed,
+        duplicates=report.duplicates,
+        verification_emails=report.verification_emails,
+        errors=[
+            SubmissionImportRowError(row=row, errors=errors)
+            for row, errors in report.errors
+        ],
+        errors_truncated=report.errors_truncated,
+    )
+
+
+# -------------------------------------------------------------------
+# G. 搜尋報名  Search submissions (email / code / answers, pg_trgm)
+# -------------------------------------------------------------------
+@router.get("/search", response_model=SubmissionSearchResponse)
+def search_event_submissions(
+    organizer_uuid: UUID,   # routing only
+    event_uuid: UUID,
+    q: str = Query(..., min_length=MIN_QUERY_LENGTH, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    membership=Depends(require_organizer_admin),
+):
+    """
+    Organizer Admin / Owner：
+    報到櫃台查找報名者（部分 email / 報名編號 / 姓名 / 電話等答案）
+
+    - 依相關度排序，最多 limit 筆（不分頁）
+    - GIN (event_uuid, trigram) index：只掃描該活動中符合 trigram 的報名（其他活動的資料量不影響）
+    """
+
+    # ⚠️ 核心安全條件：event 必須屬於該 organizer
+    event = (
+        db.query(Event.uuid)
+        .filter(
+            Event.uuid == event_uuid,
+            Event.organizer_uuid == membership.organizer_uuid,
+            Event.is_deleted == False,
+        )
+        .first()
+    )
+    if not event:
+        raise ActiFlowBusinessException(
+            message="Event not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    hits = search_submissions(
+        db,
+        event.uuid,
+        q,
+        limit=limit,
+        options=loader_options("submission.answers" if READ_DOCUMENT else "submission.review"),
+    )
+
+    context = answer_value_context(db, event.uuid)
+    return SubmissionSearchResponse(
+        query=q,
+        items=[
+            SubmissionSearchHit.model_validate(submission, context=context).model_copy(update={"score": score})
+            for submission, score in hits
+        ],
+    )
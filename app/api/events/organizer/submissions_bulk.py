@@ -0,0 +1,204 @@
+# app/api/events/organizer/submissions_bulk.py
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+from uuid import UUID
+from starlette import status
+
+from app.core.db import get_db
+from app.core.dependencies import require_organizer_admin
+
+from app.models.submission.submission import Submission
+from app.models.submission.submission_value import SubmissionValue
+from app.schemas.submission.submission_bulk import (
+    SubmissionBulkFilter,
+    SubmissionBulkItem,
+    SubmissionBulkRejectRequest,
+    SubmissionBulkRequest,
+    SubmissionBulkResponse,
+)
+
+from app.crud.submission.crud_submission_status import (
+    ALLOWED_FROM,
+    UPDATED,
+    BulkTransitionResult,
+    bulk_transition_submissions,
+)
+from app.services.event.report_aggregator import record_status_changes
+from app.services.submission.answers import READ_DOCUMENT
+from app.services.submission.notification import notify_submissions_bulk
+
+from app.exceptions.base import ActiFlowBusinessException
+
+# ============================================================
+# Organizer Bulk Submission Commands
+#
+# - 一次請求審核整批報名（指定 UUID 或條件）
+# - 狀態轉換為單一 set-based UPDATE（依 ALLOWED_TRANSITIONS 檢查來源狀態）
+# - 通知以一次 bulk INSERT 寫入 email outbox，與狀態變更同一個 transaction
+# - 活動統計 delta（record_status_changes）同一個 transaction
+#
+# ⚠️ 需在 submissions router 之前掛載（/bulk/... 不能被 /{submission_uuid}/... 吃掉）
+# ============================================================
+
+router = APIRouter(
+    prefix="/organizer/{organizer_uuid}/events/{event_uuid}/submissions/bulk",
+    tags=["Organizer - Submissions"],
+)
+
+
+def _filter_criteria(target: str, f: SubmissionBulkFilter) -> tuple:
+    criteria = []
+
+    if f.status is not None:
+        if f.status not in ALLOWED_FROM.get(target, ()):
+            raise ActiFlowBusinessException(
+                message=f"Cannot transition from {f.status} to {target}",
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        criteria.append(Submission.status == f.status)
+
+    if f.created_from is not None:
+        criteria.append(Submission.created_at >= f.created_from)
+    if f.created_to is not None:
+        criteria.append(Submission.created_at < f.created_to)
+
+    if f.field_key is not None and READ_DOCUMENT:
+        # answers @> '{"field_key": value}'（GIN jsonb_path_ops）
+        criteria.append(Submission.answers.contains({f.field_key: f.field_value}))
+    elif f.field_key is not None:
+        matches = SubmissionValue.value == f.field_value
+        if isinstance(f.field_value, str):
+            matches = or_(matches, SubmissionValue.raw_value == f.field_value)
+
+        criteria.append(
+            select(SubmissionValue.id)
+            .where(
+                SubmissionValue.submission_uuid == Submission.uuid,
+                SubmissionValue.field_key == f.field_key,
+                SubmissionValue.is_deleted == False,
+                matches,
+            )
+            .exists()
+        )
+
+    return tuple(criteria)
+
+
+def _run_bulk(
+    db: Session,
+    target: str,
+    *,
+    event_uuid: UUID,
+    membership,
+    payload: SubmissionBulkRequest,
+    values: dict | None = None,
+) -> SubmissionBulkResponse:
+    if payload.submission_uuids is not None:
+        result: BulkTransitionResult = bulk_transition_submissions(
+            db,
+            target,
+            event_uuid=event_uuid,
+            organizer_uuid=membership.organizer_uuid,
+            submission_uuids=payload.submission_uuids,
+            values=values,
+        )
+    else:
+        result = bulk_transition_submissions(
+            db,
+            target,
+            event_uuid=event_uuid,
+            organizer_uuid=membership.organizer_uuid,
+            criteria=_filter_criteria(target, payload.filter),
+            max_items=payload.filter.max_items,
+            values=values,
+        )
+
+    record_status_changes(db, result.updated)
+
+    notified = notify_submissions_bulk(
+        db=db,
+        submissions=result.updated,
+        target=target,
+    )
+
+    db.commit()
+
+    items = [
+        SubmissionBulkItem(
+            submission_uuid=row.uuid,
+            outcome=UPDATED,
+            status=getattr(row.status, "value", row.status),
+            version=row.version,
+        )
+        for row in result.updated
+    ] + [
+        SubmissionBulkItem(
+            submission_uuid=submission_uuid,
+            outcome=conflict,
+            status=current_status,
+        )
+        for submission_uuid, (conflict, current_status) in result.failed.items()
+    ]
+
+    return SubmissionBulkResponse(
+        target=target,
+        updated=len(result.updated),
+        failed=len(result.failed),
+        notified=notified,
+        has_more=result.has_more,
+        items=items,
+    )
+
+
+# -------------------------------------------------------------------
+# Bulk approve (paid -> completed)
+# -------------------------------------------------------------------
+@router.post("/approve", response_model=SubmissionBulkResponse)
+def bulk_approve_submissions(
+    organizer_uuid: UUID,   # 僅 routing，不信任
+    event_uuid: UUID,
+    payload: SubmissionBulkRequest,
+    db: Session = Depends(get_db),
+    membership=Depends(require_organizer_admin),
+):
+    """
+    Organizer Admin / Owner：
+    批次審核通過（paid -> completed）
+    """
+    return _run_bulk(
+        db,
+        "completed",
+        event_uuid=event_uuid,
+        membership=membership,
+        payload=payload,
+    )
+
+
+# -------------------------------------------------------------------
+# Bulk reject (paid -> rejected)
+# -------------------------------------------------------------------
+@router.post("/reject", response_model=SubmissionBulkResponse)
+def bulk_reject_submissions(
+    organizer_uuid: UUID,   # routing only
+    event_uuid: UUID,
+    payload: SubmissionBulkRejectRequest,
+    db: Session = Depends(get_db),
+    membership=Depends(require_organizer_admin),
+):
+    """
+    Organizer Admin / Owner：
+    批次拒絕（paid -> rejected），整批使用同一個 reason
+    """
+    return _run_bulk(
+        db,
+        "rejected",
+        event_uuid=event_uuid,
+        membership=membership,
+        payload=payload,
+        values={
+            "status_reason": payload.reason,
+            "notes": None,
+        },
+    )
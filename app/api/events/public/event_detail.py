@@ -1,13 +1,18 @@
 # app/api/events/public/event_detail.py # 單一活動公開頁
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.db import get_db
+from app.core.conditional import PUBLIC_CACHE_CONTROL, loaded_validators
+from app.core.route_cache import route_cache
 
 from app.schemas.event.core.event_response import EventResponse
 from app.models.event.event import Event
+from app.crud.base.loader_profiles import with_loader_profile
+from app.services.event.snapshot import EVENT_SNAPSHOT, get_snapshot, snapshot_response
+from app.services.submission.form_validator import EVENT_FIELDS
 
 router = APIRouter(
     prefix="/events",
@@ -19,8 +24,18 @@ router = APIRouter(
 # Public Event Detail
 # ============================================================
 @router.get("/{event_uuid}", response_model=EventResponse)
+@route_cache(
+    "public.event_detail",
+    ttl=2,
+    stale_ttl=30,
+    response_model=EventResponse,
+    tag_param="event_uuid",
+    invalidate_on=(EVENT_SNAPSHOT, EVENT_FIELDS),
+)
 def get_public_event_detail(
     event_uuid: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """
@@ -30,10 +45,17 @@ def get_public_event_detail(
     - event 必須存在
     - is_active = True
     - is_deleted = False
+
+    已發布活動直接回傳預先序列化的快照（快取命中時 0 條 SQL）
+    ETag = 快照版本；If-None-Match 命中 → 304
     """
 
+    snapshot = get_snapshot(db, event_uuid)
+    if snapshot is not None:
+        return snapshot_response(request, snapshot, "detail")
+
     event = (
-        db.query(Event)
+        with_loader_profile(db.query(Event), "event.detail")
         .filter(
             Event.uuid == event_uuid,
             Event.is_active == True,
@@ -48,4 +70,15 @@ def get_public_event_detail(
             detail="Event not found",
         )
 
+    validators = loaded_validators(
+        "event.detail",
+        event.uuid,
+        [event, event.activity_template],
+        cache_control=PUBLIC_CACHE_CONTROL,
+    )
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    validators.apply(response)
+
     return EventResponse.model_validate(event)
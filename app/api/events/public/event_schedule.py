@@ -1,11 +1,13 @@
 # app/api/events/public/event_schedule.py # 活動場次 / 時程
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List
 
 from app.core.db import get_db
+from app.core.conditional import PUBLIC_CACHE_CONTROL, loaded_validators
+from app.core.route_cache import route_cache
 
 from app.schemas.event.schedule.event_schedule import (
     EventScheduleResponse,
@@ -13,6 +15,9 @@ from app.schemas.event.schedule.event_schedule import (
 
 from app.models.event.event import Event
 from app.models.event.event_schedule import EventSchedule
+from app.crud.base.loader_profiles import with_loader_profile
+from app.services.event.snapshot import EVENT_SNAPSHOT, get_snapshot, snapshot_response
+from app.services.submission.form_validator import EVENT_FIELDS
 
 
 router = APIRouter(
@@ -28,8 +33,18 @@ router = APIRouter(
     "/{event_uuid}/schedule",
     response_model=List[EventScheduleResponse],
 )
+@route_cache(
+    "public.event_schedule",
+    ttl=2,
+    stale_ttl=30,
+    response_model=List[EventScheduleResponse],
+    tag_param="event_uuid",
+    invalidate_on=(EVENT_SNAPSHOT, EVENT_FIELDS),
+)
 def get_public_event_schedule(
     event_uuid: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """
@@ -40,11 +55,18 @@ def get_public_event_schedule(
     - event.is_active = True
     - event.is_deleted = False
     - 只回傳未刪除的場次
+
+    已發布活動直接回傳預先序列化的快照（快取命中時 0 條 SQL）
+    ETag = 快照版本；If-None-Match 命中 → 304
     """
 
+    snapshot = get_snapshot(db, event_uuid)
+    if snapshot is not None:
+        return snapshot_response(request, snapshot, "schedule")
+
     # 1. 確認活動存在且可公開
     event = (
-        db.query(Event)
+        with_loader_profile(db.query(Event), "event.row")
         .filter(
             Event.uuid == event_uuid,
             Event.is_active == True,
@@ -70,6 +92,17 @@ def get_public_event_schedule(
         .all()
     )
 
+    validators = loaded_validators(
+        "event.schedule",
+        event_uuid,
+        schedules,
+        cache_control=PUBLIC_CACHE_CONTROL,
+    )
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    validators.apply(response)
+
     return [
         EventScheduleResponse.model_validate(s)
         for s in schedules
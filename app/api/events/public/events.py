@@ -1,14 +1,21 @@
 # app/api/events/public/events.py    # 活動列表 / 搜尋
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.core.db import get_db
+from app.core.conditional import PUBLIC_CACHE_CONTROL, list_validators, loaded_validators
+from app.core.route_cache import route_cache
 
 from app.models.event.event import Event
-from app.schemas.event.core.event_public import EventPublic
-from app.schemas.common.pagination import PaginatedResponse
+from app.schemas.event.core.event_public import EventPublic, EventPublicListItem
+from app.schemas.common.pagination import PaginatedResponse, PaginationMode, TotalMode
+from app.crud.base.loader_profiles import with_loader_profile
+from app.crud.base.pagination import paginate_query
+from app.services.event.snapshot import EVENT_SNAPSHOT, get_snapshot, snapshot_response
+from app.services.submission.form_validator import EVENT_FIELDS
 
 
 router = APIRouter(
@@ -20,14 +27,21 @@ router = APIRouter(
 # -------------------------------------------------------------------
 # Public: List published events
 # -------------------------------------------------------------------
-@router.get("", response_model=PaginatedResponse)
+@router.get("", response_model=PaginatedResponse[EventPublicListItem])
 def list_public_events(
+    request: Request,
+    response: Response,
     page: int = 1,
     page_size: int = 20,
+    paginate: PaginationMode = "offset",
+    cursor: Optional[str] = None,
+    count: TotalMode = "none",
     db: Session = Depends(get_db),
 ):
     """
     公開活動列表（僅顯示已發布的活動）
+
+    Conditional GET：先以一條聚合查詢比對 ETag，命中 → 304（不載入分頁）
     """
 
     query = (
@@ -38,20 +52,28 @@ def list_public_events(
         )
     )
 
-    total = query.count()
-    events = (
-        query
-        .order_by(Event.start_at.asc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    validators = list_validators(
+        request, query, Event.updated_at, cache_control=PUBLIC_CACHE_CONTROL
     )
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    validators.apply(response)
 
-    return PaginatedResponse(
-        items=events,
-        total=total,
+    result = paginate_query(
+        with_loader_profile(query, "event.card"),
+        keys=(Event.start_date, Event.id),
+        descending=False,
+        mode=paginate,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count=count,
+    )
+
+    return PaginatedResponse(
+        items=[EventPublicListItem.model_validate(e) for e in result.items],
+        **result.meta(),
     )
 
 
@@ -59,16 +81,33 @@ def list_public_events(
 # Public: Get event detail
 # -------------------------------------------------------------------
 @router.get("/{event_uuid}", response_model=EventPublic)
+@route_cache(
+    "public.event",
+    ttl=2,
+    stale_ttl=30,
+    response_model=EventPublic,
+    tag_param="event_uuid",
+    invalidate_on=(EVENT_SNAPSHOT, EVENT_FIELDS),
+)
 def get_public_event(
     event_uuid: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """
     公開活動詳細頁
+
+    已發布活動直接回傳預先序列化的快照（快取命中時 0 條 SQL）
+    ETag = 快照版本；If-None-Match 命中 → 304
     """
 
+    snapshot = get_snapshot(db, event_uuid)
+    if snapshot is not None:
+        return snapshot_response(request, snapshot, "public")
+
     event = (
-        db.query(Event)
+        with_loader_profile(db.query(Event), "event.public")
         .filter(
             Event.uuid == event_uuid,
             Event.status == "published",
@@ -80,4 +119,15 @@ def get_public_event(
     if not event:
         raise HTTPException(404, "Event not found")
 
+    validators = loaded_validators(
+        "event.public",
+        event.uuid,
+        [event, *event.fields, *event.schedules],
+        cache_control=PUBLIC_CACHE_CONTROL,
+    )
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    validators.apply(response)
+
     return event
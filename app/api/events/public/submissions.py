@@ -4,7 +4,7 @@
 #
 # 職責說明：
 # - Public 使用者送出活動報名（建立 Submission / SubmissionValue）
-# - 建立 EmailVerification 並發送驗證信
+# - 建立 EmailVerification 並將驗證信寫入 email outbox
 # - Email 驗證完成後，透過 confirm-email API 正式推進狀態
 #
 # 注意：
@@ -13,6 +13,7 @@
 # ============================================================
 
 from fastapi import APIRouter, Depends, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from uuid import UUID, uuid4
 from datetime import datetime, timezone, timedelta
@@ -21,14 +22,13 @@ from starlette import status
 
 from app.core.db import get_db
 from app.core.jwt import decode_access_token
-from app.core.config import settings
 
 from app.api.utils.submission_code import generate_submission_code
-from app.api.utils.email_sender import send_via_resend
-from app.api.utils.email_templates import verification_email_html
+from app.api.utils.email_verification_mailer import enqueue_verification_email
+from app.services.event.report_aggregator import record_status_changes, record_submission
+from app.services.submission.answers import WRITE_DOCUMENT, WRITE_VALUES, answer_document
 
 from app.models.event.event import Event
-from app.models.event.event_field import EventField
 from app.models.submission.submission import Submission
 from app.models.submission.submission_value import SubmissionValue
 from app.models.auth.email_verification import EmailVerification
@@ -39,9 +39,13 @@ from app.schemas.submission.submission_public import (
 )
 from app.schemas.submission.submission_response import SubmissionResponse
 
-from app.crud.submission.crud_submission import submission_crud
-from app.crud.submission.crud_submission_status import assert_status_transition
-from app.exceptions.submission import InvalidSubmissionStatusTransition
+from app.crud.base.loader_profiles import with_loader_profile
+from app.services.submission.form_validator import get_validator
+from app.crud.submission.crud_submission_status import (
+    PRECONDITION_FAILED,
+    transition_submission,
+)
+from app.exceptions.submission import SubmissionTransitionConflict
 from app.exceptions.base import ActiFlowBusinessException
 
 
@@ -70,65 +74,50 @@ def confirm_email(
 
     Note:
     - 本 API 為「流程型 command」
-    - 使用 CRUD 僅作為 aggregate resolve，不代表純 CRUD API
+    - 驗證檢查與狀態推進在同一條 UPDATE（EXISTS 子查詢）完成
     """
 
     # --------------------------------------------------------
-    # 1. Resolve Submission (process context)
+    # 1. Email 已驗證（前置條件，併入 UPDATE）
     # --------------------------------------------------------
-    submission = submission_crud.get_by_uuid(db, submission_uuid)
-    if not submission:
-        raise ActiFlowBusinessException(
-            message="Submission not found",
-            status_code=status.HTTP_404_NOT_FOUND,
-        )
-
-    # --------------------------------------------------------
-    # 2. 確認 Email 已驗證
-    # --------------------------------------------------------
-    verification = (
-        db.query(EmailVerification)
-        .filter(
+    email_verified = (
+        select(EmailVerification.id)
+        .where(
             EmailVerification.ref_type == "submission",
-            EmailVerification.ref_uuid == submission.uuid,
+            EmailVerification.ref_uuid == Submission.uuid,
             EmailVerification.is_deleted == False,
             EmailVerification.is_used == True,
             EmailVerification.verified_at.isnot(None),
         )
-        .order_by(EmailVerification.created_at.desc())
-        .first()
+        .exists()
     )
 
-    if not verification:
-        raise ActiFlowBusinessException(
-            message="Email not verified yet",
-            status_code=status.HTTP_400_BAD_REQUEST,
-        )
-
     # --------------------------------------------------------
-    # 3. 檢查狀態轉換是否合法（Domain Rule）
+    # 2. 狀態轉換（pending → email_verified）
     # --------------------------------------------------------
-    try:
-        assert_status_transition(
-            current=submission.status,
-            target="email_verified",
-        )
-    except InvalidSubmissionStatusTransition as e:
+    result = transition_submission(
+        db,
+        submission_uuid,
+        "email_verified",
+        criteria=(email_verified,),
+    )
+
+    if result.conflict == PRECONDITION_FAILED:
         raise ActiFlowBusinessException(
-            message=str(e),
-            status_code=status.HTTP_409_CONFLICT,
+            message="Email not verified yet",
+            status_code=status.HTTP_400_BAD_REQUEST,
         )
+    if not result.ok:
+        raise SubmissionTransitionConflict(result)
 
-    # --------------------------------------------------------
-    # 4. 推進狀態
-    # --------------------------------------------------------
-    submission.status = "email_verified"
-    submission.updated_at = datetime.now(timezone.utc)
-
+    record_status_changes(db, [result.submission])
     db.commit()
-    db.refresh(submission)
 
-    return submission
+    return {
+        "submission_uuid": str(result.submission.uuid),
+        "status": result.submission.status,
+        "version": result.submission.version,
+    }
 
 
 # ============================================================
@@ -153,7 +142,7 @@ def create_submission(
     # 1. 檢查 Event 是否存在且可報名
     # --------------------------------------------------------
     event = (
-        db.query(Event)
+        with_loader_profile(db.query(Event), "event.row")
         .filter(
             Event.uuid == event_uuid,
             Event.is_deleted == False,
@@ -169,7 +158,19 @@ def create_submission(
         )
 
     # --------------------------------------------------------
-    # 2. 嘗試取得登入使用者（可選）
+    # 2. 驗證報名答案（編譯後的 validator，快取命中時不查 DB）
+    # --------------------------------------------------------
+    validator = get_validator(db, event.uuid)
+    answers = validator.validate((v.field_key, v.value) for v in data.values)
+
+    if not answers.ok:
+        raise ActiFlowBusinessException(
+            message="Invalid submission: " + "; ".join(answers.errors),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # --------------------------------------------------------
+    # 3. 嘗試取得登入使用者（可選）
     # --------------------------------------------------------
     user_uuid = None
     token = request.cookies.get("access_token")
@@ -178,10 +179,10 @@ def create_submission(
         user_uuid = payload.get("sub") if payload else None
 
     # --------------------------------------------------------
-    # 3. 建立 Submission（主檔）
+    # 4. 建立 Submission（主檔）
     # --------------------------------------------------------
     submission = Submission(
-        submission_code=generate_submission_code(event.event_code),
+        submission_code=generate_submission_code(event.uuid, event.event_code),
         event_uuid=event_uuid,
         user_uuid=user_uuid,
         user_email=data.user_email,
@@ -192,56 +193,34 @@ def create_submission(
         user_agent=request.headers.get("user-agent"),
     )
 
+    # answer document（dual / document 模式；見 app/services/submission/answers.py）
+    if WRITE_DOCUMENT:
+        submission.answers = answer_document(answers.values)
+        submission.answers_version = validator.version
+
     db.add(submission)
     db.flush()  # 取得 submission.uuid
 
     # --------------------------------------------------------
-    # 4. 準備 field_key → EventField 映射
+    # 5. 建立 SubmissionValue（子表，值為 validator 正規化後的結果）
     # --------------------------------------------------------
-    fields = (
-        db.query(EventField)
-        .filter(
-            EventField.event_uuid == event_uuid,
-            EventField.is_deleted == False,
-            EventField.is_enabled == True,
-        )
-        .all()
-    )
-
-    field_map = {f.field_key: f for f in fields}
-
-    # --------------------------------------------------------
-    # 5. 建立 SubmissionValue（子表）
-    # --------------------------------------------------------
-    values: list[SubmissionValue] = []
-
-    for v in data.values:
-        field = field_map.get(v.field_key)
-        if not field:
-            raise ActiFlowBusinessException(
-                message=f"Invalid field_key: {v.field_key}",
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-
-        values.append(
+    if WRITE_VALUES:
+        db.add_all(
             SubmissionValue(
                 submission_uuid=submission.uuid,
-                event_field_uuid=field.uuid,
-                field_key=field.field_key,
-                value=v.value,
+                event_field_uuid=rule.uuid,
+                field_key=rule.field_key,
+                value=value,
             )
+            for rule, value in answers.values
         )
 
-    db.add_all(values)
+    # 活動統計 delta（同一個 transaction）
+    record_submission(db, submission.uuid)
 
     # --------------------------------------------------------
-    # 6. commit submission + values
-    # --------------------------------------------------------
-    db.commit()
-    db.refresh(submission)
-
-    # --------------------------------------------------------
-    # 7. 建立 EmailVerification + 發送驗證信
+    # 6. 建立 EmailVerification + 驗證信寫入 outbox
+    #    （與 submission 同一個 transaction；寄送由 outbox worker 負責）
     # --------------------------------------------------------
     token = uuid4().hex
 
@@ -254,17 +233,21 @@ def create_submission(
     )
 
     db.add(verification)
-    db.commit()
 
-    verify_url = f"{settings.FRONTEND_BASE_URL}/verify-email?token={token}"
-
-    html = verification_email_html(verify_url)
-    send_via_resend(
+    enqueue_verification_email(
+        db,
         to_email=submission.user_email,
-        subject="請驗證你的 Email",
-        html=html,
+        token=token,
+        ref_type="submission",
+        ref_uuid=submission.uuid,
     )
 
+    # --------------------------------------------------------
+    # 7. commit submission + values + verification + outbox
+    # --------------------------------------------------------
+    db.commit()
+    db.refresh(submission)
+
     return submission
 
 
@@ -284,38 +267,19 @@ def mark_submission_paid(
     email_verified → paid
     """
 
-    # ---------------------------------------------------------
-    # 1. Fetch submission
-    # ---------------------------------------------------------
-    submission = submission_crud.get_by_uuid(db, submission_uuid)
-    if not submission:
-        raise ActiFlowBusinessException(
-            message="Submission not found",
-            status_code=status.HTTP_404_NOT_FOUND,
-        )
-
-    # ---------------------------------------------------------
-    # 2. Status transition guard
-    # ---------------------------------------------------------
-    try:
-        assert_status_transition(
-            current=submission.status,
-            target="paid",
-        )
-    except InvalidSubmissionStatusTransition as e:
-        raise ActiFlowBusinessException(
-            message=str(e),
-            status_code=status.HTTP_409_CONFLICT,
-        )
+    result = transition_submission(
+        db,
+        submission_uuid,
+        "paid",
+    )
+    if not result.ok:
+        raise SubmissionTransitionConflict(result)
 
-    # ---------------------------------------------------------
-    # 3. Update status
-    # ---------------------------------------------------------
-    submission.status = "paid"
+    record_status_changes(db, [result.submission])
     db.commit()
-    db.refresh(submission)
 
     return {
-        "submission_uuid": str(submission.uuid),
-        "status": submission.status,
-    }
\ No newline at end of file
+        "submission_uuid": str(result.submission.uuid),
+        "status": result.submission.status,
+        "version": result.submission.version,
+    }
@@ -6,6 +6,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.core.db import get_db
 from app.core.dependencies import (
@@ -21,11 +22,12 @@ from app.schemas.activity_template.activity_template_update import (
 from app.schemas.activity_template.activity_template_response import (
     ActivityTemplateResponse,
 )
-from app.schemas.common.pagination import PaginatedResponse
+from app.schemas.common.pagination import PaginatedResponse, PaginationMode, TotalMode
 
 from app.crud.activity.crud_activity_template import (
     activity_template_crud,
 )
+from app.crud.base.pagination import paginate_query
 
 from app.models.activity.activity_template import ActivityTemplate
 
@@ -43,6 +45,9 @@ router = APIRouter(
 def list_activity_templates(
     page: int = 1,
     page_size: int = 20,
+    paginate: PaginationMode = "offset",
+    cursor: Optional[str] = None,
+    count: TotalMode = "none",
     db: Session = Depends(get_db),
     membership=Depends(require_current_organizer_admin),
 ):
@@ -54,23 +59,22 @@ def list_activity_templates(
         )
     )
 
-    total = query.count()
-    templates = (
-        query
-        .order_by(ActivityTemplate.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    result = paginate_query(
+        query,
+        keys=(ActivityTemplate.created_at, ActivityTemplate.id),
+        mode=paginate,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        count=count,
     )
 
     return PaginatedResponse(
         items=[
             ActivityTemplateResponse.model_validate(t)
-            for t in templates
+            for t in result.items
         ],
-        total=total,
-        page=page,
-        page_size=page_size,
+        **result.meta(),
     )
 
 
@@ -1,21 +1,30 @@
 # app/api/organizers/organizer/dashboard.py
 # Organizer 後台 - Dashboard（owner / admin）
 
-from fastapi import APIRouter, Depends
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, or_, select
+from starlette import status
 from uuid import UUID
 
 from app.core.db import get_db
 from app.core.rbac import require_organizer_role
 
 from app.schemas.organizer.dashboard import (
+    OrganizerDashboardCounts,
+    OrganizerDashboardPoint,
     OrganizerDashboardResponse,
     OrganizerDashboardStats,
 )
 
 from app.models.event.event import Event
 from app.models.membership.organizer_membership import OrganizerMembership
+from app.models.organizer.organizer import Organizer
+from app.models.system.rollup_watermark import RollupWatermark
+
+from app.services.organizer.dashboard_rollup import WATERMARK_NAME, load_dashboard_series
 
 
 router = APIRouter(
@@ -31,45 +40,84 @@ router = APIRouter(
 )
 def get_dashboard(
     organizer_uuid: UUID,
+    days: int = Query(14, ge=1, le=90),
     db: Session = Depends(get_db),
 ):
     """
     Organizer 後台 Dashboard（UX 用）
+
+    - 成員 / 活動數：一條查詢（scalar subqueries）
+    - 報名統計：organizer_stat_buckets 區間加總（背景 job 增量維護，
+      讀取筆數固定，與活動數 / 報名數無關）
     """
+    now = datetime.now(timezone.utc)
 
-    # members count
     members_count = (
-        db.query(func.count(OrganizerMembership.user_uuid))
-        .filter(
+        select(func.count(OrganizerMembership.user_uuid))
+        .where(
             OrganizerMembership.organizer_uuid == organizer_uuid,
             OrganizerMembership.is_deleted == False,
         )
-        .scalar()
-        or 0
+        .scalar_subquery()
     )
 
-    # events count
     events_count = (
-        db.query(func.count(Event.uuid))
-        .filter(
+        select(func.count(Event.id))
+        .where(
             Event.organizer_uuid == organizer_uuid,
             Event.is_deleted == False,
         )
-        .scalar()
-        or 0
+        .scalar_subquery()
     )
 
-    # UX 階段：先給 0，之後再補
-    active_events = 0
-    submissions_last_7_days = 0
+    # 進行中：已發布且尚未結束（end_date 為 naive UTC）
+    active_events = (
+        select(func.count(Event.id))
+        .where(
+            Event.organizer_uuid == organizer_uuid,
+            Event.is_deleted == False,
+            Event.status == "published",
+            or_(Event.end_date.is_(None), Event.end_date >= now.replace(tzinfo=None)),
+        )
+        .scalar_subquery()
+    )
+
+    refreshed_at = (
+        select(RollupWatermark.watermark)
+        .where(RollupWatermark.name == WATERMARK_NAME)
+        .scalar_subquery()
+    )
+
+    summary = db.execute(
+        select(
+            Organizer.name,
+            members_count.label("members_count"),
+            events_count.label("events_count"),
+            active_events.label("active_events"),
+            refreshed_at.label("refreshed_at"),
+        ).where(Organizer.uuid == organizer_uuid)
+    ).one_or_none()
+
+    if summary is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organizer not found",
+        )
+
+    series = load_dashboard_series(db, organizer_uuid, days=days, now=now)
+    last_7_days = OrganizerDashboardCounts(**series["last_7_days"])
 
     return OrganizerDashboardResponse(
         organizer_uuid=organizer_uuid,
-        organizer_name="Organizer",  # 可之後補真資料
+        organizer_name=summary.name,
         stats=OrganizerDashboardStats(
-            members_count=members_count,
-            events_count=events_count,
-            active_events=active_events,
-            submissions_last_7_days=submissions_last_7_days,
+            members_count=summary.members_count or 0,
+            events_count=summary.events_count or 0,
+            active_events=summary.active_events or 0,
+            submissions_last_7_days=last_7_days.created,
+            last_7_days=last_7_days,
         ),
+        daily=[OrganizerDashboardPoint(**point) for point in series["daily"]],
+        hourly=[OrganizerDashboardPoint(**point) for point in series["hourly"]],
+        refreshed_at=summary.refreshed_at,
     )
@@ -5,11 +5,13 @@
 
 from uuid import UUID
 from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
+from app.core.conditional import list_validators
 from app.core.dependencies import require_current_organizer_admin
 
 from app.core.constants.event_status import EventStatus
@@ -19,9 +21,13 @@ from app.schemas.event.core.organizer.organizer_event_create import OrganizerEve
 from app.schemas.event.core.organizer.organizer_event_update import OrganizerEventUpdate
 
 from app.schemas.event.core.event_response import EventResponse
-from app.schemas.common.pagination import PaginatedResponse
+from app.schemas.common.pagination import PaginatedResponse, PaginationMode, TotalMode
 
 from app.models.event.event import Event
+from app.models.activity.activity_template import ActivityTemplate
+from app.crud.base.loader_profiles import with_loader_profile, reload_with_profile
+from app.crud.base.pagination import paginate_query
+from app.services.event.snapshot import refresh_event_snapshot
 
 router = APIRouter(
     prefix="/events",
@@ -34,8 +40,13 @@ router = APIRouter(
 # -------------------------------------------------------------------
 @router.get("", response_model=PaginatedResponse[EventResponse])
 def list_events(
+    request: Request,
+    response: Response,
     page: int = 1,
     page_size: int = 20,
+    paginate: PaginationMode = "offset",
+    cursor: Optional[str] = None,
+    count: TotalMode = "none",
     db: Session = Depends(get_db),
     membership=Depends(require_current_organizer_admin),
 ):
@@ -47,20 +58,32 @@ def list_events(
         )
     )
 
-    total = query.count()
-    events = (
-        query
-        .order_by(Event.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    # Conditional GET：EventResponse 帶 activity_template → 一併納入 fingerprint
+    validators = list_validators(
+        request,
+        query.outerjoin(Event.activity_template),
+        Event.updated_at,
+        ActivityTemplate.updated_at,
+        scope=membership.organizer_uuid,
     )
-
-    return PaginatedResponse(
-        items=[EventResponse.model_validate(e) for e in events],
-        total=total,
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    validators.apply(response)
+
+    result = paginate_query(
+        with_loader_profile(query, "event.detail"),
+        keys=(Event.created_at, Event.id),
+        mode=paginate,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count=count,
+    )
+
+    return PaginatedResponse(
+        items=[EventResponse.model_validate(e) for e in result.items],
+        **result.meta(),
     )
 
 
@@ -84,7 +107,7 @@ def create_event(
 
     db.add(event)
     db.commit()
-    db.refresh(event)
+    event = reload_with_profile(db, event, "event.detail")
 
     return EventResponse.model_validate(event)
 
@@ -99,18 +122,7 @@ def update_event(
     db: Session = Depends(get_db),
     membership=Depends(require_current_organizer_admin),
 ):
-    event = (
-        db.query(Event)
-        .filter(
-            Event.uuid == event_uuid,
-            Event.organizer_uuid == membership.organizer_uuid,
-            Event.is_deleted == False,
-        )
-        .first()
-    )
-
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
+    event = _get_event_or_404(db, event_uuid, membership.organizer_uuid)
 
     # 只更新有傳的欄位（partial update）
     update_data = data.model_dump(exclude_unset=True)
@@ -128,8 +140,10 @@ def update_event(
     event.updated_by = membership.user_uuid
     event.updated_by_role = membership.role
 
+    refresh_event_snapshot(db, event.uuid)
+
     db.commit()
-    db.refresh(event)
+    event = reload_with_profile(db, event, "event.detail")
 
     return EventResponse.model_validate(event)
 
@@ -155,8 +169,10 @@ def publish_event(
     event.updated_by = membership.user_uuid
     event.updated_by_role = membership.role
 
+    refresh_event_snapshot(db, event.uuid)
+
     db.commit()
-    db.refresh(event)
+    event = reload_with_profile(db, event, "event.detail")
 
     return EventResponse.model_validate(event)
 
@@ -181,8 +197,10 @@ def unpublish_event(
     event.updated_by = membership.user_uuid
     event.updated_by_role = membership.role
 
+    refresh_event_snapshot(db, event.uuid)
+
     db.commit()
-    db.refresh(event)
+    event = reload_with_profile(db, event, "event.detail")
 
     return EventResponse.model_validate(event)
 
@@ -207,8 +225,10 @@ def close_event(
     event.updated_by = membership.user_uuid
     event.updated_by_role = membership.role
 
+    refresh_event_snapshot(db, event.uuid)
+
     db.commit()
-    db.refresh(event)
+    event = reload_with_profile(db, event, "event.detail")
 
     return EventResponse.model_validate(event)
    
@@ -228,9 +248,10 @@ def _get_event_or_404(
     db: Session,
     event_uuid: UUID,
     organizer_uuid: UUID,
+    profile: str = "event.row",
 ) -> Event:
     event = (
-        db.query(Event)
+        with_loader_profile(db.query(Event), profile)
         .filter(
             Event.uuid == event_uuid,
             Event.organizer_uuid == organizer_uuid,
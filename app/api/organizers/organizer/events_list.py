@@ -1,15 +1,17 @@
 # app/api/organizers/organizer/events_list.py
 # Organizer 後台 - Events List（Admin UX 用，Read Model）
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.db import get_db
+from app.core.conditional import list_validators
 from app.core.rbac import require_organizer_role
 
 from app.schemas.event.core.event_list_item import OrganizerEventListItem
 from app.models.event.event import Event
+from app.crud.base.loader_profiles import with_loader_profile
 
 
 router = APIRouter(
@@ -25,6 +27,8 @@ router = APIRouter(
 )
 def list_organizer_events(
     organizer_uuid: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """
@@ -33,14 +37,25 @@ def list_organizer_events(
     - 不做 pagination
     - 不 join submission
     - schema 穩定，給前端列表頁使用
+    - Conditional GET：ETag 命中 → 304（不載入列表）
     """
 
-    events = (
+    query = (
         db.query(Event)
         .filter(
             Event.organizer_uuid == organizer_uuid,
             Event.is_deleted == False,
         )
+    )
+
+    validators = list_validators(request, query, Event.updated_at)
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    validators.apply(response)
+
+    events = (
+        with_loader_profile(query, "event.card")
         .order_by(Event.created_at.desc())
         .all()
     )
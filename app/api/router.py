@@ -34,7 +34,9 @@ from app.api.events.admin.types import router as admin_types_router
 from app.api.events.organizer.events import router as organizer_events_router
 from app.api.events.organizer.event_fields import router as organizer_event_fields_router
 from app.api.events.organizer.event_staff import router as organizer_event_staff_router
+from app.api.events.organizer.submissions_bulk import router as organizer_submissions_bulk_router
 from app.api.events.organizer.submissions import router as organizer_submissions_router
+from app.api.events.organizer.reports import router as organizer_event_reports_router
 
 # Public
 from app.api.events.public.events import router as public_events_router
@@ -106,7 +108,9 @@ api_router.include_router(admin_types_router)
 api_router.include_router(organizer_events_router)
 api_router.include_router(organizer_event_fields_router)
 api_router.include_router(organizer_event_staff_router)
+api_router.include_router(organizer_submissions_bulk_router)  # 需在 submissions router 之前
 api_router.include_router(organizer_submissions_router)
+api_router.include_router(organizer_event_reports_router)
 
 api_router.include_router(public_events_router)
 api_router.include_router(public_event_detail_router)
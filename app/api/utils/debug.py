@@ -5,7 +5,19 @@ from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.core.config import settings
 
+from app.core.jwt import token_cache
+from app.core.password_hasher import password_hasher
+from app.core.principal_cache import principal_cache
+from app.core.route_cache import route_cache_stats
 from app.crud.user.crud_user import user_crud
+from app.services.email.outbox_worker import outbox_worker_stats
+from app.services.email.transport import current_transport
+from app.services.event.reservation import hold_sweeper_stats
+from app.services.event.report_aggregator import report_aggregator_stats
+from app.services.organizer.dashboard_rollup import dashboard_rollup_stats
+from app.services.event.snapshot import snapshot_cache
+from app.services.submission.form_validator import validator_cache
+from app.services.event.field_analytics import analytics_cache
 
 router = APIRouter(prefix="/debug", tags=["Debug"])
 
@@ -29,4 +41,152 @@ def reset_admin_password(db: Session = Depends(get_db)):
         "reset": True,
         "email": user.email,
         "new_password": new_pw,
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/principal-cache")
+def principal_cache_stats():
+    """
+    ⚠️ DEV ONLY
+    principal cache hit / miss / eviction 統計
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    return principal_cache.stats()
+
+
+@router.get("/password-hasher")
+def password_hasher_stats():
+    """
+    ⚠️ DEV ONLY
+    hashing executor 佇列 / 耗時 / shed 統計
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    return password_hasher.stats()
+
+
+@router.get("/token-cache")
+def token_cache_stats():
+    """
+    ⚠️ DEV ONLY
+    verified JWT cache hit / miss 統計
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    return token_cache.stats()
+
+
+@router.get("/email-outbox")
+def email_outbox_stats():
+    """
+    ⚠️ DEV ONLY
+    email outbox worker 寄送 / 重試 / dead-letter 統計
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    return outbox_worker_stats() or {"running": False}
+
+
+@router.get("/email-transport")
+def email_transport_stats():
+    """
+    ⚠️ DEV ONLY
+    email transport 延遲分佈 / 錯誤統計（估算 HTTP pool 大小用）
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    transport = current_transport()
+    return transport.stats() if transport is not None else {"transport": None}
+
+
+@router.get("/form-validator-cache")
+def form_validator_cache_stats():
+    """
+    ⚠️ DEV ONLY
+    報名表單 validator 快取 hit / miss / 編譯次數
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    return validator_cache.stats()
+
+
+@router.get("/event-snapshot-cache")
+def event_snapshot_cache_stats():
+    """
+    ⚠️ DEV ONLY
+    公開活動快照快取 hit / miss / 載入次數
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    return snapshot_cache.stats()
+
+
+@router.get("/route-cache")
+def route_cache_debug_stats():
+    """
+    ⚠️ DEV ONLY
+    Route cache（single-flight / stale-while-revalidate）hit / miss / coalesced
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    return route_cache_stats()
+
+
+@router.get("/seat-hold-sweeper")
+def seat_hold_sweeper_stats():
+    """
+    ⚠️ DEV ONLY
+    逾期名額保留 sweeper 執行 / 釋放統計
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    stats = hold_sweeper_stats()
+    return stats if stats is not None else {"sweeper": None}
+
+
+@router.get("/report-aggregator")
+def event_report_aggregator_stats():
+    """
+    ⚠️ DEV ONLY
+    活動統計 delta 併入統計
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    stats = report_aggregator_stats()
+    return stats if stats is not None else {"aggregator": None}
+
+
+@router.get("/dashboard-rollup")
+def organizer_dashboard_rollup_stats():
+    """
+    ⚠️ DEV ONLY
+    Organizer dashboard rollup job 執行統計
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    stats = dashboard_rollup_stats()
+    return stats if stats is not None else {"worker": None}
+
+
+@router.get("/field-analytics-cache")
+def field_analytics_cache_stats():
+    """
+    ⚠️ DEV ONLY
+    欄位答案分析快取 hit / miss
+    """
+    if settings.ENV != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+
+    return analytics_cache.stats()
@@ -1,6 +1,6 @@
 # app/api/utils/email_mailer.py
 
-from app.api.utils.email_sender import send_via_resend
+from app.api.utils.email_sender import asend_email, send_email
 
 def send_generic_email(
     *,
@@ -14,7 +14,20 @@ def send_generic_email(
     - 不知道 verification
     - 只是轉呼叫
     """
-    return send_via_resend(
+    return send_email(
+        to_email=to_email,
+        subject=subject,
+        html=html,
+    )
+
+
+async def asend_generic_email(
+    *,
+    to_email: str,
+    subject: str,
+    html: str,
+):
+    return await asend_email(
         to_email=to_email,
         subject=subject,
         html=html,
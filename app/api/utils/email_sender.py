@@ -1,48 +1,62 @@
 # app/api/utils/email_sender.py
 
-import httpx
-from app.core.config import settings
+from app.services.email.transport import EmailMessage, get_transport
 
-RESEND_ENDPOINT = "https://api.resend.com/emails"
 
-def send_via_resend(
+def send_email(
     *,
     to_email: str,
     subject: str,
     html: str,
 ):
     """
-    最底層 Email 發送器（Resend Adapter）
+    最底層 Email 發送器
     - 不知道驗證 / submission / token
     - 不包含任何業務語意
+    - 實際 transport 由 settings.EMAIL_TRANSPORT 決定（process 共用 pool）
     """
-    if not settings.RESEND_API_KEY:
-        raise RuntimeError("RESEND_API_KEY not set")
- 
-    if not settings.RESEND_FROM_EMAIL:
-        raise RuntimeError("RESEND_FROM_EMAIL not set")
+    transport = get_transport()
+
+    result = transport.send(
+        EmailMessage(to_email=to_email, subject=subject, html=html)
+    )
+    if not result.ok:
+        raise RuntimeError(f"Email send failed ({transport.name}): {result.error}")
 
+    return {"id": result.message_id}
 
-    payload = {
-        "from": settings.RESEND_FROM_EMAIL,
-        "to": [to_email],
-        "subject": subject,
-        "html": html,
-    }
 
-    with httpx.Client(timeout=10) as client:
-        res = client.post(
-            RESEND_ENDPOINT,
-            headers={
-                "Authorization": f"Bearer {settings.RESEND_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
+async def asend_email(
+    *,
+    to_email: str,
+    subject: str,
+    html: str,
+):
+    """
+    send_email 的 async 版本（async endpoint 使用，不佔用 threadpool）
+    """
+    transport = get_transport()
 
-    if res.status_code >= 400:
-        raise RuntimeError(f"Resend error: {res.text}")
+    result = await transport.asend(
+        EmailMessage(to_email=to_email, subject=subject, html=html)
+    )
+    if not result.ok:
+        raise RuntimeError(f"Email send failed ({transport.name}): {result.error}")
 
-    return res.json()
+    return {"id": result.message_id}
 
 
+def send_via_resend(
+    *,
+    to_email: str,
+    subject: str,
+    html: str,
+):
+    """
+    ⚠️ Legacy：請改用 send_email()（transport 不再寫死 Resend）
+    """
+    return send_email(
+        to_email=to_email,
+        subject=subject,
+        html=html,
+    )
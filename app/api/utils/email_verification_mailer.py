@@ -1,10 +1,32 @@
 # app/api/utils/email_verification_mailer.py
 
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
 from app.core.config import settings
-from app.api.utils.email_sender import send_via_resend
+from app.api.utils.email_mailer import send_generic_email
 from app.api.utils.email_templates import verification_email_html
-from app.exceptions.submission import InvalidSubmissionStatusTransition
-from app.exceptions.base import ActiFlowException
+from app.services.email.outbox import enqueue_email
+
+
+VERIFICATION_SUBJECT = "請驗證你的 Email"
+
+
+def _verification_html(token: str) -> str:
+    verify_url = f"{settings.FRONTEND_BASE_URL}/verify-email?token={token}"
+
+    return verification_email_html(
+        verify_url=verify_url,
+    )
+
+
+def verification_html_template(placeholder: str) -> str:
+    """
+    token 以 placeholder 代替的驗證信 HTML（批次寫入時在 SQL 端 replace）
+    """
+    return _verification_html(placeholder)
 
 
 def send_verification_email(
@@ -12,17 +34,30 @@ def send_verification_email(
     to_email: str,
     token: str,
 ):
-    verify_url = f"{settings.FRONTEND_BASE_URL}/verify-email?token={token}"
-
-    subject = "請驗證你的 Email"
-
-    html = verification_email_html(
-        verify_url=verify_url,
+    return send_generic_email(
+        to_email=to_email,
+        subject=VERIFICATION_SUBJECT,
+        html=_verification_html(token),
     )
 
-    return send_via_resend(
+
+def enqueue_verification_email(
+    db: Session,
+    *,
+    to_email: str,
+    token: str,
+    ref_type: Optional[str] = None,
+    ref_uuid: Optional[UUID] = None,
+):
+    """
+    驗證信寫入 outbox（跟著呼叫端的 transaction commit）
+    """
+    return enqueue_email(
+        db,
         to_email=to_email,
-        subject=subject,
-        html=html,
+        subject=VERIFICATION_SUBJECT,
+        html=_verification_html(token),
+        category=f"{ref_type or 'email'}.verification",
+        ref_type=ref_type,
+        ref_uuid=ref_uuid,
     )
-
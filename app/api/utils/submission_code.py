@@ -1,10 +1,12 @@
 # app/api/utils/submission_code.py
 
-from datetime import datetime
+from app.services.submission.code_allocator import submission_code_allocator
 
-def generate_submission_code(event_code: str) -> str:
+def generate_submission_code(event_uuid, event_code: str) -> str:
     """
-    Example: EVT-20251224-001
+    Example: EVT-2025-001-00001Y
+
+    序號由 per-event sequence 配發（見 app/services/submission/code_allocator.py），
+    同一活動同時大量報名也不會撞到 uq_submission_event_code
     """
-    ts = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    return f"{event_code}-{ts}"
+    return submission_code_allocator.allocate(event_uuid, event_code)
@@ -0,0 +1,234 @@
+# app/core/conditional.py ← HTTP conditional requests（ETag / Last-Modified / 304）
+
+"""
+Conditional GET
+
+說明：
+- 單筆資源：strong ETag = hash(kind, resource id, version)
+  （version 來自快照版本 / fields_version / updated_at 等「變了就一定不同」的值）
+- 列表：先跑一條聚合（count, max(updated_at), sum(epoch(updated_at))）
+  → 任一列新增 / 刪除 / 更新都會改變 fingerprint，不需載入任何 row
+  ⚠️ 只用 max(updated_at) 不夠：updated_at = now() 是 transaction 開始時間，
+     較晚 commit 的舊 transaction 不一定會推高 max
+- 比對順序（RFC 9110 §13.2.2）：有 If-None-Match 就只看它，否則才看 If-Modified-Since
+- 命中 → 直接回 304（不載入資料、不序列化）；未命中 → 在 response 帶上 validators
+
+用法：
+    validators = list_validators(request, query, Event.updated_at, cache_control=PUBLIC_CACHE_CONTROL)
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    validators.apply(response)
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Query
+
+from app.core.config import settings
+
+
+# =========================================================
+# Cache-Control
+# =========================================================
+
+def _public_cache_control() -> str:
+    directives = ["public", f"max-age={settings.HTTP_CACHE_PUBLIC_MAX_AGE}"]
+    if settings.HTTP_CACHE_PUBLIC_S_MAXAGE > 0:
+        directives.append(f"s-maxage={settings.HTTP_CACHE_PUBLIC_S_MAXAGE}")
+    directives.append("must-revalidate")
+    return ", ".join(directives)
+
+
+# 公開資料：瀏覽器 / CDN 可快取，過期後以 ETag 重新驗證
+PUBLIC_CACHE_CONTROL = _public_cache_control()
+
+# 後台資料：只允許瀏覽器快取，且每次都要重新驗證
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+# =========================================================
+# ETag / HTTP date
+# =========================================================
+
+def strong_etag(*parts: Any) -> str:
+    raw = "\x1f".join("" if p is None else str(p) for p in parts)
+    return '"' + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest() + '"'
+
+
+def http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """
+    If-None-Match 使用 weak comparison（忽略 W/ 前綴）
+    """
+    if header.strip() == "*":
+        return True
+
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+# =========================================================
+# Validators
+# =========================================================
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    etag: str
+    last_modified: Optional[datetime] = None
+    cache_control: str = PRIVATE_CACHE_CONTROL
+
+    @classmethod
+    def from_headers(cls, headers) -> Optional["Validators"]:
+        """
+        由已產生的 response headers 還原（快取的 response 仍可回 304）
+        """
+        etag = headers.get("etag")
+        if etag is None:
+            return None
+
+        last_modified = headers.get("last-modified")
+        return cls(
+            etag=etag,
+            last_modified=_parse_http_date(last_modified) if last_modified else None,
+            cache_control=headers.get("cache-control", PRIVATE_CACHE_CONTROL),
+        )
+
+    def headers(self) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": self.cache_control}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = http_date(self.last_modified)
+        return headers
+
+    def is_fresh(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return _etag_matches(if_none_match, self.etag)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+
+        since = _parse_http_date(if_modified_since)
+        if since is None:
+            return False
+
+        last_modified = self.last_modified
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+        # HTTP date 只到秒
+        return last_modified.replace(microsecond=0) <= since
+
+    def not_modified(self, request: Request) -> Optional[Response]:
+        """
+        命中 → 304 Response（呼叫端直接 return）；否則 None
+        """
+        if not self.is_fresh(request):
+            return None
+        return Response(status_code=304, headers=self.headers())
+
+    def apply(self, response: Response) -> Response:
+        response.headers.update(self.headers())
+        return response
+
+
+def resource_validators(
+    kind: str,
+    resource_id: Any,
+    version: Any,
+    *,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = PRIVATE_CACHE_CONTROL,
+) -> Validators:
+    """
+    單筆資源：kind 區分同一資源的不同 representation（public / detail / schedule）
+    """
+    return Validators(
+        etag=strong_etag(kind, resource_id, version),
+        last_modified=last_modified,
+        cache_control=cache_control,
+    )
+
+
+def loaded_validators(
+    kind: str,
+    resource_id: Any,
+    rows,
+    *,
+    cache_control: str = PRIVATE_CACHE_CONTROL,
+) -> Validators:
+    """
+    已載入的 ORM rows（主體 + 會帶出的關聯）→ 以各列 (id, updated_at) 計算 validators
+
+    用於沒有單一版本號可用的 response；仍在序列化之前完成比對
+    """
+    stamps = [(row.id, row.updated_at) for row in rows if row is not None]
+    return Validators(
+        etag=strong_etag(kind, resource_id, stamps),
+        last_modified=max((s for _, s in stamps if s is not None), default=None),
+        cache_control=cache_control,
+    )
+
+
+def list_validators(
+    request: Request,
+    query: Query,
+    *updated_at_columns,
+    scope: Any = None,
+    cache_control: str = PRIVATE_CACHE_CONTROL,
+) -> Validators:
+    """
+    列表：以一條聚合查詢取得 fingerprint（沿用列表的 filter / join，不含 ORDER BY）
+
+    - updated_at_columns：第一個為列表主體；其餘為 response 會帶出的關聯（如 activity_template）
+    - scope：不在 URL 上、但會影響結果的條件（如目前 organizer）
+    - ETag 包含 path + query string（分頁參數不同 → 不同 ETag）
+    """
+    aggregates = [func.count()]
+    for column in updated_at_columns:
+        aggregates.append(func.max(column))
+        aggregates.append(func.sum(func.extract("epoch", column)))
+
+    row = query.order_by(None).with_entities(*aggregates).one()
+
+    last_modified = max(
+        (value for value in row[1::2] if value is not None),
+        default=None,
+    )
+
+    params = sorted(request.query_params.multi_items())
+    return Validators(
+        etag=strong_etag(request.url.path, params, scope, *row),
+        last_modified=last_modified,
+        cache_control=cache_control,
+    )
@@ -21,8 +21,23 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
 
+    # opt-in：access token 內嵌 membership claim + membership_version
+    # 版本相符的 request 不查 membership（見 app/core/membership_version.py）
+    JWT_MEMBERSHIP_CLAIMS: bool = False
+    # 已驗證 token payload 快取（digest → payload，到 exp 失效）
+    JWT_VERIFY_CACHE_MAX_SIZE: int = 20000
+    MEMBERSHIP_VERSION_MAP_MAX_SIZE: int = 50000
+
     COOKIE_SECURE: bool = False  # HTTPS only
 
+    # === Password hashing ===
+    # bcrypt cost；調整後舊密碼會在下次登入時自動 rehash
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    # 專用 hashing executor（與 request threadpool 分開）
+    PASSWORD_HASH_WORKERS: int = 4
+    # 排隊上限；超過直接 503（登入尖峰 / credential stuffing）
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32
+
     # === CORS ===
     BACKEND_CORS_ORIGINS: list[str] = ["*"]
 
@@ -31,6 +46,108 @@ class Settings(BaseSettings):
     RESEND_FROM_EMAIL: str = ""
     FRONTEND_BASE_URL: str = ""
 
+    # === Email transport（見 app/services/email/transport.py）===
+    # resend / memory / file / blackhole
+    EMAIL_TRANSPORT: str = "resend"
+    # process 共用的 HTTP pool（outbox worker 並行數 + request 內直接寄送）
+    EMAIL_HTTP_MAX_CONNECTIONS: int = 20
+    EMAIL_HTTP_MAX_KEEPALIVE: int = 10
+    EMAIL_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    EMAIL_HTTP_TIMEOUT_SECONDS: float = 10.0
+    # 需要 h2（pip install "httpx[http2]"），未安裝時退回 HTTP/1.1
+    EMAIL_HTTP2: bool = False
+    # file transport 輸出目錄
+    EMAIL_FILE_DIR: str = "var/mail"
+    # blackhole transport：注入延遲 / 失敗率（benchmark）
+    EMAIL_BLACKHOLE_LATENCY_MS: int = 0
+    EMAIL_BLACKHOLE_JITTER_MS: int = 0
+    EMAIL_BLACKHOLE_FAILURE_RATE: float = 0.0
+
+    # === Email outbox（見 app/services/email/outbox_worker.py）===
+    # API process 內跑 worker；改用獨立 process 時設為 False
+    EMAIL_OUTBOX_WORKER_ENABLED: bool = True
+    EMAIL_OUTBOX_WORKERS: int = 2
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_SECONDS: float = 2.0
+    # sending 租約；需大於一批的發送時間
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 300
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 8
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = 30
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS: int = 3600
+    # 每個收件網域每分鐘上限（0 = 不限）；個別網域以 JSON 覆寫，例如 {"gmail.com": 300}
+    EMAIL_DOMAIN_RATE_PER_MINUTE: int = 600
+    EMAIL_DOMAIN_RATE_OVERRIDES: dict[str, int] = {}
+
+    # === Submission code（per-event sequence block 預留）===
+    SUBMISSION_CODE_BLOCK_SIZE: int = 20
+    SUBMISSION_CODE_MAX_BLOCK_SIZE: int = 1000
+
+    # === Submission form validator cache（見 app/services/submission/form_validator.py）===
+    # TTL 為跨 worker 失效的最終上限（正常情況由 invalidation channel 即時清除）
+    FIELD_VALIDATOR_CACHE_TTL_SECONDS: int = 300
+    FIELD_VALIDATOR_CACHE_MAX_SIZE: int = 2000
+
+    # === Published-event snapshot cache（見 app/services/event/snapshot.py）===
+    EVENT_SNAPSHOT_CACHE_TTL_SECONDS: int = 300
+    EVENT_SNAPSHOT_CACHE_MAX_SIZE: int = 5000
+
+    # === HTTP conditional GET（見 app/core/conditional.py）===
+    # 公開 GET 的 Cache-Control：max-age（瀏覽器）/ s-maxage（CDN，0 = 不設定）
+    # 過期後一律以 ETag 重新驗證（304 不需序列化）
+    HTTP_CACHE_PUBLIC_MAX_AGE: int = 0
+    HTTP_CACHE_PUBLIC_S_MAXAGE: int = 0
+
+    # === Route cache（見 app/core/route_cache.py；TTL 由各 route 指定）===
+    ROUTE_CACHE_MAX_SIZE: int = 5000
+    # single-flight follower 最長等待秒數（逾時自行計算）
+    ROUTE_CACHE_WAIT_TIMEOUT_SECONDS: float = 10.0
+
+    # === Seat reservation（見 app/services/event/reservation.py）===
+    # 未付款報名的名額保留時間；逾期由 sweeper 釋放
+    SEAT_HOLD_TTL_SECONDS: int = 900
+    SEAT_HOLD_SWEEPER_ENABLED: bool = True
+    SEAT_HOLD_SWEEP_INTERVAL_SECONDS: float = 15.0
+
+    # === Event report aggregates（見 app/services/event/report_aggregator.py）===
+    # API process 內跑 fold job；改用獨立 process 時設為 False
+    EVENT_REPORT_AGGREGATOR_ENABLED: bool = True
+    EVENT_REPORT_FOLD_INTERVAL_SECONDS: float = 5.0
+
+    # === Field answer analytics cache（見 app/services/event/field_analytics.py）===
+    # key 含報名 fingerprint（count + sum(epoch(updated_at))；資料異動即換 key）；TTL / size 只限制記憶體
+    FIELD_ANALYTICS_CACHE_TTL_SECONDS: int = 900
+    FIELD_ANALYTICS_CACHE_MAX_SIZE: int = 500
+
+    # === Organizer dashboard rollup（見 app/services/organizer/dashboard_rollup.py）===
+    DASHBOARD_ROLLUP_ENABLED: bool = True
+    DASHBOARD_ROLLUP_INTERVAL_SECONDS: float = 60.0
+    # high-water mark 重疊區間；需大於最長的報名寫入 transaction
+    DASHBOARD_ROLLUP_OVERLAP_SECONDS: int = 300
+
+    # === Submission answer storage（見 app/services/submission/answers.py）===
+    # values / dual / document
+    SUBMISSION_ANSWER_STORAGE: str = "dual"
+
+    # === Submission import（見 app/services/submission/importer.py）===
+    SUBMISSION_IMPORT_MAX_ROWS: int = 200000
+    # 回傳的逐列錯誤上限（計數不受限）
+    SUBMISSION_IMPORT_MAX_ERRORS: int = 1000
+    # 匯入寄出的驗證信有效時間（outbox 依網域限速，整批寄完可能需要一段時間）
+    SUBMISSION_IMPORT_VERIFICATION_TTL_HOURS: int = 72
+
+    # === Query instrumentation ===
+    # dev / test：回傳 X-DB-* headers；prod：寫 structured log
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_N_PLUS_ONE_THRESHOLD: int = 5
+
+    # === Principal cache ===
+    # TTL 為跨 worker 失效的最終上限（正常情況由 invalidation channel 即時清除）
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # === Cross-worker invalidation（PostgreSQL LISTEN / NOTIFY）===
+    INVALIDATION_CHANNEL_ENABLED: bool = True
+
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     def split_cors(cls, v):
         if isinstance(v, str):
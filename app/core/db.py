@@ -3,6 +3,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from app.core.config import settings
+from app.core.query_stats import install_query_instrumentation
 
 
 # ---------------------------------------------------------
@@ -23,6 +24,9 @@ engine = create_engine(
     pool_pre_ping=True,
 )
 
+# statements / rows / DB time per request（見 app/core/query_stats.py）
+install_query_instrumentation(engine)
+
 SessionLocal = sessionmaker(
     bind=engine,
     autocommit=False,
@@ -23,12 +23,7 @@ def require_super_admin(
     TODO: remove after legacy APIs migrated.
     """
 
-    system_roles = [
-        m for m in user.memberships
-        if m.get("type") == "system"
-    ]
-
-    if not any(m["role"] == "super_admin" for m in system_roles):
+    if not user.has_system_role({"super_admin"}):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Super admin access required",
@@ -154,18 +149,18 @@ def require_current_organizer_admin(
 # ============================================================
 
 from app.api.auth.dependencies import get_current_user
-from app.api.auth.identity import build_identity
 
 def get_current_identity(
     user=Depends(get_current_user),
-    db: Session = Depends(get_db),
 ):
     """
     Legacy helper for APIs that expect identity dict
 
+    get_current_user 已回傳 Principal（dict 相容），直接沿用
+
     ⚠️ 新 API 不應再使用
     """
-    return build_identity(db, user)
+    return user
 
 # ============================================================
 # Compatibility aliases (legacy imports)
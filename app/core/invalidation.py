@@ -0,0 +1,237 @@
+# app/core/invalidation.py ← 跨 worker 快取失效通道
+
+"""
+Cross-worker invalidation channel（PostgreSQL LISTEN / NOTIFY）
+
+說明：
+- 各模組以 subscribe(kind, handler) 註冊自己的 in-process 快取
+- 寫入端 commit 後呼叫 publish(kind, key)（transaction 內可用 publish_after_commit）：
+  1. 立即在本 process 執行 handler
+  2. NOTIFY 給其他 worker（由 InvalidationListener thread 收訊後執行 handler）
+- handler 收到 key=None 代表「整類清空」（例如 listener 斷線重連，期間訊息可能遺失）
+- NOTIFY 失敗只記 log，不影響寫入；各快取仍有 TTL 作為上限
+"""
+
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Optional
+from uuid import uuid4
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db import engine
+
+
+logger = logging.getLogger("app.invalidation")
+
+CHANNEL = "actiflow_invalidation"
+
+# 用來忽略自己發出的 NOTIFY（本地已經先處理過）
+_PROCESS_ID = uuid4().hex
+
+Handler = Callable[[Optional[str]], None]
+
+_handlers: dict[str, list[Handler]] = defaultdict(list)
+_handlers_lock = threading.Lock()
+
+
+# =========================================================
+# Subscribe / dispatch
+# =========================================================
+
+def subscribe(kind: str, handler: Handler) -> None:
+    """
+    註冊失效 handler（通常在模組 import 時呼叫一次）
+    """
+    with _handlers_lock:
+        if handler not in _handlers[kind]:
+            _handlers[kind].append(handler)
+
+
+def _dispatch(kind: str, key: Optional[str]) -> None:
+    with _handlers_lock:
+        handlers = tuple(_handlers.get(kind, ()))
+
+    for handler in handlers:
+        try:
+            handler(key)
+        except Exception:
+            logger.exception("Invalidation handler failed: kind=%s key=%s", kind, key)
+
+
+def _dispatch_reset() -> None:
+    with _handlers_lock:
+        kinds = tuple(_handlers)
+
+    for kind in kinds:
+        _dispatch(kind, None)
+
+
+# =========================================================
+# Publish
+# =========================================================
+
+def publish(kind: str, key: Optional[str] = None) -> None:
+    """
+    發布失效訊息（本地立即生效 + 通知其他 worker）
+
+    ⚠️ 請在 commit 之後呼叫，否則其他 worker 可能重新載入到舊資料
+    """
+    _dispatch(kind, key)
+
+    if not settings.INVALIDATION_CHANNEL_ENABLED:
+        return
+
+    payload = json.dumps(
+        {"o": _PROCESS_ID, "k": kind, "v": key},
+        separators=(",", ":"),
+    )
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": CHANNEL, "payload": payload},
+            )
+            conn.commit()
+    except Exception:
+        logger.exception("Failed to publish invalidation: kind=%s key=%s", kind, key)
+
+
+_PENDING_KEY = "invalidation_pending"
+
+
+def _publish_pending(session) -> None:
+    for kind, key in session.info.pop(_PENDING_KEY, None) or ():
+        publish(kind, key)
+
+
+def _discard_pending(session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# 掛在 Session class 上：per-session 的 once listener 會被 SQLAlchemy 去重，
+# 同一個 session 第二次之後的 commit 不會再觸發
+event.listen(Session, "after_commit", _publish_pending)
+event.listen(Session, "after_rollback", _discard_pending)
+
+
+def publish_after_commit(session, kind: str, key: Optional[str] = None) -> None:
+    """
+    session commit 成功後才 publish（rollback → 丟棄）
+
+    用於寫入端還在 transaction 內、尚未 commit 的情況
+    """
+    session.info.setdefault(_PENDING_KEY, []).append((kind, key))
+
+
+# =========================================================
+# Listener（每個 worker 一條 LISTEN 連線）
+# =========================================================
+
+class InvalidationListener(threading.Thread):
+    """
+    背景 thread：LISTEN CHANNEL 並分派其他 worker 的失效訊息
+    """
+
+    POLL_TIMEOUT = 5.0
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self):
+        super().__init__(name="invalidation-listener", daemon=True)
+        self._stop_event = threading.Event()
+        self._connection = None
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        connected_before = False
+
+        while not self._stop_event.is_set():
+            try:
+                self._connect()
+
+                # 重連期間的訊息可能遺失 → 所有快取整類清空
+                if connected_before:
+                    _dispatch_reset()
+                connected_before = True
+
+                self._listen()
+            except Exception:
+                logger.exception("Invalidation listener error, reconnecting")
+                time.sleep(self.RECONNECT_DELAY)
+            finally:
+                self._close()
+
+    def _connect(self) -> None:
+        pooled = engine.raw_connection()
+        pooled.detach()  # 專用長連線，不歸還 pool
+        self._connection = pooled.driver_connection
+        self._connection.autocommit = True
+
+        with self._connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+
+    def _listen(self) -> None:
+        conn = self._connection
+
+        while not self._stop_event.is_set():
+            ready, _, _ = select.select([conn], [], [], self.POLL_TIMEOUT)
+            if not ready:
+                continue
+
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                self._handle(notify.payload)
+
+    def _handle(self, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            logger.warning("Malformed invalidation payload: %r", raw)
+            return
+
+        if message.get("o") == _PROCESS_ID:
+            return
+
+        _dispatch(message.get("k"), message.get("v"))
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+
+_listener: Optional[InvalidationListener] = None
+
+
+def start_listener() -> None:
+    global _listener
+
+    if not settings.INVALIDATION_CHANNEL_ENABLED or _listener is not None:
+        return
+
+    _listener = InvalidationListener()
+    _listener.start()
+
+
+def stop_listener() -> None:
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener.join(timeout=InvalidationListener.POLL_TIMEOUT + 1)
+    _listener = None
@@ -1,9 +1,18 @@
 # app/core/jwt.py  ← JWT 產生、驗證
 
+import hashlib
+import heapq
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 from jose import jwt, JWTError, ExpiredSignatureError
 from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.core.invalidation import publish, subscribe
+from app.crud.user.crud_revoked_access_token import revoked_access_token_crud
 import uuid
 
 ALGORITHM = settings.ALGORITHM
@@ -21,36 +30,226 @@ def create_access_token(data: dict, expires_minutes: int = 60):
     to_encode.update({
         "exp": expire,
         "iat": issued_at,
-        "jti": str(uuid.uuid4())  # 用於 future token blacklist/revoke
+        "jti": str(uuid.uuid4())  # 用於 revoke（見 jti deny-list）
     })
 
     return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=ALGORITHM)
 
 
+# =========================================================
+# Verified token cache
+# =========================================================
+# 同一個 cookie token 每個 request 都會重新 parse + 驗 HMAC；
+# 以 token digest 快取驗證過的 payload，到 exp 即失效。
+
+class VerifiedTokenCache:
+    """
+    digest → (exp, payload)（LRU + 到期淘汰；另以 jti 索引供 revoke 移除）
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._by_jti: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, digest: bytes, now: float) -> Optional[dict]:
+        with self._lock:
+            entry = self._data.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            exp, payload = entry
+            if exp <= now:
+                self._remove(digest)
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(digest)
+            self.hits += 1
+            return payload
+
+    def put(self, digest: bytes, payload: dict) -> None:
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[digest] = (float(payload.get("exp", 0)), payload)
+            self._data.move_to_end(digest)
+
+            if payload.get("jti"):
+                self._by_jti[payload["jti"]] = digest
+
+            while len(self._data) > self.maxsize:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def evict_jti(self, jti: str) -> None:
+        with self._lock:
+            digest = self._by_jti.get(jti)
+            if digest is not None:
+                self._remove(digest)
+
+    def _remove(self, digest: bytes) -> None:
+        _, payload = self._data.pop(digest)
+        jti = payload.get("jti")
+        if jti and self._by_jti.get(jti) == digest:
+            del self._by_jti[jti]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+token_cache = VerifiedTokenCache(maxsize=settings.JWT_VERIFY_CACHE_MAX_SIZE)
+
+
+# =========================================================
+# jti deny-list
+# =========================================================
+# jti → exp；token 過期後不需再拒絕
+# 過期項目以 (exp, jti) min-heap 清除：插入時只 pop 已過期的 heap 頂端（O(log n)）
+
+_revoked: dict[str, float] = {}
+_revoked_expiry: list[tuple[float, str]] = []
+_revoked_lock = threading.Lock()
+
+JWT_REVOKED = "jwt.revoked"
+
+
+def deny_jti(jti: str, exp: float) -> None:
+    """
+    本 process 拒絕此 jti（並移出 verified cache）
+    """
+    now = time.time()
+    with _revoked_lock:
+        while _revoked_expiry and _revoked_expiry[0][0] <= now:
+            expired_at, expired = heapq.heappop(_revoked_expiry)
+            # 同一個 jti 可能以不同 exp 重複加入，只移除與目前一致的項目
+            if _revoked.get(expired) == expired_at:
+                del _revoked[expired]
+        if exp > now:
+            _revoked[jti] = exp
+            heapq.heappush(_revoked_expiry, (exp, jti))
+
+    token_cache.evict_jti(jti)
+
+
+def is_jti_revoked(jti: Optional[str]) -> bool:
+    return jti is not None and jti in _revoked
+
+
+def revoke_access_token(
+    db: Session,
+    payload: dict,
+    reason: Optional[str] = None,
+) -> None:
+    """
+    撤銷 access token：寫入 DB（重啟後仍有效）→ 廣播到所有 worker
+    """
+    jti = payload.get("jti")
+    exp = payload.get("exp")
+    if not jti or not exp:
+        return
+
+    revoked_access_token_crud.revoke(
+        db,
+        jti=jti,
+        expires_at=datetime.fromtimestamp(exp, tz=timezone.utc),
+        user_uuid=payload.get("sub"),
+        reason=reason,
+    )
+    publish(JWT_REVOKED, f"{jti}:{exp}")
+
+
+def load_revoked_tokens(db: Session) -> int:
+    """
+    啟動時由 DB 載入未過期的 jti
+    """
+    rows = revoked_access_token_crud.list_unexpired(db)
+    for jti, expires_at in rows:
+        deny_jti(jti, expires_at.timestamp())
+    return len(rows)
+
+
+def _on_jwt_revoked(key: Optional[str]) -> None:
+    # key=None（listener 重連）：deny-list 只增不減，無需處理
+    if key is None:
+        return
+
+    jti, _, exp = key.rpartition(":")
+    try:
+        deny_jti(jti, float(exp))
+    except ValueError:
+        pass
+
+
+subscribe(JWT_REVOKED, _on_jwt_revoked)
+
+
+# =========================================================
+# Decode
+# =========================================================
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=20).digest()
+
+
 def decode_access_token(token: str):
     """
     解碼與驗證 Access Token
+
+    - 驗證過的 payload 以 token digest 快取到 exp
+    - jti 在 deny-list 內 → 401
+    - 回傳值為快取共用的 dict，呼叫端不可修改
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[ALGORITHM]
-        )
-        return payload
+    digest = _token_digest(token)
 
-    except ExpiredSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired",
-        )
+    payload = token_cache.get(digest, time.time())
+    if payload is None:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET,
+                algorithms=[ALGORITHM]
+            )
+
+        except ExpiredSignatureError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has expired",
+            )
 
-    except JWTError:
+        except JWTError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token is invalid",
+            )
+
+        token_cache.put(digest, payload)
+
+    if is_jti_revoked(payload.get("jti")):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token is invalid",
+            detail="Token has been revoked",
         )
 
+    return payload
+
 
 def create_login_token(user_uuid: str, role: str):
     """
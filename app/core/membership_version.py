@@ -0,0 +1,154 @@
+# app/core/membership_version.py ← per-user membership_version
+
+"""
+Membership version（JWT membership claims 模式使用）
+
+說明：
+- users.membership_version：每次 membership / 帳號狀態異動 +1
+- access token 內帶 mv（簽發當下的版本）+ 精簡 membership claim
+- 驗證時只比對本 process 的 version map，相同 → 直接信任 claim，不查 membership
+- 版本遞增與 membership 異動在同一個 transaction（遞增失敗 → 異動一起 rollback）
+- commit 成功後才經 invalidation channel 廣播（payload：<user_uuid>:<version>）
+- version map miss 時以主鍵查一次 users.membership_version 補上
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.invalidation import publish_after_commit, subscribe
+from app.models.membership.organizer_membership import OrganizerMembership
+from app.models.user.user import User
+
+
+MEMBERSHIP_VERSION = "membership_version"
+
+
+# =========================================================
+# In-memory version map
+# =========================================================
+
+class MembershipVersionMap:
+    """
+    user_uuid → 目前的 membership_version（LRU，只增不減）
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_uuid: str) -> Optional[int]:
+        with self._lock:
+            version = self._data.get(user_uuid)
+            if version is not None:
+                self._data.move_to_end(user_uuid)
+            return version
+
+    def set(self, user_uuid: str, version: int) -> None:
+        with self._lock:
+            # 通知與 DB 讀取可能交錯，只接受較新的版本
+            if self._data.get(user_uuid, -1) > version:
+                return
+
+            self._data[user_uuid] = version
+            self._data.move_to_end(user_uuid)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, user_uuid: str) -> None:
+        with self._lock:
+            self._data.pop(user_uuid, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def current(self, db: Session, user_uuid: str) -> Optional[int]:
+        """
+        目前版本；使用者不存在 / 已停用 → None
+        """
+        version = self.get(user_uuid)
+        if version is not None:
+            return version
+
+        version = (
+            db.query(User.membership_version)
+            .filter(
+                User.uuid == user_uuid,
+                User.is_deleted == False,
+                User.is_active == True,
+            )
+            .scalar()
+        )
+
+        if version is not None:
+            self.set(user_uuid, version)
+        return version
+
+
+membership_versions = MembershipVersionMap(
+    maxsize=settings.MEMBERSHIP_VERSION_MAP_MAX_SIZE,
+)
+
+
+# =========================================================
+# Bump（由 principal_cache 的失效 hook 呼叫，commit 之前）
+# =========================================================
+
+def _bump(db: Session, condition) -> None:
+    statement = (
+        update(User)
+        .where(condition)
+        .values(
+            membership_version=User.membership_version + 1,
+            # 不視為帳號資料更新（避免 onupdate 改到 updated_at）
+            updated_at=User.updated_at,
+        )
+        .returning(User.uuid, User.membership_version)
+        .execution_options(synchronize_session=False)
+    )
+
+    for user_uuid, version in db.execute(statement).all():
+        publish_after_commit(db, MEMBERSHIP_VERSION, f"{user_uuid}:{version}")
+
+
+def bump_membership_versions(db: Session, user_uuids: Iterable) -> None:
+    if not settings.JWT_MEMBERSHIP_CLAIMS:
+        return
+
+    uuids = [UUID(str(u)) for u in user_uuids]
+    if uuids:
+        _bump(db, User.uuid.in_(uuids))
+
+
+def bump_organizer_membership_versions(db: Session, organizer_uuid) -> None:
+    if not settings.JWT_MEMBERSHIP_CLAIMS:
+        return
+
+    members = (
+        select(OrganizerMembership.user_uuid)
+        .where(OrganizerMembership.organizer_uuid == UUID(str(organizer_uuid)))
+    )
+    _bump(db, User.uuid.in_(members))
+
+
+def _on_membership_version(key: Optional[str]) -> None:
+    if key is None:
+        membership_versions.clear()
+        return
+
+    user_uuid, _, version = key.rpartition(":")
+    try:
+        membership_versions.set(user_uuid, int(version))
+    except ValueError:
+        membership_versions.discard(user_uuid)
+
+
+subscribe(MEMBERSHIP_VERSION, _on_membership_version)
@@ -1 +1,81 @@
-# app/core/middleware.py ← FastAPI Middleware 全域中間件
\ No newline at end of file
+# app/core/middleware.py ← FastAPI Middleware 全域中間件
+
+import json
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.query_stats import collect_query_stats
+
+logger = logging.getLogger("db.query_stats")
+
+
+# ============================================================
+# Query stats middleware
+# ============================================================
+
+class QueryStatsMiddleware:
+    """
+    每個 HTTP request 建立一個 QueryStats 範圍
+
+    - dev / test：在 response headers 附上 X-DB-* 統計
+    - prod：request 結束後寫一行 JSON log
+    - 任何環境偵測到 N+1 都會 log warning
+
+    使用 pure ASGI middleware（不用 BaseHTTPMiddleware），
+    避免 contextvar 被切到另一個 task。
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.expose_headers = settings.ENV in ("dev", "test")
+        self.threshold = settings.QUERY_STATS_N_PLUS_ONE_THRESHOLD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not settings.QUERY_STATS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        with collect_query_stats(self.threshold) as stats:
+
+            async def send_with_stats(message: Message):
+                if message["type"] == "http.response.start" and self.expose_headers:
+                    headers = list(message.get("headers", []))
+                    headers += [
+                        (b"x-db-query-count", str(stats.statements).encode()),
+                        (b"x-db-rows", str(stats.rows).encode()),
+                        (b"x-db-time-ms", str(stats.db_time_ms).encode()),
+                        (b"x-db-n-plus-one", str(len(stats.n_plus_one())).encode()),
+                    ]
+                    message["headers"] = headers
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                self._report(scope, stats)
+
+    def _report(self, scope: Scope, stats) -> None:
+        suspects = stats.n_plus_one()
+
+        if suspects:
+            logger.warning(
+                "N+1 query pattern on %s %s: %s",
+                scope.get("method"),
+                scope.get("path"),
+                "; ".join(f"{count}× {shape[:200]}" for shape, count in suspects),
+            )
+
+        if settings.ENV == "prod" and stats.statements:
+            logger.info(
+                json.dumps(
+                    {
+                        "event": "request_query_stats",
+                        "method": scope.get("method"),
+                        "path": scope.get("path"),
+                        **stats.as_dict(),
+                    },
+                    ensure_ascii=False,
+                )
+            )
@@ -0,0 +1,163 @@
+# app/core/password_hasher.py ← 密碼 hashing 專用 executor
+
+"""
+Password hashing executor
+
+說明：
+- bcrypt 為 CPU-bound（每次數十～數百 ms），不可佔用 Starlette request threadpool
+- 專用 ThreadPoolExecutor（PASSWORD_HASH_WORKERS），bcrypt 會釋放 GIL
+- 執行中 + 排隊中 超過上限 → 立即 503（不排隊等待）
+- 記錄 hash / verify 耗時（count / avg / p95 / max）與 shed 次數
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.security import hash_password, verify_and_update_password
+
+
+class _OpMetrics:
+    """
+    單一操作（hash / verify）的耗時統計
+    """
+
+    def __init__(self, window: int = 1000):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def record(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self._recent.append(elapsed)
+
+    def as_dict(self) -> dict:
+        recent = sorted(self._recent)
+        p95 = recent[int(len(recent) * 0.95) - 1] if recent else 0.0
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 2) if self.count else 0.0,
+            "p95_ms": round(p95 * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+class PasswordHasher:
+    """
+    Bounded hashing executor（async API）
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.max_pending = workers + queue_limit
+
+        # 第一次 submit 時建立；shutdown() 後再 submit 會重新建立（同一 process 內多次 lifespan）
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        self.rejected = 0
+        self._metrics = {
+            "hash": _OpMetrics(),
+            "verify": _OpMetrics(),
+        }
+
+    # -----------------------------------------------------
+    # Submit
+    # -----------------------------------------------------
+
+    def _run(self, op: str, fn: Callable, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._metrics[op].record(elapsed)
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def submit(self, op: str, fn: Callable, *args) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication service busy, please retry",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="password-hash",
+                )
+            executor = self._executor
+
+        future = executor.submit(self._run, op, fn, *args)
+        future.add_done_callback(self._release)
+        return future
+
+    # -----------------------------------------------------
+    # Async API
+    # -----------------------------------------------------
+
+    async def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str,
+    ) -> tuple[bool, str | None]:
+        """
+        驗證密碼；cost 變更時同時回傳新 Hash（呼叫端負責寫回）
+        """
+        future = self.submit(
+            "verify",
+            verify_and_update_password,
+            plain_password,
+            hashed_password,
+        )
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, plain_password: str) -> str:
+        future = self.submit("hash", hash_password, plain_password)
+        return await asyncio.wrap_future(future)
+
+    # -----------------------------------------------------
+    # Metrics
+    # -----------------------------------------------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "rejected": self.rejected,
+                "rounds": settings.PASSWORD_BCRYPT_ROUNDS,
+                "hash": self._metrics["hash"].as_dict(),
+                "verify": self._metrics["verify"].as_dict(),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+)
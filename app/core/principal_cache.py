@@ -0,0 +1,205 @@
+# app/core/principal_cache.py ← 登入者身分（principal）快取
+
+"""
+Principal cache
+
+說明：
+- key：user UUID（str）
+- value：get_current_user 回傳的 Principal（immutable，可跨 request 共用）
+- TTL + LRU：TTL 為跨 worker 失效的最終上限，LRU 限制記憶體
+- 失效 hook：membership CRUD / 帳號停用啟用 / owner 轉移 / organizer 異動
+  → invalidate_principal() / invalidate_organizer_principals()（transaction 內、commit 之前）
+  → commit 成功後經 app/core/invalidation.py 廣播到所有 worker
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.invalidation import publish_after_commit, subscribe
+from app.core.membership_version import (
+    bump_membership_versions,
+    bump_organizer_membership_versions,
+)
+
+
+class PrincipalCache:
+    """
+    Thread-safe TTL / LRU cache
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 每次失效 +1；載入前記下，寫回時若已變動代表載入期間被失效過 → 不寫回
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    # -----------------------------------------------------
+    # Read / write
+    # -----------------------------------------------------
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> Optional[Any]:
+        now = self._clock()
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any, *, generation: Optional[int] = None) -> bool:
+        """
+        寫入快取
+
+        :param generation: 載入前取得的 self.generation；載入期間若有失效則放棄寫入
+        """
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return False
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+        return True
+
+    # -----------------------------------------------------
+    # Invalidation
+    # -----------------------------------------------------
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> int:
+        with self._lock:
+            self._generation += 1
+            keys = [k for k, (_, v) in self._data.items() if predicate(v)]
+            for k in keys:
+                del self._data[k]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    # -----------------------------------------------------
+    # Metrics
+    # -----------------------------------------------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+# =========================================================
+# Invalidation hooks（異動的 transaction 內呼叫；commit 之後才廣播）
+# =========================================================
+
+PRINCIPAL = "principal"
+PRINCIPAL_ORGANIZER = "principal.organizer"
+
+
+def invalidate_principal(db: Session, *user_uuids) -> None:
+    """
+    使用者本身 / 其 membership 變動
+    """
+    user_uuids = [u for u in user_uuids if u is not None]
+
+    # JWT membership claims 模式：與異動同一個 transaction 遞增 mv，讓既有 token 失效
+    bump_membership_versions(db, user_uuids)
+
+    for user_uuid in user_uuids:
+        publish_after_commit(db, PRINCIPAL, str(user_uuid))
+
+
+def invalidate_organizer_principals(db: Session, organizer_uuid) -> None:
+    """
+    organizer 異動（名稱 / 刪除）→ 所有該 organizer 成員
+    """
+    bump_organizer_membership_versions(db, organizer_uuid)
+    publish_after_commit(db, PRINCIPAL_ORGANIZER, str(organizer_uuid))
+
+
+def _has_organizer(organizer_uuid: str) -> Callable[[Any], bool]:
+    def predicate(principal) -> bool:
+        return organizer_uuid in principal.organizer_roles
+
+    return predicate
+
+
+def _on_principal(key: Optional[str]) -> None:
+    if key is None:
+        principal_cache.clear()
+    else:
+        principal_cache.invalidate(key)
+
+
+def _on_principal_organizer(key: Optional[str]) -> None:
+    if key is None:
+        principal_cache.clear()
+    else:
+        principal_cache.invalidate_where(_has_organizer(key))
+
+
+subscribe(PRINCIPAL, _on_principal)
+subscribe(PRINCIPAL_ORGANIZER, _on_principal_organizer)
@@ -0,0 +1,197 @@
+# app/core/query_stats.py ← SQL 查詢統計（per-request）
+
+"""
+Query instrumentation（掛在 SQLAlchemy engine 上）
+
+說明：
+- 每個 request 統計 statements / rows / DB time
+- 同一 request 內同一條（正規化後）SQL 重複出現 → 視為 N+1
+- request 範圍由 app/core/middleware.py 的 QueryStatsMiddleware 建立
+- 測試可用 observe_queries() 觀察整個 process 的查詢（跨 thread）
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# =========================================================
+# Statement normalization
+# =========================================================
+
+# IN (...) 展開後的參數：%(uuid_1_1)s, %(uuid_1_2)s ...
+_EXPANDED_PARAMS = re.compile(r"%\(\w+?\)s(?:\s*,\s*%\(\w+?\)s)+")
+_NAMED_PARAM = re.compile(r"%\(\w+?\)s")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    將 SQL 正規化成「形狀」（參數 / literal 一律換成 ?）
+    """
+    s = _EXPANDED_PARAMS.sub("?", statement)
+    s = _NAMED_PARAM.sub("?", s)
+    s = _STRING_LITERAL.sub("?", s)
+    s = _NUMBER_LITERAL.sub("?", s)
+    return _WHITESPACE.sub(" ", s).strip()
+
+
+# =========================================================
+# Stats container
+# =========================================================
+
+class QueryStats:
+    """
+    單一範圍（request / test block）的查詢統計
+    """
+
+    def __init__(self, n_plus_one_threshold: int = 5):
+        self.statements = 0
+        self.rows = 0
+        self.db_time = 0.0  # seconds
+        self.shapes: Counter[str] = Counter()
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, rows: int, elapsed: float) -> None:
+        shape = normalize_statement(statement)
+        with self._lock:
+            self.statements += 1
+            self.rows += max(rows, 0)
+            self.db_time += elapsed
+            self.shapes[shape] += 1
+
+    @property
+    def db_time_ms(self) -> float:
+        return round(self.db_time * 1000, 2)
+
+    def n_plus_one(self) -> list[tuple[str, int]]:
+        """
+        回傳重複次數達門檻的 statement（最常見的在前）
+        """
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= self.n_plus_one_threshold
+        ]
+
+    def as_dict(self) -> dict:
+        return {
+            "queries": self.statements,
+            "rows": self.rows,
+            "db_time_ms": self.db_time_ms,
+            "n_plus_one": [
+                {"statement": shape, "count": count}
+                for shape, count in self.n_plus_one()
+            ],
+        }
+
+    def describe(self) -> str:
+        lines = [
+            f"{self.statements} queries, {self.rows} rows, {self.db_time_ms} ms"
+        ]
+        for shape, count in self.shapes.most_common():
+            lines.append(f"  {count:>3} × {shape}")
+        return "\n".join(lines)
+
+
+# =========================================================
+# Active collectors
+# =========================================================
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats",
+    default=None,
+)
+
+# 測試用觀察者（不受 contextvar / thread 邊界限制）
+_observers: set[QueryStats] = set()
+_observers_lock = threading.Lock()
+
+
+def get_current_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def collect_query_stats(n_plus_one_threshold: int = 5) -> Iterator[QueryStats]:
+    """
+    以 contextvar 建立統計範圍（middleware 使用）
+
+    sync endpoint 在 threadpool 執行時會複製 context，
+    因此同一個 QueryStats 物件在 request 全程共用。
+    """
+    stats = QueryStats(n_plus_one_threshold)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def observe_queries(n_plus_one_threshold: int = 5) -> Iterator[QueryStats]:
+    """
+    觀察區塊期間整個 process 的查詢（TestClient 會在其他 thread 跑 app）
+    """
+    stats = QueryStats(n_plus_one_threshold)
+    with _observers_lock:
+        _observers.add(stats)
+    try:
+        yield stats
+    finally:
+        with _observers_lock:
+            _observers.discard(stats)
+
+
+# =========================================================
+# Engine hooks
+# =========================================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    elapsed = time.perf_counter() - started
+
+    stats = _current_stats.get()
+    if stats is None and not _observers:
+        return
+
+    rows = getattr(cursor, "rowcount", 0) or 0
+
+    if stats is not None:
+        stats.record(statement, rows, elapsed)
+
+    for observer in tuple(_observers):
+        observer.record(statement, rows, elapsed)
+
+
+def _handle_error(exception_context):
+    # 失敗的 statement 不會觸發 after_cursor_execute，需清掉計時
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """
+    掛上 engine event hooks（app/core/db.py 建立 engine 後呼叫一次）
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -1,58 +1,30 @@
 # app/core/rbac.py
 
-from typing import Iterable, Callable, Optional
+from typing import Iterable, Callable
 from fastapi import Depends, HTTPException, status
 
 from app.api.auth.dependencies import get_current_user
+from app.api.auth.identity import Principal
 
 
 # =====================================================
 # Internal helpers (pure logic)
 # =====================================================
-
-def _get_system_memberships(user: dict) -> list[dict]:
-    return [
-        m for m in user.get("memberships", [])
-        if m.get("type") == "system"
-    ]
-
-
-def _get_organizer_memberships(user: dict, organizer_uuid: Optional[str] = None) -> list[dict]:
-    memberships = [
-        m for m in user.get("memberships", [])
-        if m.get("type") == "organizer"
-    ]
-
-    if organizer_uuid:
-        memberships = [
-            m for m in memberships
-            if m.get("organizer_uuid") == organizer_uuid
-        ]
-
-    return memberships
-
+# Principal 已預先建好 lookup set / map → O(1)
 
 def _system_role_allowed(
-    user: dict,
+    user: Principal,
     allowed_roles: Iterable[str],
 ) -> bool:
-    for m in _get_system_memberships(user):
-        if m.get("status") != "active":
-            continue
-        if m.get("role") in allowed_roles:
-            return True
-    return False
+    return user.has_system_role(allowed_roles)
 
 
 def _organizer_role_allowed(
-    user: dict,
+    user: Principal,
     organizer_uuid: str,
     allowed_roles: Iterable[str],
 ) -> bool:
-    for m in _get_organizer_memberships(user, organizer_uuid):
-        if m.get("membership_role") in allowed_roles:
-            return True
-    return False
+    return user.organizer_role(organizer_uuid) in allowed_roles
 
 
 # =====================================================
@@ -70,7 +42,7 @@ def require_system_role(
     allowed_roles = {role} if isinstance(role, str) else set(role)
 
     def dependency(
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_user),
     ):
         if not _system_role_allowed(current_user, allowed_roles):
             raise HTTPException(
@@ -93,7 +65,7 @@ def require_organizer_role(
 
     def dependency(
         organizer_uuid: str,
-        current_user: dict = Depends(get_current_user),
+        current_user: Principal = Depends(get_current_user),
     ):
         if not _organizer_role_allowed(current_user, organizer_uuid, allowed_roles):
             raise HTTPException(
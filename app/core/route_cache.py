@@ -0,0 +1,445 @@
+# app/core/route_cache.py ← route-level response cache（single-flight + stale-while-revalidate）
+
+"""
+Route cache
+
+說明：
+- 以 decorator 掛在 FastAPI handler 上（sync / async 皆可），放在 @router.get 之下：
+
+      @router.get("/{event_uuid}", response_model=EventPublic)
+      @route_cache("public.event", ttl=2, stale_ttl=30, response_model=EventPublic,
+                   tag_param="event_uuid", invalidate_on=(EVENT_SNAPSHOT,))
+      def get_public_event(...): ...
+
+- key = (path, 排序後的 query string, scope(request))
+  scope 預設為 None（公開資料，所有人共用）；需登入的 route 必須提供 scope（如 organizer uuid）
+- 快取內容為「序列化後」的 200 response（body + headers，含 user-018 的 ETag）
+  → 命中時不跑 handler、不序列化；If-None-Match 命中直接 304
+- single-flight：同一 key 同時只有一個 request 執行 handler，其餘等待結果（coalesced）
+- stale-while-revalidate：過了 ttl 但仍在 stale_ttl 內 → 其他 request 直接拿舊資料，
+  第一個發現過期的 request 負責重算（在自己的 request 內，沿用自己的 DB session；
+  不開背景 thread，避免使用已關閉的 session）
+- 失效：invalidate_on 的 kind 收到 <tag>:<version> → 丟棄 tag 相同的 entry
+  （tag = handler 的 tag_param 參數值，如 event_uuid）；key=None → 全部清空
+- leader 以去掉 conditional headers（If-None-Match / If-Modified-Since）的 request 執行 handler
+  → 一定算出完整的 200 entry；leader 自己與所有 follower 都經 entry.to_response() 回應
+  （輪詢 / CDN 幾乎都帶 If-None-Match，否則 leader 拿到 304 時 follower 全部各自重算）
+- 非 200（例外 / 錯誤回應）不寫入；leader 失敗時 follower 各自重算
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from app.core.conditional import Validators
+from app.core.config import settings
+from app.core.invalidation import subscribe
+
+
+# 不保存的 headers（每次 response 重新計算 / 與單一 request 相關）
+_SKIP_HEADERS = {"content-length", "set-cookie", "x-db-query-count"}
+
+# leader 執行 handler 時移除（304 與否改由 entry.to_response() 對每個 request 判斷）
+_CONDITIONAL_HEADERS = {b"if-none-match", b"if-modified-since"}
+
+
+def _unconditional(request: Request) -> Request:
+    headers = request.scope["headers"]
+    stripped = [(k, v) for k, v in headers if k.lower() not in _CONDITIONAL_HEADERS]
+    if len(stripped) == len(headers):
+        return request
+    return Request({**request.scope, "headers": stripped}, request.receive)
+
+
+# =========================================================
+# Entry / flight
+# =========================================================
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    body: bytes
+    headers: tuple[tuple[str, str], ...]
+    tag: Optional[str]
+    fresh_until: float
+    stale_until: float
+    validators: Optional[Validators]
+
+    def to_response(self, request: Request) -> Response:
+        if self.validators is not None:
+            not_modified = self.validators.not_modified(request)
+            if not_modified is not None:
+                return not_modified
+        return Response(content=self.body, status_code=200, headers=dict(self.headers))
+
+
+class _Flight:
+    """
+    進行中的計算；sync 用 threading.Event，async 用 asyncio.Future
+    """
+
+    __slots__ = ("done", "future", "entry")
+
+    def __init__(self, future: Optional[asyncio.Future] = None):
+        self.done = threading.Event()
+        self.future = future
+        self.entry: Optional[_Entry] = None
+
+    def finish(self, entry: Optional[_Entry]) -> None:
+        self.entry = entry
+        self.done.set()
+        if self.future is not None and not self.future.done():
+            self.future.set_result(entry)
+
+
+# =========================================================
+# Cache
+# =========================================================
+
+class RouteCache:
+    """
+    單一 route 的 response cache（thread-safe；LRU + TTL）
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl: float,
+        stale_ttl: float = 0,
+        maxsize: Optional[int] = None,
+        wait_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = settings.ROUTE_CACHE_MAX_SIZE if maxsize is None else maxsize
+        self.wait_timeout = (
+            settings.ROUTE_CACHE_WAIT_TIMEOUT_SECONDS if wait_timeout is None else wait_timeout
+        )
+        self._clock = clock
+
+        self._entries: OrderedDict[Any, _Entry] = OrderedDict()
+        self._flights: dict[Any, _Flight] = {}
+        self._lock = threading.Lock()
+
+        # 每次失效 +1；計算開始後才失效的結果不寫回
+        self._generation = 0
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.uncacheable = 0
+        self.invalidations = 0
+
+    # -----------------------------------------------------
+    # Lookup（決定這個 request 的角色）
+    # -----------------------------------------------------
+
+    def _lookup(self, key, future_factory=None) -> tuple[Optional[_Entry], Optional[_Flight], bool]:
+        """
+        回傳 (可直接使用的 entry, flight, 是否為 leader)
+
+        - entry 非 None → 直接回應（fresh hit / stale hit）
+        - leader → 執行 handler 後 _store()
+        - 否則 → 等待 flight
+        """
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now >= entry.stale_until:
+                del self._entries[key]
+                entry = None
+
+            if entry is not None and now < entry.fresh_until:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry, None, False
+
+            flight = self._flights.get(key)
+            if flight is not None:
+                if entry is not None:
+                    self.stale_hits += 1
+                    return entry, None, False
+                self.coalesced += 1
+                return None, flight, False
+
+            flight = _Flight(future_factory() if future_factory else None)
+            self._flights[key] = flight
+            if entry is not None:
+                self.refreshes += 1
+            else:
+                self.misses += 1
+            return None, flight, True
+
+    def _store(self, key, flight: _Flight, generation: int, tag, response) -> Optional[_Entry]:
+        entry = None
+
+        if response is not None and response.status_code == 200:
+            now = self._clock()
+            headers = tuple(
+                (k, v) for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS
+            )
+            entry = _Entry(
+                body=bytes(response.body),
+                headers=headers,
+                tag=tag,
+                fresh_until=now + self.ttl,
+                stale_until=now + self.ttl + self.stale_ttl,
+                validators=Validators.from_headers(response.headers),
+            )
+
+        with self._lock:
+            self._flights.pop(key, None)
+
+            if entry is None:
+                self.uncacheable += 1
+            elif generation == self._generation and self.maxsize > 0:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        flight.finish(entry)
+        return entry
+
+    # -----------------------------------------------------
+    # Invalidation
+    # -----------------------------------------------------
+
+    def invalidate(self, tag: Optional[str] = None) -> None:
+        """
+        tag=None → 全部清空；否則只丟棄該 tag 的 entry
+        """
+        with self._lock:
+            self._generation += 1
+            if tag is None:
+                dropped = list(self._entries)
+            else:
+                dropped = [k for k, e in self._entries.items() if e.tag == tag]
+            for key in dropped:
+                del self._entries[key]
+            self.invalidations += len(dropped)
+
+    def on_message(self, message: Optional[str]) -> None:
+        """
+        invalidation channel handler：<tag>:<version>；None → 全部清空
+        """
+        if message is None:
+            self.invalidate()
+            return
+        tag, sep, _ = message.rpartition(":")
+        self.invalidate(tag if sep else message)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    # -----------------------------------------------------
+    # Metrics
+    # -----------------------------------------------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            served = self.hits + self.stale_hits + self.coalesced
+            lookups = served + self.misses + self.refreshes
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "stale_ttl_seconds": self.stale_ttl,
+                "in_flight": len(self._flights),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "refreshes": self.refreshes,
+                "uncacheable": self.uncacheable,
+                "hit_ratio": round(served / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+_registry: dict[str, RouteCache] = {}
+
+
+def route_cache_stats() -> list[dict]:
+    return [cache.stats() for cache in _registry.values()]
+
+
+def clear_route_caches() -> None:
+    for cache in _registry.values():
+        cache.clear()
+
+
+# =========================================================
+# Decorator
+# =========================================================
+
+def _with_parameter(signature: inspect.Signature, name: str, annotation) -> inspect.Signature:
+    """
+    handler 沒有宣告 request / response 時，由 wrapper 補上（FastAPI 注入）
+    """
+    if name in signature.parameters:
+        return signature
+
+    params = list(signature.parameters.values())
+    extra = inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+
+    # KEYWORD_ONLY 必須在 **kwargs 之前
+    if params and params[-1].kind is inspect.Parameter.VAR_KEYWORD:
+        params.insert(len(params) - 1, extra)
+    else:
+        params.append(extra)
+    return signature.replace(parameters=params)
+
+
+def route_cache(
+    name: str,
+    *,
+    ttl: float,
+    stale_ttl: float = 0,
+    response_model: Any = None,
+    scope: Optional[Callable[[Request], Any]] = None,
+    tag_param: Optional[str] = None,
+    invalidate_on: Iterable[str] = (),
+    maxsize: Optional[int] = None,
+):
+    """
+    :param name: 快取名稱（stats / debug 用，需唯一）
+    :param ttl: fresh 秒數
+    :param stale_ttl: 過期後仍可回傳舊資料的秒數（期間由一個 request 重算）
+    :param response_model: handler 回傳非 Response 時用來序列化（同 route 的 response_model）
+    :param scope: request → 權限範圍（需登入的 route 必填，避免跨使用者共用）
+    :param tag_param: 作為失效 tag 的 handler 參數名稱
+    :param invalidate_on: 訂閱的 invalidation kind
+    """
+    cache = RouteCache(name, ttl=ttl, stale_ttl=stale_ttl, maxsize=maxsize)
+    _registry[name] = cache
+
+    for kind in invalidate_on:
+        subscribe(kind, cache.on_message)
+
+    adapter = TypeAdapter(response_model) if response_model is not None else None
+
+    def decorate(handler):
+        signature = inspect.signature(handler)
+        wants_request = "request" in signature.parameters
+        wants_response = "response" in signature.parameters
+
+        wrapped_signature = _with_parameter(signature, "request", Request)
+        wrapped_signature = _with_parameter(wrapped_signature, "response", Response)
+
+        def cache_key(request: Request):
+            params = tuple(sorted(request.query_params.multi_items()))
+            return (request.url.path, params, scope(request) if scope else None)
+
+        def split(kwargs):
+            request = kwargs["request"] if wants_request else kwargs.pop("request")
+            response = kwargs["response"] if wants_response else kwargs.pop("response")
+            tag = kwargs.get(tag_param) if tag_param else None
+            return request, response, None if tag is None else str(tag)
+
+        def render(result, response: Response) -> Response:
+            if isinstance(result, Response):
+                return result
+
+            if adapter is not None:
+                # 與 FastAPI response_model 序列化一致（by_alias）
+                body = adapter.dump_json(
+                    adapter.validate_python(result, from_attributes=True),
+                    by_alias=True,
+                )
+            else:
+                body = TypeAdapter(Any).dump_json(result)
+
+            rendered = Response(
+                content=body,
+                status_code=response.status_code or 200,
+                media_type="application/json",
+            )
+            for k, v in response.headers.items():
+                if k.lower() not in ("content-length", "content-type"):
+                    rendered.headers[k] = v
+            return rendered
+
+        if inspect.iscoroutinefunction(handler):
+
+            @functools.wraps(handler)
+            async def async_wrapper(*args, **kwargs):
+                request, response, tag = split(kwargs)
+                key = cache_key(request)
+
+                loop = asyncio.get_running_loop()
+                entry, flight, leader = cache._lookup(key, loop.create_future)
+                if entry is not None:
+                    return entry.to_response(request)
+
+                if not leader:
+                    try:
+                        entry = await asyncio.wait_for(
+                            asyncio.shield(flight.future), cache.wait_timeout
+                        )
+                    except asyncio.TimeoutError:
+                        entry = None
+                    if entry is not None:
+                        return entry.to_response(request)
+                    return render(await handler(*args, **kwargs), response)
+
+                generation = cache._generation
+                if wants_request:
+                    kwargs["request"] = _unconditional(request)
+                rendered = None
+                try:
+                    rendered = render(await handler(*args, **kwargs), response)
+                finally:
+                    entry = cache._store(key, flight, generation, tag, rendered)
+                return entry.to_response(request) if entry is not None else rendered
+
+            wrapper = async_wrapper
+
+        else:
+
+            @functools.wraps(handler)
+            def sync_wrapper(*args, **kwargs):
+                request, response, tag = split(kwargs)
+                key = cache_key(request)
+
+                entry, flight, leader = cache._lookup(key)
+                if entry is not None:
+                    return entry.to_response(request)
+
+                if not leader:
+                    flight.done.wait(cache.wait_timeout)
+                    if flight.entry is not None:
+                        return flight.entry.to_response(request)
+                    return render(handler(*args, **kwargs), response)
+
+                generation = cache._generation
+                if wants_request:
+                    kwargs["request"] = _unconditional(request)
+                rendered = None
+                try:
+                    rendered = render(handler(*args, **kwargs), response)
+                finally:
+                    entry = cache._store(key, flight, generation, tag, rendered)
+                return entry.to_response(request) if entry is not None else rendered
+
+            wrapper = sync_wrapper
+
+        wrapper.__signature__ = wrapped_signature
+        wrapper.route_cache = cache
+        return wrapper
+
+    return decorate
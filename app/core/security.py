@@ -5,12 +5,17 @@ from jose import jwt, JWTError
 from passlib.context import CryptContext
 import os
 
+from app.core.config import settings
+
 # ----------------------
 # 密碼 Hash / Verify
 # ----------------------
+# rounds 變更後，舊 hash 會被 needs_update / verify_and_update 視為需要重算
+# （登入時透明 rehash，見 app/core/password_hasher.py）
 pwd_context = CryptContext(
     schemes=["bcrypt"],
-    deprecated="auto"
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
 )
 
 def hash_password(password: str) -> str:
@@ -21,6 +26,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """驗證明碼與 Hash 是否相符"""
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+) -> tuple[bool, str | None]:
+    """驗證密碼；cost 不符時一併回傳新的 Hash（否則為 None）"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 
 # ----------------------
 # JWT 設定
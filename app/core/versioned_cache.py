@@ -0,0 +1,149 @@
+# app/core/versioned_cache.py ← 以版本號失效的 in-process 快取
+
+"""
+Versioned cache
+
+說明：
+- key：str（通常為 UUID）
+- value：帶 .version（int，單調遞增）的 immutable 物件
+- 寫入端 commit 後廣播 <key>:<version>（app/core/invalidation.py）
+  → invalidate(key, version) 丟棄較舊的 value
+- 已知較新版本但尚未重新載入時，載入到的舊版本不會被寫回
+- TTL 為跨 worker 失效的最終上限，LRU 限制記憶體
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+class VersionedCache:
+    """
+    Thread-safe TTL / LRU cache
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 已知的最新版本（收到通知但尚未重新載入）；低於此版本的 value 不寫入
+        self._floor: dict[str, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    # -----------------------------------------------------
+    # Read / write
+    # -----------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        now = self._clock()
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> bool:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return False
+
+        with self._lock:
+            self.loads += 1
+
+            floor = self._floor.get(key)
+            if floor is not None:
+                if value.version < floor:
+                    return False
+                del self._floor[key]
+
+            current = self._data.get(key)
+            if current is not None and current[1].version > value.version:
+                return False
+
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return True
+
+    # -----------------------------------------------------
+    # Invalidation
+    # -----------------------------------------------------
+
+    def invalidate(self, key: str, version: Optional[int] = None) -> None:
+        """
+        version=None → 無條件丟棄；否則只丟棄比 version 舊的 value
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (version is None or entry[1].version < version):
+                del self._data[key]
+                self.invalidations += 1
+
+            if version is not None:
+                self._floor[key] = max(version, self._floor.get(key, version))
+                while len(self._floor) > self.maxsize:
+                    self._floor.pop(next(iter(self._floor)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+            self._floor.clear()
+
+    def on_message(self, message: Optional[str]) -> None:
+        """
+        invalidation channel handler：<key>:<version>；None → 整類清空
+        """
+        if message is None:
+            self.clear()
+            return
+
+        key, _, version = message.rpartition(":")
+        try:
+            self.invalidate(key, int(version))
+        except ValueError:
+            self.invalidate(message)
+
+    # -----------------------------------------------------
+    # Metrics
+    # -----------------------------------------------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "loads": self.loads,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,243 @@
+# app/crud/base/loader_profiles.py
+
+"""
+Loader profiles（ORM 關聯載入策略）
+
+說明：
+- Event / Submission 相關 relationship 一律預設 lazy="select"
+- 每個 route / CRUD method 宣告自己需要的 profile（例如 event.card）
+- profile 只套用該情境真正需要的 selectinload / joinedload / load_only
+- 測試時可用 track_lazy_loads() 抓出 profile 以外的 lazy load（N+1 來源）
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.orm import (
+    Query,
+    Session,
+    load_only,
+    noload,
+    selectinload,
+)
+
+from app.models.event.event import Event
+from app.models.submission.submission import Submission
+
+
+# =========================================================
+# Profile registry
+# =========================================================
+
+LOADER_PROFILES: dict[str, Callable[[], tuple]] = {}
+
+
+def loader_profile(name: str):
+    """
+    註冊 loader profile
+
+    Usage:
+        @loader_profile("event.card")
+        def _event_card():
+            return (load_only(...),)
+    """
+
+    def decorator(fn: Callable[[], tuple]) -> Callable[[], tuple]:
+        if name in LOADER_PROFILES:
+            raise ValueError(f"Loader profile already registered: {name}")
+        LOADER_PROFILES[name] = fn
+        return fn
+
+    return decorator
+
+
+def loader_options(name: str) -> tuple:
+    """
+    取得 profile 對應的 loader options
+    """
+    try:
+        return LOADER_PROFILES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown loader profile: {name}") from None
+
+
+def with_loader_profile(query: Query, name: str) -> Query:
+    """
+    將 profile 套用到 Query（並標記 execution option 方便除錯）
+    """
+    return (
+        query
+        .options(*loader_options(name))
+        .execution_options(loader_profile=name)
+    )
+
+
+def reload_with_profile(db: Session, obj, name: str):
+    """
+    commit 後以 profile 重新載入物件（取代 db.refresh）
+
+    ⚠️ commit 會 expire 所有屬性，eager 載入過的關聯會變回 lazy，
+    直接 refresh 後序列化會多出 lazy load。
+    """
+    model = type(obj)
+    return (
+        with_loader_profile(db.query(model), name)
+        .populate_existing()
+        .filter(model.id == obj.id)
+        .one()
+    )
+
+
+# =========================================================
+# Event profiles
+# =========================================================
+
+@loader_profile("event.card")
+def _event_card() -> tuple:
+    """
+    活動列表卡片：只取列表欄位，不載入任何關聯
+    """
+    return (
+        load_only(
+            Event.uuid,
+            Event.event_code,
+            Event.organizer_uuid,
+            Event.activity_template_uuid,
+            Event.name,
+            Event.description,
+            Event.status,
+            Event.start_date,
+            Event.end_date,
+            Event.registration_deadline,
+            Event.is_active,
+            Event.is_deleted,
+            Event.created_at,
+            Event.updated_at,
+        ),
+    )
+
+
+@loader_profile("event.row")
+def _event_row() -> tuple:
+    """
+    狀態 command / 存在性檢查：只要 events 本身
+    """
+    return ()
+
+
+@loader_profile("event.detail")
+def _event_detail() -> tuple:
+    """
+    EventResponse（後台 / 公開詳情）：event + activity_template
+    """
+    return (
+        selectinload(Event.activity_template),
+    )
+
+
+@loader_profile("event.public")
+def _event_public() -> tuple:
+    """
+    EventPublic：表單欄位 + 場次
+
+    tickets 為報名者持有的票券，不屬於公開資料，固定不載入
+    """
+    return (
+        selectinload(Event.fields),
+        selectinload(Event.schedules),
+        noload(Event.tickets),
+    )
+
+
+# =========================================================
+# Submission profiles
+# =========================================================
+
+@loader_profile("submission.row")
+def _submission_row() -> tuple:
+    """
+    狀態 command（confirm / paid / approve / reject / reopen）
+    """
+    return ()
+
+
+@loader_profile("submission.review")
+def _submission_review() -> tuple:
+    """
+    Organizer 審核列表：submission + values
+    """
+    return (
+        selectinload(Submission.values),
+    )
+
+
+@loader_profile("submission.answers")
+def _submission_answers() -> tuple:
+    """
+    Organizer 審核列表（SUBMISSION_ANSWER_STORAGE = document）：
+    答案在 submissions.answers，不載入 values
+    """
+    return (
+        noload(Submission.values),
+    )
+
+
+# =========================================================
+# Test helper：偵測 profile 以外的 lazy load
+# =========================================================
+
+@dataclass(frozen=True)
+class LazyLoad:
+    parent: str
+    relationship: str
+
+    def __str__(self) -> str:
+        return f"{self.parent}.{self.relationship}"
+
+
+@contextmanager
+def track_lazy_loads() -> Iterator[list[LazyLoad]]:
+    """
+    記錄期間內所有 Session 觸發的 lazy load
+
+    profile 內的 selectinload / joinedload 不會被記錄；
+    只有「序列化或程式碼存取到 profile 沒載入的關聯」才會出現在清單中。
+    """
+    loads: list[LazyLoad] = []
+
+    def _on_execute(orm_execute_state):
+        parent_state = orm_execute_state.lazy_loaded_from
+        if parent_state is None:
+            return
+
+        path = orm_execute_state.loader_strategy_path
+        prop = path[-1] if path else None
+        loads.append(
+            LazyLoad(
+                parent=parent_state.class_.__name__,
+                relationship=getattr(prop, "key", "?"),
+            )
+        )
+
+    event.listen(Session, "do_orm_execute", _on_execute)
+    try:
+        yield loads
+    finally:
+        event.remove(Session, "do_orm_execute", _on_execute)
+
+
+@contextmanager
+def assert_no_lazy_loads() -> Iterator[list[LazyLoad]]:
+    """
+    測試用：區塊內只要出現 lazy load 即失敗
+    """
+    with track_lazy_loads() as loads:
+        yield loads
+
+    if loads:
+        offenders = ", ".join(sorted({str(l) for l in loads}))
+        raise AssertionError(
+            f"Relationships loaded outside loader profile: {offenders}"
+        )
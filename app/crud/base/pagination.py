@@ -0,0 +1,189 @@
+# app/crud/base/pagination.py
+
+"""
+Query 分頁 helper（offset / keyset 兩種模式）
+
+keyset（cursor）模式：
+- WHERE (sort_key, id) < (:last_sort_key, :last_id) ORDER BY ... LIMIT n + 1
+- 不做 OFFSET，也不必每頁重跑 COUNT(*)
+- 需要對應的 (filter..., sort_key, id) 複合索引才會是 O(page)
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import asc, desc, tuple_
+from sqlalchemy.orm import Query
+
+from app.schemas.common.pagination import (
+    InvalidCursor,
+    PaginationMode,
+    TotalMode,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+MAX_CURSOR_PAGE_SIZE = 100
+
+
+@dataclass
+class Page:
+    items: list
+    page_size: int
+    total: Optional[int] = None
+    page: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    total_is_estimate: bool = False
+
+    def meta(self) -> dict:
+        """
+        PaginatedResponse 除了 items 以外的欄位
+        """
+        return {
+            "total": self.total,
+            "page": self.page,
+            "page_size": self.page_size,
+            "next_cursor": self.next_cursor,
+            "prev_cursor": self.prev_cursor,
+            "total_is_estimate": self.total_is_estimate,
+        }
+
+
+# =========================================================
+# Counting
+# =========================================================
+
+def estimate_count(query: Query) -> int:
+    """
+    以 PostgreSQL planner 的估計列數取代 COUNT(*)（不掃描資料）
+    """
+    connection = query.session.connection()
+    compiled = query.statement.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _count(query: Query, mode: TotalMode) -> tuple[Optional[int], bool]:
+    if mode == "exact":
+        return query.order_by(None).count(), False
+    if mode == "estimate":
+        return estimate_count(query.order_by(None)), True
+    return None, False
+
+
+# =========================================================
+# Paginate
+# =========================================================
+
+def paginate_query(
+    query: Query,
+    *,
+    keys: Sequence[Any],
+    descending: bool = True,
+    mode: PaginationMode = "offset",
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    count: TotalMode = "none",
+) -> Page:
+    """
+    依 mode 分頁
+
+    :param keys: 排序鍵（最後一個必須唯一，例如 (Model.created_at, Model.id)）
+    :param descending: 排序方向（所有鍵同方向）
+    :param mode: offset（page / page_size）或 cursor（keyset）
+    :param count: cursor 模式的 total 計算方式；offset 模式固定 exact
+    """
+    page_size = max(page_size, 1)
+
+    # 有帶 cursor 即視為 cursor 模式
+    if cursor is not None:
+        mode = "cursor"
+
+    if mode == "offset":
+        page = max(page, 1)
+        total = query.count()
+        items = (
+            query
+            .order_by(*[desc(k) if descending else asc(k) for k in keys])
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+        return Page(items=items, total=total, page=page, page_size=page_size)
+
+    # ---------------------------------------------------------
+    # Keyset
+    # ---------------------------------------------------------
+    page_size = min(page_size, MAX_CURSOR_PAGE_SIZE)
+    total, is_estimate = _count(query, count)
+
+    direction = "next"
+    filtered = query
+    if cursor:
+        try:
+            values, direction = decode_cursor(cursor)
+        except InvalidCursor as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+
+        if len(values) != len(keys):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+
+        # desc + next 或 asc + prev → 往「較小」方向找
+        go_lower = descending != (direction == "prev")
+        row, bound = tuple_(*keys), tuple_(*values)
+        filtered = filtered.filter(row < bound if go_lower else row > bound)
+
+    backwards = direction == "prev"
+    scan_desc = descending != backwards
+
+    rows = (
+        filtered
+        .order_by(*[desc(k) if scan_desc else asc(k) for k in keys])
+        .limit(page_size + 1)
+        .all()
+    )
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+
+    def _keys_of(obj) -> tuple:
+        return tuple(getattr(obj, k.key) for k in keys)
+
+    next_cursor = prev_cursor = None
+    if rows:
+        if backwards:
+            next_cursor = encode_cursor(_keys_of(rows[-1]), "next")
+            if has_more:
+                prev_cursor = encode_cursor(_keys_of(rows[0]), "prev")
+        else:
+            if has_more:
+                next_cursor = encode_cursor(_keys_of(rows[-1]), "next")
+            if cursor:
+                prev_cursor = encode_cursor(_keys_of(rows[0]), "prev")
+
+    return Page(
+        items=rows,
+        page_size=page_size,
+        total=total,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+        total_is_estimate=is_estimate,
+    )
@@ -1,5 +1,7 @@
 # app/crud/event/crud_event_field.py
 
+from typing import List, Optional
+
 from sqlalchemy.orm import Session
 
 from app.crud.base.crud_base import CRUDBase
@@ -9,9 +11,43 @@ from app.schemas.event.field.event_field_update import EventFieldUpdate
 
 
 class CRUDEventField(CRUDBase[EventField]):
+    """
+    ⚠️ 異動只 flush、不 commit：呼叫端（API）須在同一個 transaction 內
+       bump events.fields_version（報名表單 validator 快取）並重建公開活動快照後再 commit
+    """
+
+    def list_by_event(self, db: Session, event_uuid) -> List[EventField]:
+        return (
+            db.query(EventField)
+            .filter(
+                EventField.event_uuid == event_uuid,
+                EventField.is_deleted == False,
+            )
+            .order_by(EventField.sort_order, EventField.id)
+            .all()
+        )
+
+    def create(
+        self,
+        db: Session,
+        data: EventFieldCreate,
+        *,
+        event_uuid=None,
+        created_by=None,
+        created_by_role: Optional[str] = None,
+    ) -> EventField:
+        obj_in = data.model_dump()
+        if event_uuid is not None:
+            obj_in["event_uuid"] = event_uuid
 
-    def create(self, db: Session, data: EventFieldCreate) -> EventField:
-        return super().create(db, obj_in=data.model_dump())
+        obj = EventField(
+            **obj_in,
+            created_by=created_by,
+            created_by_role=created_by_role,
+        )
+        db.add(obj)
+        db.flush()
+        return obj
 
     def update(
         self,
@@ -19,11 +55,20 @@ class CRUDEventField(CRUDBase[EventField]):
         db_obj: EventField,
         data: EventFieldUpdate
     ) -> EventField:
-        return super().update(
-            db,
-            db_obj=db_obj,
-            obj_in=data.model_dump(exclude_unset=True),
-        )
+        for field, value in data.model_dump(exclude_unset=True).items():
+            setattr(db_obj, field, value)
+
+        db.add(db_obj)
+        db.flush()
+        return db_obj
+
+    def soft_delete(self, db: Session, *, db_obj: EventField) -> EventField:
+        db_obj.is_deleted = True
+        db_obj.is_active = False
+
+        db.add(db_obj)
+        db.flush()
+        return db_obj
 
 
 event_field_crud = CRUDEventField(EventField)
@@ -3,6 +3,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.principal_cache import invalidate_principal
 from app.models.membership.organizer_membership import OrganizerMembership
 from app.schemas.membership.organizer.organizer_membership_create import (
     OrganizerMembershipCreate,
@@ -109,8 +110,10 @@ def create_membership(
         created_by_role=created_by_role,
     )
     db.add(membership)
+    invalidate_principal(db, membership.user_uuid)
     db.commit()
     db.refresh(membership)
+
     return membership
 
 
@@ -131,8 +134,10 @@ def update_membership(
     membership.updated_by = updated_by
     membership.updated_by_role = updated_by_role
 
+    invalidate_principal(db, membership.user_uuid)
     db.commit()
     db.refresh(membership)
+
     return membership
 
 
@@ -150,8 +155,10 @@ def soft_delete_membership(
     membership.deleted_by = deleted_by
     membership.deleted_by_role = deleted_by_role
 
+    invalidate_principal(db, membership.user_uuid)
     db.commit()
     db.refresh(membership)
+
     return membership
 
 
@@ -213,7 +220,13 @@ def set_organizer_owner(
         target.updated_by = updated_by
         target.updated_by_role = updated_by_role
 
+        invalidate_principal(
+            db,
+            target.user_uuid,
+            current_owner.user_uuid if current_owner else None,
+        )
         db.commit()
+
         return True
 
     except SQLAlchemyError:
@@ -2,6 +2,7 @@
 
 from sqlalchemy.orm import Session
 
+from app.core.principal_cache import invalidate_principal
 from app.crud.base.crud_base import CRUDBase
 from app.models.membership.system_membership import SystemMembership
 from app.schemas.membership.system.system_membership_create import SystemMembershipCreate
@@ -22,6 +23,7 @@ class CRUDSystemMembership(CRUDBase[SystemMembership]):
         db: Session, 
         data: SystemMembershipCreate
     ) -> SystemMembership:
+        invalidate_principal(db, data.user_uuid)
         return super().create(
             db, 
             obj_in=data.model_dump()
@@ -33,12 +35,22 @@ class CRUDSystemMembership(CRUDBase[SystemMembership]):
         db_obj: SystemMembership, 
         data: SystemMembershipUpdate
     ) -> SystemMembership:
+        invalidate_principal(db, db_obj.user_uuid)
         return super().update(
             db, 
             db_obj=db_obj, 
             obj_in=data.model_dump(exclude_unset=True)
         )
 
+    def soft_delete(
+        self,
+        db: Session,
+        *,
+        db_obj: SystemMembership,
+    ) -> SystemMembership:
+        invalidate_principal(db, db_obj.user_uuid)
+        return super().soft_delete(db, db_obj=db_obj)
+
     # ------------------------------------------------------------
     #  取得某 user 的 SystemMembership（instance method）
     # ------------------------------------------------------------
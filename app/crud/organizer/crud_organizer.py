@@ -3,6 +3,7 @@
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.principal_cache import invalidate_organizer_principals
 from app.crud.base.crud_base import CRUDBase
 from app.models.organizer.organizer import Organizer
 from app.schemas.organizer.organizer_create import OrganizerCreate
@@ -34,12 +35,17 @@ class CRUDOrganizer(CRUDBase[Organizer]):
         db_obj: Organizer,
         data: OrganizerUpdate
     ) -> Organizer:
+        invalidate_organizer_principals(db, db_obj.uuid)
         return super().update(
             db,
             db_obj=db_obj,
             obj_in=data.model_dump(exclude_unset=True),
         )
 
+    def soft_delete(self, db: Session, *, db_obj: Organizer) -> Organizer:
+        invalidate_organizer_principals(db, db_obj.uuid)
+        return super().soft_delete(db, db_obj=db_obj)
+
     # -----------------------------------------------
     # ⭐ 同義方法：標準 CRUD 命名 get_by_uuid()
     #    讓 CRUD 介面保持一致性
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.crud.base.crud_base import CRUDBase
+from app.crud.base.loader_profiles import with_loader_profile
 from app.models.submission.submission import Submission
 from app.schemas.submission.submission_create import SubmissionCreate
 from app.schemas.submission.submission_update import (
@@ -89,9 +90,11 @@ class CRUDSubmission(CRUDBase[Submission]):
         self,
         db: Session,
         uuid: str,
+        *,
+        profile: str = "submission.row",
     ) -> Optional[Submission]:
         return (
-            db.query(self.model)
+            with_loader_profile(db.query(self.model), profile)
             .filter(
                 self.model.uuid == uuid,
                 self.model.is_deleted == False,
@@ -167,6 +170,9 @@ class CRUDSubmission(CRUDBase[Submission]):
         deleter_uuid: str | None = None,
         deleter_role: str | None = None,
     ) -> Submission:
+        # ⚠️ 活動統計由呼叫端在刪除前扣除（crud 不依賴 services）：
+        #    if not db_obj.is_deleted: record_submission(db, db_obj.uuid, sign=-1)
+        #    （app/services/event/report_aggregator.py）
         obj_in = {
             "is_deleted": True,
             "status": SubmissionStatus.DELETED.value,
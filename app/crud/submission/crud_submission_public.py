@@ -1,7 +1,6 @@
 #  app/crud/submission/crud_submission_public.py
 
 from sqlalchemy.orm import Session
-from uuid import uuid4
 
 from app.models.submission.submission import Submission
 from app.models.submission.submission_value import SubmissionValue
@@ -11,18 +10,23 @@ from app.schemas.submission.submission_public import SubmissionPublicCreate
 
 # -------------------------------------------------
 # Public：建立 Submission（主 + values）
+#
+# submission_code 由呼叫端配發（crud 不依賴 services）：
+#   submission_code_allocator.allocate(event.uuid, event.event_code)
+#   （app/services/submission/code_allocator.py）
 # -------------------------------------------------
 def create_public_submission(
     *,
     db: Session,
     event: Event,
+    submission_code: str,
     data: SubmissionPublicCreate,
     user_uuid: str | None,
     ip_address: str | None,
     user_agent: str | None,
 ) -> Submission:
     submission = Submission(
-        submission_code=f"SUB-{uuid4().hex[:8]}",
+        submission_code=submission_code,
         event_uuid=event.uuid,
         user_uuid=user_uuid,
         user_email=data.user_email,
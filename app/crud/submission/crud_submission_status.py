@@ -1,6 +1,16 @@
 # app/crud/submission/crud_submission_status.py
 
+from dataclasses import dataclass
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
 from app.exceptions.submission import InvalidSubmissionStatusTransition
+from app.models.event.event import Event
+from app.models.submission.submission import Submission
 
 ALLOWED_TRANSITIONS = {
 
@@ -16,6 +26,14 @@ ALLOWED_TRANSITIONS = {
     "rejected": ["paid"],
 }
 
+# target → 可轉入的來源狀態（UPDATE ... WHERE status = ANY(:allowed_from)）
+ALLOWED_FROM: dict[str, tuple[str, ...]] = {}
+for _source, _targets in ALLOWED_TRANSITIONS.items():
+    for _target in _targets:
+        ALLOWED_FROM.setdefault(_target, ())
+        ALLOWED_FROM[_target] += (_source,)
+
+
 def assert_status_transition(
     *,
     current: str,
@@ -24,4 +42,314 @@ def assert_status_transition(
     if target not in ALLOWED_TRANSITIONS.get(current, []):
         raise InvalidSubmissionStatusTransition(
             f"Cannot transition from {current} to {target}"
-        )
\ No newline at end of file
+        )
+
+
+# =========================================================
+# Transition executor（compare-and-swap）
+# =========================================================
+#
+# 一條 UPDATE 完成「檢查 + 推進」：
+#   UPDATE submissions
+#      SET status = :target, version = version + 1, ...
+#    WHERE uuid = :u AND status = ANY(:allowed_from) [AND version = :v] [AND ...]
+#   RETURNING ...
+#
+# - 同時兩位 organizer 操作 → 只有一個 UPDATE 命中，另一個拿到 conflict
+# - 成功路徑只有一個 round trip；失敗時才多一條 SELECT 判斷原因
+# - 不 commit（呼叫端可在同一個 transaction 寫入 outbox 等 side effect）
+# - 活動統計 delta 由呼叫端以 RETURNING row 寫入（crud 不依賴 services）：
+#   record_status_changes(db, [result.submission]) / record_status_changes(db, result.updated)
+#   （app/services/event/report_aggregator.py）
+# =========================================================
+
+# RETURNING 欄位（command response / notification 需要的部分）
+TRANSITION_RETURNING = (
+    Submission.uuid,
+    Submission.event_uuid,
+    Submission.status,
+    Submission.status_reason,
+    Submission.notes,
+    Submission.user_email,
+    Submission.version,
+)
+
+# conflict 種類
+NOT_FOUND = "not_found"
+WRONG_EVENT = "wrong_event"
+INVALID_TRANSITION = "invalid_transition"
+VERSION_CONFLICT = "version_conflict"
+PRECONDITION_FAILED = "precondition_failed"
+
+
+@dataclass(frozen=True, slots=True)
+class TransitionResult:
+    # 成功：RETURNING row（uuid / event_uuid / status / status_reason / notes / user_email / version）
+    submission: Optional[Row] = None
+
+    # 失敗：conflict 種類 + 目前狀態 / 版本（not_found 時為 None）
+    conflict: Optional[str] = None
+    current_status: Optional[str] = None
+    current_version: Optional[int] = None
+    target: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.submission is not None
+
+    @property
+    def message(self) -> str:
+        if self.conflict == NOT_FOUND:
+            return "Submission not found"
+        if self.conflict == WRONG_EVENT:
+            return "Submission does not belong to this event"
+        if self.conflict == VERSION_CONFLICT:
+            return (
+                f"Submission was modified concurrently "
+                f"(current version {self.current_version})"
+            )
+        if self.conflict == PRECONDITION_FAILED:
+            return "Submission precondition not met"
+        return f"Cannot transition from {self.current_status} to {self.target}"
+
+
+def _status_value(status) -> Optional[str]:
+    return getattr(status, "value", status)
+
+
+def _transition_statement(target: str, conditions, values: Optional[dict[str, Any]]):
+    """
+    UPDATE ... FROM (SELECT ... FOR UPDATE) RETURNING ..., previous_status
+
+    鎖定後讀到的狀態即為被覆寫的舊狀態 → 統計 delta（status:<舊> -1 / status:<新> +1）
+    """
+    previous = (
+        select(Submission.id, Submission.status.label("previous_status"))
+        .where(*conditions)
+        .with_for_update()
+        .subquery("previous")
+    )
+
+    return (
+        update(Submission)
+        .where(Submission.id == previous.c.id)
+        .values(
+            status=target,
+            version=Submission.version + 1,
+            **(values or {}),
+        )
+        .returning(*TRANSITION_RETURNING, previous.c.previous_status)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def transition_submission(
+    db: Session,
+    submission_uuid: UUID,
+    target: str,
+    *,
+    event_uuid: Optional[UUID] = None,
+    organizer_uuid: Optional[UUID] = None,
+    expected_version: Optional[int] = None,
+    values: Optional[dict[str, Any]] = None,
+    criteria: tuple = (),
+) -> TransitionResult:
+    """
+    以單一 UPDATE ... RETURNING 推進 submission 狀態（不 commit）
+
+    :param event_uuid / organizer_uuid: 範圍限制（不符 → WRONG_EVENT）
+    :param expected_version: 客戶端看到的 version（不符 → VERSION_CONFLICT）
+    :param values: 一併更新的欄位（status_reason / notes ...）
+    :param criteria: 額外前置條件（不符 → PRECONDITION_FAILED）
+    """
+    allowed_from = ALLOWED_FROM.get(target, ())
+
+    scope = []
+    if event_uuid is not None:
+        scope.append(Submission.event_uuid == event_uuid)
+    if organizer_uuid is not None:
+        scope.append(
+            Submission.event_uuid.in_(
+                select(Event.uuid).where(Event.organizer_uuid == organizer_uuid)
+            )
+        )
+
+    conditions = [
+        Submission.uuid == submission_uuid,
+        Submission.is_deleted == False,
+        Submission.status.in_(allowed_from),
+        *scope,
+        *criteria,
+    ]
+    if expected_version is not None:
+        conditions.append(Submission.version == expected_version)
+
+    row = db.execute(_transition_statement(target, conditions, values)).one_or_none()
+    if row is not None:
+        return TransitionResult(submission=row)
+
+    return _diagnose(
+        db,
+        submission_uuid,
+        target=target,
+        allowed_from=allowed_from,
+        event_uuid=event_uuid,
+        organizer_uuid=organizer_uuid,
+        expected_version=expected_version,
+    )
+
+
+def _diagnose(
+    db: Session,
+    submission_uuid: UUID,
+    *,
+    target: str,
+    allowed_from: tuple[str, ...],
+    event_uuid: Optional[UUID],
+    organizer_uuid: Optional[UUID],
+    expected_version: Optional[int],
+) -> TransitionResult:
+    """
+    UPDATE 沒命中時判斷原因（只在失敗路徑多一條 SELECT）
+    """
+    current = db.execute(
+        select(
+            Submission.status,
+            Submission.version,
+            Submission.event_uuid,
+            Event.organizer_uuid,
+        )
+        .join(Event, Event.uuid == Submission.event_uuid)
+        .where(
+            Submission.uuid == submission_uuid,
+            Submission.is_deleted == False,
+        )
+    ).one_or_none()
+
+    if current is None:
+        return TransitionResult(conflict=NOT_FOUND, target=target)
+
+    if (event_uuid is not None and current.event_uuid != event_uuid) or (
+        organizer_uuid is not None and current.organizer_uuid != organizer_uuid
+    ):
+        return TransitionResult(conflict=WRONG_EVENT, target=target)
+
+    status = _status_value(current.status)
+
+    if status not in allowed_from:
+        conflict = INVALID_TRANSITION
+    elif expected_version is not None and current.version != expected_version:
+        conflict = VERSION_CONFLICT
+    else:
+        conflict = PRECONDITION_FAILED
+
+    return TransitionResult(
+        conflict=conflict,
+        current_status=status,
+        current_version=current.version,
+        target=target,
+    )
+
+
+# =========================================================
+# Bulk transition（set-based）
+# =========================================================
+#
+# 一條 UPDATE 推進一整批：
+#   UPDATE submissions SET status = :target, version = version + 1, ...
+#    WHERE event_uuid = :e AND <organizer scope>
+#      AND status = ANY(:allowed_from)
+#      AND (uuid = ANY(:uuids) | uuid IN (SELECT ... <filter> LIMIT :n))
+#   RETURNING ...
+#
+# - 指定 UUID：沒命中的再用一條 SELECT 判斷原因（per-item outcome）
+# - filter：只回傳命中的列；一次最多 max_items 筆，has_more 提示呼叫端再送一次
+# =========================================================
+
+UPDATED = "updated"
+
+
+@dataclass(frozen=True, slots=True)
+class BulkTransitionResult:
+    target: str
+    updated: list[Row]
+    # submission_uuid → (conflict, current_status)
+    failed: dict[UUID, tuple[str, Optional[str]]]
+    has_more: bool = False
+
+
+def bulk_transition_submissions(
+    db: Session,
+    target: str,
+    *,
+    event_uuid: UUID,
+    organizer_uuid: UUID,
+    submission_uuids: Optional[list[UUID]] = None,
+    criteria: tuple = (),
+    max_items: Optional[int] = None,
+    values: Optional[dict[str, Any]] = None,
+) -> BulkTransitionResult:
+    """
+    批次推進 submission 狀態（不 commit）
+
+    :param submission_uuids: 指定 UUID（與 criteria 擇一）
+    :param criteria: filter 條件（status / created range / field value ...）
+    :param max_items: filter 模式單次上限
+    """
+    allowed_from = ALLOWED_FROM.get(target, ())
+
+    ownership = (
+        Submission.event_uuid == event_uuid,
+        Submission.event_uuid.in_(
+            select(Event.uuid).where(Event.organizer_uuid == organizer_uuid)
+        ),
+        Submission.is_deleted == False,
+    )
+    scope = (*ownership, Submission.status.in_(allowed_from))
+
+    if submission_uuids is not None:
+        submission_uuids = list(dict.fromkeys(submission_uuids))
+        selection = Submission.uuid.in_(submission_uuids)
+    else:
+        candidates = (
+            select(Submission.id)
+            .where(*scope, *criteria)
+            .order_by(Submission.id)
+        )
+        if max_items is not None:
+            candidates = candidates.limit(max_items)
+        selection = Submission.id.in_(candidates.scalar_subquery())
+
+    updated = db.execute(_transition_statement(target, (*scope, selection), values)).all()
+
+    if submission_uuids is None:
+        return BulkTransitionResult(
+            target=target,
+            updated=updated,
+            failed={},
+            has_more=max_items is not None and len(updated) >= max_items,
+        )
+
+    # 沒命中的 UUID：一條 SELECT 取目前狀態
+    missing = set(submission_uuids) - {row.uuid for row in updated}
+    failed: dict[UUID, tuple[str, Optional[str]]] = {}
+
+    if missing:
+        current = dict(
+            db.execute(
+                select(Submission.uuid, Submission.status).where(
+                    Submission.uuid.in_(missing),
+                    *ownership,
+                )
+            ).all()
+        )
+        for submission_uuid in missing:
+            if submission_uuid in current:
+                failed[submission_uuid] = (
+                    INVALID_TRANSITION,
+                    _status_value(current[submission_uuid]),
+                )
+            else:
+                failed[submission_uuid] = (NOT_FOUND, None)
+
+    return BulkTransitionResult(target=target, updated=updated, failed=failed)
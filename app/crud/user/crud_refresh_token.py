@@ -23,9 +23,13 @@ class CRUDRefreshToken(CRUDBase[RefreshToken]):
         *,
         user_uuid: UUID,
         user_agent: str,
+        commit: bool = True,
     ) -> RefreshToken:
         """
         建立新的 refresh token（登入 / refresh 時使用）
+
+        commit=False：只 add，由呼叫端與其他變更一起 commit
+        （token 字串在 Python 端產生，不需要 refresh 取回）
         """
         token_str = secrets.token_urlsafe(48)
 
@@ -43,8 +47,9 @@ class CRUDRefreshToken(CRUDBase[RefreshToken]):
         )
 
         db.add(token)
-        db.commit()
-        db.refresh(token)
+        if commit:
+            db.commit()
+            db.refresh(token)
         return token
 
     def revoke(self, db: Session, token: RefreshToken) -> RefreshToken:
@@ -0,0 +1,57 @@
+# app/crud/user/crud_revoked_access_token.py
+
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime, timezone
+from uuid import UUID
+
+from app.crud.base.crud_base import CRUDBase
+from app.models.auth.revoked_access_token import RevokedAccessToken
+
+
+class CRUDRevokedAccessToken(CRUDBase[RevokedAccessToken]):
+    """
+    RevokedAccessToken CRUD
+    -------------------------------------------------
+    只管 DB；記憶體 deny-list 由 app/core/jwt.py 維護
+    """
+
+    def revoke(
+        self,
+        db: Session,
+        *,
+        jti: str,
+        expires_at: datetime,
+        user_uuid: Optional[UUID] = None,
+        reason: Optional[str] = None,
+    ) -> RevokedAccessToken:
+        existing = (
+            db.query(self.model)
+            .filter(self.model.jti == jti)
+            .first()
+        )
+        if existing:
+            return existing
+
+        token = RevokedAccessToken(
+            jti=jti,
+            expires_at=expires_at,
+            user_uuid=user_uuid,
+            reason=reason,
+        )
+        db.add(token)
+        db.commit()
+        return token
+
+    def list_unexpired(self, db: Session) -> List[tuple[str, datetime]]:
+        """
+        (jti, expires_at)：啟動時載入 deny-list
+        """
+        return (
+            db.query(self.model.jti, self.model.expires_at)
+            .filter(self.model.expires_at > datetime.now(timezone.utc))
+            .all()
+        )
+
+
+revoked_access_token_crud = CRUDRevokedAccessToken(RevokedAccessToken)
@@ -1,6 +1,6 @@
 # app/crud/user/crud_user.py
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, lazyload
 from typing import Optional
 
 from app.core.security import hash_password
@@ -29,6 +29,20 @@ class CRUDUser(CRUDBase[User]):
             .first()
         )
 
+    def get_for_login(self, db: Session, email: str) -> Optional[User]:
+        """
+        登入用：只取 users 本身（不觸發 selectin relationships）
+        """
+        return (
+            db.query(self.model)
+            .options(lazyload("*"))
+            .filter(
+                self.model.email == email,
+                self.model.is_deleted == False,
+            )
+            .first()
+        )
+
     def create(self, db: Session, data: UserCreate) -> User:
         return super().create(
             db,
@@ -56,4 +70,20 @@ class CRUDUser(CRUDBase[User]):
 
         return new_password
 
+    def set_active(self, db: Session, user_uuid: str, is_active: bool) -> Optional[User]:
+        """
+        停用 / 啟用帳號（principal 快取失效由 API 層觸發）
+        """
+        user = self.get_by_uuid(db, user_uuid)
+        if not user:
+            return None
+
+        user.is_active = is_active
+
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+
+        return user
+
 user_crud = CRUDUser(User)
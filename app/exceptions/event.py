@@ -1,7 +1,32 @@
 # app/exceptions/event.py   
 
+from starlette import status
+
+from app.exceptions.base import ActiFlowBusinessException
+
+
 class InvalidEventStatusTransition(Exception):
     """
     Raised when an invalid event status transition is attempted.
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class SeatReservationConflict(ActiFlowBusinessException):
+    """
+    名額預留失敗（見 app/services/event/reservation.py）
+    """
+
+    STATUS_CODES = {
+        "not_found": status.HTTP_404_NOT_FOUND,
+        "hold_not_found": status.HTTP_404_NOT_FOUND,
+        "not_on_sale": status.HTTP_409_CONFLICT,
+        "sold_out": status.HTTP_409_CONFLICT,
+    }
+
+    def __init__(self, result):
+        super().__init__(
+            result.message,
+            self.STATUS_CODES.get(result.conflict, status.HTTP_409_CONFLICT),
+        )
+        self.conflict = result.conflict
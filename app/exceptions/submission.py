@@ -1,7 +1,36 @@
 # app/exceptions/submission.py
 
+from starlette import status
+
+from app.exceptions.base import ActiFlowBusinessException
+
+
 class InvalidSubmissionStatusTransition(Exception):
     """
     Raised when an invalid submission status transition is attempted.
     """
     pass
+
+
+class SubmissionTransitionConflict(ActiFlowBusinessException):
+    """
+    transition_submission() 沒有命中時，依 conflict 種類轉成 HTTP error
+    （見 app/crud/submission/crud_submission_status.py）
+    """
+
+    STATUS_CODES = {
+        "not_found": status.HTTP_404_NOT_FOUND,
+        "wrong_event": status.HTTP_403_FORBIDDEN,
+        "invalid_transition": status.HTTP_409_CONFLICT,
+        "version_conflict": status.HTTP_409_CONFLICT,
+        "precondition_failed": status.HTTP_409_CONFLICT,
+    }
+
+    def __init__(self, result):
+        super().__init__(
+            result.message,
+            self.STATUS_CODES.get(result.conflict, status.HTTP_409_CONFLICT),
+        )
+        self.conflict = result.conflict
+        self.current_status = result.current_status
+        self.current_version = result.current_version
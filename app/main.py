@@ -1,14 +1,57 @@
 # app/main.py
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.db import SessionLocal
+from app.core.invalidation import start_listener, stop_listener
+from app.core.jwt import load_revoked_tokens
+from app.core.middleware import QueryStatsMiddleware
+from app.core.password_hasher import password_hasher
+from app.services.email.outbox_worker import start_outbox_worker, stop_outbox_worker
+from app.services.event.reservation import start_hold_sweeper, stop_hold_sweeper
+from app.services.event.report_aggregator import start_report_aggregator, stop_report_aggregator
+from app.services.organizer.dashboard_rollup import start_dashboard_rollup, stop_dashboard_rollup
+from app.services.email.transport import close_transport
+
+
+# ------------------------------------------------------------
+# Lifespan：跨 worker 快取失效 listener / jti deny-list / email outbox worker / seat hold sweeper / report aggregator / dashboard rollup / password hash executor
+# ------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_listener()
+
+    db = SessionLocal()
+    try:
+        load_revoked_tokens(db)
+    finally:
+        db.close()
+
+    start_outbox_worker()
+    start_hold_sweeper()
+    start_report_aggregator()
+    start_dashboard_rollup()
+    try:
+        yield
+    finally:
+        stop_dashboard_rollup()
+        stop_report_aggregator()
+        stop_hold_sweeper()
+        stop_outbox_worker()
+        await close_transport()
+        password_hasher.shutdown()
+        stop_listener()
+
 
 app = FastAPI(
     title="ActiFlow Backend",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # ------------------------------------------------------------
@@ -27,6 +70,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ------------------------------------------------------------
+# Query stats（per-request SQL 統計 / N+1 偵測）
+# ------------------------------------------------------------
+app.add_middleware(QueryStatsMiddleware)
+
 # ------------------------------------------------------------
 # 掛上正式 API
 # ------------------------------------------------------------
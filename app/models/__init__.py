@@ -16,17 +16,26 @@ from .auth.auth_log import AuthLog
 from .auth.email_verification import EmailVerification
 from .auth.password_reset import PasswordReset
 from .auth.refresh_token import RefreshToken
+from .auth.revoked_access_token import RevokedAccessToken
 from .auth.user_session import UserSession
 
+# Email
+from .email.email_outbox import EmailOutbox
+
 # Event
 from .event.event import Event
 from .event.event_field import EventField
 from .event.event_media import EventMedia
 from .event.event_price import EventPrice
+from .event.event_price_hold import EventPriceHold
+from .event.event_price_shard import EventPriceShard
 from .event.event_question import EventQuestion
 from .event.event_report import EventReportCache
+from .event.event_report_delta import EventReportDelta
+from .event.event_stat_bucket import EventStatBucket
 from .event.event_rule import EventRule
 from .event.event_schedule import EventSchedule
+from .event.event_snapshot import EventSnapshot
 from .event.event_staff import EventStaff
 from .event.event_ticket import EventTicket
 
@@ -40,17 +49,20 @@ from .membership.organizer_membership import OrganizerMembership
 # Organizer
 from .organizer.organizer import Organizer
 from .organizer.organizer_application import OrganizerApplication
+from .organizer.organizer_stat_bucket import OrganizerStatBucket
 
 # Submission
 from .submission.submission import Submission
 from .submission.submission_value import SubmissionValue
 from .submission.submission_file import SubmissionFile
+from .submission.submission_code_sequence import SubmissionCodeSequence
 
 # System
 from .system.system_settings import SystemSettings
 from .system.system_audit_log import SystemAuditLog
 from .system.system_config_version import SystemConfigVersion
 from .system.system_notification import SystemNotification
+from .system.rollup_watermark import RollupWatermark
 
 # User
 from .user.user import User
@@ -11,6 +11,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -31,6 +32,11 @@ if TYPE_CHECKING:
 class ActivityTemplate(BaseModel, Base):
     __tablename__ = "activity_templates"
 
+    __table_args__ = (
+        # keyset 分頁：WHERE organizer_uuid = ? ORDER BY created_at DESC, id DESC
+        Index("ix_activity_templates_organizer_created_id", "organizer_uuid", "created_at", "id"),
+    )
+
     # ---------------------------------------------------------
     # 外部模板代碼（後台 / 報表用）
     # ---------------------------------------------------------
@@ -94,7 +100,7 @@ class ActivityTemplate(BaseModel, Base):
     events: Mapped[list["Event"]] = relationship(
         "Event",
         back_populates="activity_template",
-        lazy="selectin",
+        lazy="select",
     )
 
     # 多對一（模板 → 活動類型）
@@ -0,0 +1,56 @@
+# app/models/auth/revoked_access_token.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from typing import Optional
+from datetime import datetime
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    DateTime,
+    String,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class RevokedAccessToken(BaseModel, Base):
+    """
+    已撤銷的 Access Token（jti deny-list）
+    - 啟動時載入未過期的 jti 到記憶體（app/core/jwt.py）
+    - 過期後即無意義，可定期清除
+    """
+
+    __tablename__ = "revoked_access_tokens"
+
+    # ---------------------------------------------------------
+    # Token identity
+    # ---------------------------------------------------------
+    jti: Mapped[str] = mapped_column(
+        String(64),
+        unique=True,
+        nullable=False,
+        index=True,
+    )
+
+    user_uuid: Mapped[Optional[PyUUID]] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        index=True,
+    )
+
+    # token 原本的 exp（過期後不需再拒絕）
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+
+    reason: Mapped[Optional[str]] = mapped_column(
+        String,
+        nullable=True,
+    )
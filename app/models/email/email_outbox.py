@@ -0,0 +1,137 @@
+# app/models/email/email_outbox.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from typing import Optional
+from datetime import datetime
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class EmailOutbox(BaseModel, Base):
+    """
+    Email Outbox（transactional outbox）
+
+    - 與業務資料（submission / status 變更）寫在同一個 transaction
+    - 由背景 worker（app/services/email/outbox_worker.py）取出寄送
+    - status：pending → sending → sent
+                               ↘ pending（retry，next_attempt_at 往後推）
+                               ↘ dead（超過重試上限 / 不可重試的錯誤）
+    """
+
+    __tablename__ = "email_outbox"
+
+    __table_args__ = (
+        # worker claim：只掃待處理的列
+        Index(
+            "ix_email_outbox_ready",
+            "next_attempt_at",
+            "id",
+            postgresql_where=text("status IN ('pending', 'sending')"),
+        ),
+    )
+
+    # ---------------------------------------------------------
+    # Message
+    # ---------------------------------------------------------
+    to_email: Mapped[str] = mapped_column(
+        String,
+        nullable=False,
+    )
+
+    # rate limit 以收件網域為單位
+    recipient_domain: Mapped[str] = mapped_column(
+        String,
+        nullable=False,
+        index=True,
+    )
+
+    subject: Mapped[str] = mapped_column(
+        String,
+        nullable=False,
+    )
+
+    html: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    category: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="submission.verification / submission.completed / ...",
+    )
+
+    # ---------------------------------------------------------
+    # Reference（通用指向，同 email_verifications）
+    # ---------------------------------------------------------
+    ref_type: Mapped[Optional[str]] = mapped_column(
+        String,
+        nullable=True,
+    )
+
+    ref_uuid: Mapped[Optional[PyUUID]] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        index=True,
+    )
+
+    # ---------------------------------------------------------
+    # Delivery state
+    # ---------------------------------------------------------
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="pending",
+        server_default="pending",
+        comment="pending / sending / sent / dead",
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    # sending 的租約；worker 中途死掉 → 過期後由其他 worker 重新 claim
+    locked_until: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    sent_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    provider_message_id: Mapped[Optional[str]] = mapped_column(
+        String,
+        nullable=True,
+    )
+
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+    )
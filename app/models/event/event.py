@@ -11,6 +11,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -47,6 +48,12 @@ class Event(BaseModel, Base):
     """
     __tablename__ = "events"
 
+    __table_args__ = (
+        # keyset 分頁：主辦單位後台列表 / 公開列表
+        Index("ix_events_organizer_created_id", "organizer_uuid", "created_at", "id"),
+        Index("ix_events_status_start_id", "status", "start_date", "id"),
+    )
+
     # ---------------------------------------------------------
     # 業務用活動代號（外部顯示、不變）
     # ---------------------------------------------------------
@@ -76,7 +83,7 @@ class Event(BaseModel, Base):
 
     organizer: Mapped["Organizer"] = relationship(
         back_populates="events",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
@@ -91,7 +98,7 @@ class Event(BaseModel, Base):
 
     activity_template: Mapped[Optional["ActivityTemplate"]] = relationship(
         back_populates="events",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
@@ -116,56 +123,67 @@ class Event(BaseModel, Base):
         default=dict,
     )
 
+    # event_fields 異動即 +1（報名表單 validator 快取比對用）
+    fields_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="報名欄位定義版本（validator 快取比對）",
+    )
+
 
     # ---------------------------------------------------------
     # Relationships
+    # 預設 lazy="select"；需要的關聯由 loader profile 明確載入
+    # （見 app/crud/base/loader_profiles.py）
     # ---------------------------------------------------------
     fields: Mapped[List["EventField"]] = relationship(
         "EventField",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     media: Mapped[List["EventMedia"]] = relationship(
         "EventMedia",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     prices: Mapped[List["EventPrice"]] = relationship(
         "EventPrice",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     questions: Mapped[List["EventQuestion"]] = relationship(
         "EventQuestion",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     rules: Mapped[List["EventRule"]] = relationship(
         "EventRule",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     schedules: Mapped[List["EventSchedule"]] = relationship(
         "EventSchedule",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     staffs: Mapped[List["EventStaff"]] = relationship(
         "EventStaff",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
@@ -173,21 +191,21 @@ class Event(BaseModel, Base):
         "EventReportCache",
         back_populates="event",
         uselist=False,
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     tickets: Mapped[List["EventTicket"]] = relationship(
         "EventTicket",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     submissions: Mapped[list["Submission"]] = relationship(
         "Submission",
         back_populates="event",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
@@ -110,11 +110,11 @@ class EventField(BaseModel, Base):
     # ---------------------------------------------------------
     event: Mapped["Event"] = relationship(
         back_populates="fields",
-        lazy="selectin",
+        lazy="select",
     )
 
     submission_values: Mapped[list["SubmissionValue"]] = relationship(
         back_populates="field",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
@@ -93,5 +93,5 @@ class EventMedia(BaseModel, Base):
     event: Mapped["Event"] = relationship(
         "Event",
         back_populates="media",
-        lazy="selectin",
+        lazy="select",
     )
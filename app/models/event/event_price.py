@@ -81,12 +81,20 @@ class EventPrice(BaseModel, Base):
         nullable=True,
     )
 
-    # 已售出（你之後會用在報名邏輯）
+    # 已售出（含未付款 hold）；只能經由 app/services/event/reservation.py 的條件式 UPDATE 異動
     sold: Mapped[int] = mapped_column(
         Integer,
         default=0,
     )
 
+    # 分片數（0 = 不分片，直接更新 sold；見 EventPriceShard）
+    shard_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
     # ---------------------------------------------------------
     # 期限設定（常用於早鳥票）
     # ---------------------------------------------------------
@@ -124,11 +132,11 @@ class EventPrice(BaseModel, Base):
     event: Mapped["Event"] = relationship(
         "Event",
         back_populates="prices",
-        lazy="selectin",
+        lazy="select",
     )
 
     tickets: Mapped[List["EventTicket"]] = relationship(
         "EventTicket",
         back_populates="price",
-        lazy="selectin",
+        lazy="select",
     )
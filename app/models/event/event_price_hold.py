@@ -0,0 +1,63 @@
+# app/models/event/event_price_hold.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from datetime import datetime
+from typing import Optional
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Integer,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class EventPriceHold(BaseModel, Base):
+    """
+    未付款報名的暫時保留名額
+
+    - 建立時名額已計入 sold（event_prices 或 shard）
+    - 付款完成 → 刪除 hold（名額保留為已售出）
+    - 取消 / 逾期 → 刪除 hold 並扣回 sold（逾期由 sweeper 批次處理）
+    - 見 app/services/event/reservation.py
+    """
+
+    __tablename__ = "event_price_holds"
+
+    price_uuid: Mapped[PyUUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("event_prices.uuid", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    submission_uuid: Mapped[Optional[PyUUID]] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("submissions.uuid", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+
+    quantity: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    # 名額計在哪個 shard（None = event_prices.sold）
+    shard_no: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
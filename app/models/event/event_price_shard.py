@@ -0,0 +1,59 @@
+# app/models/event/event_price_shard.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from typing import Optional
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class EventPriceShard(BaseModel, Base):
+    """
+    熱門票種的分片售出計數器
+
+    - 啟用分片後，剩餘名額平均切給 N 個 shard（capacity），
+      每次預留隨機挑一個 shard 做條件式 UPDATE → 同時搶票的交易分散在 N 列上
+    - 總售出 = event_prices.sold（分片前已售出）+ sum(shard.sold)
+    - capacity = None：不限名額（只分散計數熱點）
+    - 見 app/services/event/reservation.py
+    """
+
+    __tablename__ = "event_price_shards"
+    __table_args__ = (
+        UniqueConstraint("price_uuid", "shard_no", name="uq_event_price_shards_price_shard"),
+    )
+
+    price_uuid: Mapped[PyUUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("event_prices.uuid", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    shard_no: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    capacity: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
+    sold: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
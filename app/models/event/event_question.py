@@ -85,5 +85,5 @@ class EventQuestion(BaseModel, Base):
     event: Mapped["Event"] = relationship(
         "Event",
         back_populates="questions",
-        lazy="selectin",
+        lazy="select",
     )
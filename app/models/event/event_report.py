@@ -30,6 +30,8 @@ class EventReportCache(BaseModel, Base):
     活動報表快取（非正式資料，會定期重算）
     - 前台 / 後台的活動統計數據會寫在這裡
     - 不影響 Submission / Price / Field 的正式資料
+    - report_data：扁平計數 {"<counter key>": n}，由 event_report_deltas 增量併入；
+      可用 rebuild_event_report() 從正式資料重算（見 app/services/event/report_aggregator.py）
     """
 
     __tablename__ = "event_report_cache"
@@ -58,5 +60,5 @@ class EventReportCache(BaseModel, Base):
     event: Mapped["Event"] = relationship(
         "Event",
         back_populates="report_cache",
-        lazy="selectin",
+        lazy="select",
     )
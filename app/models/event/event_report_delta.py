@@ -0,0 +1,38 @@
+# app/models/event/event_report_delta.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from uuid import UUID as PyUUID
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class EventReportDelta(BaseModel, Base):
+    """
+    活動統計的增量（append-only outbox）
+
+    - 報名建立 / 狀態變更 / 刪除 / 名額預留時，與異動同一個 transaction 寫入一列
+      （只 INSERT，不更新共用的計數列 → 搶報名時不會在同一列上排隊）
+    - delta：{"<counter key>": <增減量>}（格式見 app/services/event/report_aggregator.py）
+    - 背景 job 定期併入 event_report_cache.report_data 後刪除
+    """
+
+    __tablename__ = "event_report_deltas"
+
+    event_uuid: Mapped[PyUUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("events.uuid", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    delta: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
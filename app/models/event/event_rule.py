@@ -76,7 +76,7 @@ class EventRule(BaseModel, Base):
     # ---------------------------------------------------------
     event: Mapped["Event"] = relationship(
         back_populates="rules",
-        lazy="selectin",
+        lazy="select",
     )
 
     activity_rule: Mapped[Optional["ActivityRule"]] = relationship(
@@ -99,5 +99,5 @@ class EventSchedule(BaseModel, Base):
     # ---------------------------------------------------------
     event: Mapped["Event"] = relationship(
         back_populates="schedules",
-        lazy="selectin",
+        lazy="select",
     )
@@ -0,0 +1,68 @@
+# app/models/event/event_snapshot.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from datetime import datetime
+from typing import Optional
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class EventSnapshot(BaseModel, Base):
+    """
+    已發布活動的公開資料快照（預先序列化的 JSON）
+
+    - 發布 / 更新已發布活動時重建（見 app/services/event/snapshot.py）
+    - version：每次重建 / 撤下 +1（活動存續期間單調遞增），in-process 快取以此失效
+    - 取消發布 / 關閉 → 保留列作為 tombstone（*_json = NULL），公開 API 回到即時查詢
+      （刪除列會讓重新發布從 version 1 開始，低於各 worker 已知的版本 → 快取拒收、ETag 重複）
+    """
+
+    __tablename__ = "event_snapshots"
+
+    event_uuid: Mapped[PyUUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("events.uuid", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+        index=True,
+    )
+
+    # ---------------------------------------------------------
+    # Pre-serialized responses（tombstone → 全部 NULL）
+    # ---------------------------------------------------------
+    # GET /public/events/{event_uuid}（EventPublic）
+    public_json: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    # GET /events/{event_uuid}（EventResponse）
+    detail_json: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    # GET /events/{event_uuid}/schedule（List[EventScheduleResponse]）
+    schedule_json: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
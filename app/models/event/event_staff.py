@@ -107,7 +107,7 @@ class EventStaff(BaseModel, Base):
     # ---------------------------------------------------------
     event: Mapped["Event"] = relationship(
         back_populates="staffs",
-        lazy="selectin",
+        lazy="select",
     )
 
     user: Mapped[Optional["User"]] = relationship(
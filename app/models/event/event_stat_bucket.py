@@ -0,0 +1,75 @@
+# app/models/event/event_stat_bucket.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from datetime import datetime
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class EventStatBucket(BaseModel, Base):
+    """
+    活動報名統計 rollup（每小時 / 每日，UTC）
+
+    - 依報名建立時間（submissions.created_at）分桶
+    - created / verified / paid / completed：該時段建立、目前已達到該階段的報名數
+    - organizer_uuid 為冗餘欄位（organizer 層級 rollup 直接以 index 加總）
+    - 由背景 job 增量重算（見 app/services/organizer/dashboard_rollup.py）
+    """
+
+    __tablename__ = "event_stat_buckets"
+    __table_args__ = (
+        UniqueConstraint(
+            "event_uuid",
+            "granularity",
+            "bucket_start",
+            name="uq_event_stat_buckets_event_bucket",
+        ),
+        Index(
+            "ix_event_stat_buckets_organizer_bucket",
+            "organizer_uuid",
+            "granularity",
+            "bucket_start",
+        ),
+    )
+
+    event_uuid: Mapped[PyUUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("events.uuid", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    organizer_uuid: Mapped[PyUUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=False,
+    )
+
+    # hour / day
+    granularity: Mapped[str] = mapped_column(
+        String(8),
+        nullable=False,
+    )
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    created_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    verified_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    paid_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
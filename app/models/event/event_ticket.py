@@ -128,17 +128,17 @@ class EventTicket(BaseModel, Base):
     event: Mapped["Event"] = relationship(
         "Event",
         back_populates="tickets",
-        lazy="selectin",
+        lazy="select",
     )
 
     price: Mapped[Optional["EventPrice"]] = relationship(
         "EventPrice",
         back_populates="tickets",
-        lazy="selectin",
+        lazy="select",
     )
 
     submission: Mapped["Submission"] = relationship(
         "Submission",
         back_populates="tickets",
-        lazy="selectin",
+        lazy="select",
     )   
@@ -62,6 +62,6 @@ class File(BaseModel, Base):
     # ---------------------------------------------------------
     submissions: Mapped[list["SubmissionFile"]] = relationship(
         back_populates="file",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
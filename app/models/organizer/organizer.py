@@ -114,7 +114,7 @@ class Organizer(BaseModel, Base):
     events: Mapped[list["Event"]] = relationship(
         "Event",
         back_populates="organizer",
-        lazy="selectin",
+        lazy="select",
     )
 
     memberships: Mapped[list["OrganizerMembership"]] = relationship(
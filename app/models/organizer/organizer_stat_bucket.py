@@ -0,0 +1,62 @@
+# app/models/organizer/organizer_stat_bucket.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from datetime import datetime
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class OrganizerStatBucket(BaseModel, Base):
+    """
+    Organizer 報名統計 rollup（每小時 / 每日，UTC）
+
+    - 旗下所有活動的 event_stat_buckets 加總
+    - Dashboard 讀取為固定筆數的區間加總（與活動數無關）
+    - 由背景 job 增量重算（見 app/services/organizer/dashboard_rollup.py）
+    """
+
+    __tablename__ = "organizer_stat_buckets"
+    __table_args__ = (
+        UniqueConstraint(
+            "organizer_uuid",
+            "granularity",
+            "bucket_start",
+            name="uq_organizer_stat_buckets_organizer_bucket",
+        ),
+    )
+
+    organizer_uuid: Mapped[PyUUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("organizers.uuid", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # hour / day
+    granularity: Mapped[str] = mapped_column(
+        String(8),
+        nullable=False,
+    )
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    created_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    verified_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    paid_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
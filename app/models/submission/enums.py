@@ -4,7 +4,9 @@ import enum
 
 class SubmissionStatus(str, enum.Enum):
     pending = "pending"
+    email_verified = "email_verified"
     paid = "paid"
+    rejected = "rejected"
     canceled = "canceled"
     completed = "completed"
     waitlist = "waitlist"
@@ -45,6 +45,50 @@ class Submission(BaseModel, Base):
             "submission_code",
             name="uq_submission_event_code",
         ),
+        # keyset 分頁：WHERE event_uuid = ? ORDER BY created_at DESC, id DESC
+        sa.Index(
+            "ix_submissions_event_created_id",
+            "event_uuid",
+            "created_at",
+            "id",
+        ),
+        # dashboard rollup high-water mark：WHERE updated_at > ?
+        sa.Index(
+            "ix_submissions_updated_at",
+            "updated_at",
+        ),
+        # answer document 查詢：answers @> '{"field_key": value}'
+        sa.Index(
+            "ix_submissions_answers",
+            "answers",
+            postgresql_using="gin",
+            postgresql_ops={"answers": "jsonb_path_ops"},
+        ),
+        # 活動層級 fingerprint：count(*), sum(epoch(updated_at)) WHERE event_uuid = ?（欄位分析快取，index-only scan）
+        sa.Index(
+            "ix_submissions_event_updated",
+            "event_uuid",
+            "updated_at",
+        ),
+        # Organizer 搜尋（btree_gin + pg_trgm，event_uuid 在前；見 app/services/submission/search.py）
+        sa.Index(
+            "ix_submissions_email_trgm",
+            "event_uuid",
+            sa.text("lower(user_email) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        sa.Index(
+            "ix_submissions_code_trgm",
+            "event_uuid",
+            sa.text("lower(submission_code) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        sa.Index(
+            "ix_submissions_answers_trgm",
+            "event_uuid",
+            sa.text("submission_answer_text(answers) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
     )
 
     # ---------------------------------------------------------
@@ -69,7 +113,7 @@ class Submission(BaseModel, Base):
     event: Mapped["Event"] = relationship(
         "Event",
         back_populates="submissions",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
@@ -91,7 +135,7 @@ class Submission(BaseModel, Base):
     user: Mapped[Optional["User"]] = relationship(
         "User",
         back_populates="submissions",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
@@ -144,28 +188,45 @@ class Submission(BaseModel, Base):
         server_default="{}",
     )
 
+    # ---------------------------------------------------------
+    # Answer document（SUBMISSION_ANSWER_STORAGE = dual / document）
+    # {field_key: value}；answers_version = 寫入時的 events.fields_version
+    # 見 app/services/submission/answers.py
+    # ---------------------------------------------------------
+    answers: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+    )
+
+    answers_version: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
     # ---------------------------------------------------------
     # Relationships
+    # 預設 lazy="select"；需要的關聯由 loader profile 明確載入
+    # （見 app/crud/base/loader_profiles.py）
     # ---------------------------------------------------------
 
 
     values: Mapped[list["SubmissionValue"]] = relationship(
         "SubmissionValue",
         back_populates="submission",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     tickets: Mapped[list["EventTicket"]] = relationship(
         "EventTicket",
         back_populates="submission",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
 
     files: Mapped[list["SubmissionFile"]] = relationship(
         "SubmissionFile",
         back_populates="submission",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
\ No newline at end of file
@@ -0,0 +1,44 @@
+# app/models/submission/submission_code_sequence.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from uuid import UUID as PyUUID
+
+from sqlalchemy import (
+    BigInteger,
+    ForeignKey,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class SubmissionCodeSequence(BaseModel, Base):
+    """
+    每個活動一條的報名序號計數器
+
+    - next_value：下一個尚未配發的序號
+    - 各 worker 以 UPSERT … RETURNING 一次預留一整段（block），
+      在記憶體內逐一配發（見 app/services/submission/code_allocator.py）
+    - 只增不減；worker 重啟時未用完的 block 會留下空號（可接受）
+    """
+
+    __tablename__ = "submission_code_sequences"
+
+    event_uuid: Mapped[PyUUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("events.uuid", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+        index=True,
+    )
+
+    next_value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=1,
+        server_default="1",
+    )
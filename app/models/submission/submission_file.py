@@ -48,7 +48,7 @@ class SubmissionFile(BaseModel, Base):
 
     submission: Mapped["Submission"] = relationship(
         back_populates="files",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
@@ -63,7 +63,7 @@ class SubmissionFile(BaseModel, Base):
 
     submission_value: Mapped[Optional["SubmissionValue"]] = relationship(
         back_populates="files",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
@@ -78,7 +78,7 @@ class SubmissionFile(BaseModel, Base):
 
     file: Mapped["File"] = relationship(
         back_populates="submissions",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
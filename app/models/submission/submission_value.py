@@ -11,9 +11,11 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -34,6 +36,15 @@ class SubmissionValue(BaseModel, Base):
     - 可附帶多個 SubmissionFile（例如上傳附件）
     """
     __tablename__ = "submission_values"
+    __table_args__ = (
+        # 欄位分析 / 選項統計：GROUP BY event_field_uuid, value #>> '{}'
+        Index(
+            "ix_submission_values_field_scalar",
+            "event_field_uuid",
+            text("(value #>> '{}')"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     # ---------------------------------------------------------
     # Submission reference
@@ -47,7 +58,7 @@ class SubmissionValue(BaseModel, Base):
 
     submission: Mapped["Submission"] = relationship(
         back_populates="values",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
@@ -62,7 +73,7 @@ class SubmissionValue(BaseModel, Base):
 
     field: Mapped["EventField"] = relationship(
         back_populates="submission_values",
-        lazy="selectin",
+        lazy="select",
     )
 
     # ---------------------------------------------------------
@@ -88,6 +99,6 @@ class SubmissionValue(BaseModel, Base):
     # ---------------------------------------------------------
     files: Mapped[list["SubmissionFile"]] = relationship(
         back_populates="submission_value",
-        lazy="selectin",
+        lazy="select",
         cascade="all, delete-orphan",
     )
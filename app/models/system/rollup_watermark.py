@@ -0,0 +1,34 @@
+# app/models/system/rollup_watermark.py
+
+# ---------------------------------------------------------
+# Standard Model Header (SQLAlchemy 2.0)
+# ---------------------------------------------------------
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+from app.models.base.base_model import BaseModel
+# ---------------------------------------------------------
+
+class RollupWatermark(BaseModel, Base):
+    """
+    背景 rollup job 的 high-water mark
+
+    - name：job 名稱（例如 "dashboard"）
+    - watermark：已處理到的時間點；下次只掃描 updated_at 之後（減去重疊區間）的資料
+    """
+
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(
+        String,
+        unique=True,
+        nullable=False,
+    )
+
+    watermark: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
@@ -10,6 +10,7 @@ from uuid import UUID as PyUUID
 from sqlalchemy import (
     Boolean,
     DateTime,
+    Integer,
     String,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -82,6 +83,15 @@ class User(BaseModel, Base):
         comment="帳號是否啟用",
     )
 
+    # membership / 帳號狀態異動即 +1（JWT membership claims 比對用）
+    membership_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="membership 版本（JWT claims 比對）",
+    )
+
     # ---------------------------------------------------------
     # Relationships（保留完整系統關聯）
     # ---------------------------------------------------------
@@ -103,7 +113,7 @@ class User(BaseModel, Base):
 
     submissions: Mapped[List["Submission"]] = relationship(
         back_populates="user",
-        lazy="selectin",
+        lazy="select",
     )
 
     refresh_tokens: Mapped[List["RefreshToken"]] = relationship(
@@ -1,26 +1,104 @@
 # app/schemas/common/pagination.py  ← 分頁回傳格式
 
-from typing import List, Generic, TypeVar
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Generic, Literal, Optional, TypeVar
+from uuid import UUID
+
 from pydantic import BaseModel
 
 T = TypeVar("T")
 
+PaginationMode = Literal["offset", "cursor"]
+TotalMode = Literal["none", "estimate", "exact"]
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """
     通用分頁回傳格式（Generic 版）
 
+    offset 模式（預設，相容舊前端）：
     - total: 總筆數
     - page: 當前頁
     - page_size: 每頁筆數
+
+    cursor 模式（keyset，任何深度都是 O(page)）：
+    - next_cursor / prev_cursor: 不透明 cursor，帶回 ?cursor= 取得下一 / 上一頁
+    - total: 依 count 參數決定（none → null / estimate → 規劃器估計值 / exact）
+    - total_is_estimate: total 是否為估計值
+
     - items: 資料列表（型別由 T 決定）
     """
 
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
     items: List[T]
 
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    total_is_estimate: bool = False
+
     model_config = {"from_attributes": True}
 
-    
\ No newline at end of file
+
+# ============================================================
+# Cursor encoding（不透明字串，前端不應解析）
+# ============================================================
+
+class InvalidCursor(ValueError):
+    """
+    cursor 格式錯誤或被竄改
+    """
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "u" in value:
+            return UUID(value["u"])
+    return value
+
+
+def encode_cursor(keys: tuple, direction: Literal["next", "prev"]) -> str:
+    """
+    將排序鍵（例如 (created_at, id)）編碼成 cursor
+    """
+    payload = {
+        "k": [_encode_value(v) for v in keys],
+        "d": direction,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[tuple, Literal["next", "prev"]]:
+    """
+    解碼 cursor → (排序鍵, 方向)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        keys = tuple(_decode_value(v) for v in payload["k"])
+        direction = payload["d"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
+
+    if direction not in ("next", "prev"):
+        raise InvalidCursor("Invalid pagination cursor")
+
+    return keys, direction
@@ -22,3 +22,21 @@ class EventPublic(BaseModel):
     schedules: List[EventScheduleResponse] = []
 
     model_config = {"from_attributes": True}
+
+
+class EventPublicListItem(BaseModel):
+    """
+    公開活動列表卡片（輕量版）
+    - 不帶 fields / schedules 等子資料
+    """
+
+    uuid: UUID
+    event_code: str
+    name: str
+    description: Optional[str] = None
+
+    start_date: datetime
+    end_date: Optional[datetime] = None
+    registration_deadline: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,47 @@
+# app/schemas/event/report/field_analytics.py
+
+from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+from uuid import UUID
+
+
+class FieldOptionCount(BaseModel):
+    value: str
+    label: str
+    count: int
+
+
+class FieldNumericStats(BaseModel):
+    count: int
+    # 有作答但無法轉成數字（舊資料的非數字字串等），不計入統計
+    invalid: int = 0
+    # 只有 invalid 答案 → None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    avg: Optional[float] = None
+    # p25 / p50 / p75 / p90
+    percentiles: Dict[str, float] = {}
+
+
+class FieldAnalytics(BaseModel):
+    field_uuid: UUID
+    field_key: str
+    label: str
+    field_type: str
+    kind: Literal["choice", "numeric", "text"]
+
+    answered: int
+    fill_rate: float
+
+    # choice
+    options: Optional[List[FieldOptionCount]] = None
+    # numeric（尚無作答 → None）
+    numeric: Optional[FieldNumericStats] = None
+    # text
+    avg_length: Optional[float] = None
+
+
+class EventFieldAnalyticsResponse(BaseModel):
+    event_uuid: UUID
+    total_submissions: int
+    fields: List[FieldAnalytics]
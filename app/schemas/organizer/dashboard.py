@@ -1,17 +1,38 @@
 # app/schemas/organizer/dashboard.py
 
+from datetime import datetime
 from pydantic import BaseModel
+from typing import List, Optional
 from uuid import UUID
 
 
+class OrganizerDashboardCounts(BaseModel):
+    created: int = 0
+    verified: int = 0
+    paid: int = 0
+    completed: int = 0
+
+
+class OrganizerDashboardPoint(OrganizerDashboardCounts):
+    bucket_start: datetime
+
+
 class OrganizerDashboardStats(BaseModel):
     members_count: int
     events_count: int
     active_events: int
     submissions_last_7_days: int
+    last_7_days: OrganizerDashboardCounts = OrganizerDashboardCounts()
 
 
 class OrganizerDashboardResponse(BaseModel):
     organizer_uuid: UUID
     organizer_name: str
     stats: OrganizerDashboardStats
+
+    # sparkline：每日（最近 N 天）/ 每小時（最近 24 小時）
+    daily: List[OrganizerDashboardPoint] = []
+    hourly: List[OrganizerDashboardPoint] = []
+
+    # rollup 最後更新時間（統計最多落後一個 job 週期）
+    refreshed_at: Optional[datetime] = None
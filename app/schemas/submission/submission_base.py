@@ -10,6 +10,7 @@ SubmissionStatus = Literal[
     "email_verified",
     "paid",
     "completed",
+    "rejected",
 ]
 
 class SubmissionBase(BaseModel):
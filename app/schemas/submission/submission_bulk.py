@@ -0,0 +1,73 @@
+# app/schemas/submission/submission_bulk.py
+
+from datetime import datetime
+from typing import Any, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.submission.submission_base import SubmissionStatus
+
+
+# 指定 UUID 模式的單次上限
+BULK_MAX_UUIDS = 10000
+
+
+class SubmissionBulkFilter(BaseModel):
+    """
+    以條件選取（與 submission_uuids 擇一）
+    """
+
+    # 來源狀態（預設：所有可轉入目標狀態的來源）
+    status: Optional[SubmissionStatus] = None
+
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    # 指定欄位值（SubmissionValue.field_key / value）
+    field_key: Optional[str] = None
+    field_value: Optional[Any] = None
+
+    # 單次處理上限；has_more = true 時再送一次
+    max_items: int = Field(5000, ge=1, le=20000)
+
+    @model_validator(mode="after")
+    def check_field_pair(self):
+        if (self.field_key is None) != (self.field_value is None):
+            raise ValueError("field_key and field_value must be given together")
+        return self
+
+
+class SubmissionBulkRequest(BaseModel):
+    submission_uuids: Optional[List[UUID]] = Field(None, min_length=1, max_length=BULK_MAX_UUIDS)
+    filter: Optional[SubmissionBulkFilter] = None
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.submission_uuids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of submission_uuids or filter")
+        return self
+
+
+class SubmissionBulkRejectRequest(SubmissionBulkRequest):
+    reason: str = Field(..., min_length=1, max_length=500)
+
+
+class SubmissionBulkItem(BaseModel):
+    submission_uuid: UUID
+
+    # updated / invalid_transition / not_found
+    outcome: str
+
+    # updated：新狀態；invalid_transition：目前狀態
+    status: Optional[str] = None
+    version: Optional[int] = None
+
+
+class SubmissionBulkResponse(BaseModel):
+    target: str
+    updated: int
+    failed: int
+    notified: int
+    has_more: bool = False
+    items: List[SubmissionBulkItem]
@@ -0,0 +1,25 @@
+# app/schemas/submission/submission_import.py
+
+from typing import List
+
+from pydantic import BaseModel
+
+
+class SubmissionImportRowError(BaseModel):
+    # 檔案行號（CSV 含 header，第一筆資料為 2）
+    row: int
+    errors: List[str]
+
+
+class SubmissionImportResponse(BaseModel):
+    # 寫入 submissions.extra_data.import_batch，方便追查 / 回收
+    batch_id: str
+
+    total_rows: int
+    imported: int
+    failed: int
+    duplicates: int
+    verification_emails: int
+
+    errors: List[SubmissionImportRowError]
+    errors_truncated: bool = False
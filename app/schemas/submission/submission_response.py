@@ -1,7 +1,7 @@
 # app/schemas/submission/submission_response.py
 
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, ValidationInfo, model_validator
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from app.schemas.submission.submission_base import SubmissionBase
@@ -13,11 +13,16 @@ class SubmissionResponse(SubmissionBase):
     Organizer / Admin 後台最終回傳的 Submission 資料格式
     - 繼承 SubmissionBase（保留所有共用欄位）
     - 加上 values（submission values）
+      SUBMISSION_ANSWER_STORAGE = document 時不載入 value rows，
+      由 validation context 的 answer_fields 從 answers 展開（見 answer_value_context）
     - 加上 JOIN user 資訊
     """
 
     uuid: UUID
 
+    # optimistic lock（狀態變更 command 可帶 expected_version）
+    version: int = 1
+
     # JOIN User 資訊（後台需要）
     user_name: Optional[str] = None
     user_email: Optional[str] = None   # 覆蓋 base，是 OK 的（相同欄位 Pydantic 會合併）
@@ -25,4 +30,26 @@ class SubmissionResponse(SubmissionBase):
     # 每一筆 submission 對應的欄位值
     values: List[SubmissionValueResponse] = []
 
+    # answer document（{field_key: value}；SUBMISSION_ANSWER_STORAGE = dual / document）
+    answers: Optional[Dict[str, Any]] = None
+    answers_version: Optional[int] = None
+
     model_config = {"from_attributes": True}
+
+    @model_validator(mode="after")
+    def _values_from_answers(self, info: ValidationInfo) -> "SubmissionResponse":
+        fields = (info.context or {}).get("answer_fields")
+        if fields is None or self.values or not self.answers:
+            return self
+
+        # 依欄位順序；document 內沒有對應欄位（已刪除）的 key 不輸出
+        self.values = [
+            SubmissionValueResponse(
+                field_uuid=field.uuid,
+                field_type=field.field_type,
+                value=self.answers[field.field_key],
+            )
+            for field in fields
+            if field.field_key in self.answers
+        ]
+        return self
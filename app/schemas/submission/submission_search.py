@@ -0,0 +1,17 @@
+# app/schemas/submission/submission_search.py
+
+from typing import List
+
+from pydantic import BaseModel
+
+from app.schemas.submission.submission_response import SubmissionResponse
+
+
+class SubmissionSearchHit(SubmissionResponse):
+    # 相關度（0 ~ 1，pg_trgm word_similarity）
+    score: float = 0.0
+
+
+class SubmissionSearchResponse(BaseModel):
+    query: str
+    items: List[SubmissionSearchHit]
@@ -45,7 +45,8 @@ class SubmissionValuePublic(SubmissionValueBase):
 # Response (後台使用，帶有 uuid)
 # ------------------------------------------------------------
 class SubmissionValueResponse(SubmissionValueBase):
-    uuid: UUID
+    # SUBMISSION_ANSWER_STORAGE = document：值來自 submissions.answers，沒有 value row → None
+    uuid: Optional[UUID] = None
 
 
 # ------------------------------------------------------------
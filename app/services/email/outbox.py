@@ -0,0 +1,102 @@
+# app/services/email/outbox.py
+
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.models.email.email_outbox import EmailOutbox
+
+
+# ============================================================
+# Email Outbox Service
+# ============================================================
+# 責任：
+# - 把要寄的信寫進 email_outbox（不 commit，跟著呼叫端的 transaction）
+# - commit 成功後喚醒本 process 的 outbox worker（rollback → 信也不會寄出）
+# - 不做任何網路 I/O
+# ============================================================
+
+_WAKE_FLAG = "email_outbox_wake"
+
+
+def _wake_worker(session: Session) -> None:
+    if not session.info.pop(_WAKE_FLAG, None):
+        return
+
+    # 避免 import cycle（worker 依賴 transport / settings）
+    from app.services.email.outbox_worker import wake_outbox_worker
+
+    wake_outbox_worker()
+
+
+def _clear_wake(session: Session) -> None:
+    session.info.pop(_WAKE_FLAG, None)
+
+
+# 掛在 Session class 上：per-session 的 once listener 會被 SQLAlchemy 去重，
+# 同一個 session 第二次之後的 commit 不會再觸發
+event.listen(Session, "after_commit", _wake_worker)
+event.listen(Session, "after_rollback", _clear_wake)
+
+
+def _schedule_wake(db: Session) -> None:
+    db.info[_WAKE_FLAG] = True
+
+
+def _recipient_domain(to_email: str) -> str:
+    return to_email.rpartition("@")[2].lower()
+
+
+def enqueue_email(
+    db: Session,
+    *,
+    to_email: str,
+    subject: str,
+    html: str,
+    category: str,
+    ref_type: Optional[str] = None,
+    ref_uuid: Optional[UUID] = None,
+) -> EmailOutbox:
+    """
+    寫入 outbox（呼叫端負責 commit）
+    """
+    message = EmailOutbox(
+        to_email=to_email,
+        recipient_domain=_recipient_domain(to_email),
+        subject=subject,
+        html=html,
+        category=category,
+        ref_type=ref_type,
+        ref_uuid=ref_uuid,
+    )
+    db.add(message)
+    _schedule_wake(db)
+
+    return message
+
+
+def enqueue_emails(
+    db: Session,
+    messages: Iterable[dict],
+    *,
+    chunk_size: int = 1000,
+) -> int:
+    """
+    批次寫入 outbox（ORM bulk INSERT，呼叫端負責 commit）
+
+    :param messages: enqueue_email() 的參數 dict（to_email / subject / html / category / ref_*）
+    """
+    rows = [
+        {**m, "recipient_domain": _recipient_domain(m["to_email"])}
+        for m in messages
+    ]
+
+    for start in range(0, len(rows), chunk_size):
+        db.execute(insert(EmailOutbox), rows[start:start + chunk_size])
+
+    if rows:
+        _schedule_wake(db)
+
+    return len(rows)
@@ -0,0 +1,430 @@
+# app/services/email/outbox_worker.py ← email_outbox 背景寄送 worker pool
+
+"""
+Email outbox worker
+
+說明：
+- N 條 thread，各自以 SELECT … FOR UPDATE SKIP LOCKED claim 一批 pending 列
+  （多 thread / 多 process 同時跑也不會重複 claim）
+- claim 時 status → sending 並設定 locked_until（租約），commit 後才發送；
+  worker 中途死掉 → 租約過期後由其他 worker 重新 claim
+- 發送走 transport.send_batch()（process 共用的 get_transport()：Resend batch API / blackhole …）
+- 失敗：retryable → 指數退避 + jitter 後重試；超過 max_attempts 或不可重試 → dead
+- 每個收件網域一個 token bucket；額度不足的列只把 next_attempt_at 往後推，不算一次嘗試
+- 執行方式：
+  - API process 內（settings.EMAIL_OUTBOX_WORKER_ENABLED，lifespan 啟動）
+  - 獨立 process：python -m app.services.email.outbox_worker
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.models.email.email_outbox import EmailOutbox
+from app.services.email.transport import (
+    EmailMessage,
+    EmailTransport,
+    SendResult,
+    get_transport,
+)
+
+
+logger = logging.getLogger("app.email.outbox")
+
+
+# =========================================================
+# Per-domain rate limit
+# =========================================================
+
+class DomainRateLimiter:
+    """
+    收件網域 token bucket（process 內）
+
+    :param rate_per_minute: 預設每分鐘額度
+    :param overrides: 個別網域額度（例如 {"gmail.com": 300}）
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: int,
+        overrides: Optional[dict[str, int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate_per_minute = rate_per_minute
+        self.overrides = {k.lower(): v for k, v in (overrides or {}).items()}
+        self._clock = clock
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _limit(self, domain: str) -> tuple[float, float]:
+        per_minute = self.overrides.get(domain, self.rate_per_minute)
+        rate = per_minute / 60
+        # burst：10 秒的額度（至少 1 封）
+        return rate, max(1.0, rate * 10)
+
+    def acquire(self, domain: str) -> float:
+        """
+        取得一個 token；成功回傳 0，否則回傳需等待的秒數
+        """
+        rate, capacity = self._limit(domain)
+        if rate <= 0:
+            return 0.0
+
+        now = self._clock()
+
+        with self._lock:
+            tokens, updated = self._buckets.get(domain, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+
+            if tokens >= 1:
+                self._buckets[domain] = (tokens - 1, now)
+                return 0.0
+
+            self._buckets[domain] = (tokens, now)
+            return (1 - tokens) / rate
+
+
+# =========================================================
+# Worker pool
+# =========================================================
+
+class OutboxWorker:
+
+    def __init__(
+        self,
+        *,
+        transport: EmailTransport,
+        session_factory: Callable[[], Session] = SessionLocal,
+        workers: int = 2,
+        batch_size: int = 50,
+        poll_interval: float = 2.0,
+        lease_seconds: int = 300,
+        max_attempts: int = 8,
+        retry_base_seconds: float = 30,
+        retry_max_seconds: float = 3600,
+        limiter: Optional[DomainRateLimiter] = None,
+    ):
+        self.transport = transport
+        self.session_factory = session_factory
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.limiter = limiter or DomainRateLimiter(rate_per_minute=0)
+
+        self._threads: list[threading.Thread] = []
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+        self._stats_lock = threading.Lock()
+        self.sent = 0
+        self.retried = 0
+        self.dead = 0
+        self.deferred = 0
+        self.batches = 0
+
+    # -----------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._run,
+                name=f"email-outbox-{i}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads.clear()
+
+    def wake(self) -> None:
+        self._wake_event.set()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                claimed = self.run_once()
+            except Exception:
+                logger.exception("Email outbox worker error")
+                claimed = 0
+
+            # 滿批代表可能還有待寄的信 → 直接下一輪
+            if claimed < self.batch_size:
+                self._wake_event.wait(self.poll_interval)
+                self._wake_event.clear()
+
+    # -----------------------------------------------------
+    # One round：claim → send → record
+    # -----------------------------------------------------
+
+    def run_once(self) -> int:
+        """
+        處理一批；回傳 claim 到的列數
+        """
+        db = self.session_factory()
+        try:
+            claimed = self._claim(db)
+            if not claimed:
+                return 0
+
+            results = self._deliver([message for _, _, message in claimed])
+            self._record(db, claimed, results)
+            return len(claimed)
+        finally:
+            db.close()
+
+    def _claim(self, db: Session) -> list[tuple[int, int, EmailMessage]]:
+        now = datetime.now(timezone.utc)
+
+        rows = (
+            db.query(EmailOutbox)
+            .filter(
+                EmailOutbox.status.in_(("pending", "sending")),
+                EmailOutbox.next_attempt_at <= now,
+                or_(
+                    EmailOutbox.status == "pending",
+                    and_(
+                        EmailOutbox.status == "sending",
+                        EmailOutbox.locked_until < now,
+                    ),
+                ),
+            )
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+        claimed = []
+        deferred = 0
+
+        for row in rows:
+            wait = self.limiter.acquire(row.recipient_domain)
+            if wait > 0:
+                row.status = "pending"
+                row.next_attempt_at = now + timedelta(seconds=wait)
+                deferred += 1
+                continue
+
+            row.status = "sending"
+            row.locked_until = now + timedelta(seconds=self.lease_seconds)
+            row.attempts += 1
+
+            claimed.append((
+                row.id,
+                row.attempts,
+                EmailMessage(
+                    to_email=row.to_email,
+                    subject=row.subject,
+                    html=row.html,
+                    idempotency_key=str(row.uuid),
+                ),
+            ))
+
+        db.commit()
+
+        if deferred:
+            with self._stats_lock:
+                self.deferred += deferred
+
+        return claimed
+
+    def _deliver(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        results: list[SendResult] = []
+        size = max(1, self.transport.max_batch_size)
+
+        for start in range(0, len(messages), size):
+            chunk = messages[start:start + size]
+            try:
+                chunk_results = self.transport.send_batch(chunk)
+            except Exception as e:
+                logger.exception("Email transport %s failed", self.transport.name)
+                chunk_results = [
+                    SendResult(ok=False, error=f"{type(e).__name__}: {e}", retryable=True)
+                ] * len(chunk)
+
+            results.extend(chunk_results)
+            with self._stats_lock:
+                self.batches += 1
+
+        return results
+
+    def backoff(self, attempts: int) -> float:
+        """
+        指數退避 + jitter（delay/2 ~ delay）
+        """
+        delay = min(
+            self.retry_max_seconds,
+            self.retry_base_seconds * (2 ** max(0, attempts - 1)),
+        )
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _record(
+        self,
+        db: Session,
+        claimed: Sequence[tuple[int, int, EmailMessage]],
+        results: Sequence[SendResult],
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        updates = []
+        sent = retried = dead = 0
+
+        for (row_id, attempts, _), result in zip(claimed, results):
+            if result.ok:
+                sent += 1
+                updates.append({
+                    "id": row_id,
+                    "status": "sent",
+                    "sent_at": now,
+                    "locked_until": None,
+                    "provider_message_id": result.message_id,
+                    "last_error": None,
+                })
+            elif result.retryable and attempts < self.max_attempts:
+                retried += 1
+                updates.append({
+                    "id": row_id,
+                    "status": "pending",
+                    "locked_until": None,
+                    "next_attempt_at": now + timedelta(seconds=self.backoff(attempts)),
+                    "last_error": result.error,
+                })
+            else:
+                dead += 1
+                updates.append({
+                    "id": row_id,
+                    "status": "dead",
+                    "locked_until": None,
+                    "last_error": result.error,
+                })
+                logger.error(
+                    "Email dead-lettered: outbox_id=%s attempts=%s error=%s",
+                    row_id, attempts, result.error,
+                )
+
+        # ORM bulk UPDATE by primary key（executemany）
+        if updates:
+            db.execute(update(EmailOutbox), updates)
+            db.commit()
+
+        with self._stats_lock:
+            self.sent += sent
+            self.retried += retried
+            self.dead += dead
+
+    # -----------------------------------------------------
+    # Metrics
+    # -----------------------------------------------------
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "transport": self.transport.name,
+                "workers": self.workers,
+                "batch_size": self.batch_size,
+                "sent": self.sent,
+                "retried": self.retried,
+                "dead": self.dead,
+                "deferred": self.deferred,
+                "batches": self.batches,
+            }
+
+
+# =========================================================
+# Process-wide worker
+# =========================================================
+
+_worker: Optional[OutboxWorker] = None
+
+
+def build_outbox_worker() -> OutboxWorker:
+    return OutboxWorker(
+        transport=get_transport(),
+        workers=settings.EMAIL_OUTBOX_WORKERS,
+        batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+        poll_interval=settings.EMAIL_OUTBOX_POLL_SECONDS,
+        lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+        max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        retry_base_seconds=settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS,
+        retry_max_seconds=settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS,
+        limiter=DomainRateLimiter(
+            rate_per_minute=settings.EMAIL_DOMAIN_RATE_PER_MINUTE,
+            overrides=settings.EMAIL_DOMAIN_RATE_OVERRIDES,
+        ),
+    )
+
+
+def start_outbox_worker() -> None:
+    global _worker
+
+    if not settings.EMAIL_OUTBOX_WORKER_ENABLED or _worker is not None:
+        return
+
+    try:
+        worker = build_outbox_worker()
+    except RuntimeError:
+        # 例如本機未設定 RESEND_API_KEY：信件留在 outbox，設定好後再寄
+        logger.exception("Email outbox worker not started")
+        return
+
+    worker.start()
+    _worker = worker
+
+
+def stop_outbox_worker() -> None:
+    global _worker
+
+    if _worker is None:
+        return
+
+    _worker.stop()
+    _worker = None
+
+
+def wake_outbox_worker() -> None:
+    if _worker is not None:
+        _worker.wake()
+
+
+def outbox_worker_stats() -> Optional[dict]:
+    return _worker.stats() if _worker is not None else None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    worker = build_outbox_worker()
+    worker.start()
+    logger.info(
+        "Email outbox worker started: transport=%s workers=%s",
+        worker.transport.name, worker.workers,
+    )
+
+    try:
+        while True:
+            time.sleep(60)
+            logger.info("Email outbox stats: %s", worker.stats())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.stop()
+        worker.transport.close()
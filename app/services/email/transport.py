@@ -0,0 +1,548 @@
+# app/services/email/transport.py ← Email 發送 transport
+
+"""
+Email transport
+
+說明：
+- EmailTransport：send / send_batch（sync）與 asend / asend_batch（async）
+  send_batch 回傳與輸入同順序的 SendResult，不拋例外
+- 實作：
+  - resend：process 共用的 pooled httpx Client / AsyncClient（keep-alive，可選 HTTP/2），
+    多封時走 Resend batch API（POST /emails/batch，一次最多 100 封）
+  - memory：只記錄在記憶體（測試用）
+  - file：每封信寫成一個 JSON 檔（本機開發 / 測試用）
+  - blackhole：丟棄，可注入延遲 / 失敗率（壓測 / benchmark 用）
+- get_transport()：依 settings.EMAIL_TRANSPORT 建立的 process-wide 單例，
+  send_generic_email / send_verification_email / outbox worker 共用
+- 每個 transport 帶 TransportMetrics（每次呼叫的延遲分佈、錯誤分類），用來估算 pool 大小
+- 錯誤分類：網路錯誤 / 429 / 5xx → retryable；其他 4xx → 不可重試（dead-letter）
+"""
+
+import abc
+import asyncio
+import bisect
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+from uuid import uuid4
+
+import httpx
+
+from app.core.config import settings
+
+
+logger = logging.getLogger("app.email.transport")
+
+
+# =========================================================
+# Message / Result
+# =========================================================
+
+@dataclass(frozen=True, slots=True)
+class EmailMessage:
+    to_email: str
+    subject: str
+    html: str
+    # 同一封信重送時避免重複寄出（outbox uuid）
+    idempotency_key: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SendResult:
+    ok: bool
+    message_id: Optional[str] = None
+    error: Optional[str] = None
+    retryable: bool = True
+
+
+def _failure(error: str, *, retryable: bool, count: int) -> list[SendResult]:
+    return [SendResult(ok=False, error=error, retryable=retryable)] * count
+
+
+# =========================================================
+# Metrics
+# =========================================================
+
+class TransportMetrics:
+    """
+    每次 transport 呼叫（一次 HTTP request / 一批）的延遲分佈與錯誤統計
+
+    - latency：固定 bucket 的 histogram（毫秒，上界含）
+    - errors：network / rate_limited / client_error / server_error
+    """
+
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = [0] * (len(self.BUCKETS_MS) + 1)
+        self.calls = 0
+        self.messages = 0
+        self.failed_messages = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.errors: dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @contextmanager
+    def call(self, messages: int) -> Iterator[None]:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            with self._lock:
+                self.in_flight -= 1
+                self.calls += 1
+                self.messages += messages
+                self.total_ms += elapsed_ms
+                self.max_ms = max(self.max_ms, elapsed_ms)
+                self._buckets[bisect.bisect_left(self.BUCKETS_MS, elapsed_ms)] += 1
+
+    def record_results(self, results: Sequence[SendResult]) -> None:
+        failed = sum(1 for r in results if not r.ok)
+        if failed:
+            with self._lock:
+                self.failed_messages += failed
+
+    def record_error(self, kind: str) -> None:
+        with self._lock:
+            self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def _percentile(self, q: float) -> Optional[float]:
+        """
+        bucket 上界近似值（落在最後一個 bucket → max_ms）
+        """
+        target = self.calls * q
+        seen = 0
+        for i, count in enumerate(self._buckets):
+            seen += count
+            if count and seen >= target:
+                return float(self.BUCKETS_MS[i]) if i < len(self.BUCKETS_MS) else round(self.max_ms, 2)
+        return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            histogram = {
+                f"le_{bound}ms": count
+                for bound, count in zip(self.BUCKETS_MS, self._buckets)
+            }
+            histogram["le_inf"] = self._buckets[-1]
+
+            return {
+                "calls": self.calls,
+                "messages": self.messages,
+                "failed_messages": self.failed_messages,
+                "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+                "p50_ms": self._percentile(0.50),
+                "p95_ms": self._percentile(0.95),
+                "p99_ms": self._percentile(0.99),
+                "max_ms": round(self.max_ms, 2),
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "errors": dict(self.errors),
+                "latency_histogram": histogram,
+            }
+
+
+# =========================================================
+# Transport interface
+# =========================================================
+
+class EmailTransport(abc.ABC):
+    name = "base"
+
+    # 單次 send_batch 的上限
+    max_batch_size = 1
+
+    def __init__(self):
+        self.metrics = TransportMetrics()
+
+    # -----------------------------------------------------
+    # 子類別實作
+    # -----------------------------------------------------
+
+    @abc.abstractmethod
+    def _send_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        ...
+
+    async def _asend_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        # 預設：sync 實作丟到 thread，不阻塞 event loop
+        return await asyncio.to_thread(self._send_batch, messages)
+
+    # -----------------------------------------------------
+    # Public API（含 metrics）
+    # -----------------------------------------------------
+
+    def send_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        with self.metrics.call(len(messages)):
+            results = self._send_batch(messages)
+        self.metrics.record_results(results)
+        return results
+
+    async def asend_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        with self.metrics.call(len(messages)):
+            results = await self._asend_batch(messages)
+        self.metrics.record_results(results)
+        return results
+
+    def send(self, message: EmailMessage) -> SendResult:
+        return self.send_batch([message])[0]
+
+    async def asend(self, message: EmailMessage) -> SendResult:
+        return (await self.asend_batch([message]))[0]
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def stats(self) -> dict:
+        return {"transport": self.name, **self.metrics.stats()}
+
+
+# =========================================================
+# Resend
+# =========================================================
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ResendTransport(EmailTransport):
+    name = "resend"
+    max_batch_size = 100
+
+    BASE_URL = "https://api.resend.com"
+
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        from_email: str,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+    ):
+        super().__init__()
+
+        if not api_key:
+            raise RuntimeError("RESEND_API_KEY not set")
+        if not from_email:
+            raise RuntimeError("RESEND_FROM_EMAIL not set")
+
+        # HTTP/2 需要 h2（pip install "httpx[http2]"）；沒裝就退回 HTTP/1.1 keep-alive
+        if http2 and not _http2_available():
+            logger.warning("EMAIL_HTTP2 enabled but h2 is not installed, using HTTP/1.1")
+            http2 = False
+
+        self.from_email = from_email
+
+        # sync / async client 共用同一組設定；整個 process 各一個 pool
+        self._client_options = dict(
+            base_url=self.BASE_URL,
+            timeout=timeout,
+            http2=http2,
+            headers={"Authorization": f"Bearer {api_key}"},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self._client = httpx.Client(**self._client_options)
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        # lazy：AsyncClient 需在 event loop 內使用
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(**self._client_options)
+        return self._async_client
+
+    # -----------------------------------------------------
+    # Request / response mapping
+    # -----------------------------------------------------
+
+    def _payload(self, message: EmailMessage) -> dict:
+        return {
+            "from": self.from_email,
+            "to": [message.to_email],
+            "subject": message.subject,
+            "html": message.html,
+        }
+
+    def _request(self, messages: Sequence[EmailMessage]) -> dict:
+        if len(messages) == 1:
+            message = messages[0]
+            headers = {}
+            if message.idempotency_key:
+                headers["Idempotency-Key"] = message.idempotency_key
+            return {"url": "/emails", "json": self._payload(message), "headers": headers}
+
+        return {"url": "/emails/batch", "json": [self._payload(m) for m in messages]}
+
+    def _network_error(self, e: Exception, count: int) -> list[SendResult]:
+        self.metrics.record_error("network")
+        return _failure(f"{type(e).__name__}: {e}", retryable=True, count=count)
+
+    def _parse(self, res: httpx.Response, count: int) -> Optional[list[SendResult]]:
+        """
+        回傳 None 代表整批因 4xx 被拒，呼叫端改為逐封送出
+        """
+        if res.status_code == 429:
+            self.metrics.record_error("rate_limited")
+        elif res.status_code >= 500:
+            self.metrics.record_error("server_error")
+        elif res.status_code >= 400:
+            self.metrics.record_error("client_error")
+
+        if res.status_code >= 400:
+            error = f"Resend {res.status_code}: {res.text[:500]}"
+            retryable = res.status_code == 429 or res.status_code >= 500
+
+            if count > 1 and not retryable:
+                return None
+            return _failure(error, retryable=retryable, count=count)
+
+        body = res.json()
+        if count == 1:
+            return [SendResult(ok=True, message_id=body.get("id"))]
+
+        data = body.get("data") or []
+        return [
+            SendResult(ok=True, message_id=item.get("id"))
+            for item in data
+        ] + _failure("Missing batch result", retryable=True, count=count - len(data))
+
+    # -----------------------------------------------------
+    # Sync / async
+    # -----------------------------------------------------
+
+    def _send_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        try:
+            res = self._client.post(**self._request(messages))
+        except httpx.HTTPError as e:
+            return self._network_error(e, len(messages))
+
+        results = self._parse(res, len(messages))
+        if results is None:
+            # 整批被拒（例如其中一個地址格式錯誤）→ 逐封送出，只讓壞的那封進 dead-letter
+            results = [self._send_batch([m])[0] for m in messages]
+        return results
+
+    async def _asend_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        try:
+            res = await self.async_client.post(**self._request(messages))
+        except httpx.HTTPError as e:
+            return self._network_error(e, len(messages))
+
+        results = self._parse(res, len(messages))
+        if results is None:
+            results = [(await self._asend_batch([m]))[0] for m in messages]
+        return results
+
+    def close(self) -> None:
+        self._client.close()
+
+    async def aclose(self) -> None:
+        self._client.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+
+# =========================================================
+# Memory（測試用）
+# =========================================================
+
+class MemoryTransport(EmailTransport):
+    name = "memory"
+    max_batch_size = 100
+
+    def __init__(self):
+        super().__init__()
+        self.outbox: list[EmailMessage] = []
+        self._lock = threading.Lock()
+
+    def _send_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        with self._lock:
+            self.outbox.extend(messages)
+        return [SendResult(ok=True, message_id=f"memory-{uuid4().hex}") for _ in messages]
+
+    async def _asend_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        return self._send_batch(messages)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.outbox.clear()
+
+
+# =========================================================
+# File（本機開發：每封信一個 JSON 檔）
+# =========================================================
+
+class FileTransport(EmailTransport):
+    name = "file"
+    max_batch_size = 100
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _send_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        results = []
+        for message in messages:
+            message_id = uuid4().hex
+            path = self.directory / f"{time.time_ns()}-{message_id}.json"
+            try:
+                path.write_text(
+                    json.dumps(asdict(message), ensure_ascii=False, indent=2),
+                    encoding="utf-8",
+                )
+            except OSError as e:
+                self.metrics.record_error("io")
+                results.append(SendResult(ok=False, error=str(e), retryable=True))
+                continue
+            results.append(SendResult(ok=True, message_id=message_id))
+        return results
+
+
+# =========================================================
+# Blackhole（benchmark / 離線壓測）
+# =========================================================
+
+class BlackholeTransport(EmailTransport):
+    """
+    丟棄所有信件，模擬供應商延遲與失敗
+
+    :param latency: 每次呼叫的基本延遲（秒）
+    :param jitter: 額外隨機延遲上限（秒）
+    :param failure_rate: 每封信模擬 retryable 失敗的機率
+    """
+
+    name = "blackhole"
+    max_batch_size = 100
+
+    def __init__(self, *, latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0):
+        super().__init__()
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+
+    def _delay(self) -> float:
+        return self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _results(self, count: int) -> list[SendResult]:
+        results = []
+        for _ in range(count):
+            if self.failure_rate and random.random() < self.failure_rate:
+                self.metrics.record_error("injected")
+                results.append(SendResult(ok=False, error="Injected failure", retryable=True))
+            else:
+                results.append(SendResult(ok=True, message_id=f"blackhole-{uuid4().hex}"))
+        return results
+
+    def _send_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+        return self._results(len(messages))
+
+    async def _asend_batch(self, messages: Sequence[EmailMessage]) -> list[SendResult]:
+        delay = self._delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self._results(len(messages))
+
+
+# =========================================================
+# Process-wide transport
+# =========================================================
+
+def build_transport(kind: Optional[str] = None) -> EmailTransport:
+    kind = kind or settings.EMAIL_TRANSPORT
+
+    if kind == "memory":
+        return MemoryTransport()
+
+    if kind == "file":
+        return FileTransport(settings.EMAIL_FILE_DIR)
+
+    if kind == "blackhole":
+        return BlackholeTransport(
+            latency=settings.EMAIL_BLACKHOLE_LATENCY_MS / 1000,
+            jitter=settings.EMAIL_BLACKHOLE_JITTER_MS / 1000,
+            failure_rate=settings.EMAIL_BLACKHOLE_FAILURE_RATE,
+        )
+
+    if kind == "resend":
+        return ResendTransport(
+            api_key=settings.RESEND_API_KEY,
+            from_email=settings.RESEND_FROM_EMAIL,
+            timeout=settings.EMAIL_HTTP_TIMEOUT_SECONDS,
+            max_connections=settings.EMAIL_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.EMAIL_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.EMAIL_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            http2=settings.EMAIL_HTTP2,
+        )
+
+    raise RuntimeError(f"Unknown EMAIL_TRANSPORT: {kind}")
+
+
+_transport: Optional[EmailTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> EmailTransport:
+    global _transport
+
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = build_transport()
+    return _transport
+
+
+def set_transport(transport: Optional[EmailTransport]) -> None:
+    """
+    替換 process-wide transport（測試 / benchmark 用；None → 下次依設定重建）
+    """
+    global _transport
+
+    with _transport_lock:
+        _transport = transport
+
+
+def current_transport() -> Optional[EmailTransport]:
+    return _transport
+
+
+async def close_transport() -> None:
+    global _transport
+
+    with _transport_lock:
+        transport, _transport = _transport, None
+
+    if transport is not None:
+        await transport.aclose()
@@ -0,0 +1,324 @@
+# app/services/event/field_analytics.py ← 報名欄位答案分析（聚合在 PostgreSQL 內完成）
+
+"""
+Field answer analytics
+
+說明：
+- 依欄位類型分三種統計，全部以 GROUP BY event_field_uuid 在 DB 內聚合（不經 ORM 載入答案）：
+  - choice（選項類 / boolean）：選項分布（多選每個選項各算一次）
+  - numeric（number / integer）：min / max / avg / p25 / p50 / p75 / p90
+    （舊資料以字串儲存的數字（"20"）會轉型後一併統計；無法轉型的答案計入 invalid）
+  - text（其他）：平均長度
+  - 所有欄位：作答數 / 填答率（作答數 ÷ 未刪除報名數）
+- 查詢以 ix_submission_values_field_scalar（event_field_uuid, value #>> '{}'）為主
+  （document 儲存模式改讀相容 view，見 app/services/submission/answers.py）
+- 快取 key = 活動 + fields_version + 報名 fingerprint（count(*), sum(epoch(updated_at))）
+  - 與 app/core/conditional.py 列表 fingerprint 相同：報名新增 / 狀態變更 / 刪除都會改變 key，不需主動失效
+  ⚠️ 不用 max(updated_at)：updated_at = now() 是 transaction 開始時間，
+     較晚 commit 的舊 transaction 不一定會推高 max
+  - 命中時只有一條 index-only 查詢（ix_submissions_event_updated）
+  ⚠️ 直接修改 submission_values 而不更新 submissions.updated_at 的寫入路徑不會反映在快取
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, select, text, true
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.versioned_cache import VersionedCache
+from app.models.event.event import Event
+from app.models.event.event_field import EventField
+from app.models.submission.submission import Submission
+from app.services.submission.answers import ANSWER_ROWS
+from app.services.submission.form_validator import MULTI_CHOICE_TYPES, SINGLE_CHOICE_TYPES
+
+
+NUMERIC_TYPES = frozenset({"number", "integer"})
+BOOLEAN_TYPES = frozenset({"boolean"})
+
+PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+
+
+def field_kind(field_type: Optional[str]) -> str:
+    field_type = (field_type or "text").lower()
+
+    if field_type in SINGLE_CHOICE_TYPES or field_type in MULTI_CHOICE_TYPES:
+        # 沒有選項的 checkbox = 單一勾選（true / false 分布）
+        return "choice"
+    if field_type in BOOLEAN_TYPES:
+        return "choice"
+    if field_type in NUMERIC_TYPES:
+        return "numeric"
+    return "text"
+
+
+def _option_labels(options: Optional[list]) -> dict[str, str]:
+    """
+    選項定義 → {str(value): label}（依定義順序）
+    """
+    labels: dict[str, str] = {}
+    for option in options or ():
+        if isinstance(option, dict):
+            value = option.get("value", option.get("label"))
+            label = option.get("label", value)
+        else:
+            value = label = option
+        if value is not None:
+            labels[str(value)] = str(label)
+    return labels
+
+
+# =========================================================
+# Aggregation SQL（只統計未刪除的報名 / 答案）
+# =========================================================
+
+def _answers_sql(select_list: str, *, lateral: str = "", where: str = "") -> str:
+    return f"""
+SELECT v.event_field_uuid, {select_list}
+  FROM {ANSWER_ROWS} v
+  JOIN submissions s
+    ON s.uuid = v.submission_uuid
+   AND s.is_deleted = false
+{lateral}
+ WHERE v.event_field_uuid = ANY(CAST(:fields AS uuid[]))
+   AND v.is_deleted = false
+   {where}
+"""
+
+
+_COVERAGE_SQL = text(_answers_sql("""
+       count(*) FILTER (
+           WHERE v.value IS NOT NULL
+             AND v.value NOT IN ('null'::jsonb, '""'::jsonb, '[]'::jsonb)
+       ) AS answered,
+       avg(length(v.value #>> '{}')) FILTER (
+           WHERE jsonb_typeof(v.value) = 'string' AND v.value <> '""'::jsonb
+       ) AS avg_length
+""") + " GROUP BY v.event_field_uuid")
+
+# 多選展開成多列；單選 / boolean 取 scalar 文字（與 index 運算式相同）
+_HISTOGRAM_SQL = text(_answers_sql(
+    "o.value, count(*) AS n",
+    lateral="""
+ CROSS JOIN LATERAL (
+    SELECT jsonb_array_elements_text(v.value) AS value
+     WHERE jsonb_typeof(v.value) = 'array'
+    UNION ALL
+    SELECT v.value #>> '{}'
+     WHERE jsonb_typeof(v.value) IN ('string', 'number', 'boolean')
+ ) o""",
+) + " GROUP BY v.event_field_uuid, o.value")
+
+# number 直接轉型；舊資料的數字字串（"20" / " 3.5 "）轉型後一併統計，其餘非空答案計入 invalid
+NUMERIC_TEXT_PATTERN = r"^\s*[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?\s*$"
+
+_NUMERIC_SQL = text(_answers_sql(
+    """
+       count(x.n) AS n,
+       count(*) FILTER (WHERE x.n IS NULL) AS invalid,
+       min(x.n) AS min,
+       max(x.n) AS max,
+       avg(x.n) AS avg,
+       percentile_cont(CAST(:percentiles AS float8[])) WITHIN GROUP (ORDER BY x.n) AS percentiles
+""",
+    lateral="""
+ CROSS JOIN LATERAL (
+    SELECT CASE
+             WHEN jsonb_typeof(v.value) = 'number'
+               THEN CAST(v.value #>> '{}' AS float8)
+             WHEN jsonb_typeof(v.value) = 'string' AND v.value #>> '{}' ~ :numeric_text
+               THEN CAST(trim(v.value #>> '{}') AS float8)
+           END AS n
+ ) x""",
+    where="""AND v.value IS NOT NULL
+   AND v.value NOT IN ('null'::jsonb, '""'::jsonb, '[]'::jsonb)""",
+) + " GROUP BY v.event_field_uuid")
+
+
+def _fields_statement(event_uuid: UUID):
+    total = (
+        select(func.count(Submission.id))
+        .where(
+            Submission.event_uuid == event_uuid,
+            Submission.is_deleted == False,
+        )
+        .scalar_subquery()
+    )
+
+    return (
+        select(
+            total.label("total"),
+            EventField.uuid,
+            EventField.field_key,
+            EventField.label,
+            EventField.field_type,
+            EventField.options,
+        )
+        .select_from(Event)
+        .outerjoin(
+            EventField,
+            and_(
+                EventField.event_uuid == Event.uuid,
+                EventField.is_deleted == False,
+            ),
+        )
+        .where(Event.uuid == event_uuid)
+        .order_by(EventField.sort_order, EventField.id)
+    )
+
+
+def compute_field_analytics(db: Session, event_uuid: UUID) -> dict:
+    """
+    一次計算所有欄位（最多 4 條查詢：欄位 + 作答數 + 選項分布 + 數值統計）
+    """
+    rows = db.execute(_fields_statement(event_uuid)).all()
+    total = rows[0].total if rows else 0
+
+    fields = []
+    by_uuid: dict[UUID, dict] = {}
+    choice, numeric = [], []
+
+    for row in rows:
+        if row.uuid is None:
+            continue
+
+        kind = field_kind(row.field_type)
+        item: dict[str, Any] = {
+            "field_uuid": row.uuid,
+            "field_key": row.field_key,
+            "label": row.label,
+            "field_type": row.field_type,
+            "kind": kind,
+            "answered": 0,
+            "fill_rate": 0.0,
+        }
+
+        if kind == "choice":
+            labels = _option_labels(row.options)
+            item["options"] = [
+                {"value": value, "label": label, "count": 0} for value, label in labels.items()
+            ]
+            choice.append(str(row.uuid))
+        elif kind == "numeric":
+            item["numeric"] = None
+            numeric.append(str(row.uuid))
+        else:
+            item["avg_length"] = None
+
+        fields.append(item)
+        by_uuid[row.uuid] = item
+
+    if not fields:
+        return {"total_submissions": total, "fields": []}
+
+    params = {"fields": [str(u) for u in by_uuid]}
+
+    for row in db.execute(_COVERAGE_SQL, params):
+        item = by_uuid[row.event_field_uuid]
+        item["answered"] = row.answered
+        item["fill_rate"] = round(row.answered / total, 4) if total else 0.0
+        if item["kind"] == "text" and row.avg_length is not None:
+            item["avg_length"] = round(float(row.avg_length), 2)
+
+    if choice:
+        for row in db.execute(_HISTOGRAM_SQL, {"fields": choice}):
+            options = by_uuid[row.event_field_uuid]["options"]
+            for option in options:
+                if option["value"] == row.value:
+                    option["count"] = row.n
+                    break
+            else:
+                # 不在目前選項定義內（選項已修改 / 移除）
+                options.append({"value": row.value, "label": row.value, "count": row.n})
+
+    if numeric:
+        rows = db.execute(
+            _NUMERIC_SQL,
+            {"fields": numeric, "percentiles": list(PERCENTILES), "numeric_text": NUMERIC_TEXT_PATTERN},
+        )
+        for row in rows:
+            if not row.n:
+                by_uuid[row.event_field_uuid]["numeric"] = {"count": 0, "invalid": row.invalid}
+                continue
+            by_uuid[row.event_field_uuid]["numeric"] = {
+                "count": row.n,
+                "invalid": row.invalid,
+                "min": row.min,
+                "max": row.max,
+                "avg": round(float(row.avg), 4),
+                "percentiles": {
+                    f"p{int(p * 100)}": value for p, value in zip(PERCENTILES, row.percentiles)
+                },
+            }
+
+    return {"total_submissions": total, "fields": fields}
+
+
+# =========================================================
+# Cache（key = event + fields_version + submission fingerprint）
+# =========================================================
+
+@dataclass(frozen=True, slots=True)
+class CachedAnalytics:
+    version: int
+    data: dict
+
+
+analytics_cache = VersionedCache(
+    maxsize=settings.FIELD_ANALYTICS_CACHE_MAX_SIZE,
+    ttl=settings.FIELD_ANALYTICS_CACHE_TTL_SECONDS,
+)
+
+
+def _fingerprint(db: Session, event_uuid: UUID, organizer_uuid: Optional[UUID]):
+    """
+    (fields_version, 報名數, sum(epoch(updated_at)))；含已刪除的報名（soft delete 也會更新 updated_at）
+    """
+    submissions = (
+        select(
+            func.count().label("n"),
+            func.sum(func.extract("epoch", Submission.updated_at)).label("updated"),
+        )
+        .where(Submission.event_uuid == Event.uuid)
+        .lateral()
+    )
+
+    statement = (
+        select(Event.fields_version, submissions.c.n, submissions.c.updated)
+        .select_from(Event)
+        .join(submissions, true())
+    ).where(
+        Event.uuid == event_uuid,
+        Event.is_deleted == False,
+    )
+    if organizer_uuid is not None:
+        statement = statement.where(Event.organizer_uuid == organizer_uuid)
+
+    return db.execute(statement).one_or_none()
+
+
+def get_field_analytics(
+    db: Session,
+    event_uuid: UUID,
+    *,
+    organizer_uuid: Optional[UUID] = None,
+) -> Optional[dict]:
+    """
+    活動不存在（或不屬於 organizer_uuid）→ None
+    """
+    mark = _fingerprint(db, event_uuid, organizer_uuid)
+    if mark is None:
+        return None
+
+    key = f"{event_uuid}:{mark.fields_version}:{mark.n}:{mark.updated or 0}"
+
+    cached = analytics_cache.get(key)
+    if cached is not None:
+        return cached.data
+
+    data = compute_field_analytics(db, event_uuid)
+    analytics_cache.put(key, CachedAnalytics(version=mark.fields_version, data=data))
+    return data
@@ -0,0 +1,536 @@
+# app/services/event/report_aggregator.py ← 活動統計（EventReportCache）增量維護
+
+"""
+Event report aggregator
+
+說明：
+- report_data 為扁平計數（key → n），讀取時才整理成巢狀結構：
+    total                       未刪除的報名數
+    status:<status>             各狀態報名數
+    day:<YYYY-MM-DD>            每日（UTC，submitted_at）報名數
+    price:<price_uuid>          各票種已預留名額（app/services/event/reservation.py）
+    option:<field_key>:<value>  選項類欄位的答案分布（多選每個選項各算一次）
+- 寫入：異動的 transaction 內 INSERT 一列 event_report_deltas（不更新共用計數列）
+  - 報名建立 / 匯入 / 刪除：record_submissions()（以 SQL 從正式資料計算，與 rebuild 同一套規則）
+  - 狀態變更：record_status_changes()（transition RETURNING 的 previous_status → status）
+  - 名額：record_price_delta()
+- 併入：fold_report_deltas()（背景 job；DELETE … RETURNING + UPSERT，一條 SQL）
+- 讀取：get_event_report() — cache 一列 + 尚未併入的 deltas（同一個 snapshot），
+  成本與報名數無關
+- 修復：rebuild_event_report()（從 submissions / submission_values / event_prices 重算）
+  python -m app.services.event.report_aggregator rebuild [event_uuid]
+- 併入與重算以 advisory lock 互斥（fold：shared / rebuild：exclusive）
+  - API 的 rebuild 只嘗試取得 lock（忙碌 → 409），不排隊擋住其他活動的 fold
+"""
+
+import json
+import logging
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.models.event.event import Event
+from app.services.submission.answers import ANSWER_ROWS
+from app.services.submission.form_validator import MULTI_CHOICE_TYPES, SINGLE_CHOICE_TYPES
+
+
+logger = logging.getLogger("app.event.report")
+
+# pg_advisory_xact_lock key（"EVRP"）
+REPORT_LOCK_KEY = 0x45565250
+
+CHOICE_TYPES = tuple(sorted(SINGLE_CHOICE_TYPES | MULTI_CHOICE_TYPES))
+
+
+# =========================================================
+# Counters SQL（增量與重算共用）
+# =========================================================
+#
+# 需要一個名為 subs 的 CTE：(uuid, event_uuid, status, submitted_at)
+# 產出 counters：(event_uuid, key, n)
+
+_COUNTERS_CTE = """
+counters AS (
+    SELECT event_uuid, 'total' AS key, count(*) AS n
+      FROM subs
+     GROUP BY event_uuid
+    UNION ALL
+    SELECT event_uuid, 'status:' || status::text, count(*)
+      FROM subs
+     GROUP BY event_uuid, status
+    UNION ALL
+    SELECT event_uuid, 'day:' || to_char(submitted_at AT TIME ZONE 'UTC', 'YYYY-MM-DD'), count(*)
+      FROM subs
+     GROUP BY 1, 2
+    UNION ALL
+    SELECT s.event_uuid, 'option:' || v.field_key || ':' || o.value, count(*)
+      FROM subs s
+      JOIN {answer_rows} v
+        ON v.submission_uuid = s.uuid
+       AND v.is_deleted = false
+      JOIN event_fields f
+        ON f.uuid = v.event_field_uuid
+     CROSS JOIN LATERAL (
+        SELECT jsonb_array_elements_text(v.value) AS value
+         WHERE jsonb_typeof(v.value) = 'array'
+        UNION ALL
+        SELECT v.value #>> '{}'
+         WHERE jsonb_typeof(v.value) IN ('string', 'number', 'boolean')
+     ) o
+     WHERE lower(f.field_type) = ANY(:choice_types)
+       AND jsonb_typeof(f.options) = 'array'
+       AND jsonb_array_length(f.options) > 0
+     GROUP BY 1, 2
+)
+""".replace("{answer_rows}", ANSWER_ROWS)
+
+_INSERT_DELTA_COLUMNS = """
+INSERT INTO event_report_deltas (
+    event_uuid, delta, uuid, is_active, is_deleted, version, created_at, updated_at
+)
+"""
+
+_RECORD_SUBMISSIONS_SQL = """
+WITH subs AS (
+    SELECT uuid, event_uuid, status, submitted_at
+      FROM submissions
+     WHERE uuid IN ({selection})
+),
+""" + _COUNTERS_CTE + _INSERT_DELTA_COLUMNS + """
+SELECT event_uuid, jsonb_object_agg(key, n * :sign), gen_random_uuid(), true, false, 1, now(), now()
+  FROM counters
+ GROUP BY event_uuid
+"""
+
+
+def _choice_params() -> dict:
+    return {"choice_types": list(CHOICE_TYPES)}
+
+
+def record_submissions(db: Session, selection: str, params: Optional[dict] = None, *, sign: int = 1) -> None:
+    """
+    將一組 submission 計入（sign=1）或扣除（sign=-1）統計（不 commit）
+
+    :param selection: 回傳 submissions.uuid 的 SQL（例如 "SELECT uuid FROM import_submissions"）
+    ⚠️ 計算時讀取 submission / values 的目前內容：
+       新增 → 在 values 寫入（flush）之後呼叫；刪除 → 在標記刪除之前呼叫
+    """
+    db.flush()
+    db.execute(
+        text(_RECORD_SUBMISSIONS_SQL.replace("{selection}", selection)),
+        {**_choice_params(), **(params or {}), "sign": sign},
+    )
+
+
+def record_submission(db: Session, submission_uuid: UUID, *, sign: int = 1) -> None:
+    record_submissions(db, "CAST(:submission_uuid AS uuid)", {"submission_uuid": str(submission_uuid)}, sign=sign)
+
+
+def record_delta(db: Session, event_uuid: UUID, delta: dict[str, int]) -> None:
+    """
+    直接寫入一筆 delta（不 commit）；全為 0 → 不寫
+    """
+    delta = {k: v for k, v in delta.items() if v}
+    if not delta:
+        return
+
+    db.execute(
+        text(_INSERT_DELTA_COLUMNS + """
+        VALUES (:event_uuid, CAST(:delta AS jsonb), gen_random_uuid(), true, false, 1, now(), now())
+        """),
+        {"event_uuid": str(event_uuid), "delta": json.dumps(delta)},
+    )
+
+
+def _status_value(status) -> str:
+    return getattr(status, "value", status)
+
+
+def record_status_changes(db: Session, rows: Iterable) -> None:
+    """
+    transition RETURNING rows（需含 event_uuid / previous_status / status）→ 每個活動一筆 delta
+    """
+    per_event: dict[Any, Counter] = defaultdict(Counter)
+    for row in rows:
+        previous, current = _status_value(row.previous_status), _status_value(row.status)
+        if previous == current:
+            continue
+        per_event[row.event_uuid][f"status:{previous}"] -= 1
+        per_event[row.event_uuid][f"status:{current}"] += 1
+
+    for event_uuid, delta in per_event.items():
+        record_delta(db, event_uuid, delta)
+
+
+def record_price_delta(db: Session, price_uuid: UUID, quantity: int) -> None:
+    """
+    票種名額增減（不 commit）；event_uuid 由 event_prices 取得（同一條 INSERT … SELECT）
+    """
+    if not quantity:
+        return
+
+    db.execute(
+        text(_INSERT_DELTA_COLUMNS + """
+        SELECT event_uuid, jsonb_build_object('price:' || uuid::text, CAST(:quantity AS integer)),
+               gen_random_uuid(), true, false, 1, now(), now()
+          FROM event_prices
+         WHERE uuid = :price_uuid
+        """),
+        {"price_uuid": str(price_uuid), "quantity": quantity},
+    )
+
+
+# =========================================================
+# Fold（deltas → event_report_cache）
+# =========================================================
+
+# 兩份扁平計數相加；結果為 0 的 key 移除
+_MERGE_COUNTERS = """
+(
+    SELECT coalesce(jsonb_object_agg(key, n), '{{}}'::jsonb)
+      FROM (
+        SELECT key, sum(value::bigint) AS n
+          FROM (
+            SELECT * FROM jsonb_each_text({left})
+            UNION ALL
+            SELECT * FROM jsonb_each_text({right})
+          ) u
+         GROUP BY key
+      ) m
+     WHERE n <> 0
+)
+"""
+
+_FOLD_SQL = """
+WITH batch AS (
+    DELETE FROM event_report_deltas
+     WHERE id IN (
+        SELECT id
+          FROM event_report_deltas
+         ORDER BY id
+         LIMIT :limit
+           FOR UPDATE SKIP LOCKED
+     )
+    RETURNING event_uuid, delta
+),
+sums AS (
+    SELECT b.event_uuid, e.key, sum(e.value::bigint) AS n
+      FROM batch b
+     CROSS JOIN LATERAL jsonb_each_text(b.delta) e
+     GROUP BY b.event_uuid, e.key
+),
+docs AS (
+    SELECT event_uuid, jsonb_object_agg(key, n) AS delta
+      FROM sums
+     GROUP BY event_uuid
+),
+merged AS (
+    INSERT INTO event_report_cache (
+        event_uuid, report_data, uuid, is_active, is_deleted, version, created_at, updated_at
+    )
+    SELECT d.event_uuid, d.delta, gen_random_uuid(), true, false, 1, now(), now()
+      FROM docs d
+     WHERE EXISTS (SELECT 1 FROM events e WHERE e.uuid = d.event_uuid)
+    ON CONFLICT (event_uuid) DO UPDATE
+       SET report_data = """ + _MERGE_COUNTERS.format(
+    left="event_report_cache.report_data", right="excluded.report_data"
+) + """,
+           version = event_report_cache.version + 1,
+           updated_at = now()
+    RETURNING 1
+)
+SELECT (SELECT count(*) FROM batch) AS deltas, (SELECT count(*) FROM merged) AS events
+"""
+
+
+def fold_report_deltas(db: Session, limit: int = 5000) -> tuple[int, int]:
+    """
+    併入一批 deltas（不 commit）；回傳 (delta 數, 更新的活動數)
+
+    多個 job 同時跑不會重複併入（SKIP LOCKED）
+    """
+    db.execute(text("SELECT pg_advisory_xact_lock_shared(:key)"), {"key": REPORT_LOCK_KEY})
+    row = db.execute(text(_FOLD_SQL), {"limit": limit}).one()
+    return int(row.deltas), int(row.events)
+
+
+# =========================================================
+# Rebuild（修復）
+# =========================================================
+
+_REBUILD_SQL = """
+WITH cleared AS (
+    DELETE FROM event_report_deltas
+     WHERE event_uuid = :event_uuid
+    RETURNING 1
+),
+subs AS (
+    SELECT uuid, event_uuid, status, submitted_at
+      FROM submissions
+     WHERE event_uuid = :event_uuid
+       AND is_deleted = false
+),
+""" + _COUNTERS_CTE + """,
+prices AS (
+    SELECT p.event_uuid, 'price:' || p.uuid::text AS key,
+           p.sold + coalesce((SELECT sum(s.sold) FROM event_price_shards s WHERE s.price_uuid = p.uuid), 0) AS n
+      FROM event_prices p
+     WHERE p.event_uuid = :event_uuid
+),
+doc AS (
+    SELECT coalesce(jsonb_object_agg(key, n) FILTER (WHERE n <> 0), '{}'::jsonb) AS data
+      FROM (
+        SELECT key, n FROM counters
+        UNION ALL
+        SELECT key, n FROM prices
+      ) c
+)
+INSERT INTO event_report_cache (
+    event_uuid, report_data, uuid, is_active, is_deleted, version, created_at, updated_at
+)
+SELECT CAST(:event_uuid AS uuid), doc.data, gen_random_uuid(), true, false, 1, now(), now()
+  FROM doc
+ON CONFLICT (event_uuid) DO UPDATE
+   SET report_data = excluded.report_data,
+       version = event_report_cache.version + 1,
+       updated_at = now()
+RETURNING (SELECT count(*) FROM cleared) AS discarded
+"""
+
+
+def rebuild_event_report(db: Session, event_uuid: UUID, *, wait: bool = True) -> Optional[dict]:
+    """
+    從正式資料重算單一活動的統計（不 commit）；尚未併入的 deltas 一併丟棄
+
+    先取得 exclusive advisory lock（fold 為 shared），
+    之後的單一 SQL 以同一個 snapshot 刪除 deltas 並重算 → 不重複、不遺漏
+
+    :param wait: True（CLI）→ 等待進行中的 fold 結束；
+                 False（API）→ lock 忙碌時立即回傳 None，不排隊
+                 （exclusive lock 是全域的：排隊中的 rebuild 會擋住所有活動的 fold）
+    """
+    if wait:
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": REPORT_LOCK_KEY})
+    elif not db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": REPORT_LOCK_KEY}).scalar():
+        return None
+
+    db.execute(
+        text(_REBUILD_SQL),
+        {**_choice_params(), "event_uuid": str(event_uuid)},
+    ).one()
+    return get_event_report(db, event_uuid)
+
+
+# =========================================================
+# Read
+# =========================================================
+
+_READ_SQL = text("""
+SELECT
+    (SELECT report_data FROM event_report_cache WHERE event_uuid = :event_uuid) AS report_data,
+    (SELECT jsonb_agg(delta) FROM event_report_deltas WHERE event_uuid = :event_uuid) AS pending
+""")
+
+
+def load_counters(db: Session, event_uuid: UUID) -> Counter:
+    row = db.execute(_READ_SQL, {"event_uuid": str(event_uuid)}).one()
+
+    counters = Counter(row.report_data or {})
+    for delta in row.pending or ():
+        counters.update(delta)
+    return counters
+
+
+def build_report(counters: Counter) -> dict:
+    """
+    扁平計數 → 巢狀結構
+    """
+    report = {
+        "total": 0,
+        "by_status": {},
+        "by_day": {},
+        "by_price": {},
+        "options": {},
+    }
+
+    for key in sorted(counters):
+        n = counters[key]
+        if not n:
+            continue
+
+        kind, _, rest = key.partition(":")
+        if kind == "total":
+            report["total"] = n
+        elif kind == "status":
+            report["by_status"][rest] = n
+        elif kind == "day":
+            report["by_day"][rest] = n
+        elif kind == "price":
+            report["by_price"][rest] = n
+        elif kind == "option":
+            field_key, _, value = rest.partition(":")
+            report["options"].setdefault(field_key, {})[value] = n
+
+    return report
+
+
+def get_event_report(db: Session, event_uuid: UUID) -> dict:
+    return build_report(load_counters(db, event_uuid))
+
+
+# =========================================================
+# Background job
+# =========================================================
+
+class ReportAggregator:
+    """
+    背景 thread：定期併入 deltas
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session] = SessionLocal,
+        interval: float = 5.0,
+        batch_size: int = 5000,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        self._stats_lock = threading.Lock()
+        self.runs = 0
+        self.folded_deltas = 0
+        self.updated_reports = 0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="event-report-aggregator", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                folded = self.run_once()
+            except Exception:
+                logger.exception("Event report aggregator error")
+                folded = 0
+
+            # 滿批代表可能還有 deltas → 直接下一輪
+            if folded < self.batch_size:
+                self._stop_event.wait(self.interval)
+
+    def run_once(self) -> int:
+        db = self.session_factory()
+        try:
+            deltas, events = fold_report_deltas(db, self.batch_size)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        with self._stats_lock:
+            self.runs += 1
+            self.folded_deltas += deltas
+            self.updated_reports += events
+        return deltas
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "interval_seconds": self.interval,
+                "batch_size": self.batch_size,
+                "runs": self.runs,
+                "folded_deltas": self.folded_deltas,
+                "updated_reports": self.updated_reports,
+            }
+
+
+_aggregator: Optional[ReportAggregator] = None
+
+
+def start_report_aggregator() -> None:
+    global _aggregator
+
+    if not settings.EVENT_REPORT_AGGREGATOR_ENABLED or _aggregator is not None:
+        return
+
+    aggregator = ReportAggregator(interval=settings.EVENT_REPORT_FOLD_INTERVAL_SECONDS)
+    aggregator.start()
+    _aggregator = aggregator
+
+
+def stop_report_aggregator() -> None:
+    global _aggregator
+
+    if _aggregator is None:
+        return
+
+    _aggregator.stop()
+    _aggregator = None
+
+
+def report_aggregator_stats() -> Optional[dict]:
+    return _aggregator.stats() if _aggregator is not None else None
+
+
+# =========================================================
+# CLI
+# =========================================================
+
+def _rebuild_all(event_uuid: Optional[str] = None) -> None:
+    db = SessionLocal()
+    try:
+        if event_uuid:
+            targets = [UUID(event_uuid)]
+        else:
+            targets = db.execute(select(Event.uuid).order_by(Event.id)).scalars().all()
+            db.rollback()
+
+        for target in targets:
+            report = rebuild_event_report(db, target)
+            db.commit()
+            logger.info("Rebuilt report %s: total=%s", target, report["total"])
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "fold"
+
+    if command == "rebuild":
+        _rebuild_all(sys.argv[2] if len(sys.argv) > 2 else None)
+    elif command == "fold":
+        aggregator = ReportAggregator(interval=settings.EVENT_REPORT_FOLD_INTERVAL_SECONDS)
+        aggregator.start()
+        logger.info("Event report aggregator started: interval=%ss", aggregator.interval)
+        try:
+            while True:
+                time.sleep(60)
+                logger.info("Event report aggregator stats: %s", aggregator.stats())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            aggregator.stop()
+    else:
+        sys.exit("usage: python -m app.services.event.report_aggregator [fold | rebuild [event_uuid]]")
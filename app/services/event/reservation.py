@@ -0,0 +1,581 @@
+# app/services/event/reservation.py ← 票種名額預留（EventPrice.quota / sold）
+
+"""
+Seat reservation engine
+
+說明：
+- 一條條件式 UPDATE 完成「檢查 + 扣名額」，不先讀再寫：
+    UPDATE event_prices
+       SET sold = sold + :n
+     WHERE uuid = :u AND <可販售> AND (quota IS NULL OR sold + :n <= quota)
+    RETURNING sold
+  → 名額足夠時只有一個 round trip；列鎖只持有到 transaction 結束
+  → 不可能超賣（條件在列鎖取得後重新評估）
+- 失敗路徑才多一條 SELECT 判斷原因（not_found / not_on_sale / sold_out）
+- Hold（未付款報名的暫時保留）：
+  - hold_seats()：預留 + 寫入 event_price_holds（expires_at）
+  - confirm_hold()：付款完成 → 刪除 hold，名額保留為已售出
+  - release_hold()：取消 → 刪除 hold 並扣回 sold
+  - release_expired_holds()：sweeper 批次釋放逾期 hold（一條 CTE，SKIP LOCKED）
+- 分片（熱門票種）：enable_sharding() 將剩餘名額平均切到 N 個 shard，
+  預留時隨機挑起點依序嘗試各 shard → 搶票交易分散在 N 列上
+  ⚠️ 單次 n 張需落在同一個 shard；剩餘名額分散在各 shard 時，大量預留可能提早失敗
+- 皆不 commit（呼叫端與報名寫入同一個 transaction）
+- 名額增減同時寫入活動統計 delta（price:<price_uuid>，見 app/services/event/report_aggregator.py）
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, or_, select, text, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.models.event.event_price import EventPrice
+from app.models.event.event_price_hold import EventPriceHold
+from app.models.event.event_price_shard import EventPriceShard
+from app.services.event.report_aggregator import record_price_delta
+
+
+logger = logging.getLogger("app.event.reservation")
+
+NOT_FOUND = "not_found"
+NOT_ON_SALE = "not_on_sale"
+SOLD_OUT = "sold_out"
+HOLD_NOT_FOUND = "hold_not_found"
+
+
+@dataclass
+class ReservationResult:
+    price_uuid: UUID
+    quantity: int
+
+    # 成功：sold 為該計數列（event_prices 或 shard）更新後的值
+    sold: Optional[int] = None
+    shard_no: Optional[int] = None
+    hold_uuid: Optional[UUID] = None
+    expires_at: Optional[datetime] = None
+
+    # 失敗原因
+    conflict: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.conflict is None
+
+    @property
+    def message(self) -> str:
+        return {
+            None: "Reserved",
+            NOT_FOUND: "Price not found",
+            NOT_ON_SALE: "Price is not on sale",
+            SOLD_OUT: "Sold out",
+            HOLD_NOT_FOUND: "Hold not found or expired",
+        }.get(self.conflict, self.conflict)
+
+
+# =========================================================
+# Reserve / release
+# =========================================================
+
+def _on_sale():
+    now = func.now()
+    return and_(
+        EventPrice.is_enabled == True,
+        EventPrice.is_active == True,
+        EventPrice.is_deleted == False,
+        or_(EventPrice.start_at.is_(None), EventPrice.start_at <= now),
+        or_(EventPrice.end_at.is_(None), EventPrice.end_at > now),
+    )
+
+
+def reserve_seats(db: Session, price_uuid: UUID, quantity: int = 1) -> ReservationResult:
+    """
+    原子預留 quantity 個名額（不 commit）
+    """
+    if quantity <= 0:
+        raise ValueError("quantity must be positive")
+
+    sold = db.execute(
+        update(EventPrice)
+        .where(
+            EventPrice.uuid == price_uuid,
+            EventPrice.shard_count == 0,
+            _on_sale(),
+            or_(EventPrice.quota.is_(None), EventPrice.sold + quantity <= EventPrice.quota),
+        )
+        .values(sold=EventPrice.sold + quantity)
+        .returning(EventPrice.sold)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+
+    if sold is not None:
+        result = ReservationResult(price_uuid=price_uuid, quantity=quantity, sold=sold)
+    else:
+        result = _reserve_slow_path(db, price_uuid, quantity)
+
+    if result.ok:
+        record_price_delta(db, price_uuid, quantity)
+    return result
+
+
+def _reserve_slow_path(db: Session, price_uuid: UUID, quantity: int) -> ReservationResult:
+    """
+    UPDATE 沒命中：判斷原因；已分片 → 改走 shard
+    """
+    price = db.execute(
+        select(EventPrice.shard_count, _on_sale().label("on_sale"))
+        .where(EventPrice.uuid == price_uuid)
+    ).one_or_none()
+
+    if price is None:
+        return ReservationResult(price_uuid=price_uuid, quantity=quantity, conflict=NOT_FOUND)
+    if not price.on_sale:
+        return ReservationResult(price_uuid=price_uuid, quantity=quantity, conflict=NOT_ON_SALE)
+    if price.shard_count == 0:
+        return ReservationResult(price_uuid=price_uuid, quantity=quantity, conflict=SOLD_OUT)
+
+    return _reserve_from_shards(db, price_uuid, quantity, price.shard_count)
+
+
+def _reserve_from_shards(db: Session, price_uuid: UUID, quantity: int, shard_count: int) -> ReservationResult:
+    start = random.randrange(shard_count)
+
+    for offset in range(shard_count):
+        shard_no = (start + offset) % shard_count
+        sold = db.execute(
+            update(EventPriceShard)
+            .where(
+                EventPriceShard.price_uuid == price_uuid,
+                EventPriceShard.shard_no == shard_no,
+                or_(
+                    EventPriceShard.capacity.is_(None),
+                    EventPriceShard.sold + quantity <= EventPriceShard.capacity,
+                ),
+            )
+            .values(sold=EventPriceShard.sold + quantity)
+            .returning(EventPriceShard.sold)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+
+        if sold is not None:
+            return ReservationResult(
+                price_uuid=price_uuid,
+                quantity=quantity,
+                sold=sold,
+                shard_no=shard_no,
+            )
+
+    return ReservationResult(price_uuid=price_uuid, quantity=quantity, conflict=SOLD_OUT)
+
+
+def release_seats(
+    db: Session,
+    price_uuid: UUID,
+    quantity: int,
+    *,
+    shard_no: Optional[int] = None,
+) -> None:
+    """
+    扣回名額（不 commit）；shard_no 為預留時回傳的值
+    """
+    record_price_delta(db, price_uuid, -quantity)
+
+    if shard_no is None:
+        db.execute(
+            update(EventPrice)
+            .where(EventPrice.uuid == price_uuid)
+            .values(sold=func.greatest(EventPrice.sold - quantity, 0))
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        db.execute(
+            update(EventPriceShard)
+            .where(
+                EventPriceShard.price_uuid == price_uuid,
+                EventPriceShard.shard_no == shard_no,
+            )
+            .values(sold=func.greatest(EventPriceShard.sold - quantity, 0))
+            .execution_options(synchronize_session=False)
+        )
+
+
+# =========================================================
+# Holds（未付款報名）
+# =========================================================
+
+def hold_seats(
+    db: Session,
+    price_uuid: UUID,
+    quantity: int = 1,
+    *,
+    submission_uuid: Optional[UUID] = None,
+    ttl_seconds: Optional[int] = None,
+) -> ReservationResult:
+    """
+    預留名額並建立 hold（不 commit）
+    """
+    result = reserve_seats(db, price_uuid, quantity)
+    if not result.ok:
+        return result
+
+    ttl = settings.SEAT_HOLD_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    hold = EventPriceHold(
+        price_uuid=price_uuid,
+        submission_uuid=submission_uuid,
+        quantity=quantity,
+        shard_no=result.shard_no,
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=ttl),
+    )
+    db.add(hold)
+    db.flush()
+
+    result.hold_uuid = hold.uuid
+    result.expires_at = hold.expires_at
+    return result
+
+
+def confirm_hold(db: Session, hold_uuid: UUID) -> bool:
+    """
+    付款完成：刪除 hold，名額保留為已售出
+
+    回傳 False → hold 已逾期被釋放（名額可能已被別人買走，需重新 reserve）
+    """
+    return db.execute(
+        delete(EventPriceHold)
+        .where(EventPriceHold.uuid == hold_uuid)
+        .returning(EventPriceHold.id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none() is not None
+
+
+def release_hold(db: Session, hold_uuid: UUID) -> bool:
+    """
+    取消：刪除 hold 並扣回名額
+    """
+    row = db.execute(
+        delete(EventPriceHold)
+        .where(EventPriceHold.uuid == hold_uuid)
+        .returning(EventPriceHold.price_uuid, EventPriceHold.quantity, EventPriceHold.shard_no)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+
+    if row is None:
+        return False
+
+    release_seats(db, row.price_uuid, row.quantity, shard_no=row.shard_no)
+    return True
+
+
+_RELEASE_EXPIRED_SQL = text("""
+WITH expired AS (
+    DELETE FROM event_price_holds
+     WHERE id IN (
+        SELECT id
+          FROM event_price_holds
+         WHERE expires_at <= now()
+         ORDER BY expires_at
+         LIMIT :limit
+           FOR UPDATE SKIP LOCKED
+     )
+    RETURNING price_uuid, shard_no, quantity
+),
+price_totals AS (
+    SELECT price_uuid, sum(quantity) AS quantity
+      FROM expired
+     WHERE shard_no IS NULL
+     GROUP BY price_uuid
+),
+shard_totals AS (
+    SELECT price_uuid, shard_no, sum(quantity) AS quantity
+      FROM expired
+     WHERE shard_no IS NOT NULL
+     GROUP BY price_uuid, shard_no
+),
+price_updates AS (
+    UPDATE event_prices p
+       SET sold = greatest(p.sold - t.quantity, 0)
+      FROM price_totals t
+     WHERE p.uuid = t.price_uuid
+    RETURNING t.quantity
+),
+shard_updates AS (
+    UPDATE event_price_shards s
+       SET sold = greatest(s.sold - t.quantity, 0)
+      FROM shard_totals t
+     WHERE s.price_uuid = t.price_uuid
+       AND s.shard_no = t.shard_no
+    RETURNING t.quantity
+),
+report_deltas AS (
+    INSERT INTO event_report_deltas (
+        event_uuid, delta, uuid, is_active, is_deleted, version, created_at, updated_at
+    )
+    SELECT p.event_uuid, jsonb_object_agg('price:' || p.uuid::text, -t.quantity),
+           gen_random_uuid(), true, false, 1, now(), now()
+      FROM (
+        SELECT price_uuid, sum(quantity) AS quantity
+          FROM expired
+         GROUP BY price_uuid
+      ) t
+      JOIN event_prices p ON p.uuid = t.price_uuid
+     GROUP BY p.event_uuid
+)
+SELECT
+    (SELECT count(*) FROM expired) AS holds,
+    coalesce((SELECT sum(quantity) FROM price_updates), 0)
+      + coalesce((SELECT sum(quantity) FROM shard_updates), 0) AS seats
+""")
+
+
+def release_expired_holds(db: Session, limit: int = 500) -> tuple[int, int]:
+    """
+    釋放一批逾期 hold（不 commit）；回傳 (hold 數, 釋放名額數)
+
+    多個 sweeper 同時跑也不會重複釋放（SKIP LOCKED）
+    """
+    row = db.execute(_RELEASE_EXPIRED_SQL, {"limit": limit}).one()
+    return int(row.holds), int(row.seats)
+
+
+# =========================================================
+# Sharding
+# =========================================================
+
+def _fold_shards(db: Session, price_uuid: UUID) -> None:
+    """
+    shard 的售出併回 event_prices.sold，刪除 shard；hold 改計在 event_prices
+    """
+    shard_sold = db.execute(
+        delete(EventPriceShard)
+        .where(EventPriceShard.price_uuid == price_uuid)
+        .returning(EventPriceShard.sold)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+
+    db.execute(
+        update(EventPriceHold)
+        .where(EventPriceHold.price_uuid == price_uuid, EventPriceHold.shard_no.is_not(None))
+        .values(shard_no=None)
+        .execution_options(synchronize_session=False)
+    )
+
+    db.execute(
+        update(EventPrice)
+        .where(EventPrice.uuid == price_uuid)
+        .values(sold=EventPrice.sold + sum(shard_sold), shard_count=0)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def enable_sharding(db: Session, price_uuid: UUID, shards: int) -> None:
+    """
+    將剩餘名額平均切到 shards 個計數列（不 commit）；shards <= 1 → 取消分片
+
+    以 FOR UPDATE 鎖住 event_prices 列，與進行中的預留互斥
+    """
+    price = db.execute(
+        select(EventPrice.quota)
+        .where(EventPrice.uuid == price_uuid)
+        .with_for_update()
+    ).one_or_none()
+    if price is None:
+        raise ValueError(f"EventPrice {price_uuid} not found")
+
+    # shard 列也要鎖：重新分配期間不可有人從 shard 預留
+    db.execute(
+        select(EventPriceShard.id)
+        .where(EventPriceShard.price_uuid == price_uuid)
+        .with_for_update()
+    ).all()
+
+    _fold_shards(db, price_uuid)
+    if shards <= 1:
+        return
+
+    sold = db.execute(
+        select(EventPrice.sold).where(EventPrice.uuid == price_uuid)
+    ).scalar_one()
+
+    if price.quota is None:
+        capacities = [None] * shards
+    else:
+        remaining = max(price.quota - sold, 0)
+        capacities = [
+            remaining // shards + (1 if i < remaining % shards else 0)
+            for i in range(shards)
+        ]
+
+    db.add_all(
+        EventPriceShard(price_uuid=price_uuid, shard_no=i, capacity=capacity, sold=0)
+        for i, capacity in enumerate(capacities)
+    )
+    db.execute(
+        update(EventPrice)
+        .where(EventPrice.uuid == price_uuid)
+        .values(shard_count=shards)
+        .execution_options(synchronize_session=False)
+    )
+    db.flush()
+
+
+def price_availability(db: Session, price_uuid: UUID) -> Optional[dict]:
+    """
+    總售出 / 剩餘 / 保留中（非熱路徑：後台 / 監控用）
+    """
+    shard_sold = (
+        select(func.coalesce(func.sum(EventPriceShard.sold), 0))
+        .where(EventPriceShard.price_uuid == EventPrice.uuid)
+        .scalar_subquery()
+    )
+    held = (
+        select(func.coalesce(func.sum(EventPriceHold.quantity), 0))
+        .where(EventPriceHold.price_uuid == EventPrice.uuid)
+        .scalar_subquery()
+    )
+
+    row = db.execute(
+        select(EventPrice.quota, EventPrice.shard_count, (EventPrice.sold + shard_sold).label("sold"), held.label("held"))
+        .where(EventPrice.uuid == price_uuid)
+    ).one_or_none()
+
+    if row is None:
+        return None
+
+    return {
+        "quota": row.quota,
+        "sold": int(row.sold),
+        "held": int(row.held),
+        "remaining": None if row.quota is None else max(row.quota - int(row.sold), 0),
+        "shard_count": row.shard_count,
+    }
+
+
+# =========================================================
+# Sweeper（逾期 hold）
+# =========================================================
+
+class SeatHoldSweeper:
+    """
+    背景 thread：定期釋放逾期 hold
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session] = SessionLocal,
+        interval: float = 15.0,
+        batch_size: int = 500,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        self._stats_lock = threading.Lock()
+        self.runs = 0
+        self.released_holds = 0
+        self.released_seats = 0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="seat-hold-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                released = self.run_once()
+            except Exception:
+                logger.exception("Seat hold sweeper error")
+                released = 0
+
+            # 滿批代表可能還有逾期 hold → 直接下一輪
+            if released < self.batch_size:
+                self._stop_event.wait(self.interval)
+
+    def run_once(self) -> int:
+        db = self.session_factory()
+        try:
+            holds, seats = release_expired_holds(db, self.batch_size)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        with self._stats_lock:
+            self.runs += 1
+            self.released_holds += holds
+            self.released_seats += seats
+        return holds
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "interval_seconds": self.interval,
+                "batch_size": self.batch_size,
+                "runs": self.runs,
+                "released_holds": self.released_holds,
+                "released_seats": self.released_seats,
+            }
+
+
+_sweeper: Optional[SeatHoldSweeper] = None
+
+
+def start_hold_sweeper() -> None:
+    global _sweeper
+
+    if not settings.SEAT_HOLD_SWEEPER_ENABLED or _sweeper is not None:
+        return
+
+    sweeper = SeatHoldSweeper(interval=settings.SEAT_HOLD_SWEEP_INTERVAL_SECONDS)
+    sweeper.start()
+    _sweeper = sweeper
+
+
+def stop_hold_sweeper() -> None:
+    global _sweeper
+
+    if _sweeper is None:
+        return
+
+    _sweeper.stop()
+    _sweeper = None
+
+
+def hold_sweeper_stats() -> Optional[dict]:
+    return _sweeper.stats() if _sweeper is not None else None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    sweeper = SeatHoldSweeper(interval=settings.SEAT_HOLD_SWEEP_INTERVAL_SECONDS)
+    sweeper.start()
+    logger.info("Seat hold sweeper started: interval=%ss", sweeper.interval)
+
+    try:
+        while True:
+            time.sleep(60)
+            logger.info("Seat hold sweeper stats: %s", sweeper.stats())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sweeper.stop()
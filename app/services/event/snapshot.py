@@ -0,0 +1,319 @@
+# app/services/event/snapshot.py ← 已發布活動的公開資料快照
+
+"""
+Published-event snapshot
+
+說明：
+- 公開活動頁（EventPublic / EventResponse / 場次表）的 response JSON
+  在發布 / 更新時預先序列化，存進 event_snapshots（每個活動一列）
+- 讀取：in-process LRU（VersionedCache）→ 命中時 0 條 SQL，直接回傳 bytes
+  miss 時以主鍵查一次 event_snapshots；沒有快照 → 呼叫端走原本的即時查詢
+- 失效：每次重建 / 撤下 event_snapshots.version +1，
+  commit 後經 invalidation channel 廣播 <event_uuid>:<version>
+  - version 在活動存續期間單調遞增：撤下時保留列作為 tombstone（*_json = NULL），
+    重新發布沿用同一列 +1（不會回到 1 → 不會被各 worker 的版本 floor 拒收）
+- 回應帶 ETag（快照版本 + built_at）/ Last-Modified（built_at），If-None-Match 命中 → 304
+- refresh_event_snapshot() 必須在異動的 transaction 內呼叫（與異動一起 commit）：
+  - 已發布且可公開 → UPSERT 快照
+  - 其他狀態（草稿 / 關閉 / 停用 / 刪除）→ 快照改為 tombstone
+- 快照內嵌 activity_template（detail_json）：模板 / 模板欄位 / 活動類型經 ORM 異動時，
+  commit 前自動重建引用該模板且已有快照的活動（Session after_flush / before_commit）
+  ⚠️ 不經 ORM 的 bulk UPDATE 不會被偵測
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+from typing import List, Optional
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import event, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.conditional import PUBLIC_CACHE_CONTROL, resource_validators
+from app.core.config import settings
+from app.core.constants.event_status import EventStatus
+from app.core.invalidation import publish_after_commit, subscribe
+from app.core.versioned_cache import VersionedCache
+from app.crud.base.loader_profiles import with_loader_profile
+from app.models.activity.activity_template import ActivityTemplate
+from app.models.activity.activity_template_field import ActivityTemplateField
+from app.models.activity.activity_type import ActivityType
+from app.models.event.event import Event
+from app.models.event.event_schedule import EventSchedule
+from app.models.event.event_snapshot import EventSnapshot
+from app.schemas.event.core.event_public import EventPublic
+from app.schemas.event.core.event_response import EventResponse
+from app.schemas.event.schedule.event_schedule import EventScheduleResponse
+
+
+EVENT_SNAPSHOT = "event_snapshot"
+
+_schedules_adapter = TypeAdapter(List[EventScheduleResponse])
+
+
+@dataclass(frozen=True, slots=True)
+class PublishedSnapshot:
+    event_uuid: str
+    version: int
+
+    # 預先序列化的 response body（UTF-8 JSON）
+    public: bytes
+    detail: bytes
+    schedule: bytes
+
+    # Last-Modified / ETag 的一部分（conditional GET）
+    built_at: Optional[datetime] = None
+
+
+snapshot_cache = VersionedCache(
+    maxsize=settings.EVENT_SNAPSHOT_CACHE_MAX_SIZE,
+    ttl=settings.EVENT_SNAPSHOT_CACHE_TTL_SECONDS,
+)
+
+
+# =========================================================
+# Build（寫入端，transaction 內）
+# =========================================================
+
+def _is_public(event: Optional[Event]) -> bool:
+    return (
+        event is not None
+        and event.status == EventStatus.PUBLISHED
+        and event.is_active
+        and not event.is_deleted
+    )
+
+
+def render_snapshot(db: Session, event_uuid) -> Optional[dict]:
+    """
+    以公開 API 相同的 loader profile / schema 序列化；不可公開 → None
+    """
+    event = (
+        with_loader_profile(db.query(Event), "event.public")
+        .options(selectinload(Event.activity_template))
+        .populate_existing()
+        .filter(Event.uuid == event_uuid)
+        .first()
+    )
+    if not _is_public(event):
+        return None
+
+    schedules = (
+        db.query(EventSchedule)
+        .filter(
+            EventSchedule.event_uuid == event_uuid,
+            EventSchedule.is_deleted == False,
+        )
+        .order_by(EventSchedule.start_time.asc())
+        .all()
+    )
+
+    return {
+        "public_json": EventPublic.model_validate(event).model_dump_json(),
+        "detail_json": EventResponse.model_validate(event).model_dump_json(),
+        "schedule_json": _schedules_adapter.dump_json(
+            [EventScheduleResponse.model_validate(s) for s in schedules]
+        ).decode(),
+    }
+
+
+def refresh_event_snapshot(db: Session, event_uuid) -> Optional[int]:
+    """
+    重建 / 撤下快照（不 commit）；回傳新版本，沒有快照可撤下 → None
+    """
+    db.flush()
+
+    payload = render_snapshot(db, event_uuid)
+
+    if payload is None:
+        version = db.execute(
+            update(EventSnapshot)
+            .where(
+                EventSnapshot.event_uuid == event_uuid,
+                EventSnapshot.public_json.is_not(None),
+            )
+            .values(
+                public_json=None,
+                detail_json=None,
+                schedule_json=None,
+                version=EventSnapshot.version + 1,
+                built_at=func.now(),
+                updated_at=func.now(),
+            )
+            .returning(EventSnapshot.version)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if version is None:
+            return None
+    else:
+        version = db.execute(
+            insert(EventSnapshot)
+            .values(event_uuid=event_uuid, version=1, **payload)
+            .on_conflict_do_update(
+                index_elements=[EventSnapshot.event_uuid],
+                set_={
+                    **payload,
+                    "version": EventSnapshot.version + 1,
+                    "built_at": func.now(),
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(EventSnapshot.version)
+        ).scalar_one()
+
+    publish_after_commit(db, EVENT_SNAPSHOT, f"{event_uuid}:{version}")
+    return version
+
+
+# =========================================================
+# 模板異動 → 重建內嵌該模板的快照
+# =========================================================
+
+_DIRTY_TEMPLATES = "snapshot_dirty_templates"
+
+
+def _template_change(obj) -> Optional[tuple[str, object]]:
+    if isinstance(obj, ActivityTemplate):
+        return "template", obj.uuid
+    if isinstance(obj, ActivityTemplateField):
+        return "template", obj.template_uuid
+    if isinstance(obj, ActivityType):
+        return "type", obj.uuid
+    return None
+
+
+def _collect_template_changes(session: Session, flush_context) -> None:
+    # after_flush：new / dirty / deleted 仍是 flush 前的內容
+    for obj in chain(session.new, session.dirty, session.deleted):
+        change = _template_change(obj)
+        if change is not None and change[1] is not None:
+            session.info.setdefault(_DIRTY_TEMPLATES, set()).add(change)
+
+
+def refresh_template_snapshots(db: Session, template_uuids=(), type_uuids=()) -> int:
+    """
+    重建引用這些模板（或這些活動類型的模板）且目前有快照的活動；回傳重建數
+    """
+    conditions = []
+    if template_uuids:
+        conditions.append(Event.activity_template_uuid.in_(list(template_uuids)))
+    if type_uuids:
+        conditions.append(
+            Event.activity_template_uuid.in_(
+                select(ActivityTemplate.uuid).where(ActivityTemplate.activity_type_uuid.in_(list(type_uuids)))
+            )
+        )
+    if not conditions:
+        return 0
+
+    event_uuids = db.execute(
+        select(Event.uuid)
+        .join(EventSnapshot, EventSnapshot.event_uuid == Event.uuid)
+        .where(
+            EventSnapshot.public_json.is_not(None),
+            or_(*conditions),
+        )
+    ).scalars().all()
+
+    for event_uuid in event_uuids:
+        refresh_event_snapshot(db, event_uuid)
+    return len(event_uuids)
+
+
+def _refresh_dirty_templates(session: Session) -> None:
+    # before_commit 早於 commit 的最後一次 flush → 先 flush 才收得到尚未送出的異動
+    session.flush()
+
+    changes = session.info.pop(_DIRTY_TEMPLATES, None)
+    if not changes:
+        return
+
+    refresh_template_snapshots(
+        session,
+        template_uuids={uuid for kind, uuid in changes if kind == "template"},
+        type_uuids={uuid for kind, uuid in changes if kind == "type"},
+    )
+
+
+def _discard_dirty_templates(session: Session) -> None:
+    session.info.pop(_DIRTY_TEMPLATES, None)
+
+
+event.listen(Session, "after_flush", _collect_template_changes)
+event.listen(Session, "before_commit", _refresh_dirty_templates)
+event.listen(Session, "after_rollback", _discard_dirty_templates)
+
+
+# =========================================================
+# Read（公開 API）
+# =========================================================
+
+def load_snapshot(db: Session, event_uuid) -> Optional[PublishedSnapshot]:
+    row = db.execute(
+        select(
+            EventSnapshot.version,
+            EventSnapshot.public_json,
+            EventSnapshot.detail_json,
+            EventSnapshot.schedule_json,
+            EventSnapshot.built_at,
+        ).where(EventSnapshot.event_uuid == event_uuid)
+    ).one_or_none()
+
+    # 沒有列 / tombstone（已撤下）
+    if row is None or row.public_json is None:
+        return None
+
+    return PublishedSnapshot(
+        event_uuid=str(event_uuid),
+        version=row.version,
+        public=row.public_json.encode(),
+        detail=row.detail_json.encode(),
+        schedule=row.schedule_json.encode(),
+        built_at=row.built_at,
+    )
+
+
+def get_snapshot(db: Session, event_uuid) -> Optional[PublishedSnapshot]:
+    """
+    快取命中 → 不碰 DB；沒有快照（未發布 / 尚未建立）→ None
+    """
+    key = str(event_uuid)
+
+    snapshot = snapshot_cache.get(key)
+    if snapshot is not None:
+        return snapshot
+
+    snapshot = load_snapshot(db, event_uuid)
+    if snapshot is not None:
+        snapshot_cache.put(key, snapshot)
+    return snapshot
+
+
+def snapshot_response(request: Request, snapshot: PublishedSnapshot, view: str) -> Response:
+    """
+    view：public / detail / schedule
+
+    ETag = (view, event_uuid, 快照版本, built_at) → 不需任何 SQL 即可回 304
+    （built_at 讓不同次建置的 ETag 不會重複，即使版本號曾被重設）
+    """
+    validators = resource_validators(
+        f"event.{view}",
+        snapshot.event_uuid,
+        (snapshot.version, snapshot.built_at.isoformat() if snapshot.built_at else None),
+        last_modified=snapshot.built_at,
+        cache_control=PUBLIC_CACHE_CONTROL,
+    )
+
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+
+    return validators.apply(
+        Response(content=getattr(snapshot, view), media_type="application/json")
+    )
+
+
+subscribe(EVENT_SNAPSHOT, snapshot_cache.on_message)
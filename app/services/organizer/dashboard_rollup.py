@@ -0,0 +1,416 @@
+# app/services/organizer/dashboard_rollup.py ← Organizer dashboard 報名統計 rollup
+
+"""
+Dashboard rollup
+
+說明：
+- event_stat_buckets / organizer_stat_buckets：每小時、每日（UTC）報名統計
+  - 依 submissions.created_at 分桶
+  - created：該時段建立的報名（未刪除）
+  - verified / paid / completed：其中目前已達到該階段者（rejected 視為已付款）
+- 背景 job 以 high-water mark 增量更新：
+  1. 掃描 updated_at > watermark - overlap 的報名 → 受影響的 (event, hour)
+  2. 重算這些 hour bucket（以 ix_submissions_event_created_id 區間掃描）
+  3. 由 hour bucket 重算受影響的 event day / organizer hour / organizer day
+  4. watermark = 本次 transaction 開始時間
+  - 每個 bucket 都是「重算」而非累加 → 重疊掃描、重跑都不會重複計算
+  - overlap：寫入 transaction 的 updated_at 為其開始時間，晚於 watermark 才 commit 的
+    長 transaction 仍會在下一輪被掃到（需短於 overlap）
+- Dashboard 讀取：固定筆數的 organizer bucket（7 × 24 小時 + N 天），與活動數無關
+- 完整重算：python -m app.services.organizer.dashboard_rollup rebuild
+"""
+
+import logging
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.models.organizer.organizer_stat_bucket import OrganizerStatBucket
+
+
+logger = logging.getLogger("app.organizer.dashboard_rollup")
+
+WATERMARK_NAME = "dashboard"
+
+# pg_advisory_xact_lock key（"DSHR"）：同時只有一個 refresh
+ROLLUP_LOCK_KEY = 0x44534852
+
+# 各階段包含的狀態（目前狀態 → 已達到的階段）
+VERIFIED_STATUSES = ("email_verified", "paid", "completed", "rejected")
+PAID_STATUSES = ("paid", "completed", "rejected")
+COMPLETED_STATUSES = ("completed",)
+
+COUNTERS = ("created_count", "verified_count", "paid_count", "completed_count")
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+# =========================================================
+# Refresh SQL
+# =========================================================
+
+_DIRTY_SQL = """
+CREATE TEMP TABLE rollup_dirty ON COMMIT DROP AS
+SELECT DISTINCT s.event_uuid, e.organizer_uuid, date_trunc('hour', s.created_at, 'UTC') AS bucket_start
+  FROM submissions s
+  JOIN events e ON e.uuid = s.event_uuid
+ WHERE s.updated_at > :since
+"""
+
+
+def _upsert(table: str, keys: str, select_sql: str) -> str:
+    """
+    INSERT ... SELECT ... ON CONFLICT → 以重算結果覆寫 bucket
+    """
+    counters = ", ".join(COUNTERS)
+    updates = ",\n           ".join(f"{c} = excluded.{c}" for c in COUNTERS)
+    return f"""
+INSERT INTO {table} (
+    {keys}, granularity, bucket_start, {counters},
+    uuid, is_active, is_deleted, version, created_at, updated_at
+)
+{select_sql}
+ON CONFLICT ({keys.split(",")[0]}, granularity, bucket_start) DO UPDATE
+       SET {updates},
+           version = {table}.version + 1,
+           updated_at = now()
+"""
+
+
+_NEW_ROW = "gen_random_uuid(), true, false, 1, now(), now()"
+
+_SUM_BUCKETS = ", ".join(f"coalesce(sum(b.{c}), 0)" for c in COUNTERS)
+
+_EVENT_HOUR_SQL = _upsert("event_stat_buckets", "event_uuid, organizer_uuid", f"""
+SELECT d.event_uuid, d.organizer_uuid, 'hour', d.bucket_start,
+       count(s.id),
+       count(s.id) FILTER (WHERE s.status::text = ANY(:verified)),
+       count(s.id) FILTER (WHERE s.status::text = ANY(:paid)),
+       count(s.id) FILTER (WHERE s.status::text = ANY(:completed)),
+       {_NEW_ROW}
+  FROM rollup_dirty d
+  LEFT JOIN submissions s
+    ON s.event_uuid = d.event_uuid
+   AND s.created_at >= d.bucket_start
+   AND s.created_at < d.bucket_start + interval '1 hour'
+   AND s.is_deleted = false
+ GROUP BY d.event_uuid, d.organizer_uuid, d.bucket_start
+""")
+
+_EVENT_DAY_SQL = _upsert("event_stat_buckets", "event_uuid, organizer_uuid", f"""
+SELECT d.event_uuid, d.organizer_uuid, 'day', d.day, {_SUM_BUCKETS}, {_NEW_ROW}
+  FROM (
+    SELECT DISTINCT event_uuid, organizer_uuid, date_trunc('day', bucket_start, 'UTC') AS day
+      FROM rollup_dirty
+  ) d
+  LEFT JOIN event_stat_buckets b
+    ON b.event_uuid = d.event_uuid
+   AND b.granularity = 'hour'
+   AND b.bucket_start >= d.day
+   AND b.bucket_start < d.day + interval '1 day'
+ GROUP BY d.event_uuid, d.organizer_uuid, d.day
+""")
+
+_ORGANIZER_HOUR_SQL = _upsert("organizer_stat_buckets", "organizer_uuid", f"""
+SELECT d.organizer_uuid, 'hour', d.bucket_start, {_SUM_BUCKETS}, {_NEW_ROW}
+  FROM (SELECT DISTINCT organizer_uuid, bucket_start FROM rollup_dirty) d
+  LEFT JOIN event_stat_buckets b
+    ON b.organizer_uuid = d.organizer_uuid
+   AND b.granularity = 'hour'
+   AND b.bucket_start = d.bucket_start
+ GROUP BY d.organizer_uuid, d.bucket_start
+""")
+
+_ORGANIZER_DAY_SQL = _upsert("organizer_stat_buckets", "organizer_uuid", f"""
+SELECT d.organizer_uuid, 'day', d.day, {_SUM_BUCKETS}, {_NEW_ROW}
+  FROM (
+    SELECT DISTINCT organizer_uuid, date_trunc('day', bucket_start, 'UTC') AS day
+      FROM rollup_dirty
+  ) d
+  LEFT JOIN organizer_stat_buckets b
+    ON b.organizer_uuid = d.organizer_uuid
+   AND b.granularity = 'hour'
+   AND b.bucket_start >= d.day
+   AND b.bucket_start < d.day + interval '1 day'
+ GROUP BY d.organizer_uuid, d.day
+""")
+
+_SAVE_WATERMARK_SQL = f"""
+INSERT INTO rollup_watermarks (
+    name, watermark, uuid, is_active, is_deleted, version, created_at, updated_at
+)
+VALUES (:name, :watermark, {_NEW_ROW})
+ON CONFLICT (name) DO UPDATE
+   SET watermark = excluded.watermark,
+       version = rollup_watermarks.version + 1,
+       updated_at = now()
+"""
+
+
+def refresh_dashboard_rollups(
+    db: Session,
+    *,
+    overlap_seconds: Optional[float] = None,
+    full: bool = False,
+) -> Optional[int]:
+    """
+    增量更新 rollup（不 commit）；回傳重算的 event hour bucket 數
+
+    另一個 refresh 進行中 → 回傳 None（不等待）
+    :param full: 忽略 watermark，重算所有報名所在的 bucket
+    """
+    locked = db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": ROLLUP_LOCK_KEY}
+    ).scalar_one()
+    if not locked:
+        return None
+
+    started, watermark = db.execute(
+        text("SELECT now(), (SELECT watermark FROM rollup_watermarks WHERE name = :name)"),
+        {"name": WATERMARK_NAME},
+    ).one()
+
+    if full or watermark is None:
+        since = EPOCH
+    else:
+        overlap = settings.DASHBOARD_ROLLUP_OVERLAP_SECONDS if overlap_seconds is None else overlap_seconds
+        since = watermark - timedelta(seconds=overlap)
+
+    db.execute(text(_DIRTY_SQL), {"since": since})
+    dirty = db.execute(
+        text(_EVENT_HOUR_SQL),
+        {
+            "verified": list(VERIFIED_STATUSES),
+            "paid": list(PAID_STATUSES),
+            "completed": list(COMPLETED_STATUSES),
+        },
+    ).rowcount
+
+    if dirty:
+        db.execute(text(_EVENT_DAY_SQL))
+        db.execute(text(_ORGANIZER_HOUR_SQL))
+        db.execute(text(_ORGANIZER_DAY_SQL))
+
+    db.execute(text(_SAVE_WATERMARK_SQL), {"name": WATERMARK_NAME, "watermark": started})
+    return dirty
+
+
+# =========================================================
+# Read
+# =========================================================
+
+def _empty_counts() -> dict[str, int]:
+    return {c.removesuffix("_count"): 0 for c in COUNTERS}
+
+
+def load_dashboard_series(
+    db: Session,
+    organizer_uuid: UUID,
+    *,
+    days: int = 14,
+    now: Optional[datetime] = None,
+) -> dict:
+    """
+    一條查詢取出 organizer bucket：
+    - 最近 7 × 24 小時（hour）→ last_7_days 合計 + 最近 24 小時 sparkline
+    - 最近 days 天（day，含今天）→ 每日 sparkline
+    沒有資料的時段補 0
+    """
+    now = now or datetime.now(timezone.utc)
+    current_hour = now.replace(minute=0, second=0, microsecond=0)
+    today = current_hour.replace(hour=0)
+
+    hour_from = current_hour - timedelta(hours=7 * 24 - 1)
+    day_from = today - timedelta(days=days - 1)
+
+    rows = db.execute(
+        select(
+            OrganizerStatBucket.granularity,
+            OrganizerStatBucket.bucket_start,
+            *(getattr(OrganizerStatBucket, c) for c in COUNTERS),
+        )
+        .where(
+            OrganizerStatBucket.organizer_uuid == organizer_uuid,
+            or_(
+                and_(
+                    OrganizerStatBucket.granularity == "hour",
+                    OrganizerStatBucket.bucket_start >= hour_from,
+                ),
+                and_(
+                    OrganizerStatBucket.granularity == "day",
+                    OrganizerStatBucket.bucket_start >= day_from,
+                ),
+            ),
+        )
+    ).all()
+
+    buckets: dict[tuple[str, datetime], dict[str, int]] = {}
+    for row in rows:
+        buckets[(row.granularity, row.bucket_start)] = {
+            c.removesuffix("_count"): getattr(row, c) for c in COUNTERS
+        }
+
+    last_7_days = _empty_counts()
+    for (granularity, _), counts in buckets.items():
+        if granularity == "hour":
+            for key, n in counts.items():
+                last_7_days[key] += n
+
+    def series(granularity: str, start: datetime, step: timedelta, n: int) -> list[dict]:
+        points = []
+        for i in range(n):
+            bucket_start = start + step * i
+            points.append({
+                "bucket_start": bucket_start,
+                **buckets.get((granularity, bucket_start), _empty_counts()),
+            })
+        return points
+
+    return {
+        "last_7_days": last_7_days,
+        "daily": series("day", day_from, timedelta(days=1), days),
+        "hourly": series("hour", current_hour - timedelta(hours=23), timedelta(hours=1), 24),
+    }
+
+
+# =========================================================
+# Background job
+# =========================================================
+
+class DashboardRollupWorker:
+    """
+    背景 thread：定期增量更新 dashboard rollup
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session] = SessionLocal,
+        interval: float = 60.0,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        self._stats_lock = threading.Lock()
+        self.runs = 0
+        self.skipped = 0
+        self.refreshed_buckets = 0
+        self.last_duration_ms: Optional[float] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="dashboard-rollup", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Dashboard rollup error")
+            self._stop_event.wait(self.interval)
+
+    def run_once(self) -> Optional[int]:
+        started = time.perf_counter()
+
+        db = self.session_factory()
+        try:
+            dirty = refresh_dashboard_rollups(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        with self._stats_lock:
+            self.runs += 1
+            if dirty is None:
+                self.skipped += 1
+            else:
+                self.refreshed_buckets += dirty
+            self.last_duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        return dirty
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "interval_seconds": self.interval,
+                "runs": self.runs,
+                "skipped": self.skipped,
+                "refreshed_buckets": self.refreshed_buckets,
+                "last_duration_ms": self.last_duration_ms,
+            }
+
+
+_worker: Optional[DashboardRollupWorker] = None
+
+
+def start_dashboard_rollup() -> None:
+    global _worker
+
+    if not settings.DASHBOARD_ROLLUP_ENABLED or _worker is not None:
+        return
+
+    worker = DashboardRollupWorker(interval=settings.DASHBOARD_ROLLUP_INTERVAL_SECONDS)
+    worker.start()
+    _worker = worker
+
+
+def stop_dashboard_rollup() -> None:
+    global _worker
+
+    if _worker is None:
+        return
+
+    _worker.stop()
+    _worker = None
+
+
+def dashboard_rollup_stats() -> Optional[dict]:
+    return _worker.stats() if _worker is not None else None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "run"
+
+    if command == "rebuild":
+        db = SessionLocal()
+        try:
+            dirty = refresh_dashboard_rollups(db, full=True)
+            db.commit()
+            logger.info("Dashboard rollup rebuilt: %s hour buckets", dirty)
+        finally:
+            db.close()
+    elif command == "run":
+        worker = DashboardRollupWorker(interval=settings.DASHBOARD_ROLLUP_INTERVAL_SECONDS)
+        worker.start()
+        logger.info("Dashboard rollup started: interval=%ss", worker.interval)
+        try:
+            while True:
+                time.sleep(60)
+                logger.info("Dashboard rollup stats: %s", worker.stats())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            worker.stop()
+    else:
+        sys.exit("usage: python -m app.services.organizer.dashboard_rollup [run | rebuild]")
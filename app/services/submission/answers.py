@@ -0,0 +1,156 @@
+# app/services/submission/answers.py ← 報名答案儲存模式（EAV rows / JSONB document）
+
+"""
+Submission answer storage
+
+說明：
+- SUBMISSION_ANSWER_STORAGE：
+  - values：每個欄位一列 submission_values（原本的 EAV）
+  - dual：submission_values + submissions.answers 雙寫（遷移期間；讀取仍以 submission_values 為準）
+  - document：只寫 submissions.answers；讀取改走 answers / 相容 view
+    （後台 SubmissionResponse.values 以 answer_value_context 從 answers 展開，格式不變）
+- submissions.answers：{field_key: 正規化後的值}；answers_version = 寫入時的 events.fields_version
+  - GIN（jsonb_path_ops）：answers @> '{"size": "M"}'
+- 相容 view submission_answer_values（submission_uuid / event_field_uuid / field_key / value / is_deleted）：
+  已有 answers 的報名展開 document，其餘沿用 submission_values
+  → SQL 統計（report_aggregator / field_analytics）在 document 模式改讀 view（ANSWER_ROWS）
+- 遷移步驟：
+  1. migration 只建立欄位 / index / view（不回填；ADD COLUMN 的 lock 不會持有到回填結束）
+  2. 以 dual 部署（新報名雙寫）
+  3. python -m app.services.submission.answers backfill（既有報名，每批各自 commit，可中斷後重跑）
+  4. 切換為 document
+"""
+
+import logging
+import sys
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.models.event.event_field import EventField
+
+
+logger = logging.getLogger("app.submission.answers")
+
+STORAGE_MODES = ("values", "dual", "document")
+
+STORAGE = settings.SUBMISSION_ANSWER_STORAGE
+if STORAGE not in STORAGE_MODES:
+    raise ValueError(f"SUBMISSION_ANSWER_STORAGE must be one of {STORAGE_MODES}: {STORAGE!r}")
+
+WRITE_VALUES = STORAGE in ("values", "dual")
+WRITE_DOCUMENT = STORAGE in ("dual", "document")
+READ_DOCUMENT = STORAGE == "document"
+
+# SQL 統計讀取答案列的來源（欄位與 submission_values 相容）
+ANSWER_ROWS = "submission_answer_values" if READ_DOCUMENT else "submission_values"
+
+
+def answer_document(values: Iterable[tuple[Any, Any]]) -> dict[str, Any]:
+    """
+    validator 結果 [(FieldRule, value)] → {field_key: value}
+    """
+    return {rule.field_key: value for rule, value in values}
+
+
+def answer_value_context(db: Session, event_uuid: UUID) -> Optional[dict]:
+    """
+    SubmissionResponse.model_validate 的 context（document 模式才需要）
+
+    - answer_fields：活動欄位（uuid / field_key / field_type，依 sort_order）
+      → response 的 values 由 answers 展開，與 values 模式相同格式（value uuid = None）
+    - 每個列表 / 搜尋請求一條查詢；非 document 模式 → None（不查詢）
+    """
+    if not READ_DOCUMENT:
+        return None
+
+    fields = db.execute(
+        select(EventField.uuid, EventField.field_key, EventField.field_type)
+        .where(
+            EventField.event_uuid == event_uuid,
+            EventField.is_deleted == False,
+        )
+        .order_by(EventField.sort_order, EventField.id)
+    ).all()
+    return {"answer_fields": fields}
+
+
+# =========================================================
+# Backfill（submission_values → submissions.answers）
+# =========================================================
+
+_BACKFILL_SQL = text("""
+WITH batch AS (
+    SELECT id, uuid, event_uuid
+      FROM submissions
+     WHERE id > :after_id
+       AND answers IS NULL
+     ORDER BY id
+     LIMIT :batch_size
+),
+docs AS (
+    SELECT b.id,
+           coalesce(
+               jsonb_object_agg(v.field_key, coalesce(v.value, to_jsonb(v.raw_value)))
+                   FILTER (WHERE v.id IS NOT NULL),
+               '{}'::jsonb
+           ) AS answers
+      FROM batch b
+      LEFT JOIN submission_values v
+        ON v.submission_uuid = b.uuid
+       AND v.is_deleted = false
+     GROUP BY b.id
+),
+updated AS (
+    UPDATE submissions s
+       SET answers = d.answers,
+           answers_version = e.fields_version
+      FROM docs d, batch b, events e
+     WHERE s.id = d.id
+       AND b.id = d.id
+       AND e.uuid = b.event_uuid
+    RETURNING s.id
+)
+SELECT (SELECT max(id) FROM batch) AS last_id, (SELECT count(*) FROM updated) AS updated
+""")
+
+
+def backfill_answers(db: Session, *, after_id: int = 0, batch_size: int = 1000) -> tuple[int, int]:
+    """
+    回填一批（不 commit）；回傳 (last_id, 回填筆數)，last_id = 0 表示已完成
+
+    - 不更新 updated_at（內容與 submission_values 相同，不視為報名異動）
+    - answers_version 取目前的 fields_version（舊報名寫入當時的版本已無法得知）
+    """
+    row = db.execute(_BACKFILL_SQL, {"after_id": after_id, "batch_size": batch_size}).one()
+    return row.last_id or 0, row.updated
+
+
+def backfill_all(batch_size: int = 1000) -> int:
+    db = SessionLocal()
+    total = 0
+    after_id = 0
+    try:
+        while True:
+            after_id, updated = backfill_answers(db, after_id=after_id, batch_size=batch_size)
+            db.commit()
+            if not after_id:
+                return total
+            total += updated
+            logger.info("Backfilled answers through submission id %s (%s total)", after_id, total)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    if len(sys.argv) < 2 or sys.argv[1] != "backfill":
+        sys.exit("usage: python -m app.services.submission.answers backfill [batch_size]")
+
+    count = backfill_all(int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
+    logger.info("Backfill complete: %s submissions", count)
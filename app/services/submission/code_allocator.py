@@ -0,0 +1,203 @@
+# app/services/submission/code_allocator.py ← 報名序號（submission_code）配發
+
+"""
+Submission code allocator
+
+說明：
+- 每個活動一條計數器（submission_code_sequences），以 UPSERT … RETURNING
+  一次預留一整段序號（block），在 worker 記憶體內逐一配發
+  → 同一活動每秒上千筆報名也只偶爾碰 DB 一次，且序號絕不重複（不需 retry）
+- block 預留在獨立的短 transaction 內完成，不持有報名 transaction 的 row lock
+- block 大小自動調整：上一段很快用完 → 加倍（上限 max_block_size），
+  很久才用完 → 減半（下限 block_size），讓冷門活動不浪費太多號碼
+- 編碼：<event_code>-<Crockford base32 序號><Luhn mod 32 檢查碼>
+  例如 EVT-2025-001-00001Y（不含 I / L / O / U，電話念給客服也不易聽錯）
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.db import engine
+from app.models.submission.submission_code_sequence import SubmissionCodeSequence
+
+
+# =========================================================
+# Encoding（Crockford base32 + Luhn mod 32 check symbol）
+# =========================================================
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_BASE = len(ALPHABET)
+_INDEX = {c: i for i, c in enumerate(ALPHABET)}
+
+# 最少位數（32^5 ≈ 3,300 萬；超過時自動變長）
+MIN_WIDTH = 5
+
+
+def _check_symbol(body: str) -> str:
+    """
+    Luhn mod N：可偵測任一字元打錯與大多數相鄰字元對調
+    """
+    factor = 2
+    total = 0
+    for char in reversed(body):
+        addend = factor * _INDEX[char]
+        total += addend // _BASE + addend % _BASE
+        factor = 1 if factor == 2 else 2
+    return ALPHABET[(_BASE - total % _BASE) % _BASE]
+
+
+def encode_sequence(value: int) -> str:
+    if value < 0:
+        raise ValueError("Sequence value must be non-negative")
+
+    digits = []
+    while True:
+        value, remainder = divmod(value, _BASE)
+        digits.append(ALPHABET[remainder])
+        if value == 0:
+            break
+
+    body = "".join(reversed(digits)).rjust(MIN_WIDTH, "0")
+    return body + _check_symbol(body)
+
+
+def format_submission_code(event_code: str, value: int) -> str:
+    return f"{event_code}-{encode_sequence(value)}"
+
+
+def is_valid_submission_code(code: str) -> bool:
+    """
+    只檢查序號段的檢查碼（不查 DB）；舊格式的 code 一律回傳 False
+    """
+    _, _, encoded = code.rpartition("-")
+    encoded = encoded.upper()
+
+    if len(encoded) < MIN_WIDTH + 1 or any(c not in _INDEX for c in encoded):
+        return False
+
+    return _check_symbol(encoded[:-1]) == encoded[-1]
+
+
+# =========================================================
+# Block reservation（DB）
+# =========================================================
+
+def reserve_block(event_uuid: str, size: int) -> int:
+    """
+    預留 [start, start + size) 並回傳 start（獨立 transaction，立即 commit）
+    """
+    statement = (
+        insert(SubmissionCodeSequence)
+        .values(event_uuid=event_uuid, next_value=1 + size)
+        .on_conflict_do_update(
+            index_elements=[SubmissionCodeSequence.event_uuid],
+            set_={
+                "next_value": SubmissionCodeSequence.next_value + size,
+                "updated_at": func.now(),
+            },
+        )
+        .returning(SubmissionCodeSequence.next_value)
+    )
+
+    with engine.begin() as conn:
+        end = conn.execute(statement).scalar_one()
+
+    return end - size
+
+
+# =========================================================
+# Allocator（per worker）
+# =========================================================
+
+@dataclass
+class _EventBlock:
+    lock: threading.Lock
+    next: int = 0
+    end: int = 0
+    size: int = 0
+    reserved_at: float = 0.0
+
+
+class SubmissionCodeAllocator:
+
+    # 上一段在這段時間內用完 → 下一段加倍；超過 SLOW_SECONDS 才用完 → 減半
+    FAST_SECONDS = 1.0
+    SLOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        *,
+        block_size: int,
+        max_block_size: int,
+        reserve: Callable[[str, int], int] = reserve_block,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.block_size = max(1, block_size)
+        self.max_block_size = max(self.block_size, max_block_size)
+        self._reserve = reserve
+        self._clock = clock
+
+        self._blocks: dict[str, _EventBlock] = {}
+        self._blocks_lock = threading.Lock()
+
+        self.reservations = 0
+
+    def _block(self, event_uuid: str) -> _EventBlock:
+        block = self._blocks.get(event_uuid)
+        if block is None:
+            with self._blocks_lock:
+                block = self._blocks.setdefault(event_uuid, _EventBlock(lock=threading.Lock()))
+        return block
+
+    def _next_size(self, block: _EventBlock, now: float) -> int:
+        if not block.size:
+            return self.block_size
+
+        elapsed = now - block.reserved_at
+        if elapsed < self.FAST_SECONDS:
+            return min(self.max_block_size, block.size * 2)
+        if elapsed > self.SLOW_SECONDS:
+            return max(self.block_size, block.size // 2)
+        return block.size
+
+    def next_value(self, event_uuid) -> int:
+        event_uuid = str(event_uuid)
+        block = self._block(event_uuid)
+
+        # 以活動為單位上鎖：預留 block 時只阻塞同一活動
+        with block.lock:
+            if block.next >= block.end:
+                now = self._clock()
+                size = self._next_size(block, now)
+
+                start = self._reserve(event_uuid, size)
+
+                block.next, block.end = start, start + size
+                block.size, block.reserved_at = size, now
+                self.reservations += 1
+
+            value = block.next
+            block.next += 1
+            return value
+
+    def allocate(self, event_uuid, event_code: str) -> str:
+        return format_submission_code(event_code, self.next_value(event_uuid))
+
+    def forget(self, event_uuid) -> None:
+        """
+        丟棄本 worker 尚未配發的號碼（例如活動刪除）
+        """
+        with self._blocks_lock:
+            self._blocks.pop(str(event_uuid), None)
+
+
+submission_code_allocator = SubmissionCodeAllocator(
+    block_size=settings.SUBMISSION_CODE_BLOCK_SIZE,
+    max_block_size=settings.SUBMISSION_CODE_MAX_BLOCK_SIZE,
+)
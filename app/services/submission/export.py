@@ -0,0 +1,350 @@
+# app/services/submission/export.py
+
+import csv
+import io
+import json
+import re
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterator, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+from xml.sax.saxutils import escape as xml_escape
+
+from app.core.db import SessionLocal
+from app.models.event.event_field import EventField
+from app.models.submission.enums import SubmissionStatus
+from app.models.submission.submission import Submission
+from app.models.submission.submission_value import SubmissionValue
+from app.services.submission.answers import READ_DOCUMENT
+
+
+# ============================================================
+# Submission Export Service
+# ============================================================
+# 責任：
+# - 將活動報名資料串流輸出為 CSV / JSONL / XLSX
+# - SubmissionValue（EAV）依 EventField 順序轉為欄位（pivot）
+# - 欄位與匯入 validator 相同（未刪除且啟用的 EventField）→ 匯出檔可直接匯回
+#
+# 設計：
+# - 固定 2 條 SQL：欄位定義 + 報名資料（server-side cursor，yield_per）
+# - 每筆 submission 的答案以 jsonb_object_agg 在 DB 端聚合成一個 dict，
+#   不經過 ORM relationship
+# - 每個 partition 寫成一個 chunk 後清空 buffer → 記憶體與筆數無關
+#   （XLSX 以 zipfile 寫入不可 seek 的 sink，同樣逐 partition 送出）
+# - CSV：以 = + - @ 等開頭的儲存格前加 '（formula injection）；匯入時還原
+# ============================================================
+
+BASE_COLUMNS = (
+    ("submission_code", "報名編號"),
+    ("status", "狀態"),
+    ("user_email", "Email"),
+    ("created_at", "報名時間"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ExportField:
+    field_key: str
+    label: str
+
+
+def load_export_fields(db: Session, event_uuid: UUID) -> list[ExportField]:
+    rows = db.execute(
+        select(EventField.field_key, EventField.label)
+        .where(
+            EventField.event_uuid == event_uuid,
+            EventField.is_deleted == False,
+            EventField.is_enabled == True,
+        )
+        .order_by(EventField.sort_order, EventField.id)
+    ).all()
+
+    return [ExportField(field_key=k, label=l) for k, l in rows]
+
+
+def _export_statement(event_uuid: UUID, status: Optional[SubmissionStatus]):
+    answers = (
+        select(
+            func.jsonb_object_agg(
+                SubmissionValue.field_key,
+                func.coalesce(SubmissionValue.value, func.to_jsonb(SubmissionValue.raw_value)),
+                type_=JSONB,
+            )
+        )
+        .where(
+            SubmissionValue.submission_uuid == Submission.uuid,
+            SubmissionValue.is_deleted == False,
+        )
+        .correlate(Submission)
+        .scalar_subquery()
+    )
+
+    # document 模式：直接取 answers（尚未回填的報名才走 submission_values）
+    if READ_DOCUMENT:
+        answers = func.coalesce(Submission.answers, answers)
+
+    statement = (
+        select(
+            Submission.submission_code,
+            Submission.status,
+            Submission.user_email,
+            Submission.created_at,
+            answers.label("answers"),
+        )
+        .where(
+            Submission.event_uuid == event_uuid,
+            Submission.is_deleted == False,
+        )
+        .order_by(Submission.id)
+    )
+
+    if status is not None:
+        statement = statement.where(Submission.status == status)
+
+    return statement
+
+
+# ------------------------------------------------------------
+# Row formatting
+# ------------------------------------------------------------
+
+def format_value(value: Any) -> str:
+    """
+    JSONB 答案 → 儲存格文字（多選以「; 」串接）
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return "; ".join(format_value(v) for v in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _base_values(row) -> tuple:
+    return (
+        row.submission_code,
+        getattr(row.status, "value", row.status),
+        row.user_email,
+        row.created_at.isoformat() if isinstance(row.created_at, datetime) else row.created_at,
+    )
+
+
+def csv_header(fields: Sequence[ExportField], header: str = "label") -> list[str]:
+    if header == "key":
+        return [k for k, _ in BASE_COLUMNS] + [f.field_key for f in fields]
+    return [l for _, l in BASE_COLUMNS] + [f.label for f in fields]
+
+
+def csv_values(row, field_keys: Sequence[str]) -> list[str]:
+    answers = row.answers or {}
+    return [*_base_values(row), *(format_value(answers.get(k)) for k in field_keys)]
+
+
+# 試算表會當成公式的開頭；開頭本來就是 ' 的也要跳脫，匯入時才能無歧義地還原
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r", "'")
+
+
+def escape_cell(value: str) -> str:
+    if value and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def unescape_cell(value: str) -> str:
+    """
+    escape_cell 的反向（匯入 CSV 時使用）
+
+    只移除 escape_cell 加上的 '（後面緊接 FORMULA_PREFIXES）；
+    合作單位 / 手動整理的檔案中一般的開頭 '（'Ohana）保留原樣
+    """
+    if len(value) > 1 and value[0] == "'" and value[1] in FORMULA_PREFIXES:
+        return value[1:]
+    return value
+
+
+def jsonl_line(row, field_keys: Sequence[str]) -> str:
+    answers = row.answers or {}
+    record = dict(zip((k for k, _ in BASE_COLUMNS), _base_values(row)))
+    record["answers"] = {k: answers.get(k) for k in field_keys}
+    return json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+
+# ------------------------------------------------------------
+# Streaming
+# ------------------------------------------------------------
+
+def _iter_partitions(event_uuid: UUID, status: Optional[SubmissionStatus], chunk_rows: int):
+    """
+    server-side cursor，一次一個 partition
+
+    ⚠️ 使用自己的 session：request 的 get_db session 在 response 開始送出前就會關閉
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            _export_statement(event_uuid, status).execution_options(yield_per=chunk_rows)
+        )
+        yield from result.partitions()
+    finally:
+        db.close()
+
+
+def iter_submission_export(
+    event_uuid: UUID,
+    *,
+    fields: Sequence[ExportField],
+    fmt: str = "csv",
+    header: str = "label",
+    status: Optional[SubmissionStatus] = None,
+    chunk_rows: int = 2000,
+) -> Iterator[str | bytes]:
+    """
+    StreamingResponse body（csv / jsonl → str，xlsx → bytes）
+    """
+    if fmt == "xlsx":
+        yield from _iter_xlsx(event_uuid, fields, header, status, chunk_rows)
+        return
+
+    field_keys = [f.field_key for f in fields]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    if fmt == "csv":
+        # BOM：讓 Excel 以 UTF-8 開啟中文
+        buffer.write("\ufeff")
+        writer.writerow([escape_cell(c) for c in csv_header(fields, header)])
+
+    for partition in _iter_partitions(event_uuid, status, chunk_rows):
+        for row in partition:
+            if fmt == "csv":
+                writer.writerow([escape_cell(c) for c in csv_values(row, field_keys)])
+            else:
+                buffer.write(jsonl_line(row, field_keys))
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    tail = buffer.getvalue()
+    if tail:
+        yield tail
+
+
+# ------------------------------------------------------------
+# XLSX（SpreadsheetML，inline strings；不需第三方套件）
+# ------------------------------------------------------------
+
+_XLSX_STATIC_PARTS = (
+    ("[Content_Types].xml", (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    )),
+    ("_rels/.rels", (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    )),
+    ("xl/workbook.xml", (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Submissions" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    )),
+    ("xl/_rels/workbook.xml.rels", (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    )),
+)
+
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = "</sheetData></worksheet>"
+
+# XML 1.0 不允許的控制字元
+_XML_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def xlsx_row(values: Sequence[str]) -> str:
+    # inline string 不會被當成公式，不需要 escape_cell
+    cells = "".join(
+        f'<c t="inlineStr"><is><t xml:space="preserve">{xml_escape(_XML_ILLEGAL.sub("", v))}</t></is></c>'
+        for v in values
+    )
+    return f"<row>{cells}</row>"
+
+
+class _ZipSink(io.RawIOBase):
+    """
+    不可 seek 的輸出：zipfile 改用 data descriptor，寫入的 bytes 逐段取出送給 client
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_xlsx(
+    event_uuid: UUID,
+    fields: Sequence[ExportField],
+    header: str,
+    status: Optional[SubmissionStatus],
+    chunk_rows: int,
+) -> Iterator[bytes]:
+    field_keys = [f.field_key for f in fields]
+    sink = _ZipSink()
+
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_STATIC_PARTS:
+            archive.writestr(name, content)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write((_SHEET_HEAD + xlsx_row(csv_header(fields, header))).encode())
+
+            for partition in _iter_partitions(event_uuid, status, chunk_rows):
+                sheet.write("".join(xlsx_row(csv_values(row, field_keys)) for row in partition).encode())
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+
+            sheet.write(_SHEET_TAIL.encode())
+
+    yield sink.drain()
@@ -0,0 +1,457 @@
+# app/services/submission/form_validator.py ← 報名表單 validator（編譯 + 快取）
+
+"""
+Compiled submission validator
+
+說明：
+- 活動的 EventField 定義編譯成 CompiledValidator：
+  required 集合、型別 coercer、選項集合、regex / range / length 規則
+- validate()：單次走訪送出的答案，沒有 DB 存取
+- 快取 key：event UUID + events.fields_version
+  - event_fields 異動時（API handler app/api/events/organizer/event_fields.py 呼叫 bump_fields_version）版本 +1，
+    commit 後經 invalidation channel 廣播 <event_uuid>:<version>
+  - 收到較新版本 → 丟棄舊 validator；載入中的舊版本也不會被寫回
+  - TTL 為跨 worker 失效的最終上限
+- cache miss 只跑一條 SQL（events.fields_version + event_fields）
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.invalidation import publish_after_commit, subscribe
+from app.core.versioned_cache import VersionedCache
+from app.models.event.event import Event
+from app.models.event.event_field import EventField
+
+
+# =========================================================
+# Coercers（值 → 可存進 JSONB 的值；不合法 raise ValueError）
+# =========================================================
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_PHONE_RE = re.compile(r"^\+?[0-9()\-\s]{6,20}$")
+_INT_RE = re.compile(r"^[+-]?\d+$")
+
+_TRUE = frozenset({"true", "1", "yes", "y", "on"})
+_FALSE = frozenset({"false", "0", "no", "n", "off"})
+
+# CSV / 匯出檔的多選值以「;」分隔
+MULTI_VALUE_SEPARATOR = ";"
+
+
+def _to_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError("must be a string")
+    return str(value)
+
+
+def _to_email(value: Any) -> str:
+    value = _to_text(value)
+    if not _EMAIL_RE.match(value):
+        raise ValueError("invalid email")
+    return value
+
+
+def _to_phone(value: Any) -> str:
+    value = _to_text(value)
+    if not _PHONE_RE.match(value):
+        raise ValueError("invalid phone number")
+    return value
+
+
+def _to_number(value: Any) -> int | float:
+    if isinstance(value, bool):
+        raise ValueError("must be a number")
+    if isinstance(value, (int, float)):
+        number = value
+    elif isinstance(value, str):
+        value = value.strip()
+        try:
+            number = int(value) if _INT_RE.match(value) else float(value)
+        except ValueError:
+            raise ValueError("must be a number")
+    else:
+        raise ValueError("must be a number")
+
+    if isinstance(number, float) and not math.isfinite(number):
+        raise ValueError("must be a number")
+    return number
+
+
+def _to_integer(value: Any) -> int:
+    number = _to_number(value)
+    if isinstance(number, float):
+        if not number.is_integer():
+            raise ValueError("must be an integer")
+        number = int(number)
+    return number
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError("must be true or false")
+
+
+def _to_date(value: Any) -> str:
+    try:
+        return date.fromisoformat(_to_text(value)).isoformat()
+    except ValueError:
+        raise ValueError("must be a date (YYYY-MM-DD)")
+
+
+def _to_datetime(value: Any) -> str:
+    try:
+        return datetime.fromisoformat(_to_text(value)).isoformat()
+    except ValueError:
+        raise ValueError("must be an ISO 8601 datetime")
+
+
+COERCERS: dict[str, Callable[[Any], Any]] = {
+    "text": _to_text,
+    "textarea": _to_text,
+    "email": _to_email,
+    "phone": _to_phone,
+    "tel": _to_phone,
+    "number": _to_number,
+    "integer": _to_integer,
+    "boolean": _to_bool,
+    "date": _to_date,
+    "datetime": _to_datetime,
+}
+
+# 選項類欄位（值必須在 options 內）
+SINGLE_CHOICE_TYPES = frozenset({"select", "radio", "dropdown"})
+MULTI_CHOICE_TYPES = frozenset({"checkbox", "checkboxes", "multiselect"})
+
+
+def _pass_through(value: Any) -> Any:
+    return value
+
+
+# =========================================================
+# Compiled rules
+# =========================================================
+
+def _is_blank(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    if isinstance(value, (list, tuple)):
+        return not value
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class FieldRule:
+    uuid: UUID
+    field_key: str
+    label: str
+    required: bool
+    coerce: Callable[[Any], Any]
+
+    # str(option value) → option value；None = 不限制
+    choices: Optional[dict[str, Any]] = None
+    multiple: bool = False
+
+    pattern: Optional[re.Pattern] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+
+    def _choice(self, value: Any) -> Any:
+        try:
+            return self.choices[value if isinstance(value, str) else str(value)]
+        except KeyError:
+            raise ValueError(f"invalid option: {value}")
+
+    def check(self, value: Any) -> Any:
+        """
+        :return: 正規化後的值（raise ValueError 表示不合法）
+        """
+        if self.multiple:
+            if isinstance(value, str):
+                value = [v.strip() for v in value.split(MULTI_VALUE_SEPARATOR) if v.strip()]
+            elif not isinstance(value, (list, tuple)):
+                value = [value]
+            value = [self._choice(v) for v in value]
+        elif self.choices is not None:
+            value = self._choice(value.strip() if isinstance(value, str) else value)
+        else:
+            value = self.coerce(value)
+
+        if self.pattern is not None and isinstance(value, str) and not self.pattern.fullmatch(value):
+            raise ValueError("invalid format")
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if self.minimum is not None and value < self.minimum:
+                raise ValueError(f"must be >= {self.minimum:g}")
+            if self.maximum is not None and value > self.maximum:
+                raise ValueError(f"must be <= {self.maximum:g}")
+
+        if isinstance(value, (str, list)):
+            if self.min_length is not None and len(value) < self.min_length:
+                raise ValueError(f"length must be >= {self.min_length}")
+            if self.max_length is not None and len(value) > self.max_length:
+                raise ValueError(f"length must be <= {self.max_length}")
+
+        return value
+
+
+def _setting(source: Optional[dict], *names: str) -> Any:
+    if not source:
+        return None
+    for name in names:
+        if source.get(name) is not None:
+            return source[name]
+    return None
+
+
+def _choices(options: Optional[list]) -> Optional[dict[str, Any]]:
+    if not options:
+        return None
+
+    choices = {}
+    for option in options:
+        value = option.get("value", option.get("label")) if isinstance(option, dict) else option
+        if value is not None:
+            choices[str(value)] = value
+    return choices or None
+
+
+def compile_field(field) -> FieldRule:
+    """
+    EventField（或同屬性物件）→ FieldRule
+    """
+    field_type = (field.field_type or "text").lower()
+    validation = field.validation or {}
+    config = field.config or {}
+
+    choices = None
+    multiple = False
+    coerce = COERCERS.get(field_type, _pass_through)
+
+    if field_type in SINGLE_CHOICE_TYPES or field_type in MULTI_CHOICE_TYPES:
+        choices = _choices(field.options)
+        multiple = choices is not None and (
+            field_type in MULTI_CHOICE_TYPES or bool(config.get("multiple"))
+        )
+        if choices is None and field_type == "checkbox":
+            # 沒有選項的 checkbox = 單一勾選（同意條款等）
+            coerce = _to_bool
+
+    pattern = _setting(validation, "pattern", "regex")
+    minimum = _setting(validation, "min", "minimum")
+    maximum = _setting(validation, "max", "maximum")
+
+    return FieldRule(
+        uuid=field.uuid,
+        field_key=field.field_key,
+        label=field.label,
+        required=bool(field.required),
+        coerce=coerce,
+        choices=choices,
+        multiple=multiple,
+        pattern=re.compile(pattern) if pattern else None,
+        minimum=float(minimum) if minimum is not None else None,
+        maximum=float(maximum) if maximum is not None else None,
+        min_length=_setting(validation, "min_length", "minLength"),
+        max_length=_setting(validation, "max_length", "maxLength"),
+    )
+
+
+# =========================================================
+# Compiled validator
+# =========================================================
+
+@dataclass(slots=True)
+class ValidationResult:
+    values: list[tuple[FieldRule, Any]]
+    errors: list[str]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class CompiledValidator:
+    """
+    單一活動、單一 fields_version 的 validator（immutable，可跨 request 共用）
+    """
+
+    __slots__ = ("event_uuid", "version", "rules", "required", "_by_key", "_by_column")
+
+    def __init__(self, event_uuid, version: int, rules: Sequence[FieldRule]):
+        self.event_uuid = str(event_uuid)
+        self.version = version
+        self.rules = tuple(rules)
+        self.required = frozenset(r.field_key for r in self.rules if r.required)
+        self._by_key = {r.field_key: r for r in self.rules}
+
+        # 匯入檔可用 label 當欄名；field_key 優先
+        self._by_column = {r.label: r for r in reversed(self.rules)}
+        self._by_column.update(self._by_key)
+
+    @classmethod
+    def compile(cls, event_uuid, version: int, fields: Iterable) -> "CompiledValidator":
+        return cls(event_uuid, version, [compile_field(f) for f in fields])
+
+    def rule(self, field_key: str) -> Optional[FieldRule]:
+        return self._by_key.get(field_key)
+
+    def column(self, name: str) -> Optional[FieldRule]:
+        """
+        field_key 或 label → FieldRule
+        """
+        return self._by_column.get(name)
+
+    def validate(
+        self,
+        values: Iterable[tuple[str, Any]],
+        *,
+        by_label: bool = False,
+    ) -> ValidationResult:
+        """
+        :param values: (field_key, value)；by_label=True 時也接受 label
+        """
+        lookup = self._by_column if by_label else self._by_key
+        accepted: dict[str, tuple[FieldRule, Any]] = {}
+        # 有填值的欄位（含驗證失敗的；不再重複回報 required）
+        present: set[str] = set()
+        errors: list[str] = []
+
+        for key, value in values:
+            rule = lookup.get(key)
+            if rule is None:
+                errors.append(f"{key}: unknown field")
+                continue
+            if _is_blank(value):
+                continue
+            if rule.field_key in present:
+                errors.append(f"{rule.field_key}: duplicate value")
+                continue
+
+            present.add(rule.field_key)
+            try:
+                accepted[rule.field_key] = (rule, rule.check(value))
+            except ValueError as exc:
+                errors.append(f"{rule.field_key}: {exc}")
+
+        if not self.required.issubset(present):
+            errors.extend(
+                f"{r.field_key}: required"
+                for r in self.rules
+                if r.required and r.field_key not in present
+            )
+
+        return ValidationResult(values=list(accepted.values()), errors=errors)
+
+
+# =========================================================
+# Cache（event UUID → validator，版本單調遞增）
+# =========================================================
+
+validator_cache = VersionedCache(
+    maxsize=settings.FIELD_VALIDATOR_CACHE_MAX_SIZE,
+    ttl=settings.FIELD_VALIDATOR_CACHE_TTL_SECONDS,
+)
+
+
+# =========================================================
+# Loader（single statement）
+# =========================================================
+
+def _validator_statement(event_uuid):
+    return (
+        select(Event.fields_version, EventField)
+        .outerjoin(
+            EventField,
+            and_(
+                EventField.event_uuid == Event.uuid,
+                EventField.is_deleted == False,
+                EventField.is_enabled == True,
+            ),
+        )
+        .where(Event.uuid == event_uuid)
+        .order_by(EventField.sort_order, EventField.id)
+    )
+
+
+def load_validator(db: Session, event_uuid) -> Optional[CompiledValidator]:
+    """
+    一次查詢編譯 validator；活動不存在 → None
+    """
+    rows = db.execute(_validator_statement(event_uuid)).all()
+    if not rows:
+        return None
+
+    return CompiledValidator.compile(
+        event_uuid,
+        rows[0].fields_version,
+        (f for _, f in rows if f is not None),
+    )
+
+
+def get_validator(db: Session, event_uuid) -> Optional[CompiledValidator]:
+    """
+    快取命中 → 不碰 DB
+    """
+    key = str(event_uuid)
+
+    validator = validator_cache.get(key)
+    if validator is not None:
+        return validator
+
+    validator = load_validator(db, event_uuid)
+    if validator is not None:
+        validator_cache.put(key, validator)
+    return validator
+
+
+# =========================================================
+# Version bump（event_fields 異動，與異動同一個 transaction）
+# =========================================================
+
+EVENT_FIELDS = "event_fields"
+
+
+def bump_fields_version(db: Session, event_uuid) -> int:
+    """
+    events.fields_version + 1（不 commit）；commit 後廣播新版本
+
+    ⚠️ 所有 event_fields 的新增 / 修改 / 刪除都必須呼叫
+    """
+    version = db.execute(
+        update(Event)
+        .where(Event.uuid == event_uuid)
+        .values(
+            fields_version=Event.fields_version + 1,
+            # 不視為活動資料更新
+            updated_at=Event.updated_at,
+        )
+        .returning(Event.fields_version)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+
+    publish_after_commit(db, EVENT_FIELDS, f"{event_uuid}:{version}")
+    return version
+
+
+subscribe(EVENT_FIELDS, validator_cache.on_message)
@@ -0,0 +1,531 @@
+# app/services/submission/importer.py
+
+import csv
+import io
+import json
+import re
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.api.utils.email_verification_mailer import (
+    VERIFICATION_SUBJECT,
+    verification_html_template,
+)
+from app.services.event.report_aggregator import record_submissions
+from app.services.submission.answers import WRITE_DOCUMENT, WRITE_VALUES
+from app.services.submission.code_allocator import format_submission_code, reserve_block
+from app.services.submission.export import unescape_cell
+from app.services.submission.form_validator import CompiledValidator, FieldRule, get_validator
+
+
+# ============================================================
+# Submission Import Service
+# ============================================================
+# 責任：
+# - 將線下 / 合作夥伴收集的報名（CSV / JSONL）一次匯入活動
+# - 依 EventField 定義逐列驗證（form_validator 的 CompiledValidator），回傳每列錯誤
+#
+# 設計：
+# - 單次串流掃描：解析 + 驗證 + 寫入 staging buffer（SpooledTemporaryFile），
+#   記憶體不隨筆數成長
+# - 合法列以 PostgreSQL COPY 載入兩張 temp table（ON COMMIT DROP），
+#   再以 set-based INSERT … SELECT 合併進 submissions / submission_values
+#   （answer document 依 SUBMISSION_ANSWER_STORAGE，見 app/services/submission/answers.py）
+# - 需要驗證信時，email_verifications 與 email_outbox 也以 INSERT … SELECT
+#   一次寫入（HTML 模板只 render 一次，token 在 SQL 端 replace）
+# - 全部在呼叫端的 transaction 內；呼叫端 commit 後再喚醒 outbox worker
+# ============================================================
+
+# 匯出檔的基本欄位（key / label），匯入時忽略 → export 檔可直接匯回
+IGNORED_COLUMNS = frozenset({
+    "submission_code", "報名編號",
+    "status", "狀態",
+    "created_at", "報名時間",
+})
+
+EMAIL_COLUMNS = ("user_email", "email", "Email")
+NOTES_COLUMNS = ("notes",)
+
+# JSONL：答案可放在巢狀 dict（export 格式為 "answers"）
+NESTED_VALUE_KEYS = ("answers", "values")
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# 一次向 submission_code_sequences 預留的號碼數
+CODE_BLOCK_SIZE = 1000
+
+# SQL 端 replace 的 token placeholder
+TOKEN_PLACEHOLDER = "{{verification_token}}"
+
+# staging buffer 超過此大小才落地到暫存檔
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+
+class ImportFileError(ValueError):
+    """
+    整份檔案無法匯入（格式錯誤 / 超過筆數上限）
+    """
+
+
+@dataclass
+class ImportReport:
+    batch_id: str
+    total_rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    duplicates: int = 0
+    verification_emails: int = 0
+    # (row, [messages])；row 為檔案行號（CSV 含 header，從 2 開始）
+    errors: list[tuple[int, list[str]]] = field(default_factory=list)
+    errors_truncated: bool = False
+
+    def add_error(self, row: int, messages: list[str], *, limit: int) -> None:
+        if len(self.errors) < limit:
+            self.errors.append((row, messages))
+        else:
+            self.errors_truncated = True
+
+
+# ------------------------------------------------------------
+# Parsing（streaming）
+# ------------------------------------------------------------
+
+def _text_stream(stream: BinaryIO) -> io.TextIOWrapper:
+    # utf-8-sig：容忍 Excel / export 檔開頭的 BOM
+    return io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+
+def iter_csv_records(
+    stream: BinaryIO,
+    check_columns: Optional[Callable[[Sequence[str]], None]] = None,
+) -> Iterator[tuple[int, Optional[dict], Optional[str]]]:
+    """
+    yield (row, record, parse_error)
+
+    :param check_columns: 讀到 header 後呼叫一次（可 raise ImportFileError）
+    """
+    reader = csv.DictReader(_text_stream(stream))
+    if reader.fieldnames is None:
+        return
+
+    # 還原匯出時的 formula injection 跳脫（'=...）
+    reader.fieldnames = [unescape_cell(c) for c in reader.fieldnames]
+
+    if check_columns is not None:
+        check_columns(reader.fieldnames)
+
+    for record in reader:
+        if None in record:
+            yield reader.line_num, None, "Too many columns"
+            continue
+        yield reader.line_num, {k: unescape_cell(v) for k, v in record.items()}, None
+
+
+def iter_jsonl_records(stream: BinaryIO) -> Iterator[tuple[int, Optional[dict], Optional[str]]]:
+    for line_no, line in enumerate(_text_stream(stream), start=1):
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_no, None, "Invalid JSON"
+            continue
+
+        if not isinstance(record, dict):
+            yield line_no, None, "Each line must be a JSON object"
+            continue
+
+        for key in NESTED_VALUE_KEYS:
+            nested = record.pop(key, None)
+            if isinstance(nested, dict):
+                record.update(nested)
+
+        yield line_no, record, None
+
+
+# ------------------------------------------------------------
+# Validation
+# ------------------------------------------------------------
+
+def _is_blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+class RowValidator:
+    """
+    單列驗證：email / notes + 答案（交給活動的 CompiledValidator，欄位以 field_key 或 label 對應）
+    """
+
+    def __init__(self, compiled: CompiledValidator):
+        self.compiled = compiled
+        self._reserved = frozenset(EMAIL_COLUMNS + NOTES_COLUMNS) | IGNORED_COLUMNS
+
+    def check_columns(self, columns: Sequence[str]) -> None:
+        """
+        CSV header：未知欄位屬於整份檔案的錯誤
+        """
+        unknown = [
+            c for c in columns
+            if c not in self._reserved and self.compiled.column(c) is None
+        ]
+        if unknown:
+            raise ImportFileError(f"Unknown columns: {', '.join(unknown)}")
+
+    def validate(self, record: dict) -> tuple[Optional[str], Optional[str], list[tuple[FieldRule, Any]], list[str]]:
+        """
+        :return: (email, notes, [(rule, value)], errors)
+        """
+        errors: list[str] = []
+
+        email = next((record[c] for c in EMAIL_COLUMNS if not _is_blank(record.get(c))), None)
+        if email is None:
+            errors.append("user_email: required")
+        else:
+            email = str(email).strip()
+            if not _EMAIL_RE.match(email):
+                errors.append("user_email: invalid email")
+
+        notes = record.get("notes")
+        notes = None if _is_blank(notes) else str(notes)
+
+        result = self.compiled.validate(
+            ((k, v) for k, v in record.items() if k not in self._reserved),
+            by_label=True,
+        )
+        errors.extend(result.errors)
+
+        return email, notes, result.values, errors
+
+
+# ------------------------------------------------------------
+# Staging（COPY）
+# ------------------------------------------------------------
+
+_STAGE_DDL = """
+CREATE TEMP TABLE import_submissions (
+    row_no integer NOT NULL,
+    uuid uuid NOT NULL,
+    submission_code text NOT NULL,
+    user_email text NOT NULL,
+    notes text,
+    token text
+) ON COMMIT DROP;
+
+CREATE TEMP TABLE import_values (
+    submission_uuid uuid NOT NULL,
+    event_field_uuid uuid NOT NULL,
+    field_key text NOT NULL,
+    value jsonb NOT NULL
+) ON COMMIT DROP;
+"""
+
+_COPY_SUBMISSIONS = (
+    "COPY import_submissions (row_no, uuid, submission_code, user_email, notes, token) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+_COPY_VALUES = (
+    "COPY import_values (submission_uuid, event_field_uuid, field_key, value) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+
+class _StageBuffer:
+    """
+    COPY 用的 CSV buffer（None → 未加引號的空欄位 → NULL）
+    """
+
+    def __init__(self):
+        self.file = tempfile.SpooledTemporaryFile(
+            max_size=SPOOL_MAX_BYTES,
+            mode="w+",
+            encoding="utf-8",
+            newline="",
+        )
+        self.writer = csv.writer(self.file)
+        self.rows = 0
+
+    def write(self, row: tuple) -> None:
+        self.writer.writerow(row)
+        self.rows += 1
+
+    def copy_into(self, cursor, sql: str) -> None:
+        self.file.seek(0)
+        cursor.copy_expert(sql, self.file)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _CodeBlock:
+    """
+    submission_code：一次預留 CODE_BLOCK_SIZE 個號碼（與線上報名共用同一序列）
+    """
+
+    def __init__(self, event_uuid: UUID, event_code: str):
+        self.event_uuid = str(event_uuid)
+        self.event_code = event_code
+        self.next = self.end = 0
+
+    def allocate(self) -> str:
+        if self.next >= self.end:
+            self.next = reserve_block(self.event_uuid, CODE_BLOCK_SIZE)
+            self.end = self.next + CODE_BLOCK_SIZE
+
+        value = self.next
+        self.next += 1
+        return format_submission_code(self.event_code, value)
+
+
+# ------------------------------------------------------------
+# Merge（set-based）
+# ------------------------------------------------------------
+
+_DEDUPE_IN_FILE = """
+DELETE FROM import_submissions s
+USING import_submissions d
+WHERE lower(s.user_email) = lower(d.user_email)
+  AND s.row_no > d.row_no
+RETURNING s.row_no
+"""
+
+_DEDUPE_EXISTING = """
+DELETE FROM import_submissions s
+USING submissions x
+WHERE x.event_uuid = :event_uuid
+  AND x.is_deleted = false
+  AND lower(x.user_email) = lower(s.user_email)
+RETURNING s.row_no
+"""
+
+_MERGE_SUBMISSIONS = """
+INSERT INTO submissions (
+    uuid, submission_code, event_uuid, user_email, status, notes,
+    submitted_at, extra_data, is_active, is_deleted, version
+)
+SELECT
+    s.uuid, s.submission_code, :event_uuid, s.user_email,
+    CAST(:status AS submission_status), s.notes,
+    now(), CAST(:extra_data AS jsonb), true, false, 1
+FROM import_submissions s
+ORDER BY s.row_no
+"""
+
+# answer document（dual / document 模式）：每筆報名的答案聚合成一個 JSONB
+_MERGE_SUBMISSIONS_WITH_ANSWERS = """
+INSERT INTO submissions (
+    uuid, submission_code, event_uuid, user_email, status, notes,
+    submitted_at, extra_data, answers, answers_version, is_active, is_deleted, version
+)
+SELECT
+    s.uuid, s.submission_code, :event_uuid, s.user_email,
+    CAST(:status AS submission_status), s.notes,
+    now(), CAST(:extra_data AS jsonb), coalesce(a.answers, '{}'::jsonb), :answers_version,
+    true, false, 1
+FROM import_submissions s
+LEFT JOIN (
+    SELECT submission_uuid, jsonb_object_agg(field_key, value) AS answers
+      FROM import_values
+     GROUP BY submission_uuid
+) a ON a.submission_uuid = s.uuid
+ORDER BY s.row_no
+"""
+
+_MERGE_VALUES = """
+INSERT INTO submission_values (
+    uuid, submission_uuid, event_field_uuid, field_key, value,
+    is_active, is_deleted, version
+)
+SELECT
+    gen_random_uuid(), v.submission_uuid, v.event_field_uuid, v.field_key, v.value,
+    true, false, 1
+FROM import_values v
+JOIN import_submissions s ON s.uuid = v.submission_uuid
+"""
+
+_MERGE_VERIFICATIONS = """
+INSERT INTO email_verifications (
+    uuid, ref_type, ref_uuid, email, token, expires_at, is_used,
+    is_active, is_deleted, version
+)
+SELECT
+    gen_random_uuid(), 'submission', s.uuid, s.user_email, s.token, :expires_at, false,
+    true, false, 1
+FROM import_submissions s
+"""
+
+_MERGE_OUTBOX = """
+INSERT INTO email_outbox (
+    uuid, to_email, recipient_domain, subject, html, category, ref_type, ref_uuid,
+    status, attempts, next_attempt_at, is_active, is_deleted, version
+)
+SELECT
+    gen_random_uuid(), s.user_email, lower(substring(s.user_email from '[^@]*$')),
+    :subject, replace(:html, :placeholder, s.token), 'submission.verification',
+    'submission', s.uuid,
+    'pending', 0, now(), true, false, 1
+FROM import_submissions s
+"""
+
+
+# ------------------------------------------------------------
+# Import
+# ------------------------------------------------------------
+
+def import_submissions(
+    db: Session,
+    *,
+    event_uuid: UUID,
+    event_code: str,
+    stream: BinaryIO,
+    fmt: str = "csv",
+    skip_verification: bool = False,
+    dedupe: bool = True,
+    max_rows: Optional[int] = None,
+    max_errors: Optional[int] = None,
+) -> ImportReport:
+    """
+    匯入報名（不 commit；呼叫端 commit 後需喚醒 outbox worker）
+
+    - skip_verification=True：直接視為已驗證（status=email_verified），不寄驗證信
+    - dedupe=True：同一檔案內重複 email 只取第一列；活動內已報名的 email 略過
+
+    :raises ImportFileError: 檔案格式錯誤 / 超過筆數上限
+    """
+    max_rows = max_rows or settings.SUBMISSION_IMPORT_MAX_ROWS
+    max_errors = max_errors or settings.SUBMISSION_IMPORT_MAX_ERRORS
+
+    report = ImportReport(batch_id=uuid4().hex)
+    compiled = get_validator(db, event_uuid)
+    if compiled is None:
+        raise ImportFileError("Event not found")
+    validator = RowValidator(compiled)
+    codes = _CodeBlock(event_uuid, event_code)
+
+    if fmt == "csv":
+        records = iter_csv_records(stream, validator.check_columns)
+    elif fmt == "jsonl":
+        records = iter_jsonl_records(stream)
+    else:
+        raise ImportFileError(f"Unsupported format: {fmt}")
+
+    submissions_buffer = _StageBuffer()
+    values_buffer = _StageBuffer()
+
+    try:
+        # --------------------------------------------------------
+        # 1. Streaming pass：parse → validate → staging buffer
+        # --------------------------------------------------------
+        try:
+            for row_no, record, parse_error in records:
+                report.total_rows += 1
+                if report.total_rows > max_rows:
+                    raise ImportFileError(f"Too many rows (max {max_rows})")
+
+                if parse_error is not None:
+                    report.failed += 1
+                    report.add_error(row_no, [parse_error], limit=max_errors)
+                    continue
+
+                email, notes, values, errors = validator.validate(record)
+                if errors:
+                    report.failed += 1
+                    report.add_error(row_no, errors, limit=max_errors)
+                    continue
+
+                submission_uuid = uuid4()
+                token = None if skip_verification else uuid4().hex
+
+                submissions_buffer.write(
+                    (row_no, submission_uuid, codes.allocate(), email, notes, token)
+                )
+                for rule, value in values:
+                    values_buffer.write(
+                        (submission_uuid, rule.uuid, rule.field_key, json.dumps(value, ensure_ascii=False))
+                    )
+        except UnicodeDecodeError:
+            raise ImportFileError("File must be UTF-8 encoded")
+        except csv.Error as exc:
+            raise ImportFileError(f"Malformed CSV: {exc}")
+
+        if not submissions_buffer.rows:
+            return report
+
+        # --------------------------------------------------------
+        # 2. COPY → temp tables
+        # --------------------------------------------------------
+        db.execute(text(_STAGE_DDL))
+
+        raw = db.connection().connection
+        with raw.cursor() as cursor:
+            submissions_buffer.copy_into(cursor, _COPY_SUBMISSIONS)
+            values_buffer.copy_into(cursor, _COPY_VALUES)
+
+        # temp table 不會被 autovacuum ANALYZE；給 planner 正確的筆數
+        db.execute(text("ANALYZE import_submissions"))
+        db.execute(text("ANALYZE import_values"))
+
+        # --------------------------------------------------------
+        # 3. Dedupe（在 staging 內刪除，回報被略過的列）
+        # --------------------------------------------------------
+        if dedupe:
+            in_file = sorted(set(db.execute(text(_DEDUPE_IN_FILE)).scalars()))
+            for row_no in in_file:
+                report.add_error(row_no, ["user_email: duplicate in file"], limit=max_errors)
+
+            existing = sorted(set(
+                db.execute(text(_DEDUPE_EXISTING), {"event_uuid": event_uuid}).scalars()
+            ))
+            for row_no in existing:
+                report.add_error(row_no, ["user_email: already registered"], limit=max_errors)
+
+            report.duplicates = len(in_file) + len(existing)
+
+        # --------------------------------------------------------
+        # 4. Merge
+        # --------------------------------------------------------
+        report.imported = db.execute(
+            text(_MERGE_SUBMISSIONS_WITH_ANSWERS if WRITE_DOCUMENT else _MERGE_SUBMISSIONS),
+            {
+                "event_uuid": event_uuid,
+                "status": "email_verified" if skip_verification else "pending",
+                "extra_data": json.dumps({"import_batch": report.batch_id}),
+                "answers_version": compiled.version,
+            },
+        ).rowcount
+
+        if WRITE_VALUES:
+            db.execute(text(_MERGE_VALUES))
+
+        if report.imported:
+            record_submissions(db, "SELECT uuid FROM import_submissions")
+
+        if not skip_verification and report.imported:
+            db.execute(
+                text(_MERGE_VERIFICATIONS),
+                {
+                    "expires_at": datetime.now(timezone.utc)
+                    + timedelta(hours=settings.SUBMISSION_IMPORT_VERIFICATION_TTL_HOURS),
+                },
+            )
+            report.verification_emails = db.execute(
+                text(_MERGE_OUTBOX),
+                {
+                    "subject": VERIFICATION_SUBJECT,
+                    "html": verification_html_template(TOKEN_PLACEHOLDER),
+                    "placeholder": TOKEN_PLACEHOLDER,
+                },
+            ).rowcount
+
+        report.errors.sort(key=lambda e: e[0])
+        return report
+    finally:
+        submissions_buffer.close()
+        values_buffer.close()
@@ -1,9 +1,11 @@
 # app/services/submission/notification.py
 
+from typing import Sequence
+
 from sqlalchemy.orm import Session
 
 from app.models.submission.submission import Submission
-from app.api.utils.email_mailer import send_generic_email
+from app.services.email.outbox import enqueue_email, enqueue_emails
 from app.api.utils.email_templates import (
     submission_rejected_email,
     submission_reopened_email,
@@ -16,8 +18,12 @@ from app.core.config import settings
 # Submission Notification Service
 # ============================================================
 # 責任：
-# - 處理 submission 狀態變更後的 email side effects
+# - 處理 submission 狀態變更的 email side effects
+# - 只寫入 email outbox（不 commit），由狀態變更的 command 一起 commit；
+#   實際寄送由 outbox worker 負責，不佔用 request 時間
 # - 不修改狀態
+# - submission：ORM 物件或 transition_submission() 的 RETURNING row
+#   （只用到 uuid / user_email / status_reason / notes）
 # - 不處理權限
 # - 不拋 HTTP exception
 # ============================================================
@@ -41,14 +47,18 @@ def notify_submission_rejected(
         return
 
     subject, body = submission_rejected_email(
-        project_name=settings.PROJECT_NAME,
+        project_name=settings.APP_NAME,
         reason=submission.status_reason or "未提供具體原因",
     )
 
-    send_generic_email(
+    enqueue_email(
+        db,
         to_email=submission.user_email,
         subject=subject,
         html=body,
+        category="submission.rejected",
+        ref_type="submission",
+        ref_uuid=submission.uuid,
     )
 
 # ============================================================
@@ -71,14 +81,18 @@ def notify_submission_reopened(
         return
 
     subject, body = submission_reopened_email(
-        project_name=settings.PROJECT_NAME,
+        project_name=settings.APP_NAME,
         note=submission.notes or "請登入系統查看最新狀態",
     )
 
-    send_generic_email(
+    enqueue_email(
+        db,
         to_email=submission.user_email,
         subject=subject,
         html=body,
+        category="submission.reopened",
+        ref_type="submission",
+        ref_uuid=submission.uuid,
     )
 
 
@@ -102,11 +116,73 @@ def notify_submission_completed(
         return
 
     subject, body = submission_completed_email(
-        project_name=settings.PROJECT_NAME,
+        project_name=settings.APP_NAME,
     )
 
-    send_generic_email(
+    enqueue_email(
+        db,
         to_email=submission.user_email,
         subject=subject,
         html=body,
+        category="submission.completed",
+        ref_type="submission",
+        ref_uuid=submission.uuid,
     )
+
+
+# ============================================================
+# Bulk Notification（bulk approve / reject）
+# ============================================================
+
+def _render(target: str, submission) -> tuple[str, str]:
+    if target == "completed":
+        return submission_completed_email(
+            project_name=settings.APP_NAME,
+        )
+    if target == "rejected":
+        return submission_rejected_email(
+            project_name=settings.APP_NAME,
+            reason=submission.status_reason or "未提供具體原因",
+        )
+    return submission_reopened_email(
+        project_name=settings.APP_NAME,
+        note=submission.notes or "請登入系統查看最新狀態",
+    )
+
+
+def notify_submissions_bulk(
+    *,
+    db: Session,
+    submissions: Sequence,
+    target: str,
+) -> int:
+    """
+    批次通知（一次 bulk INSERT 寫入 outbox）
+
+    使用時機：
+    - Organizer bulk approve / reject
+
+    同一批的內容通常相同（同一個 reason），只 render 一次
+    """
+    rendered: dict[tuple, tuple[str, str]] = {}
+    messages = []
+
+    for submission in submissions:
+        if not submission.user_email:
+            continue
+
+        key = (submission.status_reason, submission.notes)
+        if key not in rendered:
+            rendered[key] = _render(target, submission)
+        subject, body = rendered[key]
+
+        messages.append({
+            "to_email": submission.user_email,
+            "subject": subject,
+            "html": body,
+            "category": f"submission.{target}",
+            "ref_type": "submission",
+            "ref_uuid": submission.uuid,
+        })
+
+    return enqueue_emails(db, messages)
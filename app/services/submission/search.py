@@ -0,0 +1,83 @@
+# app/services/submission/search.py ← Organizer 報名搜尋（pg_trgm）
+
+"""
+Submission search
+
+說明：
+- 搜尋範圍（皆為 GIN (event_uuid, 運算式 gin_trgm_ops)，btree_gin；寫入時由 PostgreSQL 自動維護）：
+  - lower(user_email)              ix_submissions_email_trgm
+  - lower(submission_code)         ix_submissions_code_trgm
+  - submission_answer_text(answers) ix_submissions_answers_trgm
+    （answer document 所有值串成小寫文字：姓名 / 電話 / 自訂欄位）
+  - event_uuid 與 trigram 條件在同一個 index 內交集 → 只掃描該活動的報名（不會產生全表 bitmap）
+- 比對：子字串（LIKE '%q%'，部分 email / 電話）或 word similarity（q <% 欄位，拼錯的姓名）
+  - 未滿 3 個字的查詢：LIKE '%q%' 取不出 trigram（index 只能逐筆 recheck 整個活動）
+    → 只用 word similarity（q 會補空白成 trigram，可走 index），相當於比對字首（"am" → "amy"）
+- 排序：三個欄位 word_similarity 的最大值 → 較新的報名
+- ⚠️ 答案搜尋依賴 submissions.answers；SUBMISSION_ANSWER_STORAGE = values 時只搜尋 email / 編號
+  （見 app/services/submission/answers.py）
+"""
+
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import String, func, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.submission.submission import Submission
+
+
+MIN_QUERY_LENGTH = 2
+# 子字串比對（LIKE）需要至少一個完整 trigram 才能由 index 篩選
+SUBSTRING_MIN_LENGTH = 3
+
+# 與 migration 的 index 運算式相同（planner 依運算式比對 index）
+SEARCH_COLUMNS = (
+    func.lower(Submission.user_email),
+    func.lower(Submission.submission_code),
+    func.submission_answer_text(Submission.answers),
+)
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search_submissions(
+    db: Session,
+    event_uuid: UUID,
+    q: str,
+    *,
+    limit: int = 20,
+    options: Sequence = (),
+) -> list[tuple[Submission, float]]:
+    """
+    回傳 [(submission, score)]（score 0 ~ 1，高者在前）；查詢字串過短 → []
+    """
+    term = " ".join(q.split()).lower()
+    if len(term) < MIN_QUERY_LENGTH:
+        return []
+
+    needle = literal(term, String)
+    pattern = _like_pattern(term)
+
+    score = func.greatest(*(func.word_similarity(needle, column) for column in SEARCH_COLUMNS))
+    conditions = [needle.op("<%")(column) for column in SEARCH_COLUMNS]
+    if len(term) >= SUBSTRING_MIN_LENGTH:
+        conditions += [column.like(pattern, escape="\\") for column in SEARCH_COLUMNS]
+    matches = or_(*conditions)
+
+    statement = (
+        select(Submission, score.label("score"))
+        .where(
+            Submission.event_uuid == event_uuid,
+            Submission.is_deleted == False,
+            matches,
+        )
+        .order_by(score.desc(), Submission.created_at.desc(), Submission.id.desc())
+        .limit(limit)
+        .options(*options)
+    )
+
+    return [(submission, float(s or 0)) for submission, s in db.execute(statement)]
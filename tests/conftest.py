@@ -2,10 +2,41 @@
 
 import os
 import pytest
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.core.db import SessionLocal
+from app.core.query_stats import observe_queries
+from app.models.organizer.organizer import Organizer
+from app.models.event.event import Event
+from app.models.event.event_field import EventField
+from app.models.submission.submission import Submission
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="執行 @pytest.mark.benchmark 的效能量測（預設略過）",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: 效能量測（wall-clock），需加 --run-benchmarks")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+
+    skip = pytest.mark.skip(reason="benchmark：加上 --run-benchmarks 執行")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -29,3 +60,76 @@ def client():
     # TestClient 會保留 cookie，適合測 session/cookie auth
     return TestClient(app)
 
+
+@pytest.fixture
+def published_event(db):
+    """
+    建立一個有報名資料的已發布活動（測試結束後清除）
+    """
+    organizer = Organizer(uuid=uuid4(), name="Fixture Organizer", status="approved")
+    db.add(organizer)
+    db.flush()
+
+    now = datetime.now(timezone.utc)
+    event = Event(
+        uuid=uuid4(),
+        event_code=f"EVT-{uuid4().hex[:8]}",
+        name="Fixture Event",
+        status="published",
+        organizer_uuid=organizer.uuid,
+        start_date=now,
+        end_date=now + timedelta(days=1),
+    )
+    db.add(event)
+    db.flush()
+
+    db.add(
+        EventField(
+            uuid=uuid4(),
+            event_uuid=event.uuid,
+            field_key="name",
+            label="Name",
+            field_type="text",
+        )
+    )
+    for i in range(3):
+        db.add(
+            Submission(
+                uuid=uuid4(),
+                submission_code=f"SUB-{i}",
+                event_uuid=event.uuid,
+                user_email=f"p{i}@example.com",
+            )
+        )
+    db.commit()
+
+    yield event
+
+    db.delete(event)
+    db.delete(organizer)
+    db.commit()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    斷言區塊內的 SQL 數量不超過預算，且沒有 N+1
+
+    Usage:
+        with query_budget(2):
+            client.get("/public/events")
+    """
+
+    @contextmanager
+    def _budget(max_queries: int, *, max_repeats: int = 3):
+        with observe_queries(n_plus_one_threshold=max_repeats + 1) as stats:
+            yield stats
+
+        assert stats.statements <= max_queries, (
+            f"Query budget exceeded ({max_queries}):\n{stats.describe()}"
+        )
+        assert not stats.n_plus_one(), (
+            f"N+1 query pattern detected:\n{stats.describe()}"
+        )
+
+    return _budget
@@ -0,0 +1,183 @@
+# tests/test_answer_storage.py
+
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import noload, selectinload
+
+from app.models.event.event_field import EventField
+from app.models.submission.submission import Submission
+from app.models.submission.submission_value import SubmissionValue
+from app.schemas.submission.submission_response import SubmissionResponse
+from app.services.submission.answers import (
+    READ_DOCUMENT,
+    STORAGE,
+    STORAGE_MODES,
+    WRITE_DOCUMENT,
+    WRITE_VALUES,
+    answer_document,
+    backfill_answers,
+)
+
+
+def test_storage_mode_flags():
+    assert STORAGE in STORAGE_MODES
+    # 任何模式至少寫入一種格式；document 讀取時必定有寫 document
+    assert WRITE_VALUES or WRITE_DOCUMENT
+    assert not READ_DOCUMENT or WRITE_DOCUMENT
+
+
+def test_answer_document_keys_by_field_key():
+    values = [
+        (SimpleNamespace(field_key="name"), "Amy"),
+        (SimpleNamespace(field_key="sizes"), ["S", "M"]),
+        (SimpleNamespace(field_key="age"), None),
+    ]
+    assert answer_document(values) == {"name": "Amy", "sizes": ["S", "M"], "age": None}
+
+
+def test_response_values_from_answer_document():
+    """
+    document 模式不載入 value rows：values 依欄位順序由 answers 展開（刪除欄位的 key 不輸出）
+    """
+    name = SimpleNamespace(uuid=uuid4(), field_key="name", field_type="text")
+    sizes = SimpleNamespace(uuid=uuid4(), field_key="sizes", field_type="checkbox")
+    submission = {
+        "uuid": uuid4(),
+        "submission_code": "SUB-1",
+        "event_uuid": uuid4(),
+        "user_email": "p1@example.com",
+        "answers": {"sizes": ["S"], "name": "Amy", "removed": "x"},
+    }
+
+    response = SubmissionResponse.model_validate(submission, context={"answer_fields": [name, sizes]})
+    assert [(v.uuid, v.field_uuid, v.field_type, v.value) for v in response.values] == [
+        (None, name.uuid, "text", "Amy"),
+        (None, sizes.uuid, "checkbox", ["S"]),
+    ]
+
+    # 沒有 context（values / dual 模式）→ 維持原本的 values
+    assert SubmissionResponse.model_validate(submission).values == []
+
+
+def test_backfill_builds_document_from_values(db, published_event):
+    submissions = db.query(Submission).filter(Submission.event_uuid == published_event.uuid).order_by(Submission.id).all()
+    field_uuid = published_event.fields[0].uuid
+    for i, submission in enumerate(submissions):
+        submission.answers = None
+        db.add(SubmissionValue(submission_uuid=submission.uuid, event_field_uuid=field_uuid, field_key="name", value=f"user {i}"))
+    db.flush()
+
+    after_id, updated = 0, 0
+    while True:
+        after_id, n = backfill_answers(db, after_id=after_id, batch_size=2)
+        if not after_id:
+            break
+        updated += n
+    db.commit()
+
+    assert updated >= len(submissions)
+    for i, submission in enumerate(submissions):
+        db.refresh(submission)
+        assert submission.answers == {"name": f"user {i}"}
+        assert submission.answers_version == published_event.fields_version
+
+    # document 與 @> 查詢（GIN index）
+    found = db.execute(select(Submission.id).where(Submission.answers.contains({"name": "user 1"}))).scalars().all()
+    assert found == [submissions[1].id]
+
+
+def test_read_cost_values_vs_document(db, published_event, query_budget):
+    """
+    報名列表讀取答案：EAV（submission + values 兩條查詢、每欄一列）vs document（一條查詢）
+    """
+    submissions = db.query(Submission).filter(Submission.event_uuid == published_event.uuid).all()
+    field_uuid = published_event.fields[0].uuid
+    for i, submission in enumerate(submissions):
+        submission.answers = None
+        db.add(SubmissionValue(submission_uuid=submission.uuid, event_field_uuid=field_uuid, field_key="name", value=f"user {i}"))
+    db.flush()
+    after_id = 0
+    while True:
+        after_id, _ = backfill_answers(db, after_id=after_id, batch_size=1000)
+        if not after_id:
+            break
+    db.commit()
+    uuids = [s.uuid for s in submissions]
+
+    base = select(Submission).where(Submission.uuid.in_(uuids))
+
+    def _read(options, answers):
+        db.expire_all()
+        started = time.perf_counter()
+        rows = db.execute(base.options(*options)).scalars().all()
+        result = [answers(s) for s in rows]
+        return result, time.perf_counter() - started
+
+    with query_budget(2):
+        eav, eav_elapsed = _read(
+            (selectinload(Submission.values),),
+            lambda s: {v.field_key: v.value for v in s.values if not v.is_deleted},
+        )
+    with query_budget(1):
+        doc, doc_elapsed = _read((noload(Submission.values),), lambda s: s.answers or {})
+
+    assert doc == eav
+    print(f"\nvalues: {eav_elapsed * 1e3:.2f} ms / document: {doc_elapsed * 1e3:.2f} ms ({len(uuids)} submissions)")
+
+
+@pytest.mark.benchmark
+def test_insert_cost_values_vs_document(db, published_event):
+    """
+    報名寫入：EAV（submission + 每欄一列 submission_values）vs document（submission 一列）
+    """
+    submissions, field_count = 500, 10
+    fields = [
+        EventField(uuid=uuid4(), event_uuid=published_event.uuid, field_key=f"f{i}", label=f"F{i}", field_type="text")
+        for i in range(field_count)
+    ]
+    db.add_all(fields)
+    db.commit()
+
+    def _insert(document: bool) -> float:
+        started = time.perf_counter()
+        for i in range(submissions):
+            answers = {f.field_key: f"answer {i} {f.field_key}" for f in fields}
+            submission = Submission(
+                uuid=uuid4(),
+                submission_code=f"BENCH-{'D' if document else 'V'}-{i}",
+                event_uuid=published_event.uuid,
+                user_email=f"bench{i}@example.com",
+                answers=answers if document else None,
+            )
+            db.add(submission)
+            if not document:
+                db.add_all(
+                    SubmissionValue(submission_uuid=submission.uuid, event_field_uuid=f.uuid, field_key=f.field_key, value=answers[f.field_key])
+                    for f in fields
+                )
+        db.flush()
+        elapsed = time.perf_counter() - started
+
+        inserted = db.execute(
+            select(func.count(Submission.id)).where(Submission.submission_code.like(f"BENCH-{'D' if document else 'V'}-%"))
+        ).scalar()
+        assert inserted == submissions
+        db.rollback()
+        return elapsed
+
+    eav_elapsed = _insert(document=False)
+    doc_elapsed = _insert(document=True)
+
+    print(
+        f"\nvalues: {eav_elapsed * 1e3:.2f} ms ({submissions * (field_count + 1)} rows)"
+        f" / document: {doc_elapsed * 1e3:.2f} ms ({submissions} rows)"
+        f" — {submissions} submissions × {field_count} fields"
+    )
+
+    for field in fields:
+        db.delete(field)
+    db.commit()
@@ -0,0 +1,123 @@
+# tests/test_conditional.py
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from starlette.requests import Request
+
+from app.core.conditional import (
+    PUBLIC_CACHE_CONTROL,
+    http_date,
+    resource_validators,
+    strong_etag,
+)
+from app.services.event.snapshot import PublishedSnapshot, snapshot_cache, snapshot_response
+
+
+BUILT_AT = datetime(2026, 3, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+
+
+def _request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def test_etag_is_strong_and_changes_with_version():
+    etag = strong_etag("event.public", "abc", 1)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == strong_etag("event.public", "abc", 1)
+    assert etag != strong_etag("event.public", "abc", 2)
+    assert etag != strong_etag("event.detail", "abc", 1)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    validators = resource_validators("event.public", "abc", 3, last_modified=BUILT_AT)
+    etag = validators.etag
+
+    assert validators.is_fresh(_request(if_none_match=etag))
+    assert validators.is_fresh(_request(if_none_match=f'"other", W/{etag}'))
+    assert validators.is_fresh(_request(if_none_match="*"))
+
+    # ETag 不符時即使時間較新也不可回 304
+    assert not validators.is_fresh(_request(
+        if_none_match='"other"',
+        if_modified_since=http_date(BUILT_AT + timedelta(days=1)),
+    ))
+
+
+def test_if_modified_since_uses_second_precision():
+    validators = resource_validators("event.public", "abc", 3, last_modified=BUILT_AT)
+
+    assert validators.is_fresh(_request(if_modified_since=http_date(BUILT_AT)))
+    assert not validators.is_fresh(_request(if_modified_since=http_date(BUILT_AT - timedelta(seconds=1))))
+    assert not validators.is_fresh(_request(if_modified_since="not a date"))
+    assert not validators.is_fresh(_request())
+
+
+@pytest.mark.parametrize("path, view", [
+    ("/public/events/{event_uuid}", "public"),
+    ("/events/{event_uuid}", "detail"),
+    ("/events/{event_uuid}/schedule", "schedule"),
+])
+def test_snapshot_routes_revalidate_without_queries(client, query_budget, path, view):
+    event_uuid = uuid4()
+    snapshot = PublishedSnapshot(
+        event_uuid=str(event_uuid),
+        version=5,
+        public=b'{"view": "public"}',
+        detail=b'{"view": "detail"}',
+        schedule=b'[{"view": "schedule"}]',
+        built_at=BUILT_AT,
+    )
+    snapshot_cache.put(str(event_uuid), snapshot)
+    url = path.format(event_uuid=event_uuid)
+
+    try:
+        with query_budget(0):
+            first = client.get(url)
+            revalidated = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    finally:
+        snapshot_cache.invalidate(str(event_uuid))
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == PUBLIC_CACHE_CONTROL
+    assert first.headers["last-modified"] == http_date(BUILT_AT)
+
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == first.headers["etag"]
+
+
+def test_snapshot_builds_never_share_an_etag():
+    """
+    同一活動、同一版本號但不同次建置（例如版本曾被重設）→ ETag 不同，舊 ETag 不會得到 304
+    """
+    event_uuid = str(uuid4())
+
+    def _build(version, built_at, body):
+        return PublishedSnapshot(
+            event_uuid=event_uuid, version=version,
+            public=body, detail=body, schedule=body, built_at=built_at,
+        )
+
+    first = _build(1, BUILT_AT, b'{"name": "first"}')
+    rebuilt = _build(1, BUILT_AT + timedelta(days=30), b'{"name": "relaunch"}')
+    later = _build(2, BUILT_AT + timedelta(days=30), b'{"name": "relaunch"}')
+
+    etags = {
+        snapshot_response(_request(), s, view).headers["etag"]
+        for s in (first, rebuilt, later)
+        for view in ("public", "detail", "schedule")
+    }
+    assert len(etags) == 9
+
+    old_etag = snapshot_response(_request(), first, "public").headers["etag"]
+    assert snapshot_response(_request(if_none_match=old_etag), rebuilt, "public").status_code == 200
+    assert snapshot_response(_request(if_none_match=old_etag), first, "public").status_code == 304
@@ -0,0 +1,73 @@
+# tests/test_dashboard_rollup.py
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.crud.submission.crud_submission_status import transition_submission
+from app.models.submission.submission import Submission
+from app.services.organizer.dashboard_rollup import load_dashboard_series, refresh_dashboard_rollups
+
+
+class _RowsSession:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, statement):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+def _bucket(granularity, bucket_start, created, paid=0):
+    return SimpleNamespace(
+        granularity=granularity,
+        bucket_start=bucket_start,
+        created_count=created,
+        verified_count=paid,
+        paid_count=paid,
+        completed_count=0,
+    )
+
+
+def test_series_fills_gaps_and_sums_rolling_week():
+    now = datetime(2026, 3, 10, 15, 42, tzinfo=timezone.utc)
+    hour = now.replace(minute=0)
+    db = _RowsSession([
+        _bucket("hour", hour, 2, paid=1),
+        _bucket("hour", hour - timedelta(days=3), 5),
+        _bucket("day", hour.replace(hour=0), 2, paid=1),
+    ])
+
+    series = load_dashboard_series(db, uuid4(), days=7, now=now)
+
+    assert series["last_7_days"] == {"created": 7, "verified": 1, "paid": 1, "completed": 0}
+    assert len(series["daily"]) == 7 and len(series["hourly"]) == 24
+    assert series["daily"][-1]["created"] == 2
+    assert series["daily"][0] == {
+        "bucket_start": datetime(2026, 3, 4, tzinfo=timezone.utc),
+        "created": 0, "verified": 0, "paid": 0, "completed": 0,
+    }
+    assert series["hourly"][-1]["bucket_start"] == hour
+
+
+def test_refresh_follows_status_changes(db, published_event):
+    assert refresh_dashboard_rollups(db, full=True) is not None
+    db.commit()
+
+    series = load_dashboard_series(db, published_event.organizer_uuid)
+    assert series["last_7_days"]["created"] == 3
+    assert series["last_7_days"]["verified"] == 0
+
+    submission = db.query(Submission).filter(Submission.event_uuid == published_event.uuid).first()
+    assert transition_submission(db, submission.uuid, "email_verified").ok
+    db.commit()
+
+    # 增量：只重算受影響的 bucket
+    assert refresh_dashboard_rollups(db) >= 1
+    db.commit()
+
+    series = load_dashboard_series(db, published_event.organizer_uuid)
+    assert series["last_7_days"]["verified"] == 1
+    assert sum(point["created"] for point in series["daily"]) == 3
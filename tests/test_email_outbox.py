@@ -0,0 +1,71 @@
+# tests/test_email_outbox.py
+
+from sqlalchemy.orm import Session
+
+from app.services.email import outbox_worker
+from app.services.email.outbox import _schedule_wake
+from app.services.email.outbox_worker import DomainRateLimiter, OutboxWorker
+from app.services.email.transport import EmailMessage, MemoryTransport
+
+
+def _message(to_email: str) -> EmailMessage:
+    return EmailMessage(to_email=to_email, subject="s", html="<p>h</p>")
+
+
+def test_domain_rate_limiter_defers_after_burst():
+    now = [0.0]
+    limiter = DomainRateLimiter(
+        rate_per_minute=6,
+        overrides={"Example.com": 60},
+        clock=lambda: now[0],
+    )
+
+    # 6/min → burst 1
+    assert limiter.acquire("slow.test") == 0
+    assert limiter.acquire("slow.test") > 0
+
+    # 60/min → burst 10，不影響其他網域
+    for _ in range(10):
+        assert limiter.acquire("example.com") == 0
+    assert limiter.acquire("example.com") > 0
+
+    now[0] += 10
+    assert limiter.acquire("slow.test") == 0
+
+
+def test_backoff_grows_and_is_capped():
+    worker = OutboxWorker(
+        transport=MemoryTransport(),
+        retry_base_seconds=10,
+        retry_max_seconds=100,
+    )
+
+    assert 5 <= worker.backoff(1) <= 10
+    assert 20 <= worker.backoff(3) <= 40
+    assert 50 <= worker.backoff(10) <= 100
+
+
+def test_deliver_chunks_by_transport_batch_size():
+    transport = MemoryTransport()
+    transport.max_batch_size = 2
+    worker = OutboxWorker(transport=transport)
+
+    results = worker._deliver([_message(f"u{i}@example.com") for i in range(5)])
+
+    assert all(r.ok for r in results)
+    assert len(transport.outbox) == 5
+    assert worker.stats()["batches"] == 3
+
+
+
+def test_wake_fires_on_every_commit_of_a_session(monkeypatch):
+    wakes = []
+    monkeypatch.setattr(outbox_worker, "wake_outbox_worker", lambda: wakes.append(1))
+
+    db = Session()
+    for _ in range(2):
+        _schedule_wake(db)
+        db.commit()
+    db.commit()   # 沒有排入信件 → 不喚醒
+
+    assert len(wakes) == 2
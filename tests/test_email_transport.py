@@ -0,0 +1,93 @@
+# tests/test_email_transport.py
+
+import asyncio
+import json
+import time
+
+import httpx
+
+from app.api.utils import email_mailer
+from app.services.email import transport as transport_module
+from app.services.email.transport import (
+    BlackholeTransport,
+    EmailMessage,
+    FileTransport,
+    MemoryTransport,
+    ResendTransport,
+)
+
+
+def _message(to_email: str = "user@example.com") -> EmailMessage:
+    return EmailMessage(to_email=to_email, subject="s", html="<p>h</p>")
+
+
+def _resend(handler) -> ResendTransport:
+    transport = ResendTransport(api_key="k", from_email="noreply@example.com")
+    transport._client = httpx.Client(
+        base_url=ResendTransport.BASE_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    return transport
+
+
+def test_send_generic_email_uses_process_transport(monkeypatch):
+    memory = MemoryTransport()
+    monkeypatch.setattr(transport_module, "_transport", memory)
+
+    result = email_mailer.send_generic_email(to_email="a@example.com", subject="s", html="h")
+
+    assert result["id"].startswith("memory-")
+    assert [m.to_email for m in memory.outbox] == ["a@example.com"]
+    assert memory.stats()["messages"] == 1
+
+
+def test_blackhole_injects_latency_sync_and_async():
+    blackhole = BlackholeTransport(latency=0.02)
+
+    started = time.perf_counter()
+    assert blackhole.send(_message()).ok
+    assert asyncio.run(blackhole.asend(_message())).ok
+    assert time.perf_counter() - started >= 0.04
+
+    stats = blackhole.stats()
+    assert stats["calls"] == 2
+    assert stats["latency_histogram"]["le_25ms"] + stats["latency_histogram"]["le_50ms"] == 2
+
+
+def test_file_transport_writes_one_file_per_message(tmp_path):
+    transport = FileTransport(str(tmp_path))
+
+    results = transport.send_batch([_message("a@example.com"), _message("b@example.com")])
+
+    assert all(r.ok for r in results)
+    files = sorted(tmp_path.iterdir())
+    assert len(files) == 2
+    assert {json.loads(f.read_text())["to_email"] for f in files} == {"a@example.com", "b@example.com"}
+
+
+def test_resend_batch_falls_back_to_single_sends_on_validation_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/emails/batch" or b"bad@" in request.content:
+            return httpx.Response(422, json={"message": "invalid to"})
+        return httpx.Response(200, json={"id": "msg-1"})
+
+    transport = _resend(handler)
+
+    results = transport.send_batch([_message("ok@example.com"), _message("bad@")])
+
+    assert results[0].ok and results[0].message_id == "msg-1"
+    assert not results[1].ok and not results[1].retryable
+    assert transport.stats()["errors"] == {"client_error": 2}
+
+
+def test_resend_classifies_retryable_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, json={"message": "slow down"})
+
+    transport = _resend(handler)
+
+    results = transport.send_batch([_message(), _message()])
+
+    assert all(not r.ok and r.retryable for r in results)
+    assert transport.stats()["errors"] == {"rate_limited": 1}
+    assert transport.stats()["failed_messages"] == 2
@@ -0,0 +1,77 @@
+# tests/test_event_report.py
+
+from collections import Counter
+
+from app.core.db import SessionLocal
+from app.crud.submission.crud_submission_status import transition_submission
+from app.models.submission.submission import Submission
+from app.services.event.report_aggregator import (
+    build_report,
+    fold_report_deltas,
+    get_event_report,
+    rebuild_event_report,
+    record_status_changes,
+)
+
+
+def test_build_report_nests_flat_counters():
+    report = build_report(Counter({
+        "total": 3,
+        "status:pending": 2,
+        "status:paid": 1,
+        "status:rejected": 0,
+        "day:2026-01-02": 3,
+        "option:size:M": 2,
+        "option:size:L": 1,
+        "option:topic:a:b": 1,
+    }))
+
+    assert report == {
+        "total": 3,
+        "by_status": {"paid": 1, "pending": 2},
+        "by_day": {"2026-01-02": 3},
+        "by_price": {},
+        "options": {"size": {"L": 1, "M": 2}, "topic": {"a:b": 1}},
+    }
+
+
+def test_incremental_counters_match_rebuild(db, published_event):
+    rebuilt = rebuild_event_report(db, published_event.uuid)
+    db.commit()
+    assert rebuilt["total"] == 3
+    assert rebuilt["by_status"] == {"pending": 3}
+
+    submission = db.query(Submission).filter(Submission.event_uuid == published_event.uuid).first()
+    result = transition_submission(db, submission.uuid, "email_verified")
+    assert result.ok
+    record_status_changes(db, [result.submission])
+    db.commit()
+
+    # 尚未併入的 delta 也算在讀取結果內
+    pending = get_event_report(db, published_event.uuid)
+    assert pending["by_status"] == {"pending": 2, "email_verified": 1}
+
+    fold_report_deltas(db)
+    db.commit()
+    assert get_event_report(db, published_event.uuid) == pending
+
+    assert rebuild_event_report(db, published_event.uuid) == pending
+    db.commit()
+
+
+def test_api_rebuild_does_not_queue_behind_fold(db, published_event):
+    """
+    fold 持有 shared lock 時：API rebuild（wait=False）立即回 None，不排隊擋住其他活動的 fold
+    """
+    folding = SessionLocal()
+    try:
+        fold_report_deltas(folding)  # 持有 shared lock 直到 transaction 結束
+
+        assert rebuild_event_report(db, published_event.uuid, wait=False) is None
+        db.rollback()
+
+        folding.commit()
+        assert rebuild_event_report(db, published_event.uuid, wait=False)["total"] == 3
+        db.commit()
+    finally:
+        folding.close()
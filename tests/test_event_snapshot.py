@@ -0,0 +1,156 @@
+# tests/test_event_snapshot.py
+
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.constants.event_status import EventStatus
+from app.models.activity.activity_template import ActivityTemplate
+from app.models.activity.activity_template_field import ActivityTemplateField
+from app.models.activity.activity_type import ActivityType
+from app.models.event.event_snapshot import EventSnapshot
+from app.services.event.snapshot import (
+    _DIRTY_TEMPLATES,
+    PublishedSnapshot,
+    _collect_template_changes,
+    refresh_event_snapshot,
+    snapshot_cache,
+)
+
+
+SNAPSHOT_ROUTES = [
+    ("/public/events/{event_uuid}", "public"),
+    ("/events/{event_uuid}", "detail"),
+    ("/events/{event_uuid}/schedule", "schedule"),
+]
+
+
+def _snapshot(event_uuid, version=1):
+    return PublishedSnapshot(
+        event_uuid=str(event_uuid),
+        version=version,
+        public=b'{"view": "public"}',
+        detail=b'{"view": "detail"}',
+        schedule=b'[{"view": "schedule"}]',
+    )
+
+
+@pytest.mark.parametrize("path, view", SNAPSHOT_ROUTES)
+def test_cached_snapshot_is_served_without_queries(client, query_budget, path, view):
+    event_uuid = uuid4()
+    snapshot = _snapshot(event_uuid)
+    snapshot_cache.put(str(event_uuid), snapshot)
+
+    try:
+        with query_budget(0):
+            r = client.get(path.format(event_uuid=event_uuid))
+    finally:
+        snapshot_cache.invalidate(str(event_uuid))
+
+    assert r.status_code == 200
+    assert r.content == getattr(snapshot, view)
+    assert r.headers["content-type"] == "application/json"
+
+
+def test_newer_version_message_evicts_snapshot():
+    event_uuid = str(uuid4())
+    snapshot_cache.put(event_uuid, _snapshot(event_uuid, 2))
+
+    snapshot_cache.on_message(f"{event_uuid}:2")
+    assert snapshot_cache.get(event_uuid) is not None
+
+    snapshot_cache.on_message(f"{event_uuid}:3")
+    assert snapshot_cache.get(event_uuid) is None
+
+
+def test_cache_floor_requires_monotonic_versions():
+    # 撤下（v2）後各 worker 記住 floor=2：重新發布必須是 v3，不能從 v1 重來
+    event_uuid = str(uuid4())
+    snapshot_cache.on_message(f"{event_uuid}:2")
+
+    assert snapshot_cache.put(event_uuid, _snapshot(event_uuid, 1)) is False
+    assert snapshot_cache.put(event_uuid, _snapshot(event_uuid, 3)) is True
+    assert snapshot_cache.get(event_uuid).version == 3
+    snapshot_cache.invalidate(event_uuid)
+
+
+def test_snapshot_matches_live_response_and_follows_status(client, db, published_event, query_budget):
+    live = {path: client.get(path.format(event_uuid=published_event.uuid)).json() for path, _ in SNAPSHOT_ROUTES}
+
+    assert refresh_event_snapshot(db, published_event.uuid) == 1
+    db.commit()
+
+    for path, _ in SNAPSHOT_ROUTES:
+        url = path.format(event_uuid=published_event.uuid)
+        client.get(url)  # 載入快取
+
+        with query_budget(0):
+            r = client.get(url)
+        assert json.loads(r.content) == live[path]
+
+    # 取消發布 → 快照改為 tombstone、快取失效
+    published_event.status = EventStatus.DRAFT
+    assert refresh_event_snapshot(db, published_event.uuid) == 2
+    db.commit()
+
+    tombstone = db.query(EventSnapshot).filter_by(event_uuid=published_event.uuid).one()
+    assert tombstone.public_json is None and tombstone.version == 2
+    assert snapshot_cache.get(str(published_event.uuid)) is None
+    assert client.get(f"/public/events/{published_event.uuid}").status_code == 404
+
+
+def test_republished_snapshot_is_cached_with_new_etag(client, db, published_event, query_budget):
+    """
+    發布 → 撤下 → 重新發布：版本不會回到 1（各 worker 的 floor 不會拒收新快照），ETag 也不會重複
+    """
+    url = f"/public/events/{published_event.uuid}"
+    key = str(published_event.uuid)
+
+    assert refresh_event_snapshot(db, published_event.uuid) == 1
+    db.commit()
+    first = client.get(url)
+    assert first.status_code == 200
+
+    published_event.status = EventStatus.DRAFT
+    assert refresh_event_snapshot(db, published_event.uuid) == 2
+    # 撤下後再撤下：沒有快照可撤下，不再推進版本
+    assert refresh_event_snapshot(db, published_event.uuid) is None
+    db.commit()
+    assert client.get(url).status_code == 404
+
+    published_event.status = EventStatus.PUBLISHED
+    published_event.name = "Relaunched Event"
+    assert refresh_event_snapshot(db, published_event.uuid) == 3
+    db.commit()
+
+    republished = client.get(url)  # 載入快取
+    assert republished.status_code == 200
+    assert json.loads(republished.content)["name"] == "Relaunched Event"
+    assert snapshot_cache.get(key).version == 3
+    assert republished.headers["etag"] != first.headers["etag"]
+
+    with query_budget(0):
+        assert client.get(url).content == republished.content
+
+    # 舊 ETag 不會得到 304
+    assert client.get(url, headers={"If-None-Match": first.headers["etag"]}).status_code == 200
+
+
+def test_template_changes_are_collected_for_snapshot_refresh():
+    template, field_template, activity_type = uuid4(), uuid4(), uuid4()
+    session = SimpleNamespace(
+        new=[ActivityTemplate(uuid=template)],
+        dirty=[ActivityType(uuid=activity_type), EventSnapshot(event_uuid=uuid4())],
+        deleted=[ActivityTemplateField(template_uuid=field_template)],
+        info={},
+    )
+
+    _collect_template_changes(session, None)
+
+    assert session.info[_DIRTY_TEMPLATES] == {
+        ("template", template),
+        ("template", field_template),
+        ("type", activity_type),
+    }
@@ -0,0 +1,57 @@
+# tests/test_field_analytics.py
+
+from uuid import uuid4
+
+from app.models.event.event_field import EventField
+from app.models.submission.submission import Submission
+from app.models.submission.submission_value import SubmissionValue
+from app.services.event.field_analytics import analytics_cache, field_kind, get_field_analytics
+
+
+def test_field_kind():
+    assert field_kind("Select") == "choice"
+    assert field_kind("checkbox") == "choice"
+    assert field_kind("boolean") == "choice"
+    assert field_kind("integer") == "numeric"
+    assert field_kind(None) == "text"
+
+
+def test_aggregates_in_sql_and_caches_by_fingerprint(db, published_event, query_budget):
+    size = EventField(
+        uuid=uuid4(), event_uuid=published_event.uuid, field_key="size", label="Size",
+        field_type="select", options=[{"value": "S", "label": "Small"}, {"value": "M", "label": "Medium"}],
+    )
+    age = EventField(uuid=uuid4(), event_uuid=published_event.uuid, field_key="age", label="Age", field_type="integer")
+    db.add_all([size, age])
+    db.flush()
+
+    submissions = db.query(Submission).filter(Submission.event_uuid == published_event.uuid).order_by(Submission.id).all()
+    # 舊資料以字串儲存數字（"30"）→ 轉型後統計；非數字字串 → invalid
+    for submission, (s, a) in zip(submissions, [("M", 20), ("M", "30"), ("S", "n/a")]):
+        db.add(SubmissionValue(submission_uuid=submission.uuid, event_field_uuid=size.uuid, field_key="size", value=s))
+        if a is not None:
+            db.add(SubmissionValue(submission_uuid=submission.uuid, event_field_uuid=age.uuid, field_key="age", value=a))
+    db.commit()
+    analytics_cache.clear()
+
+    result = get_field_analytics(db, published_event.uuid)
+    fields = {f["field_key"]: f for f in result["fields"]}
+
+    assert result["total_submissions"] == 3
+    assert fields["size"]["options"] == [
+        {"value": "S", "label": "Small", "count": 1},
+        {"value": "M", "label": "Medium", "count": 2},
+    ]
+    assert fields["age"]["fill_rate"] == 1.0
+    assert fields["age"]["numeric"]["count"] == 2 and fields["age"]["numeric"]["invalid"] == 1
+    assert fields["age"]["numeric"]["min"] == 20 and fields["age"]["numeric"]["max"] == 30
+    assert fields["age"]["numeric"]["percentiles"]["p50"] == 25
+    assert fields["name"]["answered"] == 0
+
+    # 沒有異動 → 只查 fingerprint
+    with query_budget(1):
+        assert get_field_analytics(db, published_event.uuid) is result
+
+    submissions[2].status = "email_verified"
+    db.commit()
+    assert get_field_analytics(db, published_event.uuid) is not result
@@ -0,0 +1,165 @@
+# tests/test_form_validator.py
+
+import timeit
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.versioned_cache import VersionedCache
+from app.services.submission.form_validator import CompiledValidator, validator_cache
+
+
+def _field(field_key, field_type="text", *, required=False, options=None, validation=None, config=None):
+    return SimpleNamespace(
+        uuid=uuid4(),
+        field_key=field_key,
+        label=field_key.title(),
+        field_type=field_type,
+        required=required,
+        options=options,
+        validation=validation,
+        config=config,
+    )
+
+
+FIELDS = [
+    _field("name", required=True, validation={"max_length": 20}),
+    _field("email", "email", required=True),
+    _field("age", "integer", validation={"min": 18, "max": 99}),
+    _field("size", "select", options=[{"value": "S", "label": "Small"}, {"value": "M", "label": "Medium"}]),
+    _field("diet", "checkbox", options=["vegan", "halal", "none"]),
+    _field("agree", "checkbox", required=True),
+    _field("code", validation={"pattern": r"[A-Z]{3}-\d{2}"}),
+    _field("birthday", "date"),
+]
+
+
+def _validator(version=1):
+    return CompiledValidator.compile(uuid4(), version, FIELDS)
+
+
+def test_valid_payload_is_coerced_in_one_pass():
+    result = _validator().validate([
+        ("name", " Amy "),
+        ("email", "amy@example.com"),
+        ("age", "30"),
+        ("size", "M"),
+        ("diet", "vegan; halal"),
+        ("agree", "yes"),
+        ("code", "ABC-12"),
+        ("birthday", "2000-01-31"),
+    ])
+
+    assert result.ok, result.errors
+    assert {r.field_key: v for r, v in result.values} == {
+        "name": "Amy",
+        "email": "amy@example.com",
+        "age": 30,
+        "size": "M",
+        "diet": ["vegan", "halal"],
+        "agree": True,
+        "code": "ABC-12",
+        "birthday": "2000-01-31",
+    }
+
+
+def test_every_rule_reports_its_own_error():
+    result = _validator().validate([
+        ("name", "x" * 21),
+        ("email", "nope"),
+        ("age", "12"),
+        ("size", "XL"),
+        ("diet", ["vegan", "keto"]),
+        ("code", "abc"),
+        ("birthday", "31/01/2000"),
+        ("phone", "123"),
+    ])
+
+    assert result.errors == [
+        "name: length must be <= 20",
+        "email: invalid email",
+        "age: must be >= 18",
+        "size: invalid option: XL",
+        "diet: invalid option: keto",
+        "code: invalid format",
+        "birthday: must be a date (YYYY-MM-DD)",
+        "phone: unknown field",
+        "agree: required",
+    ]
+
+
+def test_blank_values_count_as_missing_and_labels_need_opt_in():
+    validator = _validator()
+
+    assert validator.validate([("name", "  "), ("email", "a@b.co"), ("agree", True)]).errors == ["name: required"]
+    assert validator.validate([("Name", "Amy")]).errors[0] == "Name: unknown field"
+    assert validator.validate(
+        [("Name", "Amy"), ("Email", "a@b.co"), ("Agree", "true")],
+        by_label=True,
+    ).ok
+
+
+def test_cache_drops_older_versions_and_rejects_stale_loads():
+    cache = VersionedCache(maxsize=10, ttl=60)
+    v1 = _validator(1)
+    key = v1.event_uuid
+
+    assert cache.put(key, v1)
+    assert cache.get(key) is v1
+
+    cache.invalidate(key, 2)
+    assert cache.get(key) is None
+
+    # 通知之前開始的載入（讀到舊版本）不可寫回
+    assert not cache.put(key, CompiledValidator(key, 1, v1.rules))
+    v2 = CompiledValidator(key, 2, v1.rules)
+    assert cache.put(key, v2)
+
+    # 重複 / 較舊的通知不影響較新的 validator
+    cache.invalidate(key, 2)
+    assert cache.get(key) is v2
+
+
+def test_invalidation_message_reaches_the_global_cache():
+    validator = _validator(3)
+    validator_cache.put(validator.event_uuid, validator)
+
+    validator_cache.on_message(f"{validator.event_uuid}:4")
+    assert validator_cache.get(validator.event_uuid) is None
+
+
+@pytest.mark.benchmark
+def test_validation_cost_micro_benchmark():
+    """
+    每筆報名的驗證成本（8 個欄位，含 regex / 選項 / 型別轉換）
+
+    opt-in：pytest --run-benchmarks
+    """
+    validator = _validator()
+    payload = [
+        ("name", "Amy"),
+        ("email", "amy@example.com"),
+        ("age", "30"),
+        ("size", "M"),
+        ("diet", "vegan; halal"),
+        ("agree", "yes"),
+        ("code", "ABC-12"),
+        ("birthday", "2000-01-31"),
+    ]
+
+    rounds = 2000
+    best = min(timeit.repeat(lambda: validator.validate(payload), number=rounds, repeat=5)) / rounds
+    print(f"\nvalidate(): {best * 1e6:.1f} µs / submission")
+
+    # 寬鬆上限：只防止退化成 O(fields × payload) 或每次重新編譯
+    assert best < 200e-6
+
+
+@pytest.mark.parametrize("fields", [10, 100])
+def test_compile_is_linear_in_field_count(fields):
+    definitions = [_field(f"f{i}", required=i % 2 == 0) for i in range(fields)]
+    validator = CompiledValidator.compile(uuid4(), 1, definitions)
+
+    result = validator.validate((f"f{i}", "x") for i in range(fields))
+    assert result.ok and len(result.values) == fields
@@ -0,0 +1,64 @@
+# tests/test_jwt_cache.py
+
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import jwt as jwt_module
+from app.core.jwt import (
+    create_access_token,
+    decode_access_token,
+    deny_jti,
+    is_jti_revoked,
+    token_cache,
+)
+
+
+def test_verified_payload_is_cached():
+    token = create_access_token({"sub": "user-1"})
+    before = token_cache.stats()["hits"]
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first is second
+    assert token_cache.stats()["hits"] == before + 1
+
+
+def test_revoked_jti_is_denied():
+    token = create_access_token({"sub": "user-2"})
+    payload = decode_access_token(token)
+
+    deny_jti(payload["jti"], payload["exp"])
+
+    with pytest.raises(HTTPException) as exc:
+        decode_access_token(token)
+    assert exc.value.detail == "Token has been revoked"
+
+
+def test_expired_token_is_rejected():
+    token = create_access_token({"sub": "user-3"}, expires_minutes=-1)
+
+    with pytest.raises(HTTPException) as exc:
+        decode_access_token(token)
+    assert exc.value.detail == "Token has expired"
+
+
+def test_deny_list_drops_only_expired_entries(monkeypatch):
+    now = time.time()
+    clock = [now]
+    monkeypatch.setattr(jwt_module.time, "time", lambda: clock[0])
+
+    deny_jti("short", now + 10)
+    deny_jti("long", now + 100)
+    deny_jti("short", now + 50)   # 重新撤銷（較晚的 exp）
+
+    clock[0] = now + 20
+    deny_jti("trigger", now + 200)
+    assert is_jti_revoked("short") and is_jti_revoked("long")
+
+    clock[0] = now + 60
+    deny_jti("trigger", now + 200)
+    assert not is_jti_revoked("short")
+    assert is_jti_revoked("long")
@@ -0,0 +1,48 @@
+# tests/test_loader_profiles.py
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.crud.base.loader_profiles import (
+    LOADER_PROFILES,
+    assert_no_lazy_loads,
+    loader_options,
+    track_lazy_loads,
+)
+from app.models.event.event import Event
+
+
+def test_every_profile_builds_options():
+    for name in LOADER_PROFILES:
+        assert isinstance(loader_options(name), tuple)
+
+    with pytest.raises(ValueError):
+        loader_options("event.unknown")
+
+
+def test_helper_detects_lazy_load(db: Session, published_event: Event):
+    event = db.get(Event, published_event.id)
+
+    with track_lazy_loads() as loads:
+        _ = event.submissions
+
+    assert [str(l) for l in loads] == ["Event.submissions"]
+
+    with pytest.raises(AssertionError):
+        with assert_no_lazy_loads():
+            _ = event.tickets
+
+
+def test_public_event_routes_stay_within_profile(client, published_event: Event):
+    with assert_no_lazy_loads():
+        r = client.get("/public/events")
+    assert r.status_code == 200
+
+    with assert_no_lazy_loads():
+        r = client.get(f"/public/events/{published_event.uuid}")
+    assert r.status_code == 200
+    assert r.json()["tickets"] == []
+
+    with assert_no_lazy_loads():
+        r = client.get(f"/events/{published_event.uuid}")
+    assert r.status_code == 200
@@ -0,0 +1,51 @@
+# tests/test_pagination.py
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.common.pagination import (
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_roundtrip():
+    keys = (datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc), 42, uuid4())
+
+    cursor = encode_cursor(keys, "next")
+
+    assert decode_cursor(cursor) == (keys, "next")
+
+
+def test_cursor_rejects_garbage():
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not-a-cursor")
+
+
+def test_public_events_cursor_walk(client, published_event):
+    r = client.get("/public/events", params={"paginate": "cursor", "page_size": 1})
+    assert r.status_code == 200
+
+    body = r.json()
+    assert body["page"] is None
+    assert body["total"] is None
+    assert len(body["items"]) == 1
+
+    seen = [body["items"][0]["uuid"]]
+    while body["next_cursor"]:
+        body = client.get(
+            "/public/events",
+            params={"cursor": body["next_cursor"], "page_size": 1},
+        ).json()
+        seen += [item["uuid"] for item in body["items"]]
+
+    assert str(published_event.uuid) in seen
+    assert len(seen) == len(set(seen))
+
+
+def test_invalid_cursor_is_400(client):
+    r = client.get("/public/events", params={"cursor": "bogus"})
+    assert r.status_code == 400
@@ -0,0 +1,61 @@
+# tests/test_password_hasher.py
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.password_hasher import PasswordHasher
+
+
+def test_sheds_when_queue_is_full():
+    hasher = PasswordHasher(workers=1, queue_limit=1)
+    release = threading.Event()
+
+    running = hasher.submit("hash", release.wait)
+    queued = hasher.submit("hash", release.wait)
+
+    with pytest.raises(HTTPException) as exc:
+        hasher.submit("hash", release.wait)
+    assert exc.value.status_code == 503
+
+    release.set()
+    running.result(timeout=5)
+    queued.result(timeout=5)
+
+    stats = hasher.stats()
+    assert stats["rejected"] == 1
+    assert stats["hash"]["count"] == 2
+    hasher.shutdown()
+
+
+def test_verify_rehashes_when_cost_changes(monkeypatch):
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret")
+    monkeypatch.setattr(
+        security,
+        "pwd_context",
+        CryptContext(schemes=["bcrypt"], bcrypt__rounds=5),
+    )
+
+    hasher = PasswordHasher(workers=1, queue_limit=0)
+    valid, new_hash = asyncio.run(hasher.verify_and_update("secret", old_hash))
+
+    assert valid
+    assert new_hash.startswith("$2b$05$")
+    hasher.shutdown()
+
+
+def test_shutdown_is_idempotent_and_executor_restarts():
+    hasher = PasswordHasher(workers=1, queue_limit=0)
+    hasher.shutdown()  # 尚未建立 executor
+
+    assert hasher.submit("hash", lambda: "first").result(timeout=5) == "first"
+    hasher.shutdown()
+    hasher.shutdown()
+
+    # 同一 process 內再次啟動 app（lifespan）→ 重新建立 executor
+    assert hasher.submit("hash", lambda: "again").result(timeout=5) == "again"
+    hasher.shutdown()
@@ -0,0 +1,148 @@
+# tests/test_principal_cache.py
+
+from sqlalchemy.orm import Session
+
+from app.api.auth.identity import Principal
+from app.core.config import settings
+from app.core.membership_version import MembershipVersionMap
+from app.core.principal_cache import (
+    PrincipalCache,
+    invalidate_organizer_principals,
+    invalidate_principal,
+    principal_cache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_and_lru_eviction():
+    clock = FakeClock()
+    cache = PrincipalCache(maxsize=2, ttl=10, clock=clock)
+
+    cache.put("a", {"uuid": "a"})
+    cache.put("b", {"uuid": "b"})
+    assert cache.get("a") == {"uuid": "a"}
+
+    # b 最久未使用 → 被淘汰
+    cache.put("c", {"uuid": "c"})
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 11
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_put_is_dropped_when_invalidated_during_load():
+    cache = PrincipalCache(maxsize=10, ttl=10)
+
+    generation = cache.generation
+    cache.invalidate("a")  # 載入期間 membership 被修改
+
+    assert cache.put("a", {"uuid": "a"}, generation=generation) is False
+    assert cache.get("a") is None
+
+
+def test_invalidation_hooks(monkeypatch):
+    monkeypatch.setattr(settings, "INVALIDATION_CHANNEL_ENABLED", False)
+    principal_cache.clear()
+
+    org = "11111111-1111-1111-1111-111111111111"
+    principal_cache.put(
+        "u1",
+        Principal.build(uuid="u1", email="u1@example.com", system_roles=(), organizers=()),
+    )
+    principal_cache.put(
+        "u2",
+        Principal.build(
+            uuid="u2",
+            email="u2@example.com",
+            system_roles=(),
+            organizers=[(org, "Org", "admin")],
+        ),
+    )
+
+    # transaction 內呼叫；commit 之後才生效，rollback 則丟棄
+    db = Session()
+    invalidate_organizer_principals(db, org)
+    assert principal_cache.get("u2") is not None
+    db.commit()
+    assert principal_cache.get("u2") is None
+    assert principal_cache.get("u1") is not None
+
+    invalidate_principal(db, "u1")
+    db.rollback()
+    assert principal_cache.get("u1") is not None
+
+    invalidate_principal(db, "u1")
+    db.commit()
+    assert principal_cache.get("u1") is None
+
+
+def test_principal_rbac_lookups_and_me_payload():
+    org = "22222222-2222-2222-2222-222222222222"
+    principal = Principal.build(
+        uuid="33333333-3333-3333-3333-333333333333",
+        email="p@example.com",
+        system_roles=["super_admin"],
+        organizers=[(org, "Org", "owner")],
+    )
+
+    assert principal.has_system_role({"admin", "super_admin"})
+    assert principal.organizer_role(org) == "owner"
+    assert principal.organizer_role("other") is None
+    assert principal["uuid"] == principal.uuid
+
+    assert principal.as_dict() == {
+        "uuid": "33333333-3333-3333-3333-333333333333",
+        "email": "p@example.com",
+        "name": None,
+        "role": "user",
+        "memberships": [
+            {"type": "system", "role": "super_admin", "status": "active"},
+            {
+                "type": "organizer",
+                "organizer_uuid": org,
+                "organizer_name": "Org",
+                "membership_role": "owner",
+            },
+        ],
+    }
+
+
+def test_membership_claims_roundtrip():
+    org = "44444444-4444-4444-4444-444444444444"
+    principal = Principal.build(
+        uuid="55555555-5555-5555-5555-555555555555",
+        email="c@example.com",
+        system_roles=["admin"],
+        organizers=[(org, "Org", "editor")],
+        membership_version=7,
+    )
+
+    restored = Principal.from_claims(principal.uuid, principal.to_claims(), 7)
+
+    assert restored.system_roles == principal.system_roles
+    assert restored.organizer_roles == principal.organizer_roles
+    assert restored.membership_version == 7
+
+
+def test_membership_version_map_only_moves_forward():
+    versions = MembershipVersionMap(maxsize=2)
+
+    versions.set("u1", 3)
+    versions.set("u1", 2)  # 晚到的舊通知
+    assert versions.get("u1") == 3
+
+    versions.set("u2", 1)
+    versions.set("u3", 1)
+    assert versions.get("u1") is None  # LRU 淘汰
@@ -0,0 +1,38 @@
+# tests/test_query_budgets.py
+
+import pytest
+
+from app.core.query_stats import normalize_statement
+
+
+# ------------------------------------------------------------
+# Per-route query budgets（超過即代表 loader / N+1 回歸）
+# ------------------------------------------------------------
+PUBLIC_ROUTE_BUDGETS = [
+    ("/public/events", 3),                          # ETag fingerprint + count + page
+    # fixture 活動沒有快照：snapshot lookup + 即時查詢
+    ("/public/events/{event_uuid}", 4),             # snapshot + event + fields + schedules
+    ("/events/{event_uuid}", 3),                    # snapshot + event + activity_template
+    ("/events/{event_uuid}/schedule", 3),           # snapshot + event + schedules
+]
+
+
+def test_normalize_statement_collapses_params_and_in_lists():
+    a = normalize_statement(
+        "SELECT * FROM events WHERE uuid IN (%(uuid_1_1)s, %(uuid_1_2)s)  LIMIT 20"
+    )
+    b = normalize_statement(
+        "SELECT * FROM events WHERE uuid IN (%(uuid_1_1)s) LIMIT 5"
+    )
+    assert a == b == "SELECT * FROM events WHERE uuid IN (?) LIMIT ?"
+
+
+@pytest.mark.parametrize("path, budget", PUBLIC_ROUTE_BUDGETS)
+def test_public_route_query_budget(client, published_event, query_budget, path, budget):
+    url = path.format(event_uuid=published_event.uuid)
+
+    with query_budget(budget):
+        r = client.get(url)
+
+    assert r.status_code == 200
+    assert int(r.headers["x-db-query-count"]) <= budget
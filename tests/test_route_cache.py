@@ -0,0 +1,184 @@
+# tests/test_route_cache.py
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.conditional import resource_validators
+from app.core.route_cache import RouteCache, route_cache
+
+
+class Item(BaseModel):
+    key: str
+    calls: int
+
+
+def _request(path: str = "/items/a", query: bytes = b"", **headers) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query,
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def _app(**options):
+    app = FastAPI()
+    calls = {"n": 0}
+
+    @app.get("/items/{key}", response_model=Item)
+    @route_cache(f"test.items.{id(calls)}", response_model=Item, tag_param="key", **options)
+    def get_item(key: str, response: Response):
+        calls["n"] += 1
+        resource_validators("item", key, calls["n"]).apply(response)
+        return {"key": key, "calls": calls["n"], "ignored": True}
+
+    return app, get_item, calls
+
+
+def test_cached_response_keeps_model_filtering_and_etag():
+    app, handler, calls = _app(ttl=60)
+    client = TestClient(app)
+
+    first = client.get("/items/a")
+    second = client.get("/items/a")
+    other = client.get("/items/a", params={"lang": "en"})
+
+    assert first.json() == {"key": "a", "calls": 1}
+    assert second.content == first.content
+    assert other.json()["calls"] == 2
+    assert calls["n"] == 2
+
+    revalidated = client.get("/items/a", headers={"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert calls["n"] == 2
+
+    stats = handler.route_cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2
+
+
+def test_concurrent_identical_requests_run_the_handler_once():
+    calls = []
+    gate = threading.Event()
+
+    @route_cache("test.single_flight", ttl=60)
+    def slow(request: Request, response: Response):
+        calls.append(1)
+        gate.wait(5)
+        return {"ok": True}
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        futures = [pool.submit(slow, request=_request(), response=Response()) for _ in range(20)]
+        time.sleep(0.2)
+        gate.set()
+        bodies = {f.result().body for f in futures}
+
+    assert len(calls) == 1
+    assert bodies == {b'{"ok":true}'}
+
+    stats = slow.route_cache.stats()
+    assert stats["misses"] == 1 and stats["coalesced"] == 19
+
+
+def test_leader_with_if_none_match_still_feeds_followers():
+    """
+    leader 的 request 帶 If-None-Match：handler 仍以無條件 request 執行 → 寫入 200 entry，
+    leader 自己回 304，follower 共用結果（不會各自重算）
+    """
+    calls = []
+    gate = threading.Event()
+    etag = resource_validators("item", "a", 1).etag
+
+    @route_cache("test.single_flight_conditional", ttl=60)
+    def slow(request: Request, response: Response):
+        calls.append(request.headers.get("if-none-match"))
+        gate.wait(5)
+        validators = resource_validators("item", "a", 1)
+        not_modified = validators.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+        return validators.apply(Response(content=b'{"ok":true}', media_type="application/json"))
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        leader = pool.submit(slow, request=_request(if_none_match=etag), response=Response())
+        time.sleep(0.1)
+        followers = [pool.submit(slow, request=_request(), response=Response()) for _ in range(19)]
+        time.sleep(0.2)
+        gate.set()
+
+        assert leader.result().status_code == 304
+        assert {(f.result().status_code, f.result().body) for f in followers} == {(200, b'{"ok":true}')}
+
+    assert calls == [None]
+
+    stats = slow.route_cache.stats()
+    assert stats["misses"] == 1 and stats["coalesced"] == 19 and stats["uncacheable"] == 0
+
+
+def test_async_handlers_are_coalesced_too():
+    calls = []
+
+    @route_cache("test.single_flight_async", ttl=60)
+    async def slow(request: Request, response: Response):
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    async def burst():
+        return await asyncio.gather(*(slow(request=_request(), response=Response()) for _ in range(50)))
+
+    responses = asyncio.run(burst())
+
+    assert len(calls) == 1
+    assert {r.body for r in responses} == {b'{"ok":true}'}
+
+
+def test_stale_entries_are_served_while_one_request_refreshes():
+    now = [0.0]
+    cache = RouteCache("test.stale", ttl=10, stale_ttl=30, clock=lambda: now[0])
+    key = ("/items/a", (), None)
+
+    entry, flight, leader = cache._lookup(key)
+    assert leader
+    cache._store(key, flight, cache._generation, "a", Response(content=b"v1"))
+
+    now[0] = 15
+    entry, refresher, leader = cache._lookup(key)
+    assert leader and entry is None          # 第一個發現過期的 request 負責重算
+
+    entry, _, leader = cache._lookup(key)
+    assert not leader and entry.body == b"v1"  # 其他人先拿舊資料
+
+    cache._store(key, refresher, cache._generation, "a", Response(content=b"v2"))
+    assert cache._lookup(key)[0].body == b"v2"
+
+    now[0] = 100
+    assert cache._lookup(key)[2]             # 超過 stale_ttl → 重新計算
+    assert cache.stats()["stale_hits"] == 1 and cache.stats()["refreshes"] == 1
+
+
+def test_invalidation_drops_tagged_entries_and_in_flight_results():
+    cache = RouteCache("test.invalidate", ttl=60)
+
+    for tag in ("a", "b"):
+        key = (f"/items/{tag}", (), None)
+        _, flight, _ = cache._lookup(key)
+        cache._store(key, flight, cache._generation, tag, Response(content=tag.encode()))
+
+    cache.on_message("a:7")
+    assert cache._lookup(("/items/a", (), None))[0] is None
+    assert cache._lookup(("/items/b", (), None))[0] is not None
+
+    # 計算開始後才收到的失效 → 結果不寫回
+    key = ("/items/c", (), None)
+    _, flight, _ = cache._lookup(key)
+    generation = cache._generation
+    cache.on_message(None)
+    cache._store(key, flight, generation, "c", Response(content=b"old"))
+    assert cache._lookup(key)[2]
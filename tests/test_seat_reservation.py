@@ -0,0 +1,112 @@
+# tests/test_seat_reservation.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+
+from app.core.db import SessionLocal
+from app.models.event.event_price import EventPrice
+from app.models.event.event_price_hold import EventPriceHold
+from app.services.event.reservation import (
+    NOT_ON_SALE,
+    SOLD_OUT,
+    confirm_hold,
+    enable_sharding,
+    hold_seats,
+    price_availability,
+    release_expired_holds,
+    release_hold,
+    reserve_seats,
+)
+
+
+@pytest.fixture
+def price(db, published_event):
+    def make(quota=10, **kwargs):
+        obj = EventPrice(
+            uuid=uuid4(),
+            event_uuid=published_event.uuid,
+            label="General",
+            price_key=f"GEN-{uuid4().hex[:6]}",
+            price=100,
+            quota=quota,
+            sold=0,
+            **kwargs,
+        )
+        db.add(obj)
+        db.commit()
+        return obj.uuid
+
+    return make
+
+
+def test_reserve_never_oversells_and_reports_why(db, price):
+    price_uuid = price(quota=3)
+
+    assert reserve_seats(db, price_uuid, 2).sold == 2
+    assert reserve_seats(db, price_uuid, 2).conflict == SOLD_OUT
+    assert reserve_seats(db, price_uuid, 1).sold == 3
+    db.commit()
+
+    closed = price(quota=None, end_at=datetime.now(timezone.utc) - timedelta(days=1))
+    assert reserve_seats(db, closed).conflict == NOT_ON_SALE
+
+
+def test_holds_are_released_on_cancel_and_expiry(db, price):
+    price_uuid = price(quota=5)
+
+    kept = hold_seats(db, price_uuid, 2)
+    cancelled = hold_seats(db, price_uuid, 1)
+    expired = hold_seats(db, price_uuid, 2, ttl_seconds=60)
+    db.commit()
+    assert price_availability(db, price_uuid)["sold"] == 5
+
+    assert confirm_hold(db, kept.hold_uuid)
+    assert release_hold(db, cancelled.hold_uuid)
+    db.execute(
+        update(EventPriceHold)
+        .where(EventPriceHold.uuid == expired.hold_uuid)
+        .values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+    assert release_expired_holds(db) == (1, 2)
+    db.commit()
+
+    # 逾期後才付款 → 需重新預留
+    assert not confirm_hold(db, expired.hold_uuid)
+    assert price_availability(db, price_uuid) == {
+        "quota": 5, "sold": 2, "held": 0, "remaining": 3, "shard_count": 0,
+    }
+
+
+@pytest.mark.parametrize("shards", [0, 8])
+def test_contention_benchmark_hundreds_of_buyers(db, price, shards):
+    """
+    Stress：300 位買家（各自的 session / transaction）搶 200 個名額
+    """
+    quota, buyers = 200, 300
+    price_uuid = price(quota=quota)
+    if shards:
+        enable_sharding(db, price_uuid, shards)
+        db.commit()
+
+    def buy(_):
+        session = SessionLocal()
+        try:
+            result = reserve_seats(session, price_uuid, 1)
+            session.commit()
+            return result.ok
+        finally:
+            session.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        outcomes = list(pool.map(buy, range(buyers)))
+    elapsed = time.perf_counter() - started
+    print(f"\n{buyers} buyers / {shards or 'no'} shards: {buyers / elapsed:.0f} reservations/s")
+
+    assert outcomes.count(True) == quota
+    assert price_availability(db, price_uuid)["sold"] == quota
@@ -0,0 +1,128 @@
+# tests/test_submission_bulk.py
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from app.api.events.organizer.submissions_bulk import _filter_criteria
+from app.core.db import SessionLocal
+from app.crud.submission.crud_submission_status import (
+    INVALID_TRANSITION,
+    NOT_FOUND,
+    bulk_transition_submissions,
+)
+from app.exceptions.base import ActiFlowBusinessException
+from app.models.email.email_outbox import EmailOutbox
+from app.models.submission.submission import Submission
+from app.schemas.submission.submission_bulk import SubmissionBulkFilter, SubmissionBulkRequest
+from app.services.submission.notification import notify_submissions_bulk
+
+
+class _CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        return self
+
+    def all(self):
+        return []
+
+
+def test_request_requires_exactly_one_selection():
+    with pytest.raises(ValidationError):
+        SubmissionBulkRequest()
+    with pytest.raises(ValidationError):
+        SubmissionBulkRequest(submission_uuids=[uuid4()], filter={})
+    assert SubmissionBulkRequest(filter={"status": "paid"}).filter.max_items == 5000
+
+
+def test_filter_rejects_source_status_that_cannot_reach_target():
+    with pytest.raises(ActiFlowBusinessException):
+        _filter_criteria("completed", SubmissionBulkFilter(status="pending"))
+
+
+def test_filter_mode_is_one_set_based_update():
+    db = _CapturingSession()
+    criteria = _filter_criteria(
+        "completed",
+        SubmissionBulkFilter(
+            status="paid",
+            created_from=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            field_key="ticket",
+            field_value="vip",
+        ),
+    )
+
+    result = bulk_transition_submissions(
+        db,
+        "completed",
+        event_uuid=uuid4(),
+        organizer_uuid=uuid4(),
+        criteria=criteria,
+        max_items=100,
+    )
+
+    assert result.updated == [] and not result.has_more
+    assert len(db.statements) == 1
+
+    sql = str(db.statements[0][0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE submissions SET")
+    assert "LIMIT" in sql and "EXISTS" in sql and "RETURNING" in sql
+
+
+def test_bulk_notifications_render_once_and_insert_in_one_statement():
+    db = _CapturingSession()
+    db.info = {"email_outbox_wake": True}  # 不掛 after_commit listener
+    rows = [
+        SimpleNamespace(uuid=uuid4(), user_email=f"u{i}@example.com", status_reason="full", notes=None)
+        for i in range(3)
+    ]
+
+    assert notify_submissions_bulk(db=db, submissions=rows, target="rejected") == 3
+
+    (statement, params), = db.statements
+    assert statement.table.name == "email_outbox"
+    assert [p["recipient_domain"] for p in params] == ["example.com"] * 3
+    assert len({p["html"] for p in params}) == 1
+
+
+def test_bulk_approve_reports_per_item_outcomes(published_event):
+    db = SessionLocal()
+    try:
+        submissions = (
+            db.query(Submission)
+            .filter(Submission.event_uuid == published_event.uuid)
+            .order_by(Submission.id)
+            .all()
+        )
+        submissions[0].status = "paid"
+        submissions[1].status = "paid"
+        db.commit()
+
+        unknown = uuid4()
+        result = bulk_transition_submissions(
+            db,
+            "completed",
+            event_uuid=published_event.uuid,
+            organizer_uuid=published_event.organizer_uuid,
+            submission_uuids=[s.uuid for s in submissions] + [unknown],
+        )
+        notified = notify_submissions_bulk(db=db, submissions=result.updated, target="completed")
+        db.commit()
+
+        outbox = db.query(EmailOutbox).filter(
+            EmailOutbox.ref_uuid.in_([s.uuid for s in submissions])
+        ).count()
+    finally:
+        db.close()
+
+    assert {row.uuid for row in result.updated} == {submissions[0].uuid, submissions[1].uuid}
+    assert result.failed[submissions[2].uuid] == (INVALID_TRANSITION, "pending")
+    assert result.failed[unknown] == (NOT_FOUND, None)
+    assert notified == outbox == 2
@@ -0,0 +1,107 @@
+# tests/test_submission_code.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from sqlalchemy.exc import IntegrityError
+
+from app.core.db import SessionLocal
+from app.models.submission.submission import Submission
+from app.services.submission.code_allocator import (
+    SubmissionCodeAllocator,
+    encode_sequence,
+    format_submission_code,
+    is_valid_submission_code,
+    reserve_block,
+)
+
+
+def test_check_symbol_catches_typos_and_transpositions():
+    code = format_submission_code("EVT-1", 123456)
+    assert is_valid_submission_code(code)
+
+    body = code.rpartition("-")[2]
+    typo = body[:2] + ("0" if body[2] != "0" else "1") + body[3:]
+    swapped = body[:1] + body[2] + body[1] + body[3:]
+
+    assert not is_valid_submission_code(f"EVT-1-{typo}")
+    if swapped != body:
+        assert not is_valid_submission_code(f"EVT-1-{swapped}")
+    assert not is_valid_submission_code("EVT-1-20251224120000")
+
+
+def test_encoding_is_unique_and_fixed_width():
+    encoded = [encode_sequence(v) for v in range(5000)]
+    assert len(set(encoded)) == 5000
+    assert all(len(e) == 6 for e in encoded)
+
+
+def test_allocator_blocks_grow_under_load_and_never_overlap():
+    counter = {"next": 1}
+    lock = threading.Lock()
+
+    def fake_reserve(event_uuid: str, size: int) -> int:
+        with lock:
+            start = counter["next"]
+            counter["next"] += size
+            return start
+
+    # 兩個 allocator 模擬兩個 worker 共用同一個計數器
+    workers = [
+        SubmissionCodeAllocator(block_size=10, max_block_size=200, reserve=fake_reserve)
+        for _ in range(2)
+    ]
+    event_uuid = str(uuid4())
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        values = list(pool.map(
+            lambda i: workers[i % 2].next_value(event_uuid),
+            range(10000),
+        ))
+
+    assert len(set(values)) == len(values)
+    # 配發得很快 → block 加倍，預留次數遠少於配發次數
+    assert sum(w.reservations for w in workers) < 100
+
+
+def test_concurrent_submissions_have_no_code_conflicts(published_event):
+    """
+    Stress：多 thread（各自的 session）同時為同一活動建立報名
+    """
+    allocator = SubmissionCodeAllocator(block_size=5, max_block_size=100, reserve=reserve_block)
+    conflicts = []
+
+    def register(i: int) -> None:
+        db = SessionLocal()
+        try:
+            db.add(
+                Submission(
+                    submission_code=allocator.allocate(published_event.uuid, published_event.event_code),
+                    event_uuid=published_event.uuid,
+                    user_email=f"stress{i}@example.com",
+                )
+            )
+            db.commit()
+        except IntegrityError as e:
+            conflicts.append(e)
+            db.rollback()
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(register, range(500)))
+
+    assert conflicts == []
+
+    db = SessionLocal()
+    try:
+        codes = [
+            code for (code,) in db.query(Submission.submission_code)
+            .filter(Submission.event_uuid == published_event.uuid)
+        ]
+    finally:
+        db.close()
+
+    assert len(codes) == 503  # fixture 自帶 3 筆
+    assert len(set(codes)) == len(codes)
@@ -0,0 +1,128 @@
+# tests/test_submission_export.py
+
+import csv
+import io
+import zipfile
+from datetime import datetime, timezone
+from xml.etree import ElementTree
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.db import SessionLocal
+from app.models.submission.submission_value import SubmissionValue
+from app.services.submission.export import (
+    ExportField,
+    _export_statement,
+    csv_header,
+    _ZipSink,
+    csv_values,
+    escape_cell,
+    format_value,
+    iter_submission_export,
+    jsonl_line,
+    load_export_fields,
+    unescape_cell,
+    xlsx_row,
+)
+from app.services.submission.importer import iter_csv_records
+
+
+FIELDS = [ExportField("name", "姓名"), ExportField("tags", "興趣")]
+
+
+def _row(answers):
+    return SimpleNamespace(
+        submission_code="EVT-1-00001Y",
+        status=SimpleNamespace(value="paid"),
+        user_email="a@example.com",
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        answers=answers,
+    )
+
+
+def test_values_are_pivoted_in_field_order():
+    assert csv_header(FIELDS) == ["報名編號", "狀態", "Email", "報名時間", "姓名", "興趣"]
+    assert csv_header(FIELDS, "key")[-2:] == ["name", "tags"]
+
+    values = csv_values(_row({"tags": ["a", "b"], "name": "Amy", "extra": 1}), ["name", "tags"])
+    assert values == ["EVT-1-00001Y", "paid", "a@example.com", "2026-01-01T00:00:00+00:00", "Amy", "a; b"]
+
+    assert csv_values(_row(None), ["name"])[-1] == ""
+    assert '"answers": {"name": null}' in jsonl_line(_row(None), ["name"])
+
+
+def test_format_value():
+    assert format_value(True) == "true"
+    assert format_value(3) == "3"
+    assert format_value({"k": "值"}) == '{"k": "值"}'
+
+
+def test_export_is_a_single_statement_without_joins():
+    sql = str(_export_statement(uuid4(), "paid").compile(dialect=postgresql.dialect()))
+
+    assert sql.count("SELECT") == 2  # 主查詢 + 相關子查詢
+    assert "JOIN" not in sql
+    assert "jsonb_object_agg" in sql
+
+
+def test_stream_export_chunks(published_event):
+    db = SessionLocal()
+    try:
+        for submission in published_event.submissions:
+            db.add(
+                SubmissionValue(
+                    submission_uuid=submission.uuid,
+                    event_field_uuid=published_event.fields[0].uuid,
+                    field_key="name",
+                    value=f"name-{submission.submission_code}",
+                )
+            )
+        db.commit()
+        fields = load_export_fields(db, published_event.uuid)
+    finally:
+        db.close()
+
+    chunks = list(iter_submission_export(published_event.uuid, fields=fields, chunk_rows=1))
+
+    assert len(chunks) == 3  # 每筆一個 chunk（chunk_rows=1）
+    rows = list(csv.reader(io.StringIO("".join(chunks).lstrip("\ufeff"))))
+    assert rows[0][-1] == "Name"
+    assert sorted(r[-1] for r in rows[1:]) == [f"name-SUB-{i}" for i in range(3)]
+
+
+def test_formula_cells_are_escaped_and_restored_on_import():
+    for value in ("=HYPERLINK(\"x\")", "+1", "-5", "@SUM(A1)", "'quoted", "plain", ""):
+        assert unescape_cell(escape_cell(value)) == value
+    assert escape_cell("=1+1") == "'=1+1"
+    assert escape_cell("a=b") == "a=b"
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow([escape_cell(v) for v in ("Email", "姓名")])
+    csv.writer(buffer).writerow([escape_cell(v) for v in ("a@example.com", "=cmd")])
+    [(_, record, _)] = iter_csv_records(io.BytesIO(buffer.getvalue().encode()))
+    assert record == {"Email": "a@example.com", "姓名": "=cmd"}
+
+
+def test_xlsx_parts_are_well_formed():
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        with archive.open("sheet.xml", "w") as sheet:
+            row = xlsx_row(["=1+1", "a < b & c", "bell\x07"])
+            sheet.write(f"<sheetData>{row}</sheetData>".encode())
+
+    archive = zipfile.ZipFile(io.BytesIO(sink.drain()))
+    root = ElementTree.fromstring(archive.read("sheet.xml"))
+    assert [t.text for t in root.iter("t")] == ["=1+1", "a < b & c", "bell"]
+
+
+def test_stream_export_xlsx(published_event):
+    fields = [ExportField("name", "Name")]
+    data = b"".join(iter_submission_export(published_event.uuid, fields=fields, fmt="xlsx", chunk_rows=1))
+
+    archive = zipfile.ZipFile(io.BytesIO(data))
+    assert archive.testzip() is None
+    root = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    ns = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+    assert len(list(root.iter(f"{ns}row"))) == 1 + 3
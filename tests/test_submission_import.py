@@ -0,0 +1,136 @@
+# tests/test_submission_import.py
+
+import io
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.models.submission.submission import Submission
+from app.models.submission.submission_value import SubmissionValue
+from app.services.submission.code_allocator import is_valid_submission_code
+from app.services.submission.form_validator import CompiledValidator
+from app.services.submission.importer import (
+    ImportFileError,
+    RowValidator,
+    import_submissions,
+    iter_csv_records,
+    iter_jsonl_records,
+)
+
+
+def _field(field_key, label, required):
+    return SimpleNamespace(
+        uuid=uuid4(),
+        field_key=field_key,
+        label=label,
+        field_type="text",
+        required=required,
+        options=None,
+        validation=None,
+        config=None,
+    )
+
+
+COMPILED = CompiledValidator.compile(uuid4(), 1, [_field("name", "姓名", True), _field("team", "隊伍", False)])
+
+
+def _stream(content: str) -> io.BytesIO:
+    return io.BytesIO(content.encode("utf-8"))
+
+
+def test_csv_records_skip_bom_and_report_row_numbers():
+    rows = list(iter_csv_records(_stream("\ufeffuser_email,姓名\na@example.com,Amy\nb@example.com,Bob,extra\n")))
+
+    assert rows[0] == (2, {"user_email": "a@example.com", "姓名": "Amy"}, None)
+    assert rows[1][0] == 3 and rows[1][2] == "Too many columns"
+
+
+def test_csv_import_keeps_legitimate_leading_apostrophes():
+    # 不是 escape_cell 產生的 '（後面不是公式字元）→ 原樣匯入；'= / '' 才是跳脫
+    rows = list(iter_csv_records(_stream("user_email,'Nickname\na@example.com,'Ohana\nb@example.com,'=1+1\nc@example.com,''quoted\n")))
+    assert [record for _, record, _ in rows] == [
+        {"user_email": "a@example.com", "'Nickname": "'Ohana"},
+        {"user_email": "b@example.com", "'Nickname": "=1+1"},
+        {"user_email": "c@example.com", "'Nickname": "'quoted"},
+    ]
+
+
+def test_jsonl_records_flatten_nested_answers():
+    rows = list(iter_jsonl_records(_stream(
+        '{"user_email": "a@example.com", "answers": {"name": "Amy"}}\n'
+        "\n"
+        "not json\n"
+        "[1]\n"
+    )))
+
+    assert rows[0] == (1, {"user_email": "a@example.com", "name": "Amy"}, None)
+    assert [(r[0], r[2]) for r in rows[1:]] == [(3, "Invalid JSON"), (4, "Each line must be a JSON object")]
+
+
+def test_validator_maps_keys_and_labels():
+    validator = RowValidator(COMPILED)
+
+    email, notes, values, errors = validator.validate(
+        {"email": " a@example.com ", "姓名": " Amy ", "team": "", "notes": "VIP", "status": "paid"}
+    )
+
+    assert errors == []
+    assert (email, notes) == ("a@example.com", "VIP")
+    assert [(f.field_key, v) for f, v in values] == [("name", "Amy")]
+
+
+def test_validator_collects_every_row_error():
+    _, _, _, errors = RowValidator(COMPILED).validate({"user_email": "nope", "phone": "1"})
+
+    assert errors == ["user_email: invalid email", "phone: unknown field", "name: required"]
+
+
+def test_unknown_csv_columns_reject_the_file():
+    validator = RowValidator(COMPILED)
+
+    validator.check_columns(["user_email", "name", "隊伍", "報名編號"])
+    with pytest.raises(ImportFileError, match="phone"):
+        validator.check_columns(["user_email", "phone"])
+
+
+def test_import_copies_valid_rows_and_reports_the_rest(db, published_event):
+    content = (
+        "user_email,name,notes\n"
+        "new1@example.com,Amy,\n"
+        "new2@example.com,Bob,offline\n"
+        "NEW1@example.com,Amy again,\n"     # 同檔重複
+        "p0@example.com,Existing,\n"        # 已報名
+        "broken,Eve,\n"
+    )
+
+    report = import_submissions(
+        db,
+        event_uuid=published_event.uuid,
+        event_code=published_event.event_code,
+        stream=_stream(content),
+        skip_verification=True,
+    )
+    db.commit()
+
+    assert (report.total_rows, report.imported, report.failed, report.duplicates) == (5, 2, 1, 2)
+    assert [row for row, _ in report.errors] == [4, 5, 6]
+    assert report.verification_emails == 0
+
+    imported = (
+        db.query(Submission)
+        .filter(Submission.extra_data["import_batch"].astext == report.batch_id)
+        .order_by(Submission.user_email)
+        .all()
+    )
+    assert [s.user_email for s in imported] == ["new1@example.com", "new2@example.com"]
+    assert all(s.status.value == "email_verified" for s in imported)
+    assert all(is_valid_submission_code(s.submission_code) for s in imported)
+    assert imported[1].notes == "offline"
+
+    values = (
+        db.query(SubmissionValue.value)
+        .filter(SubmissionValue.submission_uuid == imported[0].uuid)
+        .all()
+    )
+    assert values == [("Amy",)]
@@ -0,0 +1,116 @@
+# tests/test_submission_search.py
+
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import postgresql
+
+from app.models.submission.submission import Submission
+from app.services.submission.search import SEARCH_COLUMNS, _like_pattern, search_submissions
+
+
+def test_like_pattern_escapes_wildcards():
+    assert _like_pattern("a_b%c") == "%a\\_b\\%c%"
+    assert _like_pattern("09") == "%09%"
+
+
+def test_short_query_does_not_hit_database():
+    assert search_submissions(None, None, " a ") == []
+
+
+def test_short_query_skips_substring_match():
+    def _sql(q):
+        db = MagicMock()
+        search_submissions(db, uuid4(), q)
+        return str(db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+
+    # 2 個字沒有 trigram：LIKE '%q%' 無法由 index 篩選 → 只用 word similarity（字首）
+    assert " LIKE " not in _sql("am")
+    assert " LIKE " in _sql("amy")
+
+
+def test_search_ranks_email_code_and_answers(db, published_event, query_budget):
+    submissions = db.query(Submission).filter(Submission.event_uuid == published_event.uuid).order_by(Submission.id).all()
+    answers = [
+        {"name": "Amy Chen", "phone": "0912345678"},
+        {"name": "Bob Lin", "phone": "0922000111"},
+        {"name": "Chen Wei", "phone": "0933999888"},
+    ]
+    for submission, document in zip(submissions, answers):
+        submission.answers = document
+    db.commit()
+
+    def _codes(q):
+        with query_budget(1):
+            return [s.submission_code for s, _ in search_submissions(db, published_event.uuid, q)]
+
+    # 部分 email / 編號（相近的其他報名可能以較低分數出現在後面）
+    assert _codes("p1@exam")[0] == "SUB-1"
+    assert _codes("sub-2")[0] == "SUB-2"
+
+    # 答案：部分電話、姓名（兩筆都有 chen）、拼錯
+    assert _codes("345678")[0] == "SUB-0"
+    assert set(_codes("chen")) == {"SUB-0", "SUB-2"}
+    assert _codes("amy chenn")[0] == "SUB-0"
+    assert _codes("am")[0] == "SUB-0"
+
+    hits = search_submissions(db, published_event.uuid, "amy chen")
+    assert hits[0][0].uuid == submissions[0].uuid
+    assert hits[0][1] == 1.0
+
+    # 其他活動不會出現
+    assert search_submissions(db, submissions[0].uuid, "chen") == []
+
+
+def test_search_columns_match_index_expressions():
+    assert [
+        str(c.compile(dialect=postgresql.dialect())) for c in SEARCH_COLUMNS
+    ] == [
+        "lower(submissions.user_email)",
+        "lower(submissions.submission_code)",
+        "submission_answer_text(submissions.answers)",
+    ]
+
+
+@pytest.mark.benchmark
+def test_search_latency_at_100k_submissions(db, published_event):
+    """
+    100k 筆報名（同一活動）下的搜尋延遲：部分 email / 編號 / 電話 / 拼錯姓名 / 2 個字
+
+    opt-in：pytest --run-benchmarks（資料只在 transaction 內，結束時 rollback）
+    """
+    rows = 100_000
+    first_names = ("amy", "bob", "chen", "david", "emma", "frank", "grace", "henry")
+    db.execute(
+        insert(Submission),
+        [
+            {
+                "uuid": uuid4(),
+                "submission_code": f"BENCH-{i:06d}",
+                "event_uuid": published_event.uuid,
+                "user_email": f"user{i}@example.com",
+                "answers": {"name": f"{first_names[i % len(first_names)]} {i}", "phone": f"09{i:08d}"},
+            }
+            for i in range(rows)
+        ],
+    )
+    db.execute(text("ANALYZE submissions"))
+
+    timings = {}
+    for q in ("user4242@", "bench-099", "00031415", "gracee 77", "gm"):
+        best = None
+        for _ in range(5):
+            started = time.perf_counter()
+            hits = search_submissions(db, published_event.uuid, q)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        timings[q] = best
+        assert len(hits) <= 20
+
+    print("\n" + "\n".join(f"{q!r}: {t * 1e3:.1f} ms" for q, t in timings.items()) + f" ({rows} submissions)")
+
+    # 寬鬆上限：只防止退化成逐列掃描（seq scan 100k 列 + word_similarity 為數百 ms）
+    assert max(timings.values()) < 0.1
@@ -0,0 +1,87 @@
+# tests/test_submission_transition.py
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.db import SessionLocal
+from app.crud.submission.crud_submission_status import (
+    ALLOWED_FROM,
+    INVALID_TRANSITION,
+    VERSION_CONFLICT,
+    WRONG_EVENT,
+    transition_submission,
+)
+from app.models.submission.submission import Submission
+
+
+class _CapturingSession:
+    def __init__(self, row):
+        self.row = row
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(statement)
+        return self
+
+    def one_or_none(self):
+        return self.row
+
+
+def test_allowed_from_is_inverse_of_allowed_transitions():
+    assert set(ALLOWED_FROM["paid"]) == {"email_verified", "completed", "rejected"}
+    assert ALLOWED_FROM["completed"] == ("paid",)
+    assert "pending" not in ALLOWED_FROM
+
+
+def test_transition_is_a_single_conditional_update():
+    row = SimpleNamespace(event_uuid=uuid4(), status="completed", previous_status="paid")
+    db = _CapturingSession(row)
+
+    result = transition_submission(db, uuid4(), "completed", expected_version=3)
+
+    assert result.ok and result.submission is row
+    # 只有一條 UPDATE（統計 delta 由呼叫端以 RETURNING row 寫入）
+    assert len(db.statements) == 1
+
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE submissions SET")
+    assert "version=(submissions.version +" in sql
+    assert "submissions.status IN" in sql
+    assert "submissions.version =" in sql
+    assert "RETURNING" in sql
+
+
+def _set_status(db, event, status: str) -> Submission:
+    submission = db.query(Submission).filter(Submission.event_uuid == event.uuid).first()
+    submission.status = status
+    db.commit()
+    return submission
+
+
+def test_concurrent_decisions_only_one_wins(published_event):
+    db = SessionLocal()
+    try:
+        submission = _set_status(db, published_event, "paid")
+        version = submission.version
+
+        first = transition_submission(db, submission.uuid, "completed", expected_version=version)
+        db.commit()
+
+        second = transition_submission(db, submission.uuid, "rejected", expected_version=version)
+        db.rollback()
+
+        reopen_stale = transition_submission(db, submission.uuid, "paid", expected_version=version)
+        db.rollback()
+
+        wrong_event = transition_submission(db, submission.uuid, "paid", event_uuid=uuid4())
+        db.rollback()
+    finally:
+        db.close()
+
+    assert first.ok and first.submission.version == version + 1
+    assert second.conflict == INVALID_TRANSITION
+    assert second.current_status == "completed"
+    assert reopen_stale.conflict == VERSION_CONFLICT
+    assert wrong_event.conflict == WRONG_EVENT